@@ -5,6 +5,8 @@ import json
 import threading
 from typing import Any
 
+from core.persistence.pagination import clamp_limit, decode_cursor, encode_cursor
+
 
 class ActionExecutionStore:
     _TERMINAL_STATUSES = {"success", "failed", "failed_timeout", "skipped"}
@@ -205,6 +207,34 @@ class ActionExecutionStore:
             ).fetchall()
         return [self._row_to_dict(row) for row in rows]
 
+    def list_page(self, *, limit: Any = None, cursor: str | None = None) -> dict[str, Any]:
+        """Newest-first executions after ``cursor`` plus the cursor for the next page."""
+        safe_limit = clamp_limit(limit)
+        after = decode_cursor(cursor, 1)
+        params: list[Any] = []
+        where = ""
+        if after is not None:
+            try:
+                params.append(int(after[0]))
+            except ValueError:
+                raise ValueError("invalid_cursor") from None
+            where = "WHERE id < ?"
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT id, action_id, action_type, status, executor, started_at, finished_at,
+                       request_id, trace_id, correlation_id, input_payload_json, output_payload_json, error
+                FROM action_executions
+                {where}
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (*params, safe_limit + 1),
+            ).fetchall()
+        items = [self._row_to_dict(row) for row in rows[:safe_limit]]
+        next_cursor = encode_cursor(items[-1]["id"]) if len(rows) > safe_limit else None
+        return {"items": items, "next_cursor": next_cursor}
+
     def list_for_action(self, action_id: str, limit: int = 50) -> list[dict[str, Any]]:
         safe_limit = max(1, min(int(limit), 500))
         with self._lock:
@@ -28,7 +28,7 @@ from core.product_proposal_store import ProductProposalStore
 from core.scheduler import DailyScheduler
 from core.state_machine import State, StateMachine
 from core.storage import Storage
-from core.stores import AdaptivePolicyStore
+from core.stores import AdaptivePolicyStore, get_store, get_store_registry
 from core.executors.draft_asset_executor import DraftAssetExecutor
 from core.executors.registry import ActionExecutorRegistry
 from core.strategy_action_execution_layer import StrategyActionExecutionLayer
@@ -36,6 +36,7 @@ from core.strategy_action_store import StrategyActionStore
 from core.strategy_decision_engine import StrategyDecisionEngine
 from core.services.strategy_decision_orchestrator import StrategyDecisionOrchestrator
 from core.strategy_engine import StrategyEngine
+from core.reddit_post_store import RedditPostStore
 from core.revenue_attribution.store import RevenueAttributionStore
 from core.subreddit_performance_store import SubredditPerformanceStore
 from core.event_catalog import EventType
@@ -55,7 +56,7 @@ def bootstrap_executors(registry: ActionExecutorRegistry, app_config=config) ->
 
 class TretaApp:
     def __init__(self, storage: Storage | None = None):
-        self.storage = storage or Storage()
+        self.storage = get_store_registry().register(storage) if storage is not None else get_store(Storage)
         conn = self.storage.conn
         run_migrations(conn)
         assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
@@ -66,15 +67,16 @@ class TretaApp:
 
         last_state = self.storage.get_state("last_state") or State.IDLE
         self.state_machine = StateMachine(initial_state=last_state)
-        self.opportunity_store = OpportunityStore()
-        self.product_proposal_store = ProductProposalStore()
-        self.product_plan_store = ProductPlanStore()
-        self.product_launch_store = ProductLaunchStore(proposal_store=self.product_proposal_store)
-        self.revenue_attribution_store = RevenueAttributionStore()
-        self.subreddit_performance_store = SubredditPerformanceStore()
+        self.opportunity_store = get_store(OpportunityStore)
+        self.product_proposal_store = get_store(ProductProposalStore)
+        self.product_plan_store = get_store(ProductPlanStore)
+        self.product_launch_store = get_store(ProductLaunchStore, proposal_store=self.product_proposal_store)
+        self.revenue_attribution_store = get_store(RevenueAttributionStore)
+        self.subreddit_performance_store = get_store(SubredditPerformanceStore)
+        self.reddit_post_store = get_store(RedditPostStore)
         self.performance_engine = PerformanceEngine(product_launch_store=self.product_launch_store)
         self.strategy_engine = StrategyEngine(product_launch_store=self.product_launch_store)
-        self.strategy_action_store = StrategyActionStore()
+        self.strategy_action_store = get_store(StrategyActionStore)
         self.action_execution_store = ActionExecutionStore(self.storage.conn)
         self.executor_registry = ActionExecutorRegistry()
         bootstrap_executors(self.executor_registry, config)
@@ -114,7 +116,7 @@ class TretaApp:
             autonomy_policy_engine=self.autonomy_policy_engine,
         )
         self.decision_engine = DecisionEngine(storage=self.storage)
-        self.memory_store = MemoryStore()
+        self.memory_store = get_store(MemoryStore)
         self.control = Control(
             opportunity_store=self.opportunity_store,
             product_proposal_store=self.product_proposal_store,
@@ -122,6 +124,7 @@ class TretaApp:
             product_launch_store=self.product_launch_store,
             revenue_attribution_store=self.revenue_attribution_store,
             subreddit_performance_store=self.subreddit_performance_store,
+            reddit_post_store=self.reddit_post_store,
             strategy_decision_engine=self.strategy_decision_engine,
             strategy_decision_orchestrator=self.strategy_decision_orchestrator,
             strategy_action_execution_layer=self.strategy_action_execution_layer,
@@ -182,6 +185,7 @@ class TretaApp:
             subreddit_performance_store=self.subreddit_performance_store,
             storage=self.storage,
             action_execution_store=self.action_execution_store,
+            reddit_post_store=self.reddit_post_store,
         )
         return self.http_server
 
@@ -208,4 +212,5 @@ class TretaApp:
                 self.storage.set_state("last_state", self.state_machine.state)
         finally:
             self.scheduler.stop()
+            self.subreddit_performance_store.flush()
             self.storage.set_state("last_state", self.state_machine.state)
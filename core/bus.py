@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from queue import Queue, Empty
 from collections import deque, defaultdict
-from typing import Optional
+from typing import Callable, Optional
 import logging
+import threading
 
 from core.events import Event
 import core.config as config
@@ -18,6 +19,23 @@ class EventBus:
         self._history = deque(maxlen=200)
         self._max_events_per_cycle = max_events_per_cycle if max_events_per_cycle is not None else int(config.MAX_EVENTS_PER_CYCLE)
         self._cycle_budget_by_trace: dict[str, int] = defaultdict(int)
+        self._listeners: list[Callable[[Event], None]] = []
+        self._listeners_lock = threading.Lock()
+
+    def subscribe(self, listener: Callable[[Event], None]) -> Callable[[], None]:
+        """Call ``listener`` for every accepted event; the returned callable removes it.
+
+        Listeners run synchronously on the pushing thread, so they should only
+        record or signal, never handle the event.
+        """
+        with self._listeners_lock:
+            self._listeners = [*self._listeners, listener]
+
+        def unsubscribe() -> None:
+            with self._listeners_lock:
+                self._listeners = [item for item in self._listeners if item is not listener]
+
+        return unsubscribe
 
     def push(self, event: Event):
         trace_key = str(event.trace_id or event.request_id or "").strip() or "global"
@@ -39,6 +57,11 @@ class EventBus:
         self._cycle_budget_by_trace[trace_key] = next_budget
         self._q.put(event)
         self._history.append(event)
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Event bus listener failed", extra={"event_type": event.type})
 
     def pop(self, timeout: float = 0.2) -> Optional[Event]:
         try:
@@ -19,6 +19,13 @@ STRATEGY_LOOP_INTERVAL_SECONDS = float(os.getenv("STRATEGY_LOOP_INTERVAL_SECONDS
 STRATEGY_LOOP_MAX_PENDING = int(os.getenv("STRATEGY_LOOP_MAX_PENDING", "5"))
 MAX_REQUEST_BODY_BYTES = int(os.getenv("TRETA_MAX_REQUEST_BODY_BYTES", str(1024 * 1024)))
 MAX_EVENTS_PER_CYCLE = int(os.getenv("TRETA_MAX_EVENTS_PER_CYCLE", "120"))
+HTTP_WORKER_POOL_SIZE = int(os.getenv("TRETA_HTTP_WORKER_POOL_SIZE", "4"))
+HTTP_WORKER_QUEUE_LIMIT = int(os.getenv("TRETA_HTTP_WORKER_QUEUE_LIMIT", "8"))
+HTTP_STREAM_MAX_CLIENTS = int(os.getenv("TRETA_HTTP_STREAM_MAX_CLIENTS", "32"))
+HTTP_STREAM_HEARTBEAT_SECONDS = float(os.getenv("TRETA_HTTP_STREAM_HEARTBEAT_SECONDS", "15"))
+HTTP_COMPRESS_MIN_BYTES = int(os.getenv("TRETA_HTTP_COMPRESS_MIN_BYTES", "1024"))
+HTTP_KEEPALIVE_TIMEOUT_SECONDS = float(os.getenv("TRETA_HTTP_KEEPALIVE_TIMEOUT_SECONDS", "15"))
+HTTP_KEEPALIVE_MAX_REQUESTS = int(os.getenv("TRETA_HTTP_KEEPALIVE_MAX_REQUESTS", "100"))
 
 
 def get_autonomy_mode() -> str:
@@ -1,8 +1,9 @@
+from contextlib import nullcontext
 from dataclasses import dataclass
 import logging
 import tempfile
+import threading
 from datetime import datetime
-import json
 from pathlib import Path
 from typing import Dict, List
 
@@ -19,17 +20,19 @@ from core.product_proposal_store import ProductProposalStore
 from core.product_builder import ProductBuilder
 from core.product_plan_store import ProductPlanStore
 from core.execution_engine import ExecutionEngine
-from core.execution_focus_engine import ExecutionFocusEngine
 from core.services.gumroad_sync_service import GumroadSyncService
 from core.product_launch_store import ProductLaunchStore
 from core.revenue_attribution.store import RevenueAttributionStore
 from core.subreddit_performance_store import SubredditPerformanceStore
 from core.domain.integrity import DomainIntegrityError, DomainIntegrityPolicy
 from core.errors import InvariantViolationError
+from core.persistence.json_io import durability_batch
 from core.domain.lifecycle import EXECUTION_STATUSES
 from core.reddit_public.config import get_config
 from core.reddit_public.pain_scoring import compute_pain_score
+from core.reddit_post_store import RedditPostStore
 from core.storage import Storage
+from core.stores.registry import get_store
 from core.strategy_decision_engine import StrategyDecisionEngine
 from core.services.strategy_decision_orchestrator import StrategyDecisionOrchestrator
 from core.handlers.strategy_handler import StrategyHandler
@@ -72,12 +75,13 @@ class Control:
         product_launch_store: ProductLaunchStore | None = None,
         revenue_attribution_store: RevenueAttributionStore | None = None,
         subreddit_performance_store: SubredditPerformanceStore | None = None,
+        reddit_post_store: RedditPostStore | None = None,
         strategy_decision_engine: StrategyDecisionEngine | None = None,
         strategy_decision_orchestrator: StrategyDecisionOrchestrator | None = None,
         strategy_action_execution_layer = None,
         bus: EventBus | None = None,
     ):
-        self.decision_engine = decision_engine or DecisionEngine(storage=Storage())
+        self.decision_engine = decision_engine or DecisionEngine(storage=get_store(Storage))
         self.gumroad_client = gumroad_client
         self.action_planner = action_planner or ActionPlanner()
         self.confirmation_queue = confirmation_queue or ConfirmationQueue()
@@ -97,29 +101,39 @@ class Control:
         ):
             inferred_dir = Path(tempfile.mkdtemp(prefix="treta_control_"))
 
-        self.opportunity_store = opportunity_store or OpportunityStore(
-            path=(inferred_dir / "opportunities.json") if inferred_dir is not None else None
+        self.opportunity_store = opportunity_store or get_store(
+            OpportunityStore,
+            path=(inferred_dir / "opportunities.json") if inferred_dir is not None else None,
         )
         self.product_engine = product_engine or ProductEngine()
-        self.product_proposal_store = product_proposal_store or ProductProposalStore(
-            path=(inferred_dir / "product_proposals.json") if inferred_dir is not None else None
+        self.product_proposal_store = product_proposal_store or get_store(
+            ProductProposalStore,
+            path=(inferred_dir / "product_proposals.json") if inferred_dir is not None else None,
         )
         self.alignment_engine = alignment_engine or AlignmentEngine()
         self.product_builder = product_builder or ProductBuilder()
-        self.product_plan_store = product_plan_store or ProductPlanStore(
-            path=(inferred_dir / "product_plans.json") if inferred_dir is not None else None
+        self.product_plan_store = product_plan_store or get_store(
+            ProductPlanStore,
+            path=(inferred_dir / "product_plans.json") if inferred_dir is not None else None,
         )
         self.execution_engine = execution_engine or ExecutionEngine()
-        self.product_launch_store = product_launch_store or ProductLaunchStore(
-            proposal_store=self.product_proposal_store,
+        self.product_launch_store = product_launch_store or get_store(
+            ProductLaunchStore,
             path=(inferred_dir / "product_launches.json") if inferred_dir is not None else None,
+            proposal_store=self.product_proposal_store,
         )
-        self.revenue_attribution_store = revenue_attribution_store or RevenueAttributionStore(
+        self.revenue_attribution_store = revenue_attribution_store or get_store(
+            RevenueAttributionStore,
             path=(inferred_dir / "revenue_attribution.json") if inferred_dir is not None else None,
         )
-        self.subreddit_performance_store = subreddit_performance_store or SubredditPerformanceStore(
+        self.subreddit_performance_store = subreddit_performance_store or get_store(
+            SubredditPerformanceStore,
             path=(inferred_dir / "subreddit_performance.json") if inferred_dir is not None else None,
         )
+        self.reddit_post_store = reddit_post_store or get_store(
+            RedditPostStore,
+            path=(inferred_dir / "reddit_posts.json") if inferred_dir is not None else None,
+        )
         self.strategy_decision_engine = strategy_decision_engine
         self.strategy_decision_orchestrator = strategy_decision_orchestrator
         self.strategy_action_execution_layer = strategy_action_execution_layer
@@ -134,16 +148,30 @@ class Control:
             else None
         )
         self._last_reddit_scan: Dict[str, object] | None = None
+        # Proposal/launch events check integrity against the stores and then
+        # write; serialize them so the HTTP routes and the dispatcher cannot
+        # interleave two checks ahead of both writes.
+        self._proposals_lock = threading.RLock()
         self.only_top_proposal = True
         self.domain_integrity_policy = DomainIntegrityPolicy()
         self.bus = bus or EventBus()
+        self._revenue_summary_cache: dict = {}
+        self._revenue_summary_version = -1
 
     def _revenue_summary(self) -> dict:
+        # Held until the store's version moves, so repeat readers share one
+        # copy instead of deep-copying the summary per call. Treat as read-only.
         if self.revenue_attribution_store is None:
             return {}
-        summary = self.revenue_attribution_store.summary()
-        return summary if isinstance(summary, dict) else {}
+        summary = self.revenue_attribution_store.summary_if_changed(self._revenue_summary_version)
+        if summary is not None:
+            self._revenue_summary_cache = summary if isinstance(summary, dict) else {}
+            self._revenue_summary_version = int(self._revenue_summary_cache.get("version", -1))
+        return self._revenue_summary_cache
 
+    def _revenue_by_subreddit(self) -> dict:
+        by_subreddit = self._revenue_summary().get("by_subreddit", {})
+        return by_subreddit if isinstance(by_subreddit, dict) else {}
 
     def has_active_proposal(self) -> bool:
         active_statuses = {"draft", *self.domain_integrity_policy.ACTIVE_STATUSES}
@@ -154,16 +182,7 @@ class Control:
 
 
     def _refresh_execution_focus(self) -> None:
-        target_id = ExecutionFocusEngine.select_active(
-            self.product_proposal_store._items,
-            self.product_launch_store._items,
-        )
-        ExecutionFocusEngine.enforce_single_active(
-            target_id,
-            {"proposals": self.product_proposal_store._items, "launches": self.product_launch_store._items},
-        )
-        self.product_proposal_store._save()
-        self.product_launch_store._save()
+        self.product_launch_store.refresh_execution_focus()
 
 
     def _validate_global(self) -> None:
@@ -179,37 +198,14 @@ class Control:
         except DomainIntegrityError as exc:
             raise InvariantViolationError(str(exc)) from exc
 
-    def _reddit_posts_path(self) -> Path:
-        proposal_store_path = getattr(self.product_proposal_store, "_path", None)
-        if isinstance(proposal_store_path, Path):
-            data_dir = proposal_store_path.parent
-        else:
-            data_dir = Path(__file__).resolve().parent.parent / ".treta_data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "reddit_posts.json"
-
-    def _load_reddit_posts(self) -> list[dict]:
-        path = self._reddit_posts_path()
-        if not path.exists():
-            return []
-        try:
-            loaded = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return []
-        if not isinstance(loaded, list):
-            return []
-        return [item for item in loaded if isinstance(item, dict)]
-
-    def _save_reddit_posts(self, items: list[dict]) -> None:
-        self._reddit_posts_path().write_text(json.dumps(items, indent=2), encoding="utf-8")
-
-    def _compute_ranking_bonuses(self, subreddit: str) -> dict[str, float]:
+    def _compute_ranking_bonuses(self, subreddit: str, by_subreddit: dict | None = None) -> dict[str, float]:
         stats = self.subreddit_performance_store.get_subreddit_stats(subreddit)
         posts_attempted = int(stats.get("posts_attempted", 0) or 0)
         performance_sales = int(stats.get("sales", 0) or 0)
 
-        by_subreddit = self._revenue_summary().get("by_subreddit", {})
-        revenue_stats = by_subreddit.get(subreddit, {}) if isinstance(by_subreddit, dict) else {}
+        if by_subreddit is None:
+            by_subreddit = self._revenue_by_subreddit()
+        revenue_stats = by_subreddit.get(subreddit, {})
         sales = int(revenue_stats.get("sales", performance_sales) or 0)
         revenue = float(revenue_stats.get("revenue", 0.0) or 0.0)
 
@@ -227,25 +223,27 @@ class Control:
             "throttle_penalty": 0.0,
         }
 
-    def _compute_subreddit_roi(self, subreddit_stats: dict[str, object]) -> float:
+    def _compute_subreddit_roi(self, subreddit_stats: dict[str, object], by_subreddit: dict | None = None) -> float:
         posts_attempted = int(subreddit_stats.get("posts_attempted", 0) or 0)
         if posts_attempted == 0:
             return 0.0
         subreddit = str(subreddit_stats.get("name", "")).strip()
-        by_subreddit = self._revenue_summary().get("by_subreddit", {})
-        revenue_stats = by_subreddit.get(subreddit, {}) if isinstance(by_subreddit, dict) else {}
+        if by_subreddit is None:
+            by_subreddit = self._revenue_by_subreddit()
+        revenue_stats = by_subreddit.get(subreddit, {})
         revenue = float(revenue_stats.get("revenue", 0.0) or 0.0)
         return revenue / posts_attempted
 
     def _get_top_subreddits_by_roi(self, limit: int = 2) -> list[str]:
         summary = self.subreddit_performance_store.get_summary()
         rows = list(summary.get("subreddits", [])) if isinstance(summary, dict) else []
+        by_subreddit = self._revenue_by_subreddit()
         ranked = sorted(
             [item for item in rows if isinstance(item, dict)],
             key=lambda item: (
-                self._compute_subreddit_roi(item),
+                self._compute_subreddit_roi(item, by_subreddit),
                 float(item.get("revenue", 0.0) or 0.0),
-                int(self._revenue_summary().get("by_subreddit", {}).get(str(item.get("name", "")).strip(), {}).get("sales", 0) or 0),
+                int(by_subreddit.get(str(item.get("name", "")).strip(), {}).get("sales", 0) or 0),
             ),
             reverse=True,
         )
@@ -260,6 +258,11 @@ class Control:
         }
 
     def run_reddit_public_scan(self) -> Dict[str, object]:
+        # One scan touches several JSON stores; fsync them once at the end.
+        with durability_batch():
+            return self._run_reddit_public_scan()
+
+    def _run_reddit_public_scan(self) -> Dict[str, object]:
         from core.reddit_public.service import RedditPublicService
 
         config = get_config()
@@ -294,16 +297,14 @@ class Control:
         by_subreddit: Dict[str, int] = {}
         throttled_subreddits: set[str] = set()
         skipped_due_to_channel_lock: list[str] = []
-        stored_posts = self._load_reddit_posts()
-        known_post_ids = {
-            str(item.get("post_id", "")).strip()
-            for item in stored_posts
-            if str(item.get("post_id", "")).strip()
-        }
+        new_posts: List[Dict[str, object]] = []
+        known_post_ids: set[str] = set()
+        stored_count = len(self.reddit_post_store)
+        revenue_by_subreddit = self._revenue_by_subreddit()
 
         for post in posts:
             post_id = str(post.get("id", "")).strip()
-            if post_id and post_id in known_post_ids:
+            if post_id and (post_id in known_post_ids or self.reddit_post_store.has_post(post_id)):
                 continue
 
             title = str(post.get("title", ""))
@@ -311,7 +312,7 @@ class Control:
             pain_data = compute_pain_score(post)
             pain_score = int(pain_data["pain_score"])
             subreddit_name = str(post.get("subreddit", "")).strip() or "unknown"
-            bonuses = self._compute_ranking_bonuses(subreddit_name)
+            bonuses = self._compute_ranking_bonuses(subreddit_name, revenue_by_subreddit)
             revenue_bonus = round(float(bonuses["revenue_bonus"]), 2)
             execution_bonus = round(float(bonuses["execution_bonus"]), 2)
             conversion_bonus = round(float(bonuses["conversion_bonus"]), 2)
@@ -359,9 +360,9 @@ class Control:
             by_subreddit[subreddit_name] = by_subreddit.get(subreddit_name, 0) + 1
             if post_id:
                 known_post_ids.add(post_id)
-            stored_posts.append(
+            new_posts.append(
                 {
-                    "id": f"reddit_post_{int(datetime.utcnow().timestamp() * 1000)}_{post_id or len(stored_posts)}",
+                    "id": f"reddit_post_{int(datetime.utcnow().timestamp() * 1000)}_{post_id or stored_count + len(new_posts)}",
                     "post_id": post_id,
                     "proposal_id": "",
                     "product_name": "",
@@ -375,7 +376,7 @@ class Control:
                 }
             )
 
-        self._save_reddit_posts(stored_posts)
+        self.reddit_post_store.add_many(new_posts)
 
         if ranked_candidates and not self.has_active_proposal():
             candidates = sorted(
@@ -453,6 +454,10 @@ class Control:
         return self._last_reddit_scan
 
     def run_reddit_scan(self) -> Dict[str, object]:
+        with durability_batch():
+            return self._run_reddit_scan()
+
+    def _run_reddit_scan(self) -> Dict[str, object]:
         config = get_config()
         source = str(config.get("source", "reddit_public")).strip().lower()
 
@@ -627,7 +632,8 @@ class Control:
             return []
 
         try:
-            return handler.handle(event, context)
+            with self._proposals_lock if handler is OpportunityHandler else nullcontext():
+                return handler.handle(event, context)
         except Exception:
             logger.exception("Control handler failure", extra={"event_type": event.type, "event_id": event.event_id})
             raise
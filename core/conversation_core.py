@@ -95,12 +95,11 @@ class ConversationCore:
             logger.warning("conversation_fallback reason=gpt_client_unavailable")
             return self._gpt_unavailable_message()
 
-        memory_snapshot = self.memory_store.snapshot()
-        all_memory_messages = memory_snapshot.get("chat_history", []) if isinstance(memory_snapshot, dict) else []
+        recent_limit = 10
+        all_memory_messages = self.memory_store.recent_messages(recent_limit + 1)
         if all_memory_messages and all_memory_messages[-1].get("role") == "user" and all_memory_messages[-1].get("text") == user_message:
             all_memory_messages = all_memory_messages[:-1]
 
-        recent_limit = 10
         recent_messages = [
             {
                 "role": str(item.get("role", "")).strip(),
@@ -4,6 +4,17 @@ import re
 import uuid
 from datetime import datetime, timezone
 
+from core.persistence.pagination import clamp_limit, decode_cursor, encode_cursor
+
+_ANALYSIS_KEYS = (
+    "id",
+    "reddit_signal_id",
+    "pain_category",
+    "monetization_level",
+    "urgency_score",
+    "analyzed_at",
+)
+
 
 class CreatorPainClassifier:
     def __init__(self, storage):
@@ -108,15 +119,35 @@ class CreatorPainClassifier:
             )
             rows = cursor.fetchall()
 
-        keys = [
-            "id",
-            "reddit_signal_id",
-            "pain_category",
-            "monetization_level",
-            "urgency_score",
-            "analyzed_at",
-        ]
-        return [dict(zip(keys, row)) for row in rows]
+        return [dict(zip(_ANALYSIS_KEYS, row)) for row in rows]
+
+    def list_analysis_page(self, limit=None, cursor=None):
+        """Newest-first analyses after ``cursor`` plus the cursor for the next page."""
+        safe_limit = clamp_limit(limit)
+        after = decode_cursor(cursor, 2)
+        where = ""
+        params = []
+        if after is not None:
+            where = "WHERE analyzed_at < ? OR (analyzed_at = ? AND id < ?)"
+            params = [after[0], after[0], after[1]]
+        self._ensure_schema()
+        with self.storage._lock:
+            rows = self.storage.conn.execute(
+                f"""
+                SELECT {", ".join(_ANALYSIS_KEYS)}
+                FROM creator_pain_analysis
+                {where}
+                ORDER BY analyzed_at DESC, id DESC
+                LIMIT ?
+                """,
+                (*params, safe_limit + 1),
+            ).fetchall()
+
+        items = [dict(zip(_ANALYSIS_KEYS, row)) for row in rows[:safe_limit]]
+        next_cursor = None
+        if len(rows) > safe_limit:
+            next_cursor = encode_cursor(items[-1]["analyzed_at"], items[-1]["id"])
+        return {"items": items, "next_cursor": next_cursor}
 
     def _ensure_schema(self):
         self.storage.conn.execute(
@@ -131,6 +162,9 @@ class CreatorPainClassifier:
             )
             """
         )
+        self.storage.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_creator_pain_analysis_analyzed_at ON creator_pain_analysis(analyzed_at, id)"
+        )
 
     def _detect_pain_category(self, text: str) -> str:
         category_patterns = (
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from core.stores.change_feed import store_version
+
 
 class DailyLoopEngine:
     def __init__(self, opportunity_store, proposal_store, launch_store, strategy_store):
@@ -9,8 +11,24 @@ class DailyLoopEngine:
         self.proposal_store = proposal_store
         self.launch_store = launch_store
         self.strategy_store = strategy_store
+        self._cached_phase: tuple[tuple[int | None, ...], str] | None = None
 
     def compute_phase(self) -> str:
+        versions = (
+            store_version(self.strategy_store),
+            store_version(self.proposal_store),
+            store_version(self.opportunity_store),
+        )
+        cacheable = None not in versions
+        cached = self._cached_phase
+        if cacheable and cached is not None and cached[0] == versions:
+            return cached[1]
+        phase = self._compute_phase()
+        if cacheable:
+            self._cached_phase = (versions, phase)
+        return phase
+
+    def _compute_phase(self) -> str:
         pending_strategy_actions = self.strategy_store.list(status="pending_confirmation")
         if pending_strategy_actions:
             return "EXECUTE"
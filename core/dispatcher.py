@@ -6,6 +6,7 @@ from core.bus import EventBus
 from core.memory_store import MemoryStore
 from core.conversation_core import ConversationCore
 from core.storage import Storage
+from core.stores.registry import get_store
 from core.strategic_snapshot_engine import StrategicSnapshotEngine
 from core.logging_config import set_decision_id, set_event_id, set_request_id, set_trace_id
 from core.event_catalog import event_type_is_known, validate_event_payload
@@ -36,8 +37,8 @@ class Dispatcher:
         self.sm = state_machine
         self.bus = bus or EventBus()
         self.control = control or Control(bus=self.bus)
-        self.memory_store = memory_store or MemoryStore()
-        self.storage = storage or Storage()
+        self.memory_store = memory_store or get_store(MemoryStore)
+        self.storage = storage or get_store(Storage)
         self.conversation_core = conversation_core or ConversationCore(
             bus=self.bus,
             state_machine=self.sm,
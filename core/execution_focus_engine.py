@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+from collections import Counter
+import heapq
+import os
+from typing import Any, Callable, Dict, Iterable, List
+
+from core.errors import InvariantViolationError
 
 
 class ExecutionFocusEngine:
@@ -47,3 +52,156 @@ class ExecutionFocusEngine:
         for item in launches:
             item_id = str(item.get("id", "")).strip()
             item["active_execution"] = bool(target_id and item_id == target_id)
+
+    @staticmethod
+    def select_from_indexes(*indexes: "ExecutionFocusIndex") -> str | None:
+        """Same answer as ``select_active`` read from incremental indexes in O(log n) amortised."""
+        best: tuple[int, int, str | None] | None = None
+        for index in indexes:
+            head = index.top()
+            if head is not None and (best is None or head[:2] < best[:2]):
+                best = head
+        return best[2] if best is not None else None
+
+    @staticmethod
+    def consistency_check_enabled() -> bool:
+        return os.getenv("TRETA_EXECUTION_FOCUS_CHECK", "").strip().lower() in {"1", "true", "yes"}
+
+    @staticmethod
+    def verify(
+        target_id: str | None,
+        proposals: Iterable[Dict[str, Any]],
+        launches: Iterable[Dict[str, Any]],
+    ) -> None:
+        """Compare an incremental result with the full recompute; raise on divergence."""
+        proposal_items = list(proposals)
+        launch_items = list(launches)
+        expected = ExecutionFocusEngine.select_active(proposal_items, launch_items)
+        if expected != target_id:
+            raise InvariantViolationError(f"execution focus drift: incremental={target_id!r} full={expected!r}")
+        for item in [*proposal_items, *launch_items]:
+            item_id = str(item.get("id", "")).strip()
+            if bool(item.get("active_execution")) != bool(target_id and item_id == target_id):
+                raise InvariantViolationError(f"execution focus flag drift on {item_id!r}")
+
+
+def proposal_focus_tier(item: Dict[str, Any]) -> int | None:
+    status = str(item.get("status", "")).strip()
+    if status == "building":
+        return 0
+    if status == "approved":
+        return 1
+    return None
+
+
+def launch_focus_tier(item: Dict[str, Any]) -> int | None:
+    return 2 if str(item.get("status", "")).strip() != "launched" else None
+
+
+class ExecutionFocusIndex:
+    """Incrementally maintained focus candidates for one store's items.
+
+    Candidates sit in a lazy-deletion heap ordered by (tier, most recent
+    first); status counters and the set of items currently flagged
+    ``active_execution`` are updated per change, so refreshing focus after a
+    mutation touches only the affected items instead of rescanning the store.
+    Stores must call ``track`` after changing an item's status and ``forget``
+    when an item leaves the store.
+    """
+
+    def __init__(self, tier: Callable[[Dict[str, Any]], int | None]) -> None:
+        self._tier_of = tier
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._order: Dict[str, int] = {}
+        self._tiers: Dict[str, int | None] = {}
+        self._statuses: Dict[str, str] = {}
+        self._status_counts: Counter[str] = Counter()
+        self._flagged: set[str] = set()
+        self._heap: List[tuple[int, int, str]] = []
+        self._seq = 0
+
+    @staticmethod
+    def _key(item: Dict[str, Any]) -> str:
+        item_id = str(item.get("id", "")).strip()
+        # Items without an id still take part in ordering, as in select_active.
+        return item_id or f"#{id(item)}"
+
+    def rebuild(self, items: Iterable[Dict[str, Any]]) -> None:
+        self._items.clear()
+        self._order.clear()
+        self._tiers.clear()
+        self._statuses.clear()
+        self._status_counts.clear()
+        self._flagged.clear()
+        self._heap = []
+        for item in items:
+            self.track(item)
+
+    def track(self, item: Dict[str, Any]) -> None:
+        key = self._key(item)
+        if key not in self._order:
+            self._seq += 1
+            self._order[key] = self._seq
+        else:
+            self._status_counts[self._statuses[key]] -= 1
+        self._items[key] = item
+        status = str(item.get("status", "")).strip()
+        self._statuses[key] = status
+        self._status_counts[status] += 1
+        tier = self._tier_of(item)
+        self._tiers[key] = tier
+        if tier is not None:
+            heapq.heappush(self._heap, (tier, -self._order[key], key))
+        if item.get("active_execution"):
+            self._flagged.add(key)
+        else:
+            self._flagged.discard(key)
+        if len(self._heap) > 2 * len(self._items) + 64:
+            self._compact()
+
+    def forget(self, item: Dict[str, Any]) -> None:
+        key = self._key(item)
+        if key not in self._items:
+            return
+        self._status_counts[self._statuses.pop(key)] -= 1
+        del self._items[key]
+        del self._order[key]
+        del self._tiers[key]
+        self._flagged.discard(key)
+
+    def _compact(self) -> None:
+        self._heap = [
+            (tier, -self._order[key], key) for key, tier in self._tiers.items() if tier is not None
+        ]
+        heapq.heapify(self._heap)
+
+    def top(self) -> tuple[int, int, str | None] | None:
+        """``(tier, -order, id)`` of the best candidate, dropping stale heap entries."""
+        while self._heap:
+            tier, negative_order, key = self._heap[0]
+            if self._tiers.get(key) == tier and self._order.get(key) == -negative_order:
+                item_id = str(self._items[key].get("id", "")).strip() or None
+                return tier, negative_order, item_id
+            heapq.heappop(self._heap)
+        return None
+
+    def status_counts(self) -> Dict[str, int]:
+        return {status: count for status, count in self._status_counts.items() if count > 0}
+
+    def set_active(self, target_id: str | None) -> bool:
+        """Flip ``active_execution`` only on the items whose flag actually changes.
+
+        Returns whether any tracked item changed.
+        """
+        changed = False
+        for key in list(self._flagged):
+            if not target_id or key != target_id:
+                self._items[key]["active_execution"] = False
+                self._flagged.discard(key)
+                changed = True
+        if target_id and target_id in self._items:
+            item = self._items[target_id]
+            changed = changed or item.get("active_execution") is not True
+            item["active_execution"] = True
+            self._flagged.add(target_id)
+        return changed
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any
+
+# Responses below this size go out uncompressed: the gzip header and the
+# compression time cost more than the bytes saved.
+MIN_COMPRESS_BYTES = 1024
+# Dynamic bodies are compressed per request, so trade a little ratio for speed.
+DYNAMIC_GZIP_LEVEL = 5
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    """Content codings an ``Accept-Encoding`` header allows (``q=0`` excludes one)."""
+    accepted: set[str] = set()
+    for part in str(header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name)
+    if "*" in accepted:
+        accepted |= {"br", "gzip"}
+    return accepted
+
+
+def encode_json(body: Any) -> bytes:
+    """Compact JSON: no whitespace after separators."""
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def compress_response(body: bytes, accept_encoding: str | None, min_bytes: int = MIN_COMPRESS_BYTES) -> tuple[bytes, str | None]:
+    """``(payload, content_coding)``: gzip when the client accepts it and it pays off."""
+    if len(body) < min_bytes or "gzip" not in accepted_encodings(accept_encoding):
+        return body, None
+    compressed = gzip.compress(body, compresslevel=DYNAMIC_GZIP_LEVEL)
+    if len(compressed) >= len(body):
+        return body, None
+    return compressed, "gzip"
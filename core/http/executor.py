@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+import math
+import threading
+import time
+from typing import Any
+
+from core.errors import TretaError
+
+# Queue-wait percentiles are computed over the most recent tasks.
+QUEUE_WAIT_WINDOW = 256
+
+
+class WorkerPoolSaturatedError(TretaError):
+    """Raised instead of queueing when every worker and queue slot is taken."""
+
+
+class BoundedWorkerPool:
+    """Server-wide pool for HTTP operations that run under a timeout.
+
+    At most ``max_workers`` operations run at once and at most ``max_queue``
+    more wait; beyond that ``submit`` raises ``WorkerPoolSaturatedError`` so
+    the caller can shed load. A timed-out operation keeps its worker until it
+    returns (threads cannot be killed), but it can no longer grow the thread
+    count. Operations named in ``joinable_operations`` run one at a time: a
+    caller arriving while one is in flight waits on the same future instead of
+    starting another.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 8, joinable_operations: frozenset[str] = frozenset()):
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+        self._joinable = frozenset(joinable_operations)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="treta-op")
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._pending = 0
+        self._active = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._joined = 0
+        self._queue_wait_ms: deque[float] = deque(maxlen=QUEUE_WAIT_WINDOW)
+
+    def submit(self, operation: str, func: Callable[[], Any]) -> Future:
+        with self._lock:
+            if operation in self._joinable:
+                inflight = self._inflight.get(operation)
+                if inflight is not None and not inflight.done():
+                    self._joined += 1
+                    return inflight
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise WorkerPoolSaturatedError(f"{operation}_rejected_server_busy")
+            self._pending += 1
+            self._submitted += 1
+            future = self._executor.submit(self._run, func, time.perf_counter())
+            if operation in self._joinable:
+                self._inflight[operation] = future
+        future.add_done_callback(lambda done: self._finish(operation, done))
+        return future
+
+    def run(self, operation: str, func: Callable[[], Any], timeout: float) -> tuple[bool, Any]:
+        """``submit`` and wait up to ``timeout`` seconds; returns ``(False, None)`` on timeout."""
+        future = self.submit(operation, func)
+        try:
+            return True, future.result(timeout=timeout)
+        except TimeoutError:
+            if operation not in self._joinable:
+                # Only drops the task if it never started; joined futures are shared.
+                future.cancel()
+            return False, None
+
+    def _run(self, func: Callable[[], Any], enqueued_at: float) -> Any:
+        with self._lock:
+            self._active += 1
+            self._queue_wait_ms.append((time.perf_counter() - enqueued_at) * 1000.0)
+        try:
+            return func()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _finish(self, operation: str, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if self._inflight.get(operation) is future:
+                del self._inflight[operation]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._queue_wait_ms)
+            snapshot = {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active_workers": self._active,
+                "queued": self._pending - self._active,
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "joined": self._joined,
+                "inflight_operations": sorted(self._inflight),
+            }
+        snapshot["queue_wait_ms"] = {
+            "p50": _nearest_rank(waits, 0.50),
+            "p95": _nearest_rank(waits, 0.95),
+            "max": round(waits[-1], 3) if waits else None,
+        }
+        return snapshot
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _nearest_rank(ordered: list[float], fraction: float) -> float | None:
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))], 3)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import threading
+
+LockKey = tuple[str, str]
+
+# Canonical acquisition order for HTTP mutation locks. A request that needs
+# several keys takes them in this resource order (then by entity id), so two
+# requests can never wait on each other in a cycle. Resource-wide operations
+# come before per-entity ones. These locks are always taken before any store's
+# own lock (see ``core.persistence.json_io.file_lock``) and are never taken
+# while holding one.
+HTTP_LOCK_ORDER = (
+    "conversation",
+    "autonomy",
+    "reddit_config",
+    "reddit_signals",
+    "reddit_posts",
+    "creator",
+    "proposals",
+    "launches",
+    "strategy_actions",
+)
+
+
+class KeyedLocks:
+    """Mutexes keyed by ``(resource, entity_id)``, created on demand.
+
+    Requests on the same key are serialized; requests on different keys run in
+    parallel. ``entity_id`` is ``""`` for resource-wide operations, which
+    exclude every other holder of that resource: they wait for in-flight
+    per-entity requests to finish and hold off new ones until released. Unused
+    keys are dropped once no request holds or waits on them, so per-entity keys
+    do not accumulate.
+    """
+
+    def __init__(self, order: tuple[str, ...] = HTTP_LOCK_ORDER):
+        self._rank = {resource: index for index, resource in enumerate(order)}
+        self._guard = threading.Lock()
+        self._entries: dict[LockKey, list] = {}
+        # Per resource: entity holders counted in ``_shared``, and whether a
+        # resource-wide holder has the resource (or is draining it).
+        self._resource_changed = threading.Condition(self._guard)
+        self._shared: dict[str, int] = {}
+        self._exclusive: set[str] = set()
+
+    def _sort_key(self, key: LockKey) -> tuple[int, str]:
+        resource, entity_id = key
+        if resource not in self._rank:
+            raise ValueError(f"unknown_lock_resource: {resource}")
+        return self._rank[resource], entity_id
+
+    def _checkout(self, key: LockKey) -> threading.Lock:
+        with self._guard:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [threading.Lock(), 0]
+                self._entries[key] = entry
+            entry[1] += 1
+            return entry[0]
+
+    def _checkin(self, key: LockKey) -> None:
+        with self._guard:
+            entry = self._entries[key]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._entries[key]
+
+    def _enter_resource(self, key: LockKey) -> None:
+        resource, entity_id = key
+        with self._resource_changed:
+            if entity_id:
+                while resource in self._exclusive:
+                    self._resource_changed.wait()
+                self._shared[resource] = self._shared.get(resource, 0) + 1
+            else:
+                self._exclusive.add(resource)
+                try:
+                    while self._shared.get(resource):
+                        self._resource_changed.wait()
+                except BaseException:
+                    self._exclusive.discard(resource)
+                    self._resource_changed.notify_all()
+                    raise
+
+    def _leave_resource(self, key: LockKey) -> None:
+        resource, entity_id = key
+        with self._resource_changed:
+            if entity_id:
+                self._shared[resource] -= 1
+                if not self._shared[resource]:
+                    del self._shared[resource]
+            else:
+                self._exclusive.discard(resource)
+            self._resource_changed.notify_all()
+
+    @contextmanager
+    def hold(self, *keys: LockKey) -> Iterator[None]:
+        """Acquire ``keys`` in canonical order and release them in reverse."""
+        wide = {resource for resource, entity_id in keys if not entity_id}
+        # A resource-wide key already covers that resource's entities.
+        ordered = sorted({key for key in keys if not key[1] or key[0] not in wide}, key=self._sort_key)
+        held: list[tuple[LockKey, threading.Lock]] = []
+        try:
+            for key in ordered:
+                lock = self._checkout(key)
+                try:
+                    if key[1]:
+                        self._enter_resource(key)
+                        try:
+                            lock.acquire()
+                        except BaseException:
+                            self._leave_resource(key)
+                            raise
+                    else:
+                        # Wide holders queue on their key first, then drain the entities.
+                        lock.acquire()
+                        try:
+                            self._enter_resource(key)
+                        except BaseException:
+                            lock.release()
+                            raise
+                except BaseException:
+                    self._checkin(key)
+                    raise
+                held.append((key, lock))
+            yield
+        finally:
+            for key, lock in reversed(held):
+                if key[1]:
+                    lock.release()
+                    self._leave_resource(key)
+                else:
+                    self._leave_resource(key)
+                    lock.release()
+                self._checkin(key)
+
+    def active_keys(self) -> list[LockKey]:
+        with self._guard:
+            return sorted(self._entries)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import threading
+from typing import Any
+import uuid
+
+# How many recent changes a reconnecting ``/stream`` client can replay.
+NOTIFICATION_LOG_CAPACITY = 1024
+
+
+@dataclass(frozen=True)
+class Notification:
+    """One ``/stream`` notification; ``topic`` names what changed, not the new data."""
+
+    seq: int
+    topic: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class NotificationLog:
+    """Bounded, ordered log of change notifications fanned out to ``/stream``.
+
+    Unlike the per-store ``core.stores.change_feed.ChangeFeed`` (a version
+    counter), this keeps the recent notifications themselves so a client that
+    reconnects with ``Last-Event-ID`` can replay what it missed.
+
+    Sequence numbers are contiguous. Event ids sent to clients are
+    ``<epoch>-<seq>``, where ``epoch`` is random per log, so an id saved
+    before a server restart is recognised as foreign instead of being
+    mistaken for a position in the new log. ``wait`` blocks until something
+    newer than ``after`` is published and reports whether the caller fell
+    out of the retained window, in which case it must resynchronise.
+    """
+
+    def __init__(self, capacity: int = NOTIFICATION_LOG_CAPACITY):
+        self.epoch = uuid.uuid4().hex[:12]
+        self._cond = threading.Condition()
+        self._changes: deque[Notification] = deque(maxlen=max(1, int(capacity)))
+        self._last_seq = 0
+        self._closed = False
+
+    @property
+    def last_seq(self) -> int:
+        with self._cond:
+            return self._last_seq
+
+    @property
+    def closed(self) -> bool:
+        with self._cond:
+            return self._closed
+
+    def publish(self, topic: str, **data: Any) -> int:
+        with self._cond:
+            self._last_seq += 1
+            self._changes.append(Notification(seq=self._last_seq, topic=topic, data=data))
+            self._cond.notify_all()
+            return self._last_seq
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def resume_point(self, last_event_id: str | None) -> int | None:
+        """Sequence number to resume after, or ``None`` if the id is not from this log."""
+        epoch, _, raw_seq = str(last_event_id or "").strip().rpartition("-")
+        if epoch != self.epoch:
+            return None
+        try:
+            seq = int(raw_seq)
+        except ValueError:
+            return None
+        return seq if 0 <= seq <= self.last_seq else None
+
+    def wait(self, after: int, timeout: float) -> tuple[list[Notification], bool]:
+        """Changes newer than ``after`` (possibly none, on timeout or close) and whether they are complete."""
+        with self._cond:
+            if self._last_seq <= after and not self._closed:
+                self._cond.wait(timeout)
+            pending = self._last_seq - after
+            if pending <= 0:
+                return [], True
+            retained = len(self._changes)
+            if pending > retained:
+                return [], False
+            return [self._changes[index] for index in range(retained - pending, retained)], True
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
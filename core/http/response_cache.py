@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import threading
+from typing import Any, Hashable
+
+# One entry per (path, query); a changed input replaces the entry in place,
+# so this only bounds distinct query strings.
+RESPONSE_CACHE_MAX_ENTRIES = 256
+# Cached bodies carry this in place of the envelope's ``request_id``; each
+# response gets its own id substituted on the way out.
+REQUEST_ID_PLACEHOLDER = "__request_id__"
+_PLACEHOLDER_FIELD = b'"request_id":"' + REQUEST_ID_PLACEHOLDER.encode("utf-8") + b'"'
+
+
+def with_request_id(body: bytes, request_id: str) -> bytes:
+    """``body`` with the placeholder ``request_id`` replaced by ``request_id``."""
+    return body.replace(_PLACEHOLDER_FIELD, b'"request_id":' + json.dumps(request_id).encode("utf-8"), 1)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized 200 response and the input versions it was computed at."""
+
+    versions: tuple[Hashable, ...]
+    body: bytes
+    content_type: str
+    # Weak, so the same tag validates the identity and gzip representations.
+    etag: str
+
+    def render(self, request_id: str) -> bytes:
+        return with_request_id(self.body, request_id)
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in tags or self.etag in tags or self.etag[2:] in tags
+
+
+class ResponseCache:
+    """GET responses reused until one of the versions they depend on moves.
+
+    The caller supplies the current versions of an endpoint's inputs (store
+    change counters, a date bucket); a lookup hits only if they equal the
+    versions stored with the entry, so there is no TTL and no explicit
+    invalidation.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], CachedResponse] = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0, "not_modified": 0, "bypassed": 0}
+
+    def get(self, key: tuple[str, str], versions: tuple[Hashable, ...]) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.versions != versions:
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry
+
+    def put(self, key: tuple[str, str], versions: tuple[Hashable, ...], body: bytes, content_type: str) -> CachedResponse:
+        entry = CachedResponse(
+            versions=versions,
+            body=body,
+            content_type=content_type,
+            etag='W/"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            snapshot: dict[str, Any] = dict(self._counters)
+            snapshot["entries"] = len(self._entries)
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = round(snapshot["hits"] / lookups, 4) if lookups else None
+        return snapshot
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Route:
+    """One ``(method, pattern)`` entry; ``handler`` names a ``Handler`` method.
+
+    ``defaults`` are passed to the handler alongside the path parameters.
+    ``lock`` is an optional ``(resource, param)`` pair naming the keyed
+    mutation lock (see ``core.http.locks``); ``param`` is a path parameter or
+    body field holding the entity id, or ``None`` for a resource-wide lock.
+    ``topic`` is the ``/stream`` notification published after a successful
+    mutation, for state that no store change feed reports. ``cache`` names the
+    inputs a GET response depends on; it is served from the response cache
+    until one of their versions moves.
+    """
+
+    method: str
+    pattern: str
+    handler: str
+    defaults: dict[str, Any] = field(default_factory=dict)
+    lock: tuple[str, str | None] | None = None
+    topic: str | None = None
+    cache: tuple[str, ...] | None = None
+
+
+class _Node:
+    __slots__ = ("children", "param_name", "param_child", "routes")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.param_name: str | None = None
+        self.param_child: _Node | None = None
+        self.routes: dict[str, Route] = {}
+
+
+def _segments(path: str) -> list[str]:
+    return path.strip("/").split("/") if path.strip("/") else []
+
+
+class RouteTable:
+    """Compiled routes: an exact-match dict for static paths plus a segment trie.
+
+    Static lookups are one dict probe; parameterized ones (``/product_launches/
+    {launch_id}/add_sale``) walk one trie level per path segment, preferring a
+    literal segment over a ``{param}`` one. Either way the cost is independent
+    of how many routes are registered. A parameter matches exactly one segment,
+    including an empty one, so handlers still validate ids.
+    """
+
+    def __init__(self) -> None:
+        self._exact: dict[tuple[str, str], Route] = {}
+        self._root = _Node()
+
+    def add(
+        self,
+        method: str,
+        pattern: str,
+        handler: str,
+        *,
+        lock: tuple[str, str | None] | None = None,
+        topic: str | None = None,
+        cache: tuple[str, ...] | None = None,
+        **defaults: Any,
+    ) -> None:
+        route = Route(method=method.upper(), pattern=pattern, handler=handler, defaults=defaults, lock=lock, topic=topic, cache=cache)
+        if "{" not in pattern:
+            key = (route.method, pattern)
+            if key in self._exact:
+                raise ValueError(f"duplicate_route: {route.method} {pattern}")
+            self._exact[key] = route
+            return
+
+        node = self._root
+        for segment in _segments(pattern):
+            if segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if node.param_child is None:
+                    node.param_name, node.param_child = name, _Node()
+                elif node.param_name != name:
+                    raise ValueError(f"conflicting_route_param: {pattern}")
+                node = node.param_child
+            else:
+                node = node.children.setdefault(segment, _Node())
+        if route.method in node.routes:
+            raise ValueError(f"duplicate_route: {route.method} {pattern}")
+        node.routes[route.method] = route
+
+    def match(self, method: str, path: str) -> tuple[Route, dict[str, str]] | None:
+        route = self._exact.get((method, path))
+        if route is not None:
+            return route, {}
+        params: dict[str, str] = {}
+        node = self._walk(self._root, path.split("/")[1:] if path.startswith("/") else path.split("/"), 0, params)
+        if node is None or method not in node.routes:
+            return None
+        return node.routes[method], params
+
+    def _walk(self, node: _Node, segments: list[str], index: int, params: dict[str, str]) -> _Node | None:
+        if index == len(segments):
+            return node if node.routes else None
+        segment = segments[index]
+        literal = node.children.get(segment)
+        if literal is not None:
+            found = self._walk(literal, segments, index + 1, params)
+            if found is not None:
+                return found
+        if node.param_child is not None:
+            found = self._walk(node.param_child, segments, index + 1, params)
+            if found is not None:
+                params[node.param_name] = segment
+                return found
+        return None
+
+    def routes(self) -> list[Route]:
+        collected = list(self._exact.values())
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            collected.extend(node.routes.values())
+            stack.extend(node.children.values())
+            if node.param_child is not None:
+                stack.append(node.param_child)
+        return collected
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from email.utils import formatdate
+import gzip
+import hashlib
+from pathlib import Path
+import re
+import stat
+import threading
+
+from core.http.compression import accepted_encodings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".json": "application/json",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+}
+_COMPRESSIBLE_SUFFIXES = {".html", ".js", ".css", ".json", ".svg", ".txt", ".map"}
+# Smaller bodies gain nothing from compression once headers are counted.
+MIN_COMPRESS_BYTES = 512
+# ``app.3f9a2c1b.js``: the content hash is in the name, so it can be cached forever.
+_HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """One file held in memory with its precompressed variants (keyed by content coding)."""
+
+    signature: tuple[int, int]
+    content_type: str
+    etag: str
+    last_modified: str
+    cache_control: str
+    body: bytes
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+    def etag_for(self, encoding: str | None) -> str:
+        # Strong ETags must differ per content coding.
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in tags:
+            return True
+        tags |= {tag[2:] for tag in tags if tag.startswith("W/")}
+        return any(self.etag_for(encoding) in tags for encoding in (None, *self.variants))
+
+    def select(self, accept_encoding: str | None) -> tuple[bytes, str | None]:
+        """Pick the body for an ``Accept-Encoding`` header: brotli, then gzip, then identity."""
+        accepted = accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return self.variants[encoding], encoding
+        return self.body, None
+
+
+def _build_asset(path: Path, signature: tuple[int, int]) -> StaticAsset:
+    body = path.read_bytes()
+    suffix = path.suffix.lower()
+    variants: dict[str, bytes] = {}
+    if suffix in _COMPRESSIBLE_SUFFIXES and len(body) >= MIN_COMPRESS_BYTES:
+        # mtime=0 keeps the gzip bytes stable across reloads of the same content.
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            variants["gzip"] = compressed
+        if brotli is not None:
+            compressed = brotli.compress(body)
+            if len(compressed) < len(body):
+                variants["br"] = compressed
+    return StaticAsset(
+        signature=signature,
+        content_type=CONTENT_TYPES.get(suffix, "application/octet-stream"),
+        etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+        last_modified=formatdate(signature[0] / 1e9, usegmt=True),
+        cache_control=IMMUTABLE_CACHE_CONTROL if _HASHED_NAME.search(path.name) else REVALIDATE_CACHE_CONTROL,
+        body=body,
+        variants=variants,
+    )
+
+
+class StaticAssetCache:
+    """Static files read and compressed once, reloaded when their mtime or size changes.
+
+    Each lookup costs one ``stat``; the file is only re-read after an edit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._assets: dict[Path, StaticAsset] = {}
+
+    def get(self, path: Path) -> StaticAsset | None:
+        try:
+            file_stat = path.stat()
+        except OSError:
+            self._evict(path)
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self._lock:
+            asset = self._assets.get(path)
+        if asset is not None and asset.signature == signature:
+            return asset
+        try:
+            asset = _build_asset(path, signature)
+        except OSError:
+            return None
+        with self._lock:
+            self._assets[path] = asset
+        return asset
+
+    def _evict(self, path: Path) -> None:
+        with self._lock:
+            self._assets.pop(path, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._assets)
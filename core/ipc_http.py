@@ -4,7 +4,7 @@ import os
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from datetime import datetime, timezone
 from pathlib import Path
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import parse_qs, urlparse
@@ -33,11 +33,28 @@ from core.system_integrity import compute_system_integrity
 from core.strategic_loop_engine import StrategicLoopEngine
 from core.reddit_intelligence.router import RedditIntelligenceRouter
 from core.reddit_public.config import get_config, update_config
+from core.http.compression import compress_response, encode_json
+from core.http.executor import BoundedWorkerPool, WorkerPoolSaturatedError
+from core.http.locks import KeyedLocks
+from core.http.notifications import NotificationLog
+from core.http.response_cache import REQUEST_ID_PLACEHOLDER, ResponseCache, with_request_id
+from core.http.routes import RouteTable
+from core.http.static_assets import StaticAsset, StaticAssetCache
 from core.http_response import error, ok
+from core.persistence.pagination import DEFAULT_PAGE_LIMIT, clamp_limit, parse_fields, project_fields
+from core.persistence.write_metrics import snapshot_write_metrics
+from core.stores.change_feed import store_version
 from core.logging_config import set_request_id, set_trace_id
 from core.version import VERSION
 from core.config import (
     API_TOKEN,
+    HTTP_COMPRESS_MIN_BYTES,
+    HTTP_KEEPALIVE_MAX_REQUESTS,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    HTTP_WORKER_POOL_SIZE,
+    HTTP_STREAM_HEARTBEAT_SECONDS,
+    HTTP_STREAM_MAX_CLIENTS,
+    HTTP_WORKER_QUEUE_LIMIT,
     MAX_REQUEST_BODY_BYTES,
     STRATEGY_LOOP_ENABLED,
     STRATEGY_LOOP_INTERVAL_SECONDS,
@@ -51,6 +68,10 @@ from core.event_catalog import KNOWN_EVENT_TYPES
 _ALLOWED_EVENT_TYPES = KNOWN_EVENT_TYPES
 
 UI_DIR = Path(__file__).parent.parent / "ui"
+# Chat turns ``/memory`` returns unless ``?limit=`` asks for more; the full
+# history stays searchable through ``MemoryStore.search_chat_history``.
+MEMORY_HISTORY_LIMIT = 20
+
 logger = logging.getLogger("treta.http")
 
 try:
@@ -127,16 +148,25 @@ class TretaHTTPServer(ThreadingHTTPServer):
         self.memory_store = dependencies.get("memory_store")
         self.conversation_core = dependencies.get("conversation_core")
         self.reddit_router = dependencies.get("reddit_router") or RedditIntelligenceRouter()
-        self.mutation_lock = threading.Lock()
+        self.mutation_locks = KeyedLocks()
+        self.static_assets = StaticAssetCache()
+        self.response_cache = ResponseCache()
         self._strategy_cycle_lock = threading.Lock()
         self._strategy_cycle_lock_acquired_at: float | None = None
         self.revenue_attribution_store = dependencies.get("revenue_attribution_store")
         self.subreddit_performance_store = dependencies.get("subreddit_performance_store")
+        self.reddit_post_store = dependencies.get("reddit_post_store") or getattr(self.control, "reddit_post_store", None)
         self.storage = dependencies.get("storage")
         self.action_execution_store = dependencies.get("action_execution_store")
         self.integrity_cache_ttl_seconds = 15
         self.integrity_cache = None
         self.operation_timeout_seconds = 8
+        self.compress_min_bytes = HTTP_COMPRESS_MIN_BYTES
+        self.worker_pool = BoundedWorkerPool(
+            max_workers=HTTP_WORKER_POOL_SIZE,
+            max_queue=HTTP_WORKER_QUEUE_LIMIT,
+            joinable_operations=frozenset({"reddit_scan", "gumroad_sync"}),
+        )
         self.metrics_lock = threading.Lock()
         self.metrics = {
             "last_integrity_compute_ms": None,
@@ -144,6 +174,11 @@ class TretaHTTPServer(ThreadingHTTPServer):
             "integrity_cache_hit": 0,
             "last_mutation_at": None,
         }
+        self.notifications = NotificationLog()
+        self.stream_heartbeat_seconds = HTTP_STREAM_HEARTBEAT_SECONDS
+        self.stream_slots = threading.BoundedSemaphore(max(1, HTTP_STREAM_MAX_CLIENTS))
+        self._stream_clients = 0
+        self._unsubscribers = self._subscribe_notifications()
         self.strategic_loop_engine = None
         if STRATEGY_LOOP_ENABLED and self.control is not None:
             self.strategic_loop_engine = StrategicLoopEngine(
@@ -160,10 +195,42 @@ class TretaHTTPServer(ThreadingHTTPServer):
                 self.strategic_loop_engine.max_pending,
             )
 
+    def _subscribe_notifications(self) -> list:
+        """Feed ``/stream`` from bus activity and from every store that has a change feed."""
+        unsubscribers = []
+        if self.bus is not None and hasattr(self.bus, "subscribe"):
+            unsubscribers.append(self.bus.subscribe(lambda event: self.notifications.publish("events", type=str(event.type))))
+        stores = (
+            self.opportunity_store,
+            self.product_proposal_store,
+            self.product_plan_store,
+            self.product_launch_store,
+            self.revenue_attribution_store,
+            self.subreddit_performance_store,
+            self.reddit_post_store,
+            # The strategic loop adds pending actions outside HTTP and emits no bus event.
+            getattr(self.strategy_action_execution_layer, "_strategy_action_store", None),
+        )
+        for store in stores:
+            if store is not None and hasattr(store, "subscribe"):
+                unsubscribers.append(
+                    store.subscribe(lambda change: self.notifications.publish(change.store, op=change.op, id=change.item_id))
+                )
+        return unsubscribers
+
+    def track_stream_client(self, delta: int):
+        with self.metrics_lock:
+            self._stream_clients += delta
+
     def shutdown(self):
         if self.strategic_loop_engine is not None:
             self.strategic_loop_engine.stop()
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        # Wakes every open /stream so its handler thread returns.
+        self.notifications.close()
         super().shutdown()
+        self.worker_pool.shutdown()
 
     def update_metrics(self, **updates):
         with self.metrics_lock:
@@ -179,11 +246,35 @@ class TretaHTTPServer(ThreadingHTTPServer):
             snapshot = dict(self.metrics)
         if self.bus is not None and hasattr(self.bus, "_q") and hasattr(self.bus._q, "qsize"):
             snapshot["event_queue_depth"] = self.bus._q.qsize()
+        snapshot["persistence"] = snapshot_write_metrics()
+        snapshot["worker_pool"] = self.worker_pool.snapshot()
+        snapshot["response_cache"] = self.response_cache.snapshot()
+        with self.metrics_lock:
+            stream_clients = self._stream_clients
+        snapshot["stream"] = {"clients": stream_clients, "notifications": self.notifications.last_seq}
         return snapshot
 
 
+# Handler attributes that describe one request; cleared before the next one
+# on a kept-alive connection.
+_PER_REQUEST_ATTRIBUTES = ("request_id", "trace_id", "event_id", "response_code", "body_consumed", "captured_response")
+
+
 class Handler(BaseHTTPRequestHandler):
     ui_dir = UI_DIR
+    # Persistent connections: every response carries Content-Length or closes
+    # the connection. ``timeout`` closes connections idle for that long and
+    # ``max_requests_per_connection`` recycles long-lived ones.
+    protocol_version = "HTTP/1.1"
+    timeout = HTTP_KEEPALIVE_TIMEOUT_SECONDS
+    max_requests_per_connection = HTTP_KEEPALIVE_MAX_REQUESTS
+    requests_served = 0
+
+    def handle_one_request(self):
+        for attribute in _PER_REQUEST_ATTRIBUTES:
+            self.__dict__.pop(attribute, None)
+        self.requests_served += 1
+        super().handle_one_request()
 
     def _ensure_request_id(self) -> str:
         if not hasattr(self, "request_id"):
@@ -277,45 +368,129 @@ class Handler(BaseHTTPRequestHandler):
     def subreddit_performance_store(self):
         return self.server.subreddit_performance_store
 
-    def _reddit_posts_path(self) -> Path:
-        data_dir = Path(__file__).resolve().parent.parent / ".treta_data"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "reddit_posts.json"
-
-    def _load_reddit_posts(self) -> list[dict]:
-        path = self._reddit_posts_path()
-        if not path.exists():
-            return []
+    @property
+    def reddit_post_store(self):
+        return self.server.reddit_post_store
+
+    def send_response(self, code, message=None):
+        self.response_code = code
+        super().send_response(code, message)
+        # Tell the client when this response ends the connection: request cap
+        # reached, an unread body, or the client asked for it.
+        if self.close_connection or self.requests_served >= self.max_requests_per_connection:
+            self.send_header("Connection", "close")
+
+    def _discard_request_body(self) -> None:
+        """Consume a body the handler did not read, so the connection can serve the next request."""
+        if getattr(self, "body_consumed", False):
+            return
+        self.body_consumed = True
         try:
-            loaded = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return []
-        if not isinstance(loaded, list):
-            return []
-        return [item for item in loaded if isinstance(item, dict)]
+            length = int(self.headers.get("Content-Length", "0"))
+        except (TypeError, ValueError):
+            length = -1
+        if 0 < length <= MAX_REQUEST_BODY_BYTES and not self.headers.get("Transfer-Encoding"):
+            self.rfile.read(length)
+        elif length != 0 or self.headers.get("Transfer-Encoding"):
+            self.close_connection = True
 
-    def _save_reddit_posts(self, items: list[dict]) -> None:
-        path = self._reddit_posts_path()
-        path.write_text(json.dumps(items, indent=2), encoding="utf-8")
+    def _notify_mutation(self, route) -> None:
+        if route.topic is not None and getattr(self, "response_code", 500) < 400:
+            self.server.notifications.publish(route.topic)
 
     def _send(self, code: int, body: dict):
         normalized_body = self._normalize_body(code, body)
-        self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("X-Request-Id", self._ensure_request_id())
-        self.end_headers()
-        self.wfile.write(json.dumps(normalized_body).encode("utf-8"))
+        if "captured_response" in self.__dict__ and normalized_body.get("request_id") == self._ensure_request_id():
+            normalized_body["request_id"] = REQUEST_ID_PLACEHOLDER
+        return self._send_bytes(code, encode_json(normalized_body), "application/json", compressible=True)
 
     def _send_success(self, code: int, data: dict):
         return self._send(code, ok(data, self._ensure_request_id()))
 
-    def _send_bytes(self, code: int, body: bytes, content_type: str):
+    def _send_bytes(self, code: int, body: bytes, content_type: str, *, compressible: bool = False, headers: dict | None = None):
+        if self.__dict__.get("captured_response", False) is None:
+            # _send_cached is computing this response: hand it back instead of writing it.
+            self.captured_response = (code, body, content_type)
+            return
+        encoding = None
+        if compressible:
+            body, encoding = compress_response(body, self.headers.get("Accept-Encoding"), self.server.compress_min_bytes)
         self.send_response(code)
         self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if compressible:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.send_header("X-Request-Id", self._ensure_request_id())
         self.end_headers()
         self.wfile.write(body)
 
+    def _send_cached(self, route, parsed, params: dict):
+        """Serve a ``Route.cache`` GET from the response cache, computing it on a miss."""
+        cache = self.server.response_cache
+        versions = tuple(_CACHE_INPUTS[name](self.server) for name in route.cache)
+        if None in versions:
+            cache.count("bypassed")
+            return getattr(self, route.handler)(parsed, **route.defaults, **params)
+
+        key = (parsed.path, parsed.query)
+        entry = cache.get(key, versions)
+        if entry is None:
+            self.captured_response = None
+            try:
+                getattr(self, route.handler)(parsed, **route.defaults, **params)
+                captured = self.captured_response
+            finally:
+                del self.captured_response
+            if captured is None:
+                return
+            code, body, content_type = captured
+            if code != 200:
+                return self._send_bytes(code, with_request_id(body, self._ensure_request_id()), content_type, compressible=True)
+            entry = cache.put(key, versions, body, content_type)
+
+        if entry.matches(self.headers.get("If-None-Match")):
+            cache.count("not_modified")
+            self.send_response(304)
+            self.send_header("ETag", entry.etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("X-Request-Id", self._ensure_request_id())
+            self.end_headers()
+            return
+        return self._send_bytes(
+            200,
+            entry.render(self._ensure_request_id()),
+            entry.content_type,
+            compressible=True,
+            headers={"ETag": entry.etag, "Cache-Control": "no-cache"},
+        )
+
+    def _list_page(self, parsed, list_page, *, default_limit: int = DEFAULT_PAGE_LIMIT, **filters) -> dict | None:
+        """``list_page(limit=, cursor=, **filters)`` for the request's ``limit``/``cursor``/``fields``.
+
+        Returns ``{"items", "next_cursor"}`` with ``fields`` applied, or None
+        once a 400 has been sent for a bad limit or cursor.
+        """
+        query = parse_qs(parsed.query)
+        try:
+            limit = clamp_limit(query.get("limit", [None])[0], default_limit)
+        except (TypeError, ValueError):
+            self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+            return None
+        try:
+            page = list_page(limit=limit, cursor=query.get("cursor", [None])[0], **filters)
+        except ValueError as exc:
+            if str(exc) != "invalid_cursor":
+                raise
+            self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_cursor", "invalid_cursor")
+            return None
+        fields = parse_fields(query.get("fields", [None])[0])
+        return {"items": project_fields(page["items"], fields), "next_cursor": page["next_cursor"]}
+
     def _send_error(self, status_code: int, error_type: str, code: str, message: str, details: dict | None = None, data: dict | None = None):
         merged_details = dict(details or {})
         if error_type:
@@ -330,6 +505,8 @@ class Handler(BaseHTTPRequestHandler):
             return 500, ErrorType.INVARIANT_VIOLATION, "invariant_violation"
         if isinstance(exc, NotFoundError):
             return 404, ErrorType.NOT_FOUND, "not_found"
+        if isinstance(exc, WorkerPoolSaturatedError):
+            return 503, ErrorType.SERVER_ERROR, "server_busy"
         if isinstance(exc, GumroadAPIError):
             return 503, ErrorType.DEPENDENCY_ERROR, "gumroad_api_error"
         if isinstance(exc, DependencyError):
@@ -348,7 +525,10 @@ class Handler(BaseHTTPRequestHandler):
         request_id = self._ensure_request_id()
         if isinstance(body, dict) and body.get("ok") in {True, False} and "data" in body and "error" in body:
             if body.get("ok") is True:
-                return ok(body.get("data"), request_id)
+                wrapped = ok(body.get("data"), request_id)
+                # Keep siblings of ``data`` such as a list's ``next_cursor``.
+                wrapped.update({key: value for key, value in body.items() if key not in wrapped})
+                return wrapped
             raw_error = body.get("error") if isinstance(body.get("error"), dict) else {}
             return error(
                 str(raw_error.get("code", "request_failed")),
@@ -381,6 +561,7 @@ class Handler(BaseHTTPRequestHandler):
         if require_auth(self.headers):
             return True
         logger.warning("request_id=%s unauthorized endpoint=%s", self._ensure_request_id(), path)
+        self._discard_request_body()
         self._send(401, {"error": "unauthorized"})
         return False
 
@@ -401,16 +582,17 @@ class Handler(BaseHTTPRequestHandler):
         )
 
     def _run_with_timeout(self, operation_name: str, func):
-        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"treta-{operation_name}")
-        future = executor.submit(func)
-        try:
-            return True, future.result(timeout=self.server.operation_timeout_seconds)
-        except TimeoutError:
-            future.cancel()
-            executor.shutdown(wait=False, cancel_futures=True)
-            return False, None
-        finally:
-            executor.shutdown(wait=False, cancel_futures=True)
+        return self.server.worker_pool.run(operation_name, func, self.server.operation_timeout_seconds)
+
+    def _locked(self, func, *keys):
+        """``func`` wrapped to run under the mutation locks ``keys``, for pooled operations."""
+        locks = self.server.mutation_locks
+
+        def run():
+            with locks.hold(*keys):
+                return func()
+
+        return run
 
     def _resolve_static_path(self, request_path: str) -> Path | None:
         if request_path == "/":
@@ -427,36 +609,48 @@ class Handler(BaseHTTPRequestHandler):
             return None
         return candidate
 
-    def _send_static(self, request_path: str):
-        file_path = self._resolve_static_path(request_path)
-        if file_path is None or not file_path.exists() or not file_path.is_file():
-            return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
-
-        content_type = "application/octet-stream"
-        suffix = file_path.suffix.lower()
-        if suffix == ".html":
-            content_type = "text/html; charset=utf-8"
-        elif suffix == ".js":
-            content_type = "application/javascript; charset=utf-8"
-        elif suffix == ".css":
-            content_type = "text/css; charset=utf-8"
+    def _send_static(self, asset: StaticAsset):
+        if asset.matches(self.headers.get("If-None-Match")):
+            self.send_response(304)
+            self.send_header("ETag", asset.etag_for(asset.select(self.headers.get("Accept-Encoding"))[1]))
+            self.send_header("Cache-Control", asset.cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("X-Request-Id", self._ensure_request_id())
+            self.end_headers()
+            return
 
+        body, encoding = asset.select(self.headers.get("Accept-Encoding"))
         self.send_response(200)
-        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("ETag", asset.etag_for(encoding))
+        self.send_header("Last-Modified", asset.last_modified)
+        self.send_header("Cache-Control", asset.cache_control)
+        self.send_header("Vary", "Accept-Encoding")
         self.send_header("X-Request-Id", self._ensure_request_id())
         self.end_headers()
-        self.wfile.write(file_path.read_bytes())
+        self.wfile.write(body)
 
     def _read_json_body(self) -> tuple[dict | None, tuple[int, str, str, str] | None]:
+        self.body_consumed = True
+        if self.headers.get("Transfer-Encoding"):
+            # Chunked bodies are not supported; the unread body ends the connection.
+            self.close_connection = True
+            return None, (411, ErrorType.CLIENT_ERROR, "length_required", "length_required")
         header_value = self.headers.get("Content-Length", "0")
         try:
             length = int(header_value)
         except (TypeError, ValueError):
+            self.close_connection = True
             return None, (400, ErrorType.CLIENT_ERROR, "invalid_content_length", "invalid_content_length")
 
         if length < 0:
+            self.close_connection = True
             return None, (400, ErrorType.CLIENT_ERROR, "invalid_content_length", "invalid_content_length")
         if length > MAX_REQUEST_BODY_BYTES:
+            self.close_connection = True
             return None, (413, ErrorType.CLIENT_ERROR, "payload_too_large", "payload_too_large")
 
         raw = self.rfile.read(length).decode("utf-8") if length > 0 else "{}"
@@ -478,649 +672,722 @@ class Handler(BaseHTTPRequestHandler):
     def _do_get(self):
         self._ensure_request_id()
         self._ensure_trace_id()
+        self._discard_request_body()
         parsed = urlparse(self.path)
 
-        try:
-            reddit_response = self.reddit_router.handle_get(parsed.path, parse_qs(parsed.query))
-            if reddit_response is not None:
-                code, body = reddit_response
-                return self._send(code, body)
-        except ValueError:
-            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        match = _ROUTES.match("GET", parsed.path)
+        if match is not None:
+            route, params = match
+            if route.cache is not None:
+                return self._send_cached(route, parsed, params)
+            return getattr(self, route.handler)(parsed, **route.defaults, **params)
 
         static_path = self._resolve_static_path(parsed.path)
-        if static_path is not None and static_path.exists() and static_path.is_file():
-            return self._send_static(parsed.path)
+        asset = self.server.static_assets.get(static_path) if static_path is not None else None
+        if asset is not None:
+            return self._send_static(asset)
 
-        if parsed.path == "/state":
-            sm = self.state_machine
-            if sm is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "state_machine_unavailable", "state_machine_unavailable")
+        return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
 
-            return self._send(200, {"state": str(sm.state)})
+    def _get_stream(self, parsed):
+        """Server-Sent Events: one ``change`` event per notification, resumable via ``Last-Event-ID``."""
+        server = self.server
+        if not server.stream_slots.acquire(blocking=False):
+            return self._send_error(503, ErrorType.SERVER_ERROR, "server_busy", "stream_clients_exhausted")
+        server.track_stream_client(1)
+        try:
+            notifications = server.notifications
+            last_event_id = self.headers.get("Last-Event-ID") or (parse_qs(parsed.query).get("last_event_id") or [""])[0]
+            after = notifications.resume_point(last_event_id)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("X-Accel-Buffering", "no")
+            # The stream has no length, so it is the last response on this connection.
+            self.send_header("Connection", "close")
+            self.send_header("X-Request-Id", self._ensure_request_id())
+            self.end_headers()
+            self.wfile.write(b"retry: 3000\n\n")
+            if after is None:
+                after = notifications.last_seq
+                # A fresh client has nothing to catch up on; a foreign or unknown id must refetch.
+                self._write_stream_event("resync" if last_event_id else "ready", notifications.event_id(after), {})
+            while not notifications.closed:
+                changes, complete = notifications.wait(after, timeout=server.stream_heartbeat_seconds)
+                if not complete:
+                    after = notifications.last_seq
+                    self._write_stream_event("resync", notifications.event_id(after), {})
+                elif changes:
+                    for change in changes:
+                        self._write_stream_event("change", notifications.event_id(change.seq), {"topic": change.topic, **change.data})
+                    after = changes[-1].seq
+                else:
+                    # Comment line: keeps proxies from timing out and detects gone clients.
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            server.track_stream_client(-1)
+            server.stream_slots.release()
 
-        if parsed.path == "/events":
-            events = [
-                {
-                    "type": event.type,
-                    "payload": event.payload,
-                    "source": event.source,
-                    "request_id": event.request_id,
-                    "trace_id": event.trace_id,
-                    "timestamp": event.timestamp,
-                    "event_id": event.event_id,
-                }
-                for event in self.bus.recent(limit=10)
-            ]
-            return self._send(200, {"events": events})
+    def _write_stream_event(self, event: str, event_id: str, data: dict):
+        payload = json.dumps(data, separators=(",", ":"))
+        self.wfile.write(f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8"))
 
-        if parsed.path == "/memory":
-            if self.memory_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "memory_store_unavailable", "memory_store_unavailable")
-            return self._send(200, self.memory_store.snapshot())
+    def _get_reddit_intelligence(self, parsed):
+        try:
+            code, body = self.reddit_router.handle_get(parsed.path, parse_qs(parsed.query))
+        except ValueError:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        return self._send(code, body)
+
+    def _get_state(self, parsed):
+        sm = self.state_machine
+        if sm is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "state_machine_unavailable", "state_machine_unavailable")
+
+        return self._send(200, {"state": str(sm.state)})
+
+    def _get_events(self, parsed):
+        events = [
+            {
+                "type": event.type,
+                "payload": event.payload,
+                "source": event.source,
+                "request_id": event.request_id,
+                "trace_id": event.trace_id,
+                "timestamp": event.timestamp,
+                "event_id": event.event_id,
+            }
+            for event in self.bus.recent(limit=10)
+        ]
+        return self._send(200, {"events": events})
+
+    def _get_memory(self, parsed):
+        if self.memory_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "memory_store_unavailable", "memory_store_unavailable")
+        query = parse_qs(parsed.query)
+        try:
+            limit = clamp_limit(query.get("limit", [None])[0], MEMORY_HISTORY_LIMIT)
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        return self._send(200, self.memory_store.snapshot(history_limit=limit))
 
-        if parsed.path == "/product_proposals":
-            if self.product_proposal_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_proposal_store_unavailable", "product_proposal_store_unavailable")
+    def _get_product_proposals(self, parsed):
+        if self.product_proposal_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_proposal_store_unavailable", "product_proposal_store_unavailable")
 
-            items = self.product_proposal_store.list()[:10]
-            return self._send(200, {"items": items})
+        page = self._list_page(parsed, self.product_proposal_store.list_page, default_limit=10)
+        if page is None:
+            return None
+        return self._send(200, page)
 
-        if parsed.path.startswith("/product_proposals/"):
-            if self.product_proposal_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_proposal_store_unavailable", "product_proposal_store_unavailable")
+    def _get_product_proposals_item(self, parsed, proposal_id: str):
+        if self.product_proposal_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_proposal_store_unavailable", "product_proposal_store_unavailable")
 
-            proposal_id = parsed.path.rsplit("/", 1)[-1]
-            item = self.product_proposal_store.get(proposal_id)
-            if item is None:
-                return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
-            return self._send(200, item)
-
-        if parsed.path == "/product_launches":
-            if self.product_launch_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
-            items = self.product_launch_store.list()[:10]
-            return self._send(200, {"items": items})
-
-        if parsed.path == "/performance/summary":
-            if self.performance_engine is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "performance_engine_unavailable", "performance_engine_unavailable")
-            return self._send(200, self.performance_engine.generate_insights())
-
-        if parsed.path == "/revenue/summary":
-            if self.revenue_attribution_store is None:
-                return self._send_success(200, {"totals": {"sales": 0, "revenue": 0.0}, "by_product": {}, "by_channel": {}, "by_subreddit": {}, "sales": []})
-            return self._send_success(200, self.revenue_attribution_store.summary())
-
-        if parsed.path == "/revenue/subreddits":
-            if self.subreddit_performance_store is None:
-                return self._send_success(200, {"subreddits": []})
-
-            summary = self.subreddit_performance_store.get_summary()
-            revenue_summary = self.revenue_attribution_store.summary() if self.revenue_attribution_store is not None else {}
-            by_subreddit = revenue_summary.get("by_subreddit", {}) if isinstance(revenue_summary, dict) else {}
-            subreddits = []
-            for item in summary.get("subreddits", []):
-                name = str(item.get("name", ""))
-                posts_attempted = int(item.get("posts_attempted", 0) or 0)
-                revenue_item = by_subreddit.get(name, {}) if isinstance(by_subreddit, dict) else {}
-                sales = int(revenue_item.get("sales", item.get("sales", 0)) or 0)
-                conversion_rate = (sales / posts_attempted) if posts_attempted > 0 else 0.0
-                subreddits.append(
-                    {
-                        "name": name,
-                        "posts_attempted": posts_attempted,
-                        "plans_executed": int(item.get("plans_executed", 0) or 0),
-                        "sales": sales,
-                        "conversion_rate": round(conversion_rate, 4),
-                    }
-                )
-            return self._send_success(200, {"subreddits": subreddits})
-
-        if parsed.path == "/revenue/roi":
-            if self.subreddit_performance_store is None:
-                return self._send_success(200, {"subreddits": []})
-
-            summary = self.subreddit_performance_store.get_summary()
-            revenue_summary = self.revenue_attribution_store.summary() if self.revenue_attribution_store is not None else {}
-            by_subreddit = revenue_summary.get("by_subreddit", {}) if isinstance(revenue_summary, dict) else {}
-            subreddits = []
-            for item in summary.get("subreddits", []):
-                name = str(item.get("name", ""))
-                posts_attempted = int(item.get("posts_attempted", 0) or 0)
-                revenue_item = by_subreddit.get(name, {}) if isinstance(by_subreddit, dict) else {}
-                sales = int(revenue_item.get("sales", item.get("sales", 0)) or 0)
-                roi = (sales / posts_attempted) if posts_attempted > 0 else 0.0
-                subreddits.append(
-                    {
-                        "name": name,
-                        "roi": round(roi, 4),
-                        "posts_attempted": posts_attempted,
-                        "sales": sales,
-                    }
-                )
-            return self._send_success(200, {"subreddits": subreddits})
+        item = self.product_proposal_store.get(proposal_id)
+        if item is None:
+            return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
+        return self._send(200, item)
 
-        if parsed.path == "/revenue/dominant":
-            if self.control is None:
-                return self._send_success(200, {"dominant_subreddits": [], "total_tracked": 0})
-            return self._send_success(200, self.control.get_dominant_subreddits(limit=2))
+    def _get_product_launches(self, parsed):
+        if self.product_launch_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+        page = self._list_page(parsed, self.product_launch_store.list_page, default_limit=10)
+        if page is None:
+            return None
+        return self._send(200, page)
+
+    def _get_performance_summary(self, parsed):
+        if self.performance_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "performance_engine_unavailable", "performance_engine_unavailable")
+        return self._send(200, self.performance_engine.generate_insights())
+
+    def _get_revenue_summary(self, parsed):
+        if self.revenue_attribution_store is None:
+            return self._send_success(200, {"totals": {"sales": 0, "revenue": 0.0}, "by_product": {}, "by_channel": {}, "by_subreddit": {}, "sales": []})
+        query = parse_qs(parsed.query)
+        since = str(query.get("since", [""])[0] or "").strip() or None
+        until = str(query.get("until", [""])[0] or "").strip() or None
+        try:
+            return self._send_success(
+                200,
+                self.revenue_attribution_store.summary(
+                    since=since,
+                    until=until,
+                    include_trackings=str(query.get("trackings", [""])[0]).strip().lower() in {"1", "true", "yes"},
+                ),
+            )
+        except ValueError:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_timestamp", "invalid_timestamp")
+
+    def _get_revenue_subreddits(self, parsed):
+        if self.subreddit_performance_store is None:
+            return self._send_success(200, {"subreddits": []})
+
+        summary = self.subreddit_performance_store.get_summary()
+        revenue_summary = self.revenue_attribution_store.summary() if self.revenue_attribution_store is not None else {}
+        by_subreddit = revenue_summary.get("by_subreddit", {}) if isinstance(revenue_summary, dict) else {}
+        subreddits = []
+        for item in summary.get("subreddits", []):
+            name = str(item.get("name", ""))
+            posts_attempted = int(item.get("posts_attempted", 0) or 0)
+            revenue_item = by_subreddit.get(name, {}) if isinstance(by_subreddit, dict) else {}
+            sales = int(revenue_item.get("sales", item.get("sales", 0)) or 0)
+            conversion_rate = (sales / posts_attempted) if posts_attempted > 0 else 0.0
+            subreddits.append(
+                {
+                    "name": name,
+                    "posts_attempted": posts_attempted,
+                    "plans_executed": int(item.get("plans_executed", 0) or 0),
+                    "sales": sales,
+                    "conversion_rate": round(conversion_rate, 4),
+                }
+            )
+        return self._send_success(200, {"subreddits": subreddits})
+
+    def _get_revenue_roi(self, parsed):
+        if self.subreddit_performance_store is None:
+            return self._send_success(200, {"subreddits": []})
+
+        summary = self.subreddit_performance_store.get_summary()
+        revenue_summary = self.revenue_attribution_store.summary() if self.revenue_attribution_store is not None else {}
+        by_subreddit = revenue_summary.get("by_subreddit", {}) if isinstance(revenue_summary, dict) else {}
+        subreddits = []
+        for item in summary.get("subreddits", []):
+            name = str(item.get("name", ""))
+            posts_attempted = int(item.get("posts_attempted", 0) or 0)
+            revenue_item = by_subreddit.get(name, {}) if isinstance(by_subreddit, dict) else {}
+            sales = int(revenue_item.get("sales", item.get("sales", 0)) or 0)
+            roi = (sales / posts_attempted) if posts_attempted > 0 else 0.0
+            subreddits.append(
+                {
+                    "name": name,
+                    "roi": round(roi, 4),
+                    "posts_attempted": posts_attempted,
+                    "sales": sales,
+                }
+            )
+        return self._send_success(200, {"subreddits": subreddits})
 
-        if parsed.path == "/metrics/strategic/summary":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            return self._send_success(200, self.server.storage.get_strategic_metrics_summary())
+    def _get_revenue_dominant(self, parsed):
+        if self.control is None:
+            return self._send_success(200, {"dominant_subreddits": [], "total_tracked": 0})
+        return self._send_success(200, self.control.get_dominant_subreddits(limit=2))
 
-        if parsed.path == "/strategy/recommendations":
-            if self.strategy_engine is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_engine_unavailable", "strategy_engine_unavailable")
-            return self._send(200, self.strategy_engine.generate_recommendations())
+    def _get_metrics_strategic_summary(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        return self._send_success(200, self.server.storage.get_strategic_metrics_summary())
 
-        if parsed.path == "/strategy/decide":
-            if not self._check_auth_or_401("POST", parsed.path):
-                return
-            if self.strategy_decision_engine is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_decision_engine_unavailable", "strategy_decision_engine_unavailable")
-            if self.control is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
-            request_id = self._ensure_request_id()
-            trace_id = self._ensure_trace_id()
-            event_id = self._ensure_event_id()
-            if not self.server._strategy_cycle_lock.acquire(blocking=False):
-                if self.server.storage is not None:
-                    self.server.storage.create_decision_log(
-                        {
-                            "decision_type": "strategy_action_skipped",
-                            "entity_type": "portfolio",
-                            "entity_id": "global",
-                            "action_type": "recommend",
-                            "decision": "SKIPPED",
-                            "policy_name": "StrategyCycleLock",
-                            "reason": "cycle_lock_active",
-                            "correlation_id": request_id,
-                            "request_id": request_id,
-                            "trace_id": trace_id,
-                            "event_id": event_id,
-                            "status": "skipped",
-                            "outputs_json": {"reason": "cycle_lock_active"},
-                        }
-                    )
-                return self._send_success(
-                    200,
+    def _get_strategy_recommendations(self, parsed):
+        if self.strategy_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_engine_unavailable", "strategy_engine_unavailable")
+        return self._send(200, self.strategy_engine.generate_recommendations())
+
+    def _get_strategy_decide(self, parsed):
+        if not self._check_auth_or_401("POST", parsed.path):
+            return
+        if self.strategy_decision_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_decision_engine_unavailable", "strategy_decision_engine_unavailable")
+        if self.control is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
+        request_id = self._ensure_request_id()
+        trace_id = self._ensure_trace_id()
+        event_id = self._ensure_event_id()
+        if not self.server._strategy_cycle_lock.acquire(blocking=False):
+            if self.server.storage is not None:
+                self.server.storage.create_decision_log(
                     {
-                        "status": "skipped",
+                        "decision_type": "strategy_action_skipped",
+                        "entity_type": "portfolio",
+                        "entity_id": "global",
+                        "action_type": "recommend",
+                        "decision": "SKIPPED",
+                        "policy_name": "StrategyCycleLock",
                         "reason": "cycle_lock_active",
-                    },
-                )
-
-            self.server._strategy_cycle_lock_acquired_at = time.time()
-            event = Event(
-                type="RunStrategyDecision",
-                payload={
-                    "request_id": request_id,
-                    "trace_id": trace_id,
-                    "event_id": event_id,
-                },
-                source="http",
-                request_id=request_id,
-                trace_id=trace_id,
-                event_id=event_id,
-            )
-            try:
-                actions = self.control.consume(event)
-                result = actions[0].payload if actions else {"status": "executed", "cooldown_active": False}
-                if result.get("status") == "skipped":
-                    reason = str(result.get("reason", "cooldown_active") or "cooldown_active")
-                    response_payload = {
+                        "correlation_id": request_id,
+                        "request_id": request_id,
+                        "trace_id": trace_id,
+                        "event_id": event_id,
                         "status": "skipped",
-                        "reason": reason,
+                        "outputs_json": {"reason": "cycle_lock_active"},
                     }
-                    if reason == "cooldown_active":
-                        response_payload["cooldown_remaining_minutes"] = float(
-                            result.get("cooldown_remaining_minutes", 0.0) or 0.0
-                        )
-                    return self._send_success(200, response_payload)
-                return self._send_success(
-                    200,
-                    {
-                        "status": "executed",
-                        "cooldown_active": False,
-                    },
                 )
-            finally:
-                self.server._strategy_cycle_lock_acquired_at = None
-                self.server._strategy_cycle_lock.release()
-
-        if parsed.path == "/debug/events/recent":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            query = parse_qs(parsed.query)
-            limit_raw = query.get("limit", ["50"])[0]
-            try:
-                limit = int(limit_raw)
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            items = self.server.storage.list_recent_processed_events(limit=limit)
-            return self._send_success(200, {"items": items})
-
-        if parsed.path in {"/system/decision_logs", "/decision-logs"}:
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            query = parse_qs(parsed.query)
-            limit_raw = query.get("limit", ["50"])[0]
-            decision_type = str(query.get("decision_type", [""])[0] or "").strip() or None
-            try:
-                limit = int(limit_raw)
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            items = self.server.storage.list_recent_decision_logs(limit=limit, decision_type=decision_type)
-            return self._send_success(200, items)
-
-        if parsed.path == "/decision-logs/entity":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            query = parse_qs(parsed.query)
-            entity_type = str(query.get("entity_type", [""])[0] or "").strip()
-            entity_id = str(query.get("entity_id", [""])[0] or "").strip()
-            limit_raw = query.get("limit", ["50"])[0]
-            if not entity_type or not entity_id:
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_entity", "missing_entity")
-            try:
-                limit = int(limit_raw)
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            items = self.server.storage.get_decision_logs_for_entity(entity_type=entity_type, entity_id=entity_id, limit=limit)
-            return self._send_success(200, items)
-
-        if parsed.path == "/action-executions":
-            if self.strategy_action_execution_layer is None or self.strategy_action_execution_layer._action_execution_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "action_execution_store_unavailable", "action_execution_store_unavailable")
-            query = parse_qs(parsed.query)
-            limit_raw = query.get("limit", ["50"])[0]
-            try:
-                limit = int(limit_raw)
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            items = self.strategy_action_execution_layer._action_execution_store.list_recent(limit=limit)
-            return self._send_success(200, {"items": items})
-
-        if parsed.path.startswith("/action-executions/"):
-            if self.strategy_action_execution_layer is None or self.strategy_action_execution_layer._action_execution_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "action_execution_store_unavailable", "action_execution_store_unavailable")
-            action_id = parsed.path.rsplit("/", 1)[-1]
-            items = self.strategy_action_execution_layer._action_execution_store.list_for_action(action_id=action_id, limit=50)
-            return self._send_success(200, {"items": items})
-
-        if parsed.path == "/strategy/pending_actions":
-            if self.strategy_action_execution_layer is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
-            items = self.strategy_action_execution_layer.list_pending_actions()
-            return self._send(200, {"items": items})
-
-        if parsed.path == "/autonomy/status":
-            if self.autonomy_policy_engine is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "autonomy_policy_engine_unavailable", "autonomy_policy_engine_unavailable")
-            return self._send(200, self.autonomy_policy_engine.status())
-
-        if parsed.path == "/autonomy/adaptive_status":
-            if self.autonomy_policy_engine is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "autonomy_policy_engine_unavailable", "autonomy_policy_engine_unavailable")
-            return self._send(200, self.autonomy_policy_engine.adaptive_status())
-
-        if parsed.path == "/daily_loop/status":
-            if self.daily_loop_engine is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "daily_loop_engine_unavailable", "daily_loop_engine_unavailable")
-            loop_state = self.daily_loop_engine.get_loop_state()
-            loop_state["timestamp"] = time.time()
-            return self._send(200, loop_state)
-
-        if parsed.path == "/health/live":
-            return self._send_success(200, {"status": "live"})
+            return self._send_success(
+                200,
+                {
+                    "status": "skipped",
+                    "reason": "cycle_lock_active",
+                },
+            )
 
-        if parsed.path == "/health":
+        self.server._strategy_cycle_lock_acquired_at = time.time()
+        event = Event(
+            type="RunStrategyDecision",
+            payload={
+                "request_id": request_id,
+                "trace_id": trace_id,
+                "event_id": event_id,
+            },
+            source="http",
+            request_id=request_id,
+            trace_id=trace_id,
+            event_id=event_id,
+        )
+        try:
+            actions = self.control.consume(event)
+            result = actions[0].payload if actions else {"status": "executed", "cooldown_active": False}
+            if result.get("status") == "skipped":
+                reason = str(result.get("reason", "cooldown_active") or "cooldown_active")
+                response_payload = {
+                    "status": "skipped",
+                    "reason": reason,
+                }
+                if reason == "cooldown_active":
+                    response_payload["cooldown_remaining_minutes"] = float(
+                        result.get("cooldown_remaining_minutes", 0.0) or 0.0
+                    )
+                return self._send_success(200, response_payload)
             return self._send_success(
                 200,
                 {
-                    "status": "ok",
-                    "timestamp": time.time(),
-                    "version": VERSION,
+                    "status": "executed",
+                    "cooldown_active": False,
                 },
             )
+        finally:
+            self.server._strategy_cycle_lock_acquired_at = None
+            self.server._strategy_cycle_lock.release()
+
+    def _get_debug_events_recent(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        query = parse_qs(parsed.query)
+        limit_raw = query.get("limit", ["50"])[0]
+        try:
+            limit = int(limit_raw)
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        items = self.server.storage.list_recent_processed_events(limit=limit)
+        return self._send_success(200, {"items": items})
+
+    def _get_decision_logs(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        query = parse_qs(parsed.query)
+        limit_raw = query.get("limit", ["50"])[0]
+        decision_type = str(query.get("decision_type", [""])[0] or "").strip() or None
+        try:
+            limit = int(limit_raw)
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        items = self.server.storage.list_recent_decision_logs(limit=limit, decision_type=decision_type)
+        return self._send_success(200, items)
+
+    def _get_decision_logs_entity(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        query = parse_qs(parsed.query)
+        entity_type = str(query.get("entity_type", [""])[0] or "").strip()
+        entity_id = str(query.get("entity_id", [""])[0] or "").strip()
+        limit_raw = query.get("limit", ["50"])[0]
+        if not entity_type or not entity_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_entity", "missing_entity")
+        try:
+            limit = int(limit_raw)
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        items = self.server.storage.get_decision_logs_for_entity(entity_type=entity_type, entity_id=entity_id, limit=limit)
+        return self._send_success(200, items)
+
+    def _get_action_executions(self, parsed):
+        if self.strategy_action_execution_layer is None or self.strategy_action_execution_layer._action_execution_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "action_execution_store_unavailable", "action_execution_store_unavailable")
+        page = self._list_page(parsed, self.strategy_action_execution_layer._action_execution_store.list_page)
+        if page is None:
+            return None
+        return self._send_success(200, page)
+
+    def _get_action_executions_item(self, parsed, action_id: str):
+        if self.strategy_action_execution_layer is None or self.strategy_action_execution_layer._action_execution_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "action_execution_store_unavailable", "action_execution_store_unavailable")
+        items = self.strategy_action_execution_layer._action_execution_store.list_for_action(action_id=action_id, limit=50)
+        return self._send_success(200, {"items": items})
+
+    def _get_strategy_pending_actions(self, parsed):
+        if self.strategy_action_execution_layer is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
+        query = parse_qs(parsed.query)
+        if "limit" not in query and "cursor" not in query:
+            items = self.strategy_action_execution_layer.list_pending_actions()
+            return self._send(200, {"items": project_fields(items, parse_fields(query.get("fields", [None])[0]))})
+        page = self._list_page(parsed, self.strategy_action_execution_layer.list_actions_page, status="pending_confirmation")
+        if page is None:
+            return None
+        return self._send(200, page)
+
+    def _get_strategy_actions(self, parsed):
+        if self.strategy_action_execution_layer is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
+        query = parse_qs(parsed.query)
+        status = str(query.get("status", [""])[0] or "").strip() or None
+        page = self._list_page(parsed, self.strategy_action_execution_layer.list_actions_page, status=status)
+        if page is None:
+            return None
+        return self._send(200, page)
+
+    def _get_autonomy_status(self, parsed):
+        if self.autonomy_policy_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "autonomy_policy_engine_unavailable", "autonomy_policy_engine_unavailable")
+        return self._send(200, self.autonomy_policy_engine.status())
+
+    def _get_autonomy_adaptive_status(self, parsed):
+        if self.autonomy_policy_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "autonomy_policy_engine_unavailable", "autonomy_policy_engine_unavailable")
+        return self._send(200, self.autonomy_policy_engine.adaptive_status())
+
+    def _get_daily_loop_status(self, parsed):
+        if self.daily_loop_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "daily_loop_engine_unavailable", "daily_loop_engine_unavailable")
+        loop_state = self.daily_loop_engine.get_loop_state()
+        loop_state["timestamp"] = time.time()
+        return self._send(200, loop_state)
+
+    def _get_health_live(self, parsed):
+        return self._send_success(200, {"status": "live"})
+
+    def _get_health(self, parsed):
+        return self._send_success(
+            200,
+            {
+                "status": "ok",
+                "timestamp": time.time(),
+                "version": VERSION,
+            },
+        )
 
-        if parsed.path == "/health/ready":
-            checks = {
-                "stores_loadable": all([
-                    self.product_proposal_store is not None,
-                    self.product_plan_store is not None,
-                    self.product_launch_store is not None,
-                ]),
-                "control_wired": self.control is not None,
-                "bus_present": self.bus is not None,
-            }
-            if all(checks.values()):
-                return self._send_success(200, {"status": "ready", "checks": checks, "metrics": self.server.snapshot_metrics()})
+    def _get_health_ready(self, parsed):
+        checks = {
+            "stores_loadable": all([
+                self.product_proposal_store is not None,
+                self.product_plan_store is not None,
+                self.product_launch_store is not None,
+            ]),
+            "control_wired": self.control is not None,
+            "bus_present": self.bus is not None,
+        }
+        if all(checks.values()):
+            return self._send_success(200, {"status": "ready", "checks": checks, "metrics": self.server.snapshot_metrics()})
+        return self._send_error(
+            503,
+            ErrorType.DEPENDENCY_ERROR,
+            "not_ready",
+            "not_ready",
+            details={"checks": checks},
+        )
+
+    def _get_ready(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        try:
+            self.server.storage.conn.execute("SELECT 1").fetchone()
+            return self._send_success(200, {"status": "ready", "timestamp": time.time(), "version": VERSION})
+        except Exception as exc:
             return self._send_error(
                 503,
                 ErrorType.DEPENDENCY_ERROR,
-                "not_ready",
-                "not_ready",
-                details={"checks": checks},
+                "db_not_ready",
+                "db_not_ready",
+                details={"error": str(exc)},
             )
 
-        if parsed.path == "/ready":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            try:
-                self.server.storage.conn.execute("SELECT 1").fetchone()
-                return self._send_success(200, {"status": "ready", "timestamp": time.time(), "version": VERSION})
-            except Exception as exc:
-                return self._send_error(
-                    503,
-                    ErrorType.DEPENDENCY_ERROR,
-                    "db_not_ready",
-                    "db_not_ready",
-                    details={"error": str(exc)},
-                )
-
-        if parsed.path == "/system/integrity":
-            if self.product_proposal_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_proposal_store_unavailable", "product_proposal_store_unavailable")
-            if self.product_plan_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_plan_store_unavailable", "product_plan_store_unavailable")
-            if self.product_launch_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+    def _get_system_integrity(self, parsed):
+        if self.product_proposal_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_proposal_store_unavailable", "product_proposal_store_unavailable")
+        if self.product_plan_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_plan_store_unavailable", "product_plan_store_unavailable")
+        if self.product_launch_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+
+        # Stores with a change feed let the cached report live until an
+        # input actually changes; otherwise fall back to the fixed TTL.
+        input_versions = (
+            store_version(self.product_proposal_store),
+            store_version(self.product_plan_store),
+            store_version(self.product_launch_store),
+        )
+        versioned = None not in input_versions
+        cache_entry = self.server.integrity_cache
+        if versioned and cache_entry is not None and cache_entry.get("versions") == input_versions:
+            self.server.increment_metric("integrity_cache_hit")
+            cached_snapshot = dict(cache_entry["snapshot"])
+            cached_snapshot["metrics"] = self.server.snapshot_metrics()
+            return self._send_success(200, cached_snapshot)
 
-            data_errors: list[str] = []
+        data_errors: list[str] = []
 
-            try:
-                proposals = self.product_proposal_store.list()
-            except Exception as exc:
-                proposals = []
-                data_errors.append(f"proposals_load_failed: {exc}")
+        try:
+            proposals = self.product_proposal_store.list()
+        except Exception as exc:
+            proposals = []
+            data_errors.append(f"proposals_load_failed: {exc}")
 
+        try:
+            plans = self.product_plan_store.list(limit=10000)
+        except TypeError:
             try:
-                plans = self.product_plan_store.list(limit=10000)
-            except TypeError:
-                try:
-                    plans = self.product_plan_store.list()
-                except Exception as exc:
-                    plans = []
-                    data_errors.append(f"plans_load_failed: {exc}")
+                plans = self.product_plan_store.list()
             except Exception as exc:
                 plans = []
                 data_errors.append(f"plans_load_failed: {exc}")
+        except Exception as exc:
+            plans = []
+            data_errors.append(f"plans_load_failed: {exc}")
 
-            try:
-                launches = self.product_launch_store.list()
-            except Exception as exc:
-                launches = []
-                data_errors.append(f"launches_load_failed: {exc}")
+        try:
+            launches = self.product_launch_store.list()
+        except Exception as exc:
+            launches = []
+            data_errors.append(f"launches_load_failed: {exc}")
 
-            if data_errors:
-                return self._send_error(
-                    503,
-                    ErrorType.DEPENDENCY_ERROR,
-                    "integrity_data_unavailable",
-                    "integrity_data_unavailable",
-                    details={"data_errors": data_errors},
-                    data={"error": "integrity_data_unavailable", "details": data_errors},
-                )
+        if data_errors:
+            return self._send_error(
+                503,
+                ErrorType.DEPENDENCY_ERROR,
+                "integrity_data_unavailable",
+                "integrity_data_unavailable",
+                details={"data_errors": data_errors},
+                data={"error": "integrity_data_unavailable", "details": data_errors},
+            )
 
-            cache_entry = self.server.integrity_cache
-            now = time.time()
-            if cache_entry is not None and now - cache_entry["computed_at"] < self.server.integrity_cache_ttl_seconds:
-                self.server.increment_metric("integrity_cache_hit")
-                cached_snapshot = dict(cache_entry["snapshot"])
-                cached_snapshot["metrics"] = self.server.snapshot_metrics()
-                return self._send_success(200, cached_snapshot)
+        now = time.time()
+        if (
+            not versioned
+            and cache_entry is not None
+            and now - cache_entry["computed_at"] < self.server.integrity_cache_ttl_seconds
+        ):
+            self.server.increment_metric("integrity_cache_hit")
+            cached_snapshot = dict(cache_entry["snapshot"])
+            cached_snapshot["metrics"] = self.server.snapshot_metrics()
+            return self._send_success(200, cached_snapshot)
 
+        try:
+            started_at = time.perf_counter()
+
+            ok, report = self._run_with_timeout(
+                "integrity_recompute",
+                lambda: compute_system_integrity(
+                    proposals=proposals,
+                    plans=plans,
+                    launches=launches,
+                ),
+            )
+            if not ok:
+                return self._send_timeout_error("integrity_recompute")
+
+            finished_at = time.time()
+            compute_ms = round((time.perf_counter() - started_at) * 1000, 2)
+            self.server.update_metrics(
+                last_integrity_compute_ms=compute_ms,
+                last_integrity_at=finished_at,
+            )
+            report["version"] = VERSION
+            report["stale"] = False
+            report["recompute_failed"] = False
+            report["metrics"] = self.server.snapshot_metrics()
+            self.server.integrity_cache = {
+                "snapshot": report,
+                "computed_at": now,
+                "versions": input_versions if versioned else None,
+            }
+            return self._send_success(200, report)
+        except Exception:
+            if cache_entry is None:
+                raise
+            stale_report = dict(cache_entry["snapshot"])
+            stale_report["stale"] = True
+            stale_report["recompute_failed"] = True
+            stale_report["metrics"] = self.server.snapshot_metrics()
+            return self._send_success(200, stale_report)
+
+    def _get_product_launches_item(self, parsed, launch_id: str):
+        if self.product_launch_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+        query = parse_qs(parsed.query)
+        if str(query.get("detail", [""])[0]).strip().lower() in {"1", "true", "yes"}:
             try:
-                started_at = time.perf_counter()
-
-                ok, report = self._run_with_timeout(
-                    "integrity_recompute",
-                    lambda: compute_system_integrity(
-                        proposals=proposals,
-                        plans=plans,
-                        launches=launches,
-                    ),
-                )
-                if not ok:
-                    return self._send_timeout_error("integrity_recompute")
-
-                finished_at = time.time()
-                compute_ms = round((time.perf_counter() - started_at) * 1000, 2)
-                self.server.update_metrics(
-                    last_integrity_compute_ms=compute_ms,
-                    last_integrity_at=finished_at,
-                )
-                report["version"] = VERSION
-                report["stale"] = False
-                report["recompute_failed"] = False
-                report["metrics"] = self.server.snapshot_metrics()
-                self.server.integrity_cache = {
-                    "snapshot": report,
-                    "computed_at": now,
-                }
-                return self._send_success(200, report)
-            except Exception:
-                if cache_entry is None:
-                    raise
-                stale_report = dict(cache_entry["snapshot"])
-                stale_report["stale"] = True
-                stale_report["recompute_failed"] = True
-                stale_report["metrics"] = self.server.snapshot_metrics()
-                return self._send_success(200, stale_report)
-
-        if parsed.path.startswith("/product_launches/"):
-            if self.product_launch_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
-            launch_id = parsed.path.rsplit("/", 1)[-1]
+                item = self.product_launch_store.get_detail(launch_id, limit=query.get("limit", [None])[0])
+            except ValueError:
+                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        else:
             item = self.product_launch_store.get(launch_id)
-            if item is None:
-                return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
-            return self._send(200, item)
-
-        if parsed.path == "/product_plans":
-            if self.product_plan_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_plan_store_unavailable", "product_plan_store_unavailable")
-            items = self.product_plan_store.list(limit=10)
-            return self._send(200, {"items": items})
-
-        if parsed.path.startswith("/product_plans/"):
-            if self.product_plan_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_plan_store_unavailable", "product_plan_store_unavailable")
-            plan_id = parsed.path.rsplit("/", 1)[-1]
-            item = self.product_plan_store.get(plan_id)
-            if item is None:
-                return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
-            return self._send(200, item)
+        if item is None:
+            return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
+        return self._send(200, item)
 
-        if parsed.path == "/opportunities":
-            if self.opportunity_store is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "opportunity_store_unavailable", "opportunity_store_unavailable")
+    def _get_product_plans(self, parsed):
+        if self.product_plan_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_plan_store_unavailable", "product_plan_store_unavailable")
+        page = self._list_page(parsed, self.product_plan_store.list_page, default_limit=10)
+        if page is None:
+            return None
+        return self._send(200, page)
 
-            query = parse_qs(parsed.query)
-            status = query.get("status", [None])[0]
-            items = self.opportunity_store.list(status=status)
-            return self._send(200, {"items": items})
+    def _get_product_plans_item(self, parsed, plan_id: str):
+        if self.product_plan_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_plan_store_unavailable", "product_plan_store_unavailable")
+        item = self.product_plan_store.get(plan_id)
+        if item is None:
+            return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
+        return self._send(200, item)
 
-        if parsed.path == "/gumroad/auth":
-            try:
-                auth_url = get_auth_url()
-            except ValueError as e:
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "validation_error", str(e))
+    def _get_opportunities(self, parsed):
+        if self.opportunity_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "opportunity_store_unavailable", "opportunity_store_unavailable")
 
-            self.send_response(302)
-            self.send_header("Location", auth_url)
-            self.send_header("X-Request-Id", self._ensure_request_id())
-            self.end_headers()
-            return
+        query = parse_qs(parsed.query)
+        status = query.get("status", [None])[0]
+        if "limit" not in query and "cursor" not in query:
+            items = self.opportunity_store.list(status=status)
+            return self._send(200, {"items": project_fields(items, parse_fields(query.get("fields", [None])[0]))})
+        page = self._list_page(parsed, self.opportunity_store.list_page, status=status)
+        if page is None:
+            return None
+        return self._send(200, page)
 
-        if parsed.path == "/gumroad/callback":
-            query = parse_qs(parsed.query)
-            code = str(query.get("code", [""])[0]).strip()
-            if not code:
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_code", "missing_code")
-            try:
-                token = exchange_code_for_token(code)
-                save_token(token)
-            except ValueError as e:
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "validation_error", str(e))
-            except Exception as e:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "oauth_exchange_failed", f"oauth_exchange_failed: {e}")
-            return self._send(200, {"status": "connected"})
-
-        if parsed.path == "/creator/pains":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            classifier = CreatorPainClassifier(storage=self.server.storage)
-            items = classifier.list_recent_analysis(limit=50)
-            return self._send(200, {"ok": True, "data": items, "error": None})
-
-        if parsed.path == "/creator/product_suggestions":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            suggester = CreatorProductSuggester(storage=self.server.storage)
-            items = suggester.list_recent_suggestions(limit=20)
-            return self._send_success(200, {"items": items})
-
-        if parsed.path == "/creator/offers":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            query = parse_qs(parsed.query)
-            try:
-                limit = int(query.get("limit", ["20"])[0])
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            service = CreatorOfferService(storage=self.server.storage)
-            items = service.list_offer_drafts(limit=limit)
-            return self._send_success(200, {"items": items})
-
-        if parsed.path.startswith("/creator/offers/"):
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            offer_id = parsed.path.rsplit("/", 1)[-1]
-            service = CreatorOfferService(storage=self.server.storage)
-            item = service.get_offer_draft(offer_id)
-            if item is None:
-                return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
-            return self._send_success(200, item)
+    def _get_gumroad_auth(self, parsed):
+        try:
+            auth_url = get_auth_url()
+        except ValueError as e:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "validation_error", str(e))
 
-        if parsed.path == "/creator/launches":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            query = parse_qs(parsed.query)
-            try:
-                limit = int(query.get("limit", ["50"])[0])
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            tracker = CreatorLaunchTracker(storage=self.server.storage)
-            items = tracker.list_launches(limit=limit)
-            return self._send_success(200, {"items": items})
-
-        if parsed.path == "/creator/launches/summary":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            tracker = CreatorLaunchTracker(storage=self.server.storage)
-            return self._send_success(200, tracker.get_performance_summary())
-
-        if parsed.path == "/creator/demand":
-            if self.server.storage is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-            query = parse_qs(parsed.query)
-            try:
-                limit = int(query.get("limit", ["20"])[0])
-            except (TypeError, ValueError):
-                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
-            validator = CreatorDemandValidator(storage=self.server.storage)
-            items = validator.list_recent_validations(limit=limit)
-            return self._send_success(200, {"items": items})
+        self.send_response(302)
+        self.send_header("Location", auth_url)
+        self.send_header("Content-Length", "0")
+        self.send_header("X-Request-Id", self._ensure_request_id())
+        self.end_headers()
+        return
 
-        if parsed.path == "/reddit/config":
-            return self._send_success(200, get_config())
+    def _get_gumroad_callback(self, parsed):
+        query = parse_qs(parsed.query)
+        code = str(query.get("code", [""])[0]).strip()
+        if not code:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_code", "missing_code")
+        try:
+            token = exchange_code_for_token(code)
+            save_token(token)
+        except ValueError as e:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "validation_error", str(e))
+        except Exception as e:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "oauth_exchange_failed", f"oauth_exchange_failed: {e}")
+        return self._send(200, {"status": "connected"})
+
+    def _get_creator_pains(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        classifier = CreatorPainClassifier(storage=self.server.storage)
+        page = self._list_page(parsed, classifier.list_analysis_page)
+        if page is None:
+            return None
+        return self._send(200, {"ok": True, "data": page["items"], "next_cursor": page["next_cursor"], "error": None})
+
+    def _get_creator_product_suggestions(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        suggester = CreatorProductSuggester(storage=self.server.storage)
+        items = suggester.list_recent_suggestions(limit=20)
+        return self._send_success(200, {"items": items})
+
+    def _get_creator_offers(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        query = parse_qs(parsed.query)
+        try:
+            limit = int(query.get("limit", ["20"])[0])
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        service = CreatorOfferService(storage=self.server.storage)
+        items = service.list_offer_drafts(limit=limit)
+        return self._send_success(200, {"items": items})
+
+    def _get_creator_offers_item(self, parsed, offer_id: str):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        service = CreatorOfferService(storage=self.server.storage)
+        item = service.get_offer_draft(offer_id)
+        if item is None:
+            return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
+        return self._send_success(200, item)
 
-        if parsed.path == "/reddit/last_scan":
-            if self.control is None:
-                return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
-            return self._send_success(
-                200,
-                self.control.get_last_reddit_scan() or {"message": "No scan executed yet."},
-            )
+    def _get_creator_launches(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        query = parse_qs(parsed.query)
+        try:
+            limit = int(query.get("limit", ["50"])[0])
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        tracker = CreatorLaunchTracker(storage=self.server.storage)
+        items = tracker.list_launches(limit=limit)
+        return self._send_success(200, {"items": items})
+
+    def _get_creator_launches_summary(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        tracker = CreatorLaunchTracker(storage=self.server.storage)
+        return self._send_success(200, tracker.get_performance_summary())
+
+    def _get_creator_demand(self, parsed):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        query = parse_qs(parsed.query)
+        try:
+            limit = int(query.get("limit", ["20"])[0])
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_limit", "invalid_limit")
+        validator = CreatorDemandValidator(storage=self.server.storage)
+        items = validator.list_recent_validations(limit=limit)
+        return self._send_success(200, {"items": items})
+
+    def _get_reddit_config(self, parsed):
+        return self._send_success(200, get_config())
+
+    def _get_reddit_last_scan(self, parsed):
+        if self.control is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
+        return self._send_success(
+            200,
+            self.control.get_last_reddit_scan() or {"message": "No scan executed yet."},
+        )
 
-        if parsed.path == "/reddit/posts":
-            posts = self._load_reddit_posts()
-            return self._send_success(200, {"items": list(reversed(posts))})
+    def _get_reddit_posts(self, parsed):
+        if self.reddit_post_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "reddit_post_store_unavailable", "reddit_post_store_unavailable")
+        query = parse_qs(parsed.query)
+        filters = {
+            "proposal_id": query.get("proposal_id", [None])[0],
+            "subreddit": query.get("subreddit", [None])[0],
+        }
+        if "limit" not in query and "cursor" not in query:
+            items = self.reddit_post_store.list(**filters)
+            return self._send_success(200, {"items": project_fields(items, parse_fields(query.get("fields", [None])[0]))})
+        page = self._list_page(parsed, self.reddit_post_store.list_page, **filters)
+        if page is None:
+            return None
+        return self._send_success(200, page)
 
-        return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
     def do_POST(self):
         self._ensure_request_id()
-        proposal_transition_paths = {
-            "/approve": "ApproveProposal",
-            "/reject": "RejectProposal",
-            "/start_build": "StartBuildingProposal",
-            "/ready": "MarkReadyToLaunch",
-            "/launch": "MarkProposalLaunched",
-            "/archive": "ArchiveProposal",
-        }
-
-        transition_event_type = None
-        transition_proposal_id = None
-        for suffix, event_type in proposal_transition_paths.items():
-            marker = f"/product_proposals/"
-            if self.path.startswith(marker) and self.path.endswith(suffix):
-                transition_proposal_id = self.path[len(marker):-len(suffix)]
-                transition_event_type = event_type
-                break
-
-        launch_sale_id = None
-        if self.path.startswith("/product_launches/") and self.path.endswith("/add_sale"):
-            launch_sale_id = self.path[len("/product_launches/"):-len("/add_sale")]
-
-        launch_status_id = None
-        if self.path.startswith("/product_launches/") and self.path.endswith("/status"):
-            launch_status_id = self.path[len("/product_launches/"):-len("/status")]
-
-        launch_link_gumroad_id = None
-        if self.path.startswith("/product_launches/") and self.path.endswith("/link_gumroad"):
-            launch_link_gumroad_id = self.path[len("/product_launches/"):-len("/link_gumroad")]
-
-        strategy_execute_id = None
-        if self.path.startswith("/strategy/execute_action/"):
-            strategy_execute_id = self.path[len("/strategy/execute_action/"):]
-
-        creator_launch_sale_id = None
-        if self.path.startswith("/creator/launches/") and self.path.endswith("/sale"):
-            creator_launch_sale_id = self.path[len("/creator/launches/"):-len("/sale")]
-
-
-        strategy_reject_id = None
-        if self.path.startswith("/strategy/reject_action/"):
-            strategy_reject_id = self.path[len("/strategy/reject_action/"):]
-
-        allowed_paths = {
-            "/event",
-            "/opportunities/evaluate",
-            "/opportunities/dismiss",
-            "/scan/infoproduct",
-            "/product_plans/build",
-            "/product_proposals/execute",
-            "/gumroad/sync_sales",
-            "/reddit/signals",
-            "/reddit/config",
-            "/reddit/run_scan",
-            "/reddit/mark_posted",
-            "/conversation/message",
-            "/voice/tts",
-            "/creator/offers/generate",
-            "/creator/demand/validate",
-            "/creator/launches/register",
-            "/autonomy/override",
-        }
-        if self.path not in allowed_paths and transition_event_type is None and launch_sale_id is None and launch_status_id is None and launch_link_gumroad_id is None and strategy_execute_id is None and strategy_reject_id is None and creator_launch_sale_id is None:
+        parsed = urlparse(self.path)
+        match = _ROUTES.match("POST", parsed.path)
+        if match is None:
+            self._discard_request_body()
             return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
 
-        if not self._check_auth_or_401("POST", self.path):
+        if not self._check_auth_or_401("POST", parsed.path):
             return
 
         data, body_error = self._read_json_body()
@@ -1128,409 +1395,427 @@ class Handler(BaseHTTPRequestHandler):
             status_code, error_type, code, message = body_error
             return self._send_error(status_code, error_type, code, message)
 
+        route, params = match
         try:
-            with self.server.mutation_lock:
+            with self.server.mutation_locks.hold(*self._route_lock_keys(route, params, data)):
                 self.server.update_metrics(last_mutation_at=time.time())
-                reddit_post_response = self.reddit_router.handle_post(self.path, data)
-                if reddit_post_response is not None:
-                    code, body = reddit_post_response
-                    return self._send(code, body)
-
-                if transition_event_type is not None:
-                    if self.control is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
-                    proposal_id = str(transition_proposal_id or "").strip()
-                    if not proposal_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-
-                    transition_event = Event(
-                        type=transition_event_type,
-                        payload={"proposal_id": proposal_id, "request_id": self._ensure_request_id()},
-                        source="http",
-                        request_id=self._ensure_request_id(),
-                    )
-                    self.bus.push(transition_event)
-                    actions = self.control.consume(transition_event)
-                    for action in actions:
-                        self.bus.push(Event(type=action.type, payload=action.payload, source="control", request_id=self._ensure_request_id()))
-                        if action.type == "ProductProposalStatusChanged":
-                            return self._send_success(200, action.payload["proposal"])
-
-                    return self._send_error(404, ErrorType.NOT_FOUND, "proposal_not_found", "proposal_not_found")
-
-                if self.path == "/event":
-                    ev_type = data.get("type")
-                    payload = data.get("payload", {})
-                    source = data.get("source", "openclaw")
-
-                    if not ev_type:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_type", "missing_type")
-                    if str(ev_type) not in _ALLOWED_EVENT_TYPES:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "unsupported_event_type", "unsupported_event_type")
-
-                    self.bus.push(make_event(ev_type, {**payload, "request_id": self._ensure_request_id(), "trace_id": self._ensure_trace_id()}, source=source, request_id=self._ensure_request_id(), trace_id=self._ensure_trace_id()))
-                    return self._send_success(200, {"status": "ok"})
-
-                if self.path == "/scan/infoproduct":
-                    self.bus.push(
-                        Event(
-                            type="RunInfoproductScan",
-                            payload={"request_id": self._ensure_request_id()},
-                            source="http",
-                            request_id=self._ensure_request_id(),
-                            trace_id=self._ensure_trace_id(),
-                        )
-                    )
-                    return self._send_success(200, {"status": "ok"})
-
-                if self.path == "/product_plans/build":
-                    proposal_id = str(data.get("proposal_id", "")).strip()
-                    if not proposal_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_proposal_id", "missing_proposal_id")
-                    self.bus.push(
-                        Event(
-                            type="BuildProductPlanRequested",
-                            payload={"proposal_id": proposal_id, "request_id": self._ensure_request_id()},
-                            source="http",
-                            request_id=self._ensure_request_id(),
-                            trace_id=self._ensure_trace_id(),
-                        )
-                    )
-                    return self._send_success(200, {"status": "ok"})
-
-                if self.path == "/product_proposals/execute":
-                    proposal_id = str(data.get("id", "")).strip()
-                    if not proposal_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-                    if self.control is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
-
-                    execute_event = Event(
-                        type="ExecuteProductPlanRequested",
-                        payload={"proposal_id": proposal_id, "request_id": self._ensure_request_id()},
-                        source="http",
-                        request_id=self._ensure_request_id(),
-                    )
-                    self.bus.push(execute_event)
-                    actions = self.control.consume(execute_event)
-                    for action in actions:
-                        self.bus.push(Event(type=action.type, payload=action.payload, source="control", request_id=self._ensure_request_id()))
-                        if action.type == "ProductPlanExecuted":
-                            return self._send_success(200, action.payload["execution_package"])
-
-                    return self._send_error(404, ErrorType.NOT_FOUND, "proposal_not_found", "proposal_not_found")
-
-                if self.path == "/conversation/message":
-                    if self.conversation_core is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "conversation_core_unavailable", "conversation_core_unavailable")
-                    text = str(data.get("text", "")).strip()
-                    source = str(data.get("source", "ui")).strip() or "ui"
-                    if not text:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_text", "missing_text")
-                    logger.info("request_id=%s conversation_message_received source=%s text=%s", self._ensure_request_id(), source, text[:200])
-                    try:
-                        reply_text = self.conversation_core.reply(text, source=source)
-                    except Exception as exc:
-                        logger.exception("request_id=%s conversation_message_failed", self._ensure_request_id(), exc_info=exc)
-                        return self._send_error(500, ErrorType.SERVER_ERROR, "conversation_failed", "conversation_failed")
-                    logger.info("request_id=%s conversation_message_replied reply=%s", self._ensure_request_id(), str(reply_text)[:200])
-                    return self._send_success(200, {"reply_text": reply_text})
-
-                if self.path == "/autonomy/override":
-                    if self.autonomy_policy_engine is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "autonomy_policy_engine_unavailable", "autonomy_policy_engine_unavailable")
-                    requested_mode = str(data.get("mode", "")).strip().lower()
-                    if requested_mode not in {"manual", "partial", "disabled"}:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_mode", "invalid_mode")
-                    effective_mode = self.autonomy_policy_engine.set_runtime_mode_override(requested_mode)
-                    return self._send_success(200, {"mode": effective_mode, "status": self.autonomy_policy_engine.status()})
-
-                if self.path == "/voice/tts":
-                    text = str(data.get("text", "")).strip()
-                    if not text:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_text", "missing_text")
-
-                    api_key = os.getenv("OPENAI_API_KEY", "").strip()
-                    if not api_key or OpenAI is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "gpt_not_configured", "gpt_not_configured")
-
-                    client = OpenAI()
-                    response = client.audio.speech.create(
-                        model="gpt-4o-mini-tts",
-                        voice="sol",
-                        input=text,
-                    )
-                    return self._send_bytes(200, response.read(), "audio/mpeg")
-
-                if launch_sale_id is not None:
-                    if self.product_launch_store is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
-                    launch_id = str(launch_sale_id).strip()
-                    if not launch_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-                    amount = float(data.get("amount", 0))
-                    updated = self.product_launch_store.add_sale(launch_id, amount)
-                    return self._send(200, updated)
-
-                if launch_status_id is not None:
-                    if self.product_launch_store is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
-                    launch_id = str(launch_status_id).strip()
-                    if not launch_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-                    status = str(data.get("status", "")).strip()
-                    updated = self.product_launch_store.transition_status(launch_id, status)
-                    return self._send(200, updated)
-
-                if launch_link_gumroad_id is not None:
-                    if self.control is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
-                    launch_id = str(launch_link_gumroad_id).strip()
-                    if not launch_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-                    gumroad_product_id = str(data.get("gumroad_product_id", "")).strip()
-                    if not gumroad_product_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_gumroad_product_id", "missing_gumroad_product_id")
-                    updated = self.control.link_launch_gumroad(launch_id, gumroad_product_id)
-                    return self._send(200, updated)
-
-                if self.path == "/gumroad/sync_sales":
-                    if self.product_launch_store is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
-                    access_token = load_token()
-                    if not access_token:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "gumroad_not_connected", "Gumroad not connected. Visit /gumroad/auth first.")
-                    gumroad_client = GumroadClient(access_token)
-                    service = GumroadSyncService(
-                        self.product_launch_store,
-                        gumroad_client,
-                        self.revenue_attribution_store,
-                    )
-                    ok, summary = self._run_with_timeout("gumroad_sync", service.sync_sales)
-                    if not ok:
-                        return self._send_timeout_error("gumroad_sync")
-                    return self._send(200, summary)
-
-                if self.path == "/creator/offers/generate":
-                    if self.server.storage is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-                    suggestion_id = str(data.get("suggestion_id", "")).strip()
-                    if not suggestion_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_suggestion_id", "missing_suggestion_id")
-                    service = CreatorOfferService(storage=self.server.storage)
-                    try:
-                        draft = service.generate_offer_draft(suggestion_id=suggestion_id)
-                    except ValueError as exc:
-                        if str(exc) == "suggestion_not_found":
-                            return self._send_error(404, ErrorType.NOT_FOUND, "suggestion_not_found", "suggestion_not_found")
-                        raise
-                    return self._send_success(200, draft)
-
-                if self.path == "/creator/launches/register":
-                    if self.server.storage is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-                    offer_id = str(data.get("offer_id", "")).strip()
-                    if not offer_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_offer_id", "missing_offer_id")
-                    try:
-                        price = float(data.get("price"))
-                    except (TypeError, ValueError):
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_price", "invalid_price")
-                    notes = str(data.get("notes", ""))
-                    tracker = CreatorLaunchTracker(storage=self.server.storage)
-                    try:
-                        launch = tracker.register_launch(offer_id=offer_id, price=price, notes=notes)
-                    except ValueError as exc:
-                        if str(exc) == "offer_not_found":
-                            return self._send_error(404, ErrorType.NOT_FOUND, "offer_not_found", "offer_not_found")
-                        raise
-                    return self._send_success(200, launch)
-
-                if self.path.startswith("/creator/launches/") and self.path.endswith("/sale"):
-                    if self.server.storage is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-                    launch_id = self.path[len("/creator/launches/") : -len("/sale")].strip("/")
-                    if not launch_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_launch_id", "missing_launch_id")
-                    try:
-                        quantity = int(data.get("quantity", 1))
-                    except (TypeError, ValueError):
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_quantity", "invalid_quantity")
-                    tracker = CreatorLaunchTracker(storage=self.server.storage)
-                    try:
-                        launch = tracker.record_sale(launch_id=launch_id, quantity=quantity)
-                    except ValueError as exc:
-                        if str(exc) == "launch_not_found":
-                            return self._send_error(404, ErrorType.NOT_FOUND, "launch_not_found", "launch_not_found")
-                        if str(exc) == "invalid_quantity":
-                            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_quantity", "invalid_quantity")
-                        raise
-                    return self._send_success(200, launch)
-
-                if self.path == "/creator/demand/validate":
-                    if self.server.storage is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
-                    validator = CreatorDemandValidator(storage=self.server.storage)
-                    items = validator.validate()
-                    return self._send_success(200, {"items": items})
-
-                if self.path == "/reddit/config":
-                    editable_fields = {
-                        "subreddits",
-                        "pain_threshold",
-                        "pain_keywords",
-                        "commercial_keywords",
-                        "enable_engagement_boost",
-                        "source",
-                    }
-                    payload = {key: value for key, value in data.items() if key in editable_fields}
-                    if "subreddits" in payload:
-                        raw_subreddits = payload["subreddits"]
-                        if isinstance(raw_subreddits, str):
-                            raw_subreddits = raw_subreddits.split(",")
-                        payload["subreddits"] = [str(item).strip() for item in raw_subreddits if str(item).strip()]
-                    if "pain_threshold" in payload:
-                        payload["pain_threshold"] = int(payload["pain_threshold"])
-                    if "pain_keywords" in payload:
-                        raw_pain_keywords = payload["pain_keywords"]
-                        if isinstance(raw_pain_keywords, str):
-                            raw_pain_keywords = raw_pain_keywords.split(",")
-                        payload["pain_keywords"] = [str(item).strip().lower() for item in raw_pain_keywords if str(item).strip()]
-                    if "commercial_keywords" in payload:
-                        raw_commercial_keywords = payload["commercial_keywords"]
-                        if isinstance(raw_commercial_keywords, str):
-                            raw_commercial_keywords = raw_commercial_keywords.split(",")
-                        payload["commercial_keywords"] = [str(item).strip().lower() for item in raw_commercial_keywords if str(item).strip()]
-                    if "enable_engagement_boost" in payload:
-                        payload["enable_engagement_boost"] = bool(payload["enable_engagement_boost"])
-                    if "source" in payload:
-                        source_value = str(payload["source"]).strip().lower()
-                        if source_value not in {"reddit_public", "openclaw"}:
-                            return self._send_error(
-                                400,
-                                ErrorType.CLIENT_ERROR,
-                                "invalid_source",
-                                "source must be one of: reddit_public, openclaw",
-                            )
-                        payload["source"] = source_value
-                    updated = update_config(payload)
-                    return self._send_success(200, updated)
-
-                if self.path == "/reddit/run_scan":
-                    if self.control is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
-                    ok, result = self._run_with_timeout("reddit_scan", self.control.run_reddit_scan)
-                    if not ok:
-                        return self._send_timeout_error("reddit_scan")
-                    return self._send_success(200, result)
-
-                if self.path == "/reddit/mark_posted":
-                    proposal_id = str(data.get("proposal_id", "")).strip()
-                    subreddit = str(data.get("subreddit", "")).strip()
-                    post_url = str(data.get("post_url", "")).strip()
-                    post_id = str(data.get("post_id", "")).strip()
-                    if not post_id and post_url:
-                        path_parts = [part for part in urlparse(post_url).path.split("/") if part]
-                        if "comments" in path_parts:
-                            comments_index = path_parts.index("comments")
-                            if comments_index + 1 < len(path_parts):
-                                post_id = str(path_parts[comments_index + 1]).strip()
-                    if not proposal_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_proposal_id", "missing_proposal_id")
-                    if not subreddit:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_subreddit", "missing_subreddit")
-                    if not post_url:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_post_url", "missing_post_url")
-
-                    product_name = ""
-                    if self.product_proposal_store is not None:
-                        proposal = self.product_proposal_store.get(proposal_id)
-                        if proposal:
-                            product_name = str(proposal.get("product_name", "")).strip()
-
-                    upvotes = data.get("upvotes", 0)
-                    comments = data.get("comments", 0)
-                    try:
-                        upvotes = int(upvotes)
-                    except (TypeError, ValueError):
-                        upvotes = 0
-                    try:
-                        comments = int(comments)
-                    except (TypeError, ValueError):
-                        comments = 0
-
-                    entry = {
-                        "id": f"reddit_post_{int(time.time() * 1000)}",
-                        "post_id": post_id,
-                        "proposal_id": proposal_id,
-                        "product_name": product_name,
-                        "subreddit": subreddit,
-                        "post_url": post_url,
-                        "upvotes": upvotes,
-                        "comments": comments,
-                        "status": "open",
-                        "date": time.strftime("%Y-%m-%d"),
-                        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                    }
-                    posts = self._load_reddit_posts()
-                    posts.append(entry)
-                    self._save_reddit_posts(posts)
-                    return self._send_success(200, {"item": entry})
-
-                if strategy_execute_id is not None:
-                    if self.strategy_action_execution_layer is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
-                    action_id = str(strategy_execute_id).strip()
-                    if not action_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-                    updated = self.strategy_action_execution_layer.execute_action(action_id)
-                    return self._send(200, updated)
-
-                if strategy_reject_id is not None:
-                    if self.strategy_action_execution_layer is None:
-                        return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
-                    action_id = str(strategy_reject_id).strip()
-                    if not action_id:
-                        return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-                    updated = self.strategy_action_execution_layer.reject_action(action_id)
-                    return self._send(200, updated)
-
-                event_id = str(data.get("id", "")).strip()
-                if not event_id:
-                    return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
-
-                if self.path == "/opportunities/evaluate":
-                    self.bus.push(
-                        Event(
-                            type="EvaluateOpportunityById",
-                            payload={"id": event_id, "request_id": self._ensure_request_id()},
-                            source="http",
-                            request_id=self._ensure_request_id(),
-                            trace_id=self._ensure_trace_id(),
-                        )
-                    )
-                    return self._send_success(200, {"status": "ok"})
-
-                if self.path == "/opportunities/dismiss":
-                    self.bus.push(
-                        Event(
-                            type="OpportunityDismissed",
-                            payload={"id": event_id, "request_id": self._ensure_request_id()},
-                            source="http",
-                            request_id=self._ensure_request_id(),
-                            trace_id=self._ensure_trace_id(),
-                        )
-                    )
-                    return self._send_success(200, {"status": "ok"})
-
-            return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
+                getattr(self, route.handler)(data, **route.defaults, **params)
+            self._notify_mutation(route)
         except Exception as e:
             return self._handle_exception(e)
 
+    def _route_lock_keys(self, route, params: dict, data: dict) -> list[tuple[str, str]]:
+        if route.lock is None:
+            return []
+        resource, param = route.lock
+        if param is None:
+            return [(resource, "")]
+        return [(resource, str(params.get(param, data.get(param, "")) or "").strip())]
+
+    def _post_proposal_transition(self, data, proposal_id: str, event_type: str):
+        if self.control is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
+        proposal_id = str(proposal_id or "").strip()
+        if not proposal_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+
+        transition_event = Event(
+            type=event_type,
+            payload={"proposal_id": proposal_id, "request_id": self._ensure_request_id()},
+            source="http",
+            request_id=self._ensure_request_id(),
+        )
+        self.bus.push(transition_event)
+        actions = self.control.consume(transition_event)
+        for action in actions:
+            self.bus.push(Event(type=action.type, payload=action.payload, source="control", request_id=self._ensure_request_id()))
+            if action.type == "ProductProposalStatusChanged":
+                return self._send_success(200, action.payload["proposal"])
+
+        return self._send_error(404, ErrorType.NOT_FOUND, "proposal_not_found", "proposal_not_found")
+
+    def _post_event(self, data):
+        ev_type = data.get("type")
+        payload = data.get("payload", {})
+        source = data.get("source", "openclaw")
+
+        if not ev_type:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_type", "missing_type")
+        if str(ev_type) not in _ALLOWED_EVENT_TYPES:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "unsupported_event_type", "unsupported_event_type")
+
+        self.bus.push(make_event(ev_type, {**payload, "request_id": self._ensure_request_id(), "trace_id": self._ensure_trace_id()}, source=source, request_id=self._ensure_request_id(), trace_id=self._ensure_trace_id()))
+        return self._send_success(200, {"status": "ok"})
+
+    def _post_scan_infoproduct(self, data):
+        self.bus.push(
+            Event(
+                type="RunInfoproductScan",
+                payload={"request_id": self._ensure_request_id()},
+                source="http",
+                request_id=self._ensure_request_id(),
+                trace_id=self._ensure_trace_id(),
+            )
+        )
+        return self._send_success(200, {"status": "ok"})
+
+    def _post_product_plans_build(self, data):
+        proposal_id = str(data.get("proposal_id", "")).strip()
+        if not proposal_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_proposal_id", "missing_proposal_id")
+        self.bus.push(
+            Event(
+                type="BuildProductPlanRequested",
+                payload={"proposal_id": proposal_id, "request_id": self._ensure_request_id()},
+                source="http",
+                request_id=self._ensure_request_id(),
+                trace_id=self._ensure_trace_id(),
+            )
+        )
+        return self._send_success(200, {"status": "ok"})
+
+    def _post_product_proposals_execute(self, data):
+        proposal_id = str(data.get("id", "")).strip()
+        if not proposal_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+        if self.control is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
+
+        execute_event = Event(
+            type="ExecuteProductPlanRequested",
+            payload={"proposal_id": proposal_id, "request_id": self._ensure_request_id()},
+            source="http",
+            request_id=self._ensure_request_id(),
+        )
+        self.bus.push(execute_event)
+        actions = self.control.consume(execute_event)
+        for action in actions:
+            self.bus.push(Event(type=action.type, payload=action.payload, source="control", request_id=self._ensure_request_id()))
+            if action.type == "ProductPlanExecuted":
+                return self._send_success(200, action.payload["execution_package"])
+
+        return self._send_error(404, ErrorType.NOT_FOUND, "proposal_not_found", "proposal_not_found")
+
+    def _post_conversation_message(self, data):
+        if self.conversation_core is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "conversation_core_unavailable", "conversation_core_unavailable")
+        text = str(data.get("text", "")).strip()
+        source = str(data.get("source", "ui")).strip() or "ui"
+        if not text:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_text", "missing_text")
+        logger.info("request_id=%s conversation_message_received source=%s text=%s", self._ensure_request_id(), source, text[:200])
+        try:
+            reply_text = self.conversation_core.reply(text, source=source)
+        except Exception as exc:
+            logger.exception("request_id=%s conversation_message_failed", self._ensure_request_id(), exc_info=exc)
+            return self._send_error(500, ErrorType.SERVER_ERROR, "conversation_failed", "conversation_failed")
+        logger.info("request_id=%s conversation_message_replied reply=%s", self._ensure_request_id(), str(reply_text)[:200])
+        return self._send_success(200, {"reply_text": reply_text})
+
+    def _post_autonomy_override(self, data):
+        if self.autonomy_policy_engine is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "autonomy_policy_engine_unavailable", "autonomy_policy_engine_unavailable")
+        requested_mode = str(data.get("mode", "")).strip().lower()
+        if requested_mode not in {"manual", "partial", "disabled"}:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_mode", "invalid_mode")
+        effective_mode = self.autonomy_policy_engine.set_runtime_mode_override(requested_mode)
+        return self._send_success(200, {"mode": effective_mode, "status": self.autonomy_policy_engine.status()})
+
+    def _post_voice_tts(self, data):
+        text = str(data.get("text", "")).strip()
+        if not text:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_text", "missing_text")
+
+        api_key = os.getenv("OPENAI_API_KEY", "").strip()
+        if not api_key or OpenAI is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "gpt_not_configured", "gpt_not_configured")
+
+        client = OpenAI()
+        response = client.audio.speech.create(
+            model="gpt-4o-mini-tts",
+            voice="sol",
+            input=text,
+        )
+        return self._send_bytes(200, response.read(), "audio/mpeg")
+
+    def _post_launch_add_sale(self, data, launch_id: str):
+        if self.product_launch_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+        launch_id = str(launch_id).strip()
+        if not launch_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+        amount = float(data.get("amount", 0))
+        updated = self.product_launch_store.add_sale(launch_id, amount)
+        return self._send(200, updated)
+
+    def _post_launch_status(self, data, launch_id: str):
+        if self.product_launch_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+        launch_id = str(launch_id).strip()
+        if not launch_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+        status = str(data.get("status", "")).strip()
+        updated = self.product_launch_store.transition_status(launch_id, status)
+        return self._send(200, updated)
+
+    def _post_launch_link_gumroad(self, data, launch_id: str):
+        if self.control is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
+        launch_id = str(launch_id).strip()
+        if not launch_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+        gumroad_product_id = str(data.get("gumroad_product_id", "")).strip()
+        if not gumroad_product_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_gumroad_product_id", "missing_gumroad_product_id")
+        updated = self.control.link_launch_gumroad(launch_id, gumroad_product_id)
+        return self._send(200, updated)
+
+    def _post_gumroad_sync_sales(self, data):
+        if self.product_launch_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "product_launch_store_unavailable", "product_launch_store_unavailable")
+        access_token = load_token()
+        if not access_token:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "gumroad_not_connected", "Gumroad not connected. Visit /gumroad/auth first.")
+        gumroad_client = GumroadClient(access_token)
+        service = GumroadSyncService(
+            self.product_launch_store,
+            gumroad_client,
+            self.revenue_attribution_store,
+        )
+        ok, summary = self._run_with_timeout("gumroad_sync", self._locked(service.sync_sales, ("launches", "")))
+        if not ok:
+            return self._send_timeout_error("gumroad_sync")
+        return self._send(200, summary)
+
+    def _post_creator_offers_generate(self, data):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        suggestion_id = str(data.get("suggestion_id", "")).strip()
+        if not suggestion_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_suggestion_id", "missing_suggestion_id")
+        service = CreatorOfferService(storage=self.server.storage)
+        try:
+            draft = service.generate_offer_draft(suggestion_id=suggestion_id)
+        except ValueError as exc:
+            if str(exc) == "suggestion_not_found":
+                return self._send_error(404, ErrorType.NOT_FOUND, "suggestion_not_found", "suggestion_not_found")
+            raise
+        return self._send_success(200, draft)
+
+    def _post_creator_launches_register(self, data):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        offer_id = str(data.get("offer_id", "")).strip()
+        if not offer_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_offer_id", "missing_offer_id")
+        try:
+            price = float(data.get("price"))
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_price", "invalid_price")
+        notes = str(data.get("notes", ""))
+        tracker = CreatorLaunchTracker(storage=self.server.storage)
+        try:
+            launch = tracker.register_launch(offer_id=offer_id, price=price, notes=notes)
+        except ValueError as exc:
+            if str(exc) == "offer_not_found":
+                return self._send_error(404, ErrorType.NOT_FOUND, "offer_not_found", "offer_not_found")
+            raise
+        return self._send_success(200, launch)
+
+    def _post_creator_launch_sale(self, data, launch_id: str):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        launch_id = launch_id.strip()
+        if not launch_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_launch_id", "missing_launch_id")
+        try:
+            quantity = int(data.get("quantity", 1))
+        except (TypeError, ValueError):
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_quantity", "invalid_quantity")
+        tracker = CreatorLaunchTracker(storage=self.server.storage)
+        try:
+            launch = tracker.record_sale(launch_id=launch_id, quantity=quantity)
+        except ValueError as exc:
+            if str(exc) == "launch_not_found":
+                return self._send_error(404, ErrorType.NOT_FOUND, "launch_not_found", "launch_not_found")
+            if str(exc) == "invalid_quantity":
+                return self._send_error(400, ErrorType.CLIENT_ERROR, "invalid_quantity", "invalid_quantity")
+            raise
+        return self._send_success(200, launch)
+
+    def _post_creator_demand_validate(self, data):
+        if self.server.storage is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "storage_unavailable", "storage_unavailable")
+        validator = CreatorDemandValidator(storage=self.server.storage)
+        items = validator.validate()
+        return self._send_success(200, {"items": items})
+
+    def _post_reddit_config(self, data):
+        editable_fields = {
+            "subreddits",
+            "pain_threshold",
+            "pain_keywords",
+            "commercial_keywords",
+            "enable_engagement_boost",
+            "source",
+        }
+        payload = {key: value for key, value in data.items() if key in editable_fields}
+        if "subreddits" in payload:
+            raw_subreddits = payload["subreddits"]
+            if isinstance(raw_subreddits, str):
+                raw_subreddits = raw_subreddits.split(",")
+            payload["subreddits"] = [str(item).strip() for item in raw_subreddits if str(item).strip()]
+        if "pain_threshold" in payload:
+            payload["pain_threshold"] = int(payload["pain_threshold"])
+        if "pain_keywords" in payload:
+            raw_pain_keywords = payload["pain_keywords"]
+            if isinstance(raw_pain_keywords, str):
+                raw_pain_keywords = raw_pain_keywords.split(",")
+            payload["pain_keywords"] = [str(item).strip().lower() for item in raw_pain_keywords if str(item).strip()]
+        if "commercial_keywords" in payload:
+            raw_commercial_keywords = payload["commercial_keywords"]
+            if isinstance(raw_commercial_keywords, str):
+                raw_commercial_keywords = raw_commercial_keywords.split(",")
+            payload["commercial_keywords"] = [str(item).strip().lower() for item in raw_commercial_keywords if str(item).strip()]
+        if "enable_engagement_boost" in payload:
+            payload["enable_engagement_boost"] = bool(payload["enable_engagement_boost"])
+        if "source" in payload:
+            source_value = str(payload["source"]).strip().lower()
+            if source_value not in {"reddit_public", "openclaw"}:
+                return self._send_error(
+                    400,
+                    ErrorType.CLIENT_ERROR,
+                    "invalid_source",
+                    "source must be one of: reddit_public, openclaw",
+                )
+            payload["source"] = source_value
+        updated = update_config(payload)
+        return self._send_success(200, updated)
+
+    def _post_reddit_run_scan(self, data):
+        if self.control is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "control_unavailable", "control_unavailable")
+        ok, result = self._run_with_timeout("reddit_scan", self.control.run_reddit_scan)
+        if not ok:
+            return self._send_timeout_error("reddit_scan")
+        return self._send_success(200, result)
+
+    def _post_reddit_mark_posted(self, data):
+        if self.reddit_post_store is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "reddit_post_store_unavailable", "reddit_post_store_unavailable")
+        proposal_id = str(data.get("proposal_id", "")).strip()
+        subreddit = str(data.get("subreddit", "")).strip()
+        post_url = str(data.get("post_url", "")).strip()
+        post_id = str(data.get("post_id", "")).strip()
+        if not post_id and post_url:
+            path_parts = [part for part in urlparse(post_url).path.split("/") if part]
+            if "comments" in path_parts:
+                comments_index = path_parts.index("comments")
+                if comments_index + 1 < len(path_parts):
+                    post_id = str(path_parts[comments_index + 1]).strip()
+        if not proposal_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_proposal_id", "missing_proposal_id")
+        if not subreddit:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_subreddit", "missing_subreddit")
+        if not post_url:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_post_url", "missing_post_url")
+
+        product_name = ""
+        if self.product_proposal_store is not None:
+            proposal = self.product_proposal_store.get(proposal_id)
+            if proposal:
+                product_name = str(proposal.get("product_name", "")).strip()
+
+        upvotes = data.get("upvotes", 0)
+        comments = data.get("comments", 0)
+        try:
+            upvotes = int(upvotes)
+        except (TypeError, ValueError):
+            upvotes = 0
+        try:
+            comments = int(comments)
+        except (TypeError, ValueError):
+            comments = 0
+
+        entry = {
+            "id": f"reddit_post_{int(time.time() * 1000)}",
+            "post_id": post_id,
+            "proposal_id": proposal_id,
+            "product_name": product_name,
+            "subreddit": subreddit,
+            "post_url": post_url,
+            "upvotes": upvotes,
+            "comments": comments,
+            "status": "open",
+            "date": time.strftime("%Y-%m-%d"),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        return self._send_success(200, {"item": self.reddit_post_store.add(entry)})
+
+    def _post_strategy_execute_action(self, data, action_id: str):
+        if self.strategy_action_execution_layer is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
+        action_id = str(action_id).strip()
+        if not action_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+        updated = self.strategy_action_execution_layer.execute_action(action_id)
+        return self._send(200, updated)
+
+    def _post_strategy_reject_action(self, data, action_id: str):
+        if self.strategy_action_execution_layer is None:
+            return self._send_error(503, ErrorType.DEPENDENCY_ERROR, "strategy_action_execution_layer_unavailable", "strategy_action_execution_layer_unavailable")
+        action_id = str(action_id).strip()
+        if not action_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+        updated = self.strategy_action_execution_layer.reject_action(action_id)
+        return self._send(200, updated)
+
+    def _post_opportunities_evaluate(self, data):
+        event_id = str(data.get("id", "")).strip()
+        if not event_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+
+        self.bus.push(
+            Event(
+                type="EvaluateOpportunityById",
+                payload={"id": event_id, "request_id": self._ensure_request_id()},
+                source="http",
+                request_id=self._ensure_request_id(),
+                trace_id=self._ensure_trace_id(),
+            )
+        )
+        return self._send_success(200, {"status": "ok"})
+
+    def _post_opportunities_dismiss(self, data):
+        event_id = str(data.get("id", "")).strip()
+        if not event_id:
+            return self._send_error(400, ErrorType.CLIENT_ERROR, "missing_id", "missing_id")
+
+        self.bus.push(
+            Event(
+                type="OpportunityDismissed",
+                payload={"id": event_id, "request_id": self._ensure_request_id()},
+                source="http",
+                request_id=self._ensure_request_id(),
+                trace_id=self._ensure_trace_id(),
+            )
+        )
+        return self._send_success(200, {"status": "ok"})
+
+    def _post_reddit_signals(self, data):
+        code, body = self.reddit_router.handle_post("/reddit/signals", data)
+        return self._send(code, body)
+
     def do_PATCH(self):
         try:
             self._ensure_request_id()
-            if not self._check_auth_or_401("PATCH", self.path):
+            parsed = urlparse(self.path)
+            match = _ROUTES.match("PATCH", parsed.path)
+            if match is None:
+                self._discard_request_body()
+                return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
+
+            if not self._check_auth_or_401("PATCH", parsed.path):
                 return
 
             data, body_error = self._read_json_body()
@@ -1538,17 +1823,143 @@ class Handler(BaseHTTPRequestHandler):
                 status_code, error_type, code, message = body_error
                 return self._send_error(status_code, error_type, code, message)
 
-            with self.server.mutation_lock:
+            route, params = match
+            with self.server.mutation_locks.hold(*self._route_lock_keys(route, params, data)):
                 self.server.update_metrics(last_mutation_at=time.time())
-                patch_response = self.reddit_router.handle_patch(self.path, data)
-                if patch_response is None:
-                    return self._send_error(404, ErrorType.NOT_FOUND, "not_found", "not_found")
-
-                code, body = patch_response
-                return self._send(code, body)
+                getattr(self, route.handler)(parsed, data, **route.defaults, **params)
+            self._notify_mutation(route)
         except Exception as e:
             return self._handle_exception(e)
 
+    def _patch_reddit_signal(self, parsed, data, signal_id: str):
+        code, body = self.reddit_router.handle_patch(parsed.path, data)
+        return self._send(code, body)
+
+
+def _versions(*stores) -> tuple | None:
+    versions = tuple(store_version(store) for store in stores)
+    return None if None in versions else versions
+
+
+# Inputs a cached GET response can depend on (``Route.cache``). Each returns a
+# value that changes whenever the input does, or ``None`` when the input is
+# missing or unversioned, which bypasses the cache.
+_CACHE_INPUTS = {
+    "launches": lambda server: store_version(server.product_launch_store),
+    "revenue": lambda server: store_version(server.revenue_attribution_store),
+    "subreddit_performance": lambda server: store_version(server.subreddit_performance_store),
+    "storage": lambda server: store_version(server.storage),
+    "control_revenue": lambda server: None if server.control is None else _versions(
+        getattr(server.control, "subreddit_performance_store", None),
+        getattr(server.control, "revenue_attribution_store", None),
+    ),
+    # Recommendations count days since launch.
+    "utc_day": lambda server: datetime.now(timezone.utc).date().isoformat(),
+}
+
+
+# Route table. Handlers are ``Handler`` method names: GET handlers take the
+# parsed URL, POST handlers the JSON body, PATCH handlers both; path parameters
+# and ``defaults`` follow as keyword arguments. ``lock`` names the keyed
+# mutation lock (see ``core.http.locks.HTTP_LOCK_ORDER``). Every route that
+# ends in ``Control.consume`` on proposals takes the whole ``proposals``
+# resource, since their integrity checks read across proposals.
+# ``/gumroad/sync_sales`` takes the launches resource inside the pooled run
+# (``Handler._locked``), so concurrent callers still join the in-flight run and
+# the lock lasts as long as the run, not the request. ``/reddit/run_scan`` takes
+# no lock: ``RedditPostStore`` dedupes by ``post_id`` on its own, so a slow scan
+# never holds up ``/reddit/mark_posted``. Mutations that only enqueue other bus
+# events (such as ``/opportunities/evaluate`` and ``/opportunities/dismiss``) or
+# touch no shared state take none. ``topic`` publishes a ``/stream``
+# notification for state that no store change feed covers. Paths that match no
+# route fall back to static UI files on GET.
+_ROUTES = RouteTable()
+_ROUTES.add("GET", "/state", "_get_state")
+_ROUTES.add("GET", "/events", "_get_events")
+_ROUTES.add("GET", "/memory", "_get_memory")
+_ROUTES.add("GET", "/product_proposals", "_get_product_proposals")
+_ROUTES.add("GET", "/product_proposals/{proposal_id}", "_get_product_proposals_item")
+_ROUTES.add("GET", "/product_launches", "_get_product_launches")
+_ROUTES.add("GET", "/performance/summary", "_get_performance_summary", cache=("launches",))
+_ROUTES.add("GET", "/revenue/summary", "_get_revenue_summary", cache=("revenue",))
+_ROUTES.add("GET", "/revenue/subreddits", "_get_revenue_subreddits", cache=("subreddit_performance", "revenue"))
+_ROUTES.add("GET", "/revenue/roi", "_get_revenue_roi", cache=("subreddit_performance", "revenue"))
+_ROUTES.add("GET", "/revenue/dominant", "_get_revenue_dominant", cache=("control_revenue",))
+_ROUTES.add("GET", "/metrics/strategic/summary", "_get_metrics_strategic_summary", cache=("storage",))
+_ROUTES.add("GET", "/strategy/recommendations", "_get_strategy_recommendations", cache=("launches", "utc_day"))
+_ROUTES.add("GET", "/strategy/decide", "_get_strategy_decide")
+_ROUTES.add("GET", "/debug/events/recent", "_get_debug_events_recent")
+_ROUTES.add("GET", "/system/decision_logs", "_get_decision_logs")
+_ROUTES.add("GET", "/decision-logs", "_get_decision_logs")
+_ROUTES.add("GET", "/decision-logs/entity", "_get_decision_logs_entity")
+_ROUTES.add("GET", "/action-executions", "_get_action_executions")
+_ROUTES.add("GET", "/action-executions/{action_id}", "_get_action_executions_item")
+_ROUTES.add("GET", "/strategy/pending_actions", "_get_strategy_pending_actions")
+_ROUTES.add("GET", "/strategy/actions", "_get_strategy_actions")
+_ROUTES.add("GET", "/autonomy/status", "_get_autonomy_status")
+_ROUTES.add("GET", "/autonomy/adaptive_status", "_get_autonomy_adaptive_status")
+# Not cached: every response carries its own ``timestamp``, and the engine
+# already recomputes the phase only after a store change.
+_ROUTES.add("GET", "/daily_loop/status", "_get_daily_loop_status")
+_ROUTES.add("GET", "/health/live", "_get_health_live")
+_ROUTES.add("GET", "/health", "_get_health")
+_ROUTES.add("GET", "/health/ready", "_get_health_ready")
+_ROUTES.add("GET", "/ready", "_get_ready")
+_ROUTES.add("GET", "/system/integrity", "_get_system_integrity")
+_ROUTES.add("GET", "/product_launches/{launch_id}", "_get_product_launches_item")
+_ROUTES.add("GET", "/product_plans", "_get_product_plans")
+_ROUTES.add("GET", "/product_plans/{plan_id}", "_get_product_plans_item")
+_ROUTES.add("GET", "/opportunities", "_get_opportunities")
+_ROUTES.add("GET", "/gumroad/auth", "_get_gumroad_auth")
+_ROUTES.add("GET", "/gumroad/callback", "_get_gumroad_callback")
+_ROUTES.add("GET", "/creator/pains", "_get_creator_pains")
+_ROUTES.add("GET", "/creator/product_suggestions", "_get_creator_product_suggestions")
+_ROUTES.add("GET", "/creator/offers", "_get_creator_offers")
+_ROUTES.add("GET", "/creator/offers/{offer_id}", "_get_creator_offers_item")
+_ROUTES.add("GET", "/creator/launches", "_get_creator_launches")
+_ROUTES.add("GET", "/creator/launches/summary", "_get_creator_launches_summary")
+_ROUTES.add("GET", "/creator/demand", "_get_creator_demand")
+_ROUTES.add("GET", "/reddit/config", "_get_reddit_config")
+_ROUTES.add("GET", "/reddit/last_scan", "_get_reddit_last_scan")
+_ROUTES.add("GET", "/reddit/posts", "_get_reddit_posts")
+_ROUTES.add("GET", "/reddit/signals", "_get_reddit_intelligence")
+_ROUTES.add("GET", "/reddit/daily_actions", "_get_reddit_intelligence")
+_ROUTES.add("GET", "/reddit/today_plan", "_get_reddit_intelligence")
+_ROUTES.add("GET", "/stream", "_get_stream")
+
+_ROUTES.add("POST", "/product_proposals/{proposal_id}/approve", "_post_proposal_transition", lock=("proposals", None), event_type="ApproveProposal")
+_ROUTES.add("POST", "/product_proposals/{proposal_id}/reject", "_post_proposal_transition", lock=("proposals", None), event_type="RejectProposal")
+_ROUTES.add("POST", "/product_proposals/{proposal_id}/start_build", "_post_proposal_transition", lock=("proposals", None), event_type="StartBuildingProposal")
+_ROUTES.add("POST", "/product_proposals/{proposal_id}/ready", "_post_proposal_transition", lock=("proposals", None), event_type="MarkReadyToLaunch")
+_ROUTES.add("POST", "/product_proposals/{proposal_id}/launch", "_post_proposal_transition", lock=("proposals", None), event_type="MarkProposalLaunched")
+_ROUTES.add("POST", "/product_proposals/{proposal_id}/archive", "_post_proposal_transition", lock=("proposals", None), event_type="ArchiveProposal")
+_ROUTES.add("POST", "/event", "_post_event")
+_ROUTES.add("POST", "/scan/infoproduct", "_post_scan_infoproduct")
+_ROUTES.add("POST", "/product_plans/build", "_post_product_plans_build")
+_ROUTES.add("POST", "/product_proposals/execute", "_post_product_proposals_execute", lock=("proposals", None))
+_ROUTES.add("POST", "/conversation/message", "_post_conversation_message", lock=("conversation", None), topic="conversation")
+_ROUTES.add("POST", "/autonomy/override", "_post_autonomy_override", lock=("autonomy", None), topic="autonomy")
+_ROUTES.add("POST", "/voice/tts", "_post_voice_tts")
+_ROUTES.add("POST", "/product_launches/{launch_id}/add_sale", "_post_launch_add_sale", lock=("launches", "launch_id"))
+_ROUTES.add("POST", "/product_launches/{launch_id}/status", "_post_launch_status", lock=("launches", "launch_id"))
+_ROUTES.add("POST", "/product_launches/{launch_id}/link_gumroad", "_post_launch_link_gumroad", lock=("launches", "launch_id"))
+_ROUTES.add("POST", "/gumroad/sync_sales", "_post_gumroad_sync_sales", topic="revenue")
+_ROUTES.add("POST", "/creator/offers/generate", "_post_creator_offers_generate", lock=("creator", None), topic="creator")
+_ROUTES.add("POST", "/creator/launches/register", "_post_creator_launches_register", lock=("creator", None), topic="creator")
+_ROUTES.add("POST", "/creator/launches/{launch_id}/sale", "_post_creator_launch_sale", lock=("creator", None), topic="creator")
+_ROUTES.add("POST", "/creator/demand/validate", "_post_creator_demand_validate", lock=("creator", None), topic="creator")
+_ROUTES.add("POST", "/reddit/config", "_post_reddit_config", lock=("reddit_config", None), topic="reddit_config")
+_ROUTES.add("POST", "/reddit/run_scan", "_post_reddit_run_scan", topic="reddit_scan")
+_ROUTES.add("POST", "/reddit/mark_posted", "_post_reddit_mark_posted", lock=("reddit_posts", None))
+_ROUTES.add("POST", "/strategy/execute_action/{action_id}", "_post_strategy_execute_action", lock=("strategy_actions", "action_id"), topic="strategy_actions")
+_ROUTES.add("POST", "/strategy/reject_action/{action_id}", "_post_strategy_reject_action", lock=("strategy_actions", "action_id"), topic="strategy_actions")
+_ROUTES.add("POST", "/opportunities/evaluate", "_post_opportunities_evaluate")
+_ROUTES.add("POST", "/opportunities/dismiss", "_post_opportunities_dismiss")
+_ROUTES.add("POST", "/reddit/signals", "_post_reddit_signals", lock=("reddit_signals", None), topic="reddit_signals")
+
+_ROUTES.add("PATCH", "/reddit/signals/{signal_id}/status", "_patch_reddit_signal", lock=("reddit_signals", "signal_id"), topic="reddit_signals")
+_ROUTES.add("PATCH", "/reddit/signals/{signal_id}/feedback", "_patch_reddit_signal", lock=("reddit_signals", "signal_id"), topic="reddit_signals")
+
 
 def start_http_server(
     host="0.0.0.0",
@@ -1573,6 +1984,7 @@ def start_http_server(
     subreddit_performance_store: SubredditPerformanceStore | None = None,
     storage=None,
     action_execution_store=None,
+    reddit_post_store=None,
 ):
     _bootstrap_ci_auth_defaults()
     # Thread daemon: se muere si se muere el proceso principal (bien para dev)
@@ -1600,6 +2012,7 @@ def start_http_server(
         subreddit_performance_store=subreddit_performance_store,
         storage=storage,
         action_execution_store=action_execution_store,
+        reddit_post_store=reddit_post_store,
         reddit_router=RedditIntelligenceRouter(),
     )
     t = threading.Thread(target=server.serve_forever, daemon=True)
@@ -1,29 +1,61 @@
 from __future__ import annotations
 
+from collections import deque
 from copy import deepcopy
 from datetime import datetime, timezone
+import json
 import os
 from pathlib import Path
-import re
 import sqlite3
+import threading
 from typing import Any, Dict, List
 
+from core.persistence.chat_messages import ensure_chat_messages_table
 from core.persistence.json_io import atomic_read_json, atomic_write_json
+from core.persistence.text_index import create_text_index
 
 
 class MemoryStore:
+    """Profile and chat history, with a full-text index over the history.
+
+    The profile lives in the JSON file; chat messages are rows in the
+    ``chat_messages`` SQLite table, so an append is one INSERT (plus a range
+    DELETE once the history is over its limit) instead of a rewrite of the
+    whole history. The last ``history_limit`` messages are mirrored in memory
+    together with a search index (FTS5, or a pure-Python inverted index when
+    FTS5 is missing), so ranked search cost tracks the number of matches
+    rather than the history length. History left in the JSON file by older
+    versions is imported once. Without SQLite the history stays in the JSON
+    file.
+    """
+
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "memory_store.json"
+    _DEFAULT_HISTORY_LIMIT = 2000
 
-    def __init__(self, path: Path | None = None):
+    def __init__(self, path: Path | None = None, history_limit: int | None = None):
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "memory_store.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._state: Dict[str, Any] = self._load()
+        if history_limit is None:
+            history_limit = int(os.getenv("TRETA_CHAT_HISTORY_LIMIT", self._DEFAULT_HISTORY_LIMIT))
+        self._history_limit = max(1, int(history_limit))
+        self._lock = threading.RLock()
+        self._index = create_text_index()
+        self._doc_ids: deque[int] = deque()
+        self._row_ids: deque[int] = deque()
+        self._next_doc_id = 1
         self._conn: sqlite3.Connection | None = None
-        self._init_snapshot_db(data_dir)
+        self._init_db(self._resolve_db_path(data_dir=data_dir, json_path=self._path))
+        self._state: Dict[str, Any] = self._load()
+        self._rebuild_index()
 
-    def _init_snapshot_db(self, data_dir: Path) -> None:
-        db_path = data_dir / "memory" / "treta.sqlite"
+    def _resolve_db_path(self, *, data_dir: Path, json_path: Path) -> Path:
+        if json_path.is_absolute():
+            return json_path.parent / "memory" / "treta.sqlite"
+        return data_dir / "memory" / "treta.sqlite"
+
+    def _init_db(self, db_path: Path) -> None:
         try:
             db_path.parent.mkdir(parents=True, exist_ok=True)
             self._conn = sqlite3.connect(db_path, check_same_thread=False)
@@ -37,6 +69,7 @@ class MemoryStore:
                 """
             )
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_strategic_snapshots_created_at ON strategic_snapshots(created_at)")
+            ensure_chat_messages_table(self._conn)
             self._conn.commit()
         except sqlite3.Error:
             self._conn = None
@@ -52,36 +85,125 @@ class MemoryStore:
         }
 
     def _load(self) -> Dict[str, Any]:
-        if not self._path.exists():
-            state = self._default_state()
-            self.save(state)
-            return state
+        existed = self._path.exists()
+        state = self._default_state()
+        file_history: List[Dict[str, Any]] = []
+        if existed:
+            loaded = atomic_read_json(self._path, {})
+            if isinstance(loaded, dict):
+                profile = loaded.get("profile", {})
+                if isinstance(profile, dict):
+                    state["profile"].update({k: v for k, v in profile.items() if isinstance(k, str)})
+                chat_history = loaded.get("chat_history", [])
+                if isinstance(chat_history, list):
+                    file_history = [dict(item) for item in chat_history if isinstance(item, dict)][-self._history_limit :]
 
-        loaded = atomic_read_json(self._path, self._default_state())
-        if not isinstance(loaded, dict):
-            return self._default_state()
+        if self._conn is None:
+            state["chat_history"] = file_history
+            if not existed:
+                self._write_file(state)
+            return state
 
-        state = self._default_state()
-        profile = loaded.get("profile", {})
-        if isinstance(profile, dict):
-            state["profile"].update({k: v for k, v in profile.items() if isinstance(k, str)})
-        chat_history = loaded.get("chat_history", [])
-        if isinstance(chat_history, list):
-            state["chat_history"] = [dict(item) for item in chat_history if isinstance(item, dict)][-20:]
+        with self._lock:
+            if file_history and self._conn.execute("SELECT 1 FROM chat_messages LIMIT 1").fetchone() is None:
+                with self._conn:
+                    self._insert_rows(file_history)
+            state["chat_history"] = self._load_rows()
+        if not existed or file_history:
+            # Create the file, or drop history that now lives in SQLite.
+            self._write_file(state)
         return state
 
+    def _load_rows(self) -> List[Dict[str, Any]]:
+        assert self._conn is not None
+        rows = self._conn.execute(
+            "SELECT id, payload_json FROM chat_messages ORDER BY id DESC LIMIT ?", (self._history_limit,)
+        ).fetchall()
+        rows.reverse()
+        self._row_ids = deque(int(row_id) for row_id, _ in rows)
+        return [json.loads(payload_json) for _, payload_json in rows]
+
+    def _insert_rows(self, messages: List[Dict[str, Any]]) -> List[int]:
+        assert self._conn is not None
+        row_ids: List[int] = []
+        for message in messages:
+            cursor = self._conn.execute(
+                "INSERT INTO chat_messages (role, ts, payload_json) VALUES (?, ?, ?)",
+                (
+                    str(message.get("role", "")),
+                    str(message.get("ts", "")),
+                    json.dumps(message, ensure_ascii=False, separators=(",", ":")),
+                ),
+            )
+            row_ids.append(int(cursor.lastrowid))
+        return row_ids
+
+    def _write_file(self, state: Dict[str, Any]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._conn is None:
+            atomic_write_json(self._path, state)
+            return
+        atomic_write_json(self._path, {key: value for key, value in state.items() if key != "chat_history"})
+
+    @staticmethod
+    def _message_fields(item: Any) -> tuple[str, str]:
+        if not isinstance(item, dict):
+            return "", ""
+        role = str(item.get("role", "")).strip()
+        content = str(item.get("text", item.get("content", ""))).strip()
+        return role, content
+
+    def _index_message(self, item: Dict[str, Any]) -> None:
+        doc_id = self._next_doc_id
+        self._next_doc_id += 1
+        self._doc_ids.append(doc_id)
+        role, content = self._message_fields(item)
+        if role and content:
+            self._index.add(doc_id, content)
+
+    def _rebuild_index(self) -> None:
+        with self._lock:
+            self._index.clear()
+            self._doc_ids.clear()
+            for item in self._state.get("chat_history", []):
+                self._index_message(item)
+
     def load(self) -> Dict[str, Any]:
-        self._state = self._load()
+        with self._lock:
+            self._state = self._load()
+            self._rebuild_index()
         return self.snapshot()
 
     def save(self, state: Dict[str, Any] | None = None) -> None:
-        if state is not None:
-            self._state = dict(state)
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(self._path, self._state)
+        """Write the profile; replacing ``state`` also replaces the stored chat history."""
+        with self._lock:
+            if state is not None:
+                self._state = dict(state)
+                history = [dict(item) for item in self._state.get("chat_history", []) if isinstance(item, dict)]
+                self._state["chat_history"] = history[-self._history_limit :]
+                if self._conn is not None:
+                    with self._conn:
+                        self._conn.execute("DELETE FROM chat_messages")
+                        self._row_ids = deque(self._insert_rows(self._state["chat_history"]))
+                self._rebuild_index()
+            self._write_file(self._state)
+
+    def snapshot(self, history_limit: int | None = None) -> Dict[str, Any]:
+        """Copy of the state; ``history_limit`` keeps only that many recent messages and copies just those."""
+        with self._lock:
+            if history_limit is None:
+                return deepcopy(self._state)
+            state = {key: deepcopy(value) for key, value in self._state.items() if key != "chat_history"}
+            state["chat_history"] = self.recent_messages(history_limit)
+            return state
 
-    def snapshot(self) -> Dict[str, Any]:
-        return deepcopy(self._state)
+    def recent_messages(self, limit: int) -> List[Dict[str, Any]]:
+        """Copy of the last ``limit`` chat messages, without copying the whole history."""
+        with self._lock:
+            history = self._state.get("chat_history", [])
+            if not isinstance(history, list) or limit <= 0:
+                return []
+            return deepcopy(history[-int(limit) :])
 
     def append_message(self, role: str, text: str, ts: str | None = None) -> Dict[str, Any]:
         message = {
@@ -89,10 +211,23 @@ class MemoryStore:
             "text": str(text),
             "ts": ts or datetime.now(timezone.utc).isoformat(),
         }
-        history: List[Dict[str, Any]] = self._state.setdefault("chat_history", [])
-        history.append(message)
-        self._state["chat_history"] = history[-20:]
-        self.save()
+        with self._lock:
+            history: List[Dict[str, Any]] = self._state.setdefault("chat_history", [])
+            history.append(message)
+            self._index_message(message)
+            overflow = len(history) - self._history_limit
+            if overflow > 0:
+                del history[:overflow]
+                for _ in range(overflow):
+                    self._index.remove(self._doc_ids.popleft())
+            if self._conn is None:
+                self._write_file(self._state)
+                return deepcopy(message)
+            evicted = [self._row_ids.popleft() for _ in range(max(0, overflow)) if self._row_ids]
+            with self._conn:
+                self._row_ids.extend(self._insert_rows([message]))
+                if evicted:
+                    self._conn.execute("DELETE FROM chat_messages WHERE id <= ?", (evicted[-1],))
         return deepcopy(message)
 
     def save_snapshot(self, snapshot_text: str, ts: str | None = None) -> None:
@@ -116,37 +251,22 @@ class MemoryStore:
         return str(row[0] or "")
 
     def search_chat_history(self, query: str, limit: int = 6) -> list[dict]:
-        normalized_query = str(query or "").strip().lower()
+        """BM25-ranked history matches for ``query``; ties favour the most recent message."""
         capped_limit = max(int(limit), 0)
-        if not normalized_query or capped_limit == 0:
-            return []
-
-        terms = [token for token in re.split(r"\s+", normalized_query) if token]
-        if not terms:
-            terms = [normalized_query]
-
-        history = self._state.get("chat_history", [])
-        if not isinstance(history, list):
+        if not str(query or "").strip() or capped_limit == 0:
             return []
 
-        ranked: list[tuple[int, int, dict]] = []
-        total = len(history)
-        for index, item in enumerate(history):
-            if not isinstance(item, dict):
-                continue
-            role = str(item.get("role", "")).strip()
-            content = str(item.get("text", item.get("content", ""))).strip()
-            if not role or not content:
-                continue
-
-            haystack = content.lower()
-            occurrences = sum(haystack.count(term) for term in terms)
-            if normalized_query not in haystack and occurrences == 0:
-                continue
-
-            score = occurrences + (1 if normalized_query in haystack else 0)
-            recency = index - total
-            ranked.append((score, recency, {"role": role, "content": content}))
-
-        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
-        return [payload for _, _, payload in ranked[:capped_limit]]
+        with self._lock:
+            history = self._state.get("chat_history", [])
+            if not isinstance(history, list) or not self._doc_ids:
+                return []
+            first_doc_id = self._doc_ids[0]
+            results: list[dict] = []
+            for doc_id, _score in self._index.search(query, capped_limit):
+                position = doc_id - first_doc_id
+                if not 0 <= position < len(history):
+                    continue
+                role, content = self._message_fields(history[position])
+                if role and content:
+                    results.append({"role": role, "content": content})
+            return results
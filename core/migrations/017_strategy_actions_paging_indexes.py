@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_actions_created_at ON strategy_actions(created_at, id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_strategy_actions_status_created_at ON strategy_actions(status, created_at, id)"
+    )
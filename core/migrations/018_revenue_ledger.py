@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import sqlite3
+
+from core.revenue_attribution.ledger import ensure_revenue_ledger_tables
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    ensure_revenue_ledger_tables(conn)
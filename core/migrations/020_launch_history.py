@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import sqlite3
+
+from core.persistence.launch_history import ensure_launch_history_tables
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    ensure_launch_history_tables(conn)
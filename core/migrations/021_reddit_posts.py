@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import sqlite3
+
+from core.persistence.reddit_posts import ensure_reddit_posts_table
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    ensure_reddit_posts_table(conn)
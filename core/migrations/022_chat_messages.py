@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import sqlite3
+
+from core.persistence.chat_messages import ensure_chat_messages_table
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    ensure_chat_messages_table(conn)
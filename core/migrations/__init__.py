@@ -70,6 +70,30 @@ migration_016_processed_decisions = _load_migration(
     "016_processed_decisions.py", "core.migrations.migration_016_processed_decisions"
 )
 
+migration_017_strategy_actions_paging_indexes = _load_migration(
+    "017_strategy_actions_paging_indexes.py", "core.migrations.migration_017_strategy_actions_paging_indexes"
+)
+
+migration_018_revenue_ledger = _load_migration(
+    "018_revenue_ledger.py", "core.migrations.migration_018_revenue_ledger"
+)
+
+migration_019_revenue_rollups = _load_migration(
+    "019_revenue_rollups.py", "core.migrations.migration_019_revenue_rollups"
+)
+
+migration_020_launch_history = _load_migration(
+    "020_launch_history.py", "core.migrations.migration_020_launch_history"
+)
+
+migration_021_reddit_posts = _load_migration(
+    "021_reddit_posts.py", "core.migrations.migration_021_reddit_posts"
+)
+
+migration_022_chat_messages = _load_migration(
+    "022_chat_messages.py", "core.migrations.migration_022_chat_messages"
+)
+
 __all__ = [
     "migration_001_base_schema",
     "migration_003_unify_reddit_db",
@@ -86,4 +110,10 @@ __all__ = [
     "migration_014_action_executions",
     "migration_015_adaptive_policy_state",
     "migration_016_processed_decisions",
+    "migration_017_strategy_actions_paging_indexes",
+    "migration_018_revenue_ledger",
+    "migration_019_revenue_rollups",
+    "migration_020_launch_history",
+    "migration_021_reddit_posts",
+    "migration_022_chat_messages",
 ]
@@ -19,6 +19,12 @@ from core.migrations import (
     migration_014_action_executions,
     migration_015_adaptive_policy_state,
     migration_016_processed_decisions,
+    migration_017_strategy_actions_paging_indexes,
+    migration_018_revenue_ledger,
+    migration_019_revenue_rollups,
+    migration_020_launch_history,
+    migration_021_reddit_posts,
+    migration_022_chat_messages,
 )
 
 
@@ -52,6 +58,12 @@ MIGRATIONS: list[tuple[int, callable]] = [
     (14, migration_014_action_executions.upgrade),
     (15, migration_015_adaptive_policy_state.upgrade),
     (16, migration_016_processed_decisions.upgrade),
+    (17, migration_017_strategy_actions_paging_indexes.upgrade),
+    (18, migration_018_revenue_ledger.upgrade),
+    (19, migration_019_revenue_rollups.upgrade),
+    (20, migration_020_launch_history.upgrade),
+    (21, migration_021_reddit_posts.upgrade),
+    (22, migration_022_chat_messages.upgrade),
 ]
 
 
@@ -8,7 +8,9 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List
 
-from core.persistence.json_io import atomic_read_json, atomic_write_json, quarantine_corrupt_file
+from core.persistence.json_io import SharedJsonFile, atomic_read_json, file_lock, quarantine_corrupt_file
+from core.persistence.pagination import clamp_limit, page_after
+from core.stores.change_feed import ChangeFeed, ChangeListener
 import uuid
 
 
@@ -18,15 +20,32 @@ logger = logging.getLogger(__name__)
 
 
 class OpportunityStore:
-    """In-memory bounded store for opportunities."""
+    """In-memory bounded store for opportunities.
+
+    Safe to share between processes: writes hold the file lock and first
+    reload anything another process saved (see ``SharedJsonFile``).
+    """
 
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "opportunities.json"
 
     def __init__(self, capacity: int = 50, path: Path | None = None):
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "opportunities.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._items: deque[Opportunity] = deque(self._load_items(), maxlen=capacity)
+        self._shared = SharedJsonFile(self._path)
+        with file_lock(self._path):
+            self._items: deque[Opportunity] = deque(self._load_items(), maxlen=capacity)
+            self._shared.mark_synced()
+        self._changes = ChangeFeed("opportunities")
+
+    @property
+    def version(self) -> int:
+        self._shared.refresh(self._reload)
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
 
     def _load_items(self) -> List[Opportunity]:
         if not self._path.exists():
@@ -37,9 +56,13 @@ class OpportunityStore:
             return []
         return [dict(item) for item in loaded if isinstance(item, dict)]
 
+    def _reload(self) -> None:
+        self._items = deque(self._load_items(), maxlen=self._items.maxlen)
+        self._changes.publish("reload")
+
     def _save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(self._path, list(self._items))
+        self._shared.write(list(self._items))
 
     def add(
         self,
@@ -61,35 +84,52 @@ class OpportunityStore:
             "decision": None,
             "status": "new",
         }
-        self._items.append(new_item)
-        self._save()
+        with self._shared.mutation(self._reload):
+            self._items.append(new_item)
+            self._save()
+            self._changes.publish("add", new_item["id"])
         return deepcopy(new_item)
 
     def list(self, status: str | None = None) -> List[Opportunity]:
+        self._shared.refresh(self._reload)
         items = list(self._items)
         if status is not None:
             items = [item for item in items if item.get("status") == status]
         return deepcopy(items)
 
+    def list_page(self, *, limit: int = 50, cursor: str | None = None, status: str | None = None) -> Dict[str, Any]:
+        """Newest-first opportunities after ``cursor`` plus the cursor for the next page."""
+        self._shared.refresh(self._reload)
+        items = reversed(self._items)
+        if status is not None:
+            items = (item for item in items if item.get("status") == status)
+        page = page_after(items, limit=clamp_limit(limit), cursor=cursor)
+        return {"items": deepcopy(page["items"]), "next_cursor": page["next_cursor"]}
+
     def get(self, item_id: str) -> Opportunity | None:
+        self._shared.refresh(self._reload)
         for item in self._items:
             if item.get("id") == item_id:
                 return deepcopy(item)
         return None
 
     def set_decision(self, item_id: str, decision: Dict[str, Any]) -> Opportunity | None:
-        for item in self._items:
-            if item.get("id") == item_id:
-                item["decision"] = dict(decision)
-                item["status"] = "evaluated"
-                self._save()
-                return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            for item in self._items:
+                if item.get("id") == item_id:
+                    item["decision"] = dict(decision)
+                    item["status"] = "evaluated"
+                    self._save()
+                    self._changes.publish("set_decision", item_id)
+                    return deepcopy(item)
         return None
 
     def set_status(self, item_id: str, status: str) -> Opportunity | None:
-        for item in self._items:
-            if item.get("id") == item_id:
-                item["status"] = status
-                self._save()
-                return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            for item in self._items:
+                if item.get("id") == item_id:
+                    item["status"] = status
+                    self._save()
+                    self._changes.publish("set_status", item_id)
+                    return deepcopy(item)
         return None
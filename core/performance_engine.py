@@ -4,6 +4,7 @@ from collections import defaultdict
 from typing import Any, Dict
 
 from core.product_launch_store import ProductLaunchStore
+from core.stores.change_feed import store_version
 
 
 class PerformanceEngine:
@@ -11,9 +12,29 @@ class PerformanceEngine:
 
     def __init__(self, product_launch_store: ProductLaunchStore):
         self._product_launch_store = product_launch_store
+        self._cached_launches: list[Dict[str, Any]] | None = None
+        self._cached_insights: Dict[str, Any] | None = None
+        self._cached_version: int | None = None
+
+    def _sync_cache(self) -> int | None:
+        # Read the version before the data: a concurrent write can only make
+        # the cached copy newer than its version, which forces a refresh.
+        version = store_version(self._product_launch_store)
+        if version is None or version != self._cached_version:
+            self._cached_launches = None
+            self._cached_insights = None
+            self._cached_version = version
+        return version
 
     def _launches(self) -> list[Dict[str, Any]]:
-        return self._product_launch_store.list()
+        version = self._sync_cache()
+        if version is None:
+            return self._product_launch_store.list()
+        launches = self._cached_launches
+        if launches is None:
+            launches = self._product_launch_store.list()
+            self._cached_launches = launches
+        return launches
 
     def total_revenue(self) -> float:
         return round(
@@ -54,6 +75,10 @@ class PerformanceEngine:
         return {name: round(amount, 2) for name, amount in totals.items()}
 
     def generate_insights(self) -> Dict[str, Any]:
+        version = self._sync_cache()
+        if version is not None and self._cached_insights is not None:
+            return dict(self._cached_insights)
+
         revenue_by_type = self.revenue_by_product_type()
         top_category = max(sorted(revenue_by_type), key=lambda name: revenue_by_type[name]) if revenue_by_type else None
         best_product = self.best_performing_product()
@@ -63,10 +88,13 @@ class PerformanceEngine:
             suffix = "s" if not top_category.endswith("s") else ""
             recommendation = f"Double down on creator-focused {top_category}{suffix} priced under $30."
 
-        return {
+        insights = {
             "total_revenue": self.total_revenue(),
             "total_sales": self.total_sales(),
             "best_product": best_product,
             "top_category": top_category,
             "recommendation": recommendation,
         }
+        if version is not None and version == self._cached_version:
+            self._cached_insights = insights
+        return dict(insights)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+def ensure_chat_messages_table(conn: sqlite3.Connection) -> None:
+    # Append-only chat history; ``id`` is the rowid, so eviction of the oldest
+    # rows is a range delete on the primary key.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS chat_messages (
+            id INTEGER PRIMARY KEY,
+            role TEXT NOT NULL,
+            ts TEXT NOT NULL DEFAULT '',
+            payload_json TEXT NOT NULL
+        )
+        """
+    )
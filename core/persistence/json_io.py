@@ -1,34 +1,239 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from core.errors import DependencyError
+from core.persistence.write_metrics import record_fsyncs, store_key, timed_write
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on this platform (e.g. Windows); locking degrades to in-process only.
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+FORMAT_PRETTY = "pretty"
+FORMAT_COMPACT = "compact"
+FORMAT_MSGPACK = "msgpack"
+PERSISTENCE_FORMATS = {FORMAT_PRETTY, FORMAT_COMPACT, FORMAT_MSGPACK}
+
+DURABILITY_STRICT = "strict"
+DURABILITY_BATCHED = "batched"
+DURABILITY_RELAXED = "relaxed"
+DURABILITY_POLICIES = {DURABILITY_STRICT, DURABILITY_BATCHED, DURABILITY_RELAXED}
+_DEFAULT_FSYNC_WINDOW_SECONDS = 0.2
+
+_pending_lock = threading.Lock()
+_pending_paths: set[Path] = set()
+_pending_timer: threading.Timer | None = None
+_batch_state = threading.local()
+_file_lock_state = threading.local()
+_process_file_locks: dict[Path, threading.RLock] = {}
+_process_file_locks_guard = threading.Lock()
+
+
+def resolve_persistence_format(path: Path) -> str:
+    """Pick the on-disk format for ``path``.
+
+    ``TRETA_PERSISTENCE_FORMAT_<STEM>`` (e.g. ``..._REVENUE_ATTRIBUTION``) wins
+    over the global ``TRETA_PERSISTENCE_FORMAT``; both default to ``pretty``.
+    msgpack silently degrades to compact JSON when the package is missing.
+    """
+    store_key = "TRETA_PERSISTENCE_FORMAT_" + path.name.split(".", 1)[0].upper()
+    raw = os.getenv(store_key) or os.getenv("TRETA_PERSISTENCE_FORMAT") or FORMAT_PRETTY
+    fmt = raw.strip().lower()
+    if fmt not in PERSISTENCE_FORMATS:
+        logger.warning("Unknown persistence format %r for %s; using %s", raw, path, FORMAT_PRETTY)
+        return FORMAT_PRETTY
+    if fmt == FORMAT_MSGPACK and msgpack is None:
+        return FORMAT_COMPACT
+    return fmt
+
+
+def encode_payload(data: Any, fmt: str) -> bytes:
+    if fmt == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise DependencyError("msgpack is not installed")
+        return msgpack.packb(data, use_bin_type=True)
+    if fmt == FORMAT_COMPACT:
+        return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def decode_payload(raw: bytes) -> Any:
+    # Every JSON document starts with an ASCII byte; msgpack maps/arrays start at 0x80+.
+    stripped = raw.lstrip()
+    if stripped and stripped[0] >= 0x80:
+        if msgpack is None:
+            raise DependencyError("msgpack is not installed; cannot read binary store")
+        return msgpack.unpackb(stripped, raw=False)
+    return json.loads(raw.decode("utf-8"))
+
+
+def resolve_durability() -> str:
+    """Durability policy from ``TRETA_PERSISTENCE_DURABILITY``.
+
+    - ``strict``: fsync the temp file before the rename and the directory after it.
+    - ``batched``: skip per-write fsyncs; touched files and their directories are
+      fsynced once per ``TRETA_PERSISTENCE_FSYNC_WINDOW_MS`` window or when
+      ``flush_pending_writes()`` runs.
+    - ``relaxed``: never fsync; rely on the OS page cache.
+    """
+    raw = os.getenv("TRETA_PERSISTENCE_DURABILITY") or DURABILITY_STRICT
+    policy = raw.strip().lower()
+    if policy not in DURABILITY_POLICIES:
+        logger.warning("Unknown durability policy %r; using %s", raw, DURABILITY_STRICT)
+        return DURABILITY_STRICT
+    return policy
+
+
+def _fsync_window_seconds() -> float:
+    raw = os.getenv("TRETA_PERSISTENCE_FSYNC_WINDOW_MS")
+    if not raw:
+        return _DEFAULT_FSYNC_WINDOW_SECONDS
+    try:
+        return max(0.0, float(raw) / 1000.0)
+    except ValueError:
+        return _DEFAULT_FSYNC_WINDOW_SECONDS
+
+
+def _fsync_file(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: Path) -> bool:
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        # Directories cannot be opened for fsync on every platform (e.g. Windows).
+        return False
+    try:
+        os.fsync(fd)
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    return True
+
+
+def _in_durability_batch() -> bool:
+    return getattr(_batch_state, "depth", 0) > 0
+
+
+def _schedule_group_fsync(path: Path) -> None:
+    global _pending_timer
+    with _pending_lock:
+        _pending_paths.add(path)
+        if _pending_timer is not None or _in_durability_batch():
+            return
+        timer = threading.Timer(_fsync_window_seconds(), flush_pending_writes)
+        timer.daemon = True
+        _pending_timer = timer
+        timer.start()
+
+
+def flush_pending_writes() -> int:
+    """fsync every file (and its directory) written under the batched policy; returns the file count."""
+    global _pending_timer
+    with _pending_lock:
+        paths = set(_pending_paths)
+        _pending_paths.clear()
+        if _pending_timer is not None:
+            _pending_timer.cancel()
+            _pending_timer = None
 
-def atomic_write_json(path: Path, data: Any) -> None:
+    # Directory fsyncs are charged to the first store synced in that directory.
+    directories: dict[Path, str] = {}
+    for path in paths:
+        try:
+            _fsync_file(path)
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            logger.warning("Deferred fsync failed for %s: %s", path, exc)
+            continue
+        record_fsyncs(store_key(path), 1)
+        directories.setdefault(path.parent, store_key(path))
+    for directory, key in directories.items():
+        if _fsync_directory(directory):
+            record_fsyncs(key, 1)
+    return len(paths)
+
+
+@contextmanager
+def durability_batch() -> Iterator[None]:
+    """Treat writes from this thread as ``batched`` and fsync them once on exit.
+
+    Used around logical operations (a Reddit scan, a Gumroad sync) that touch
+    several stores. Has no effect when the policy is ``relaxed``.
+    """
+    _batch_state.depth = getattr(_batch_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _batch_state.depth -= 1
+        if _batch_state.depth == 0:
+            flush_pending_writes()
+
+
+def atomic_write_json(path: Path, data: Any, *, fmt: str | None = None) -> None:
+    atomic_write_bytes(path, encode_payload(data, fmt or resolve_persistence_format(path)))
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Replace ``path`` with ``payload`` via temp file + rename under the active durability policy.
+
+    Each call is recorded in ``write_metrics`` under the file's store key.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    payload = json.dumps(data, ensure_ascii=False, indent=2)
+    durability = resolve_durability()
+    if durability == DURABILITY_STRICT and _in_durability_batch():
+        durability = DURABILITY_BATCHED
+
+    with timed_write(store_key(path)) as counters:
+        with tmp_path.open("wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            if durability == DURABILITY_STRICT:
+                os.fsync(handle.fileno())
+                counters["fsyncs"] += 1
 
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        handle.write(payload)
-        handle.write("\n")
-        handle.flush()
-        os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+        counters["bytes"] = len(payload)
 
-    os.replace(tmp_path, path)
+        if durability == DURABILITY_STRICT:
+            if _fsync_directory(path.parent):
+                counters["fsyncs"] += 1
+        elif durability == DURABILITY_BATCHED:
+            _schedule_group_fsync(path)
 
 
 def atomic_read_json(path: Path, default: Any, *, quarantine_corrupt: bool = True) -> Any:
     try:
-        raw = path.read_text(encoding="utf-8")
-        return json.loads(raw)
-    except (OSError, json.JSONDecodeError) as exc:
+        return decode_payload(path.read_bytes())
+    except DependencyError:
+        # The file is fine, we just cannot decode it here; never quarantine it.
+        raise
+    except (OSError, ValueError) as exc:
         if not quarantine_corrupt:
             raise
         quarantine_corrupt_file(path, exc)
@@ -55,3 +260,108 @@ def quarantine_corrupt_file(path: Path, reason: Exception) -> None:
         return
 
     logger.warning("Corrupt JSON store moved from %s to %s: %s", path, corrupt_path, reason)
+
+
+def file_signature(path: Path) -> tuple[int, int, int] | None:
+    """``(mtime_ns, size, inode)`` of ``path``, or ``None`` when it does not exist.
+
+    Every ``atomic_write_json`` renames a fresh file into place, so the inode
+    changes on each write even when the mtime resolution is too coarse to.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _process_lock_for(path: Path) -> threading.RLock:
+    with _process_file_locks_guard:
+        lock = _process_file_locks.get(path)
+        if lock is None:
+            lock = threading.RLock()
+            _process_file_locks[path] = lock
+        return lock
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Exclusive advisory lock for ``path``, held on a ``<name>.lock`` sidecar file.
+
+    Serialises writers across threads and, where ``fcntl`` exists, across every
+    process sharing the data directory. Re-entrant within a thread. When
+    several store files are locked together, take them in a fixed order; the
+    stores only ever nest launches -> proposals.
+    """
+    key = path.resolve()
+    held: dict[Path, list] = getattr(_file_lock_state, "held", None) or {}
+    _file_lock_state.held = held
+    entry = held.get(key)
+    if entry is not None:
+        entry[1] += 1
+        try:
+            yield
+        finally:
+            entry[1] -= 1
+        return
+
+    process_lock = _process_lock_for(key)
+    with process_lock:
+        handle = None
+        if fcntl is not None:
+            key.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(key.with_name(key.name + ".lock"), "a+b")
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        held[key] = [handle, 1]
+        try:
+            yield
+        finally:
+            del held[key]
+            if handle is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                handle.close()
+
+
+class SharedJsonFile:
+    """Keeps one process's in-memory copy of a JSON store in step with the file.
+
+    Mutations run inside ``mutation(reload)``: the file lock is taken, ``reload``
+    runs first if another process replaced the file since this one last read
+    or wrote it, and the caller then applies its change and saves under the
+    same lock, so no other writer's update is lost. Readers call
+    ``refresh(reload)``, which costs one ``stat`` when nothing changed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._signature: tuple[int, int, int] | None = None
+
+    def mark_synced(self) -> None:
+        self._signature = file_signature(self.path)
+
+    def is_stale(self) -> bool:
+        return file_signature(self.path) != self._signature
+
+    def refresh(self, reload: Callable[[], None]) -> bool:
+        if not self.is_stale():
+            return False
+        with file_lock(self.path):
+            if not self.is_stale():
+                return False
+            reload()
+            self.mark_synced()
+        return True
+
+    @contextmanager
+    def mutation(self, reload: Callable[[], None]) -> Iterator[None]:
+        with file_lock(self.path):
+            if self.is_stale():
+                reload()
+                self.mark_synced()
+            yield
+
+    def write(self, data: Any) -> None:
+        """``atomic_write_json`` under the file lock, remembering the result as in sync."""
+        with file_lock(self.path):
+            atomic_write_json(self.path, data)
+            self.mark_synced()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+def ensure_launch_history_tables(conn: sqlite3.Connection) -> None:
+    # Per-launch detail that only grows; ``seq`` is a per-launch counter so
+    # the primary key doubles as the newest-first paging index.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS launch_sales (
+            launch_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            amount REAL NOT NULL DEFAULT 0,
+            sold_at TEXT NOT NULL,
+            PRIMARY KEY (launch_id, seq)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS launch_metric_history (
+            launch_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            recorded_at TEXT NOT NULL,
+            event TEXT NOT NULL,
+            views INTEGER NOT NULL DEFAULT 0,
+            clicks INTEGER NOT NULL DEFAULT 0,
+            sales INTEGER NOT NULL DEFAULT 0,
+            revenue REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (launch_id, seq)
+        )
+        """
+    )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, Iterable, Mapping
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+
+def clamp_limit(limit: Any, default: int = DEFAULT_PAGE_LIMIT) -> int:
+    if limit is None or str(limit).strip() == "":
+        return default
+    return max(1, min(int(limit), MAX_PAGE_LIMIT))
+
+
+def encode_cursor(*parts: Any) -> str:
+    raw = json.dumps([str(part) for part in parts], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str | None, size: int) -> tuple[str, ...] | None:
+    text = str(cursor or "").strip()
+    if not text:
+        return None
+    padded = text + "=" * (-len(text) % 4)
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError):
+        raise ValueError("invalid_cursor") from None
+    if not isinstance(decoded, list) or len(decoded) != size:
+        raise ValueError("invalid_cursor")
+    return tuple(str(part) for part in decoded)
+
+
+def page_after(items: Iterable[Mapping[str, Any]], *, limit: int, cursor: str | None, key: str = "id") -> dict[str, Any]:
+    """One page of ``items`` (already in page order) following the item the cursor names.
+
+    For the bounded in-memory stores: the cursor holds the ``key`` of the last
+    item returned, so the walk stops after ``limit + 1`` items instead of
+    copying the collection. If that item has since been evicted the page is
+    empty, as eviction drops the oldest items first.
+    """
+    after = decode_cursor(cursor, 1)
+    remaining = iter(items)
+    if after is not None:
+        for item in remaining:
+            if str(item.get(key)) == after[0]:
+                break
+    page: list[Mapping[str, Any]] = []
+    for item in remaining:
+        page.append(item)
+        if len(page) > limit:
+            break
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(page[-1].get(key))
+    return {"items": page, "next_cursor": next_cursor}
+
+
+def parse_fields(raw: Any) -> tuple[str, ...] | None:
+    """``fields=id,status`` as a tuple of names; None when no projection was asked for."""
+    names = tuple(dict.fromkeys(name.strip() for name in str(raw or "").split(",") if name.strip()))
+    return names or None
+
+
+def project_fields(items: Iterable[Mapping[str, Any]], fields: tuple[str, ...] | None) -> list[Any]:
+    """``items`` reduced to the top-level ``fields`` each one has."""
+    if not fields:
+        return list(items)
+    return [{name: item[name] for name in fields if name in item} for item in items]
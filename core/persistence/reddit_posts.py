@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+def ensure_reddit_posts_table(conn: sqlite3.Connection) -> None:
+    # Append-only; ``seq`` is the rowid, so it orders pages and every
+    # secondary index below already ends in it. ``post_id`` is NULL when the
+    # Reddit id is unknown, which keeps UNIQUE from merging those rows.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS reddit_posts (
+            seq INTEGER PRIMARY KEY,
+            id TEXT NOT NULL,
+            post_id TEXT UNIQUE,
+            proposal_id TEXT NOT NULL DEFAULT '',
+            subreddit TEXT NOT NULL DEFAULT '',
+            created_at TEXT NOT NULL DEFAULT '',
+            payload_json TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_reddit_posts_proposal_id ON reddit_posts(proposal_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_reddit_posts_subreddit ON reddit_posts(subreddit)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_reddit_posts_created_at ON reddit_posts(created_at)")
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from contextlib import ExitStack
+from datetime import datetime, timezone
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+from core.persistence.json_io import atomic_write_bytes, durability_batch, file_lock
+
+
+SNAPSHOT_MANIFEST = "manifest.json"
+SNAPSHOT_FORMAT_VERSION = 1
+DB_RELATIVE_PATH = Path("memory") / "treta.sqlite"
+_SKIPPED_SUFFIXES = (".tmp", ".corrupt", ".lock")
+
+
+def _snapshot_files(root: Path) -> list[Path]:
+    """Plain data files under ``root``: everything but the SQLite database and write leftovers."""
+    files = []
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(root)
+        if relative.name == SNAPSHOT_MANIFEST or relative.name.endswith(_SKIPPED_SUFFIXES):
+            continue
+        # The database plus its -wal/-shm/-journal files go through the backup API.
+        if relative.parent == DB_RELATIVE_PATH.parent and relative.name.startswith(DB_RELATIVE_PATH.name):
+            continue
+        files.append(relative)
+    return files
+
+
+def _lock_store_files(stack: ExitStack, root: Path, files: list[Path]) -> None:
+    # Sorted paths take product_launches.json before product_proposals.json,
+    # the only order in which the stores nest these locks themselves.
+    for relative in sorted(files):
+        if relative.suffix == ".json":
+            stack.enter_context(file_lock(root / relative))
+
+
+def _remove_database(db_path: Path) -> None:
+    for path in db_path.parent.glob(db_path.name + "*"):
+        path.unlink()
+
+
+def _table_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    tables = [
+        str(row[0])
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+    ]
+    counts: dict[str, int] = {}
+    for table in tables:
+        try:
+            counts[table] = int(conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0])
+        except sqlite3.Error:
+            continue
+    return counts
+
+
+def export_snapshot(data_dir: Path, destination: Path) -> dict[str, Any]:
+    """Copy the data directory into ``destination`` and write a manifest last.
+
+    The SQLite database is copied with the online backup API, so it is a
+    consistent point-in-time image even while the server is writing. The
+    JSON store files are copied while holding every store's ``file_lock``,
+    so no store can save between the first file and the last.
+    """
+    data_dir = Path(data_dir)
+    destination = Path(destination)
+    destination.mkdir(parents=True, exist_ok=True)
+    if any(destination.iterdir()):
+        raise ValueError("snapshot_destination_not_empty")
+
+    manifest: dict[str, Any] = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "files": {},
+        "sqlite": None,
+    }
+
+    with ExitStack() as locks, durability_batch():
+        files = _snapshot_files(data_dir)
+        _lock_store_files(locks, data_dir, files)
+        db_path = data_dir / DB_RELATIVE_PATH
+        if db_path.exists():
+            target_db = destination / DB_RELATIVE_PATH
+            target_db.parent.mkdir(parents=True, exist_ok=True)
+            source = sqlite3.connect(f"file:{db_path.resolve()}?mode=ro", uri=True)
+            target = sqlite3.connect(target_db)
+            try:
+                source.backup(target)
+                manifest["sqlite"] = {"path": DB_RELATIVE_PATH.as_posix(), "tables": _table_counts(target)}
+            finally:
+                target.close()
+                source.close()
+
+        for relative in files:
+            payload = (data_dir / relative).read_bytes()
+            atomic_write_bytes(destination / relative, payload)
+            manifest["files"][relative.as_posix()] = {
+                "bytes": len(payload),
+                "sha256": hashlib.sha256(payload).hexdigest(),
+            }
+        atomic_write_bytes(
+            destination / SNAPSHOT_MANIFEST,
+            (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode("utf-8"),
+        )
+    return manifest
+
+
+def read_manifest(snapshot_dir: Path) -> dict[str, Any]:
+    manifest_path = Path(snapshot_dir) / SNAPSHOT_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ValueError("snapshot_manifest_missing") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError("snapshot_manifest_invalid") from exc
+    if not isinstance(manifest, dict) or manifest.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError("snapshot_format_unsupported")
+    return manifest
+
+
+def import_snapshot(snapshot_dir: Path, data_dir: Path) -> dict[str, Any]:
+    """Restore a snapshot written by ``export_snapshot`` into ``data_dir``.
+
+    Every file is checked against the manifest before anything is written.
+    Data files in ``data_dir`` that the snapshot does not list (a store's
+    journal, say, or the database when the snapshot has none) are removed, so
+    nothing stale is replayed over the restored state. Restored data is only
+    picked up by processes started afterwards, so stop the server first.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    data_dir = Path(data_dir)
+    manifest = read_manifest(snapshot_dir)
+
+    payloads: dict[str, bytes] = {}
+    for relative, meta in dict(manifest.get("files") or {}).items():
+        payload = (snapshot_dir / relative).read_bytes()
+        if hashlib.sha256(payload).hexdigest() != meta.get("sha256"):
+            raise ValueError(f"snapshot_checksum_mismatch:{relative}")
+        payloads[relative] = payload
+
+    existing = _snapshot_files(data_dir) if data_dir.exists() else []
+    with ExitStack() as locks, durability_batch():
+        _lock_store_files(locks, data_dir, [*existing, *(Path(relative) for relative in payloads)])
+        for relative in existing:
+            if relative.as_posix() not in payloads:
+                (data_dir / relative).unlink()
+
+        sqlite_meta = manifest.get("sqlite")
+        target_db = data_dir / DB_RELATIVE_PATH
+        if sqlite_meta:
+            source_db = snapshot_dir / str(sqlite_meta["path"])
+            target_db.parent.mkdir(parents=True, exist_ok=True)
+            source = sqlite3.connect(f"file:{source_db.resolve()}?mode=ro", uri=True)
+            target = sqlite3.connect(target_db)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+        elif target_db.parent.exists():
+            _remove_database(target_db)
+
+        for relative, payload in payloads.items():
+            atomic_write_bytes(data_dir / relative, payload)
+    return manifest
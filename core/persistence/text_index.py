@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+import logging
+import math
+import re
+import sqlite3
+import threading
+import unicodedata
+
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# FTS5's bm25() defaults.
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased, accent-folded word tokens; mirrors FTS5 ``unicode61 remove_diacritics 2``."""
+    folded = unicodedata.normalize("NFKD", str(text or "").lower())
+    stripped = "".join(char for char in folded if not unicodedata.combining(char))
+    return _TOKEN_PATTERN.findall(stripped)
+
+
+class InvertedTextIndex:
+    """Pure-Python inverted index with BM25 ranking and prefix matching.
+
+    Query terms are OR-ed and each one matches any indexed term it prefixes,
+    the same semantics as the FTS5 query built by ``Fts5TextIndex``.
+    """
+
+    backend = "inverted"
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_terms: dict[int, dict[str, int]] = {}
+        self._doc_lengths: dict[int, int] = {}
+        self._total_length = 0
+        self._vocabulary: list[str] = []
+        self._vocabulary_dirty = False
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        tokens = tokenize(text)
+        with self._lock:
+            self.remove(doc_id)
+            frequencies: dict[str, int] = {}
+            for token in tokens:
+                frequencies[token] = frequencies.get(token, 0) + 1
+            for token, count in frequencies.items():
+                postings = self._postings.setdefault(token, {})
+                if not postings:
+                    self._vocabulary_dirty = True
+                postings[doc_id] = count
+            self._doc_terms[doc_id] = frequencies
+            self._doc_lengths[doc_id] = len(tokens)
+            self._total_length += len(tokens)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            frequencies = self._doc_terms.pop(doc_id, None)
+            if frequencies is None:
+                return
+            for token in frequencies:
+                postings = self._postings.get(token)
+                if postings is None:
+                    continue
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary_dirty = True
+            self._total_length -= self._doc_lengths.pop(doc_id, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0
+            self._vocabulary = []
+            self._vocabulary_dirty = False
+
+    def _expand(self, prefix: str) -> list[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect_left(self._vocabulary, prefix)
+        matches = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def search(self, query: str, limit: int) -> list[tuple[int, float]]:
+        """Return ``(doc_id, score)`` pairs, best first; ties go to the newest doc."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        with self._lock:
+            doc_count = len(self._doc_lengths)
+            if doc_count == 0:
+                return []
+            average_length = self._total_length / doc_count or 1.0
+            scores: dict[int, float] = {}
+            for term in terms:
+                # A query term and its expansions form one phrase column in FTS5;
+                # summing term frequencies per doc keeps the scores comparable.
+                matched: dict[int, int] = {}
+                for expanded in self._expand(term):
+                    for doc_id, count in self._postings[expanded].items():
+                        matched[doc_id] = matched.get(doc_id, 0) + count
+                if not matched:
+                    continue
+                idf = math.log((doc_count - len(matched) + 0.5) / (len(matched) + 0.5))
+                idf = max(idf, 1e-6)
+                for doc_id, frequency in matched.items():
+                    length_norm = 1 - BM25_B + BM25_B * (self._doc_lengths[doc_id] / average_length)
+                    weight = idf * (frequency * (BM25_K1 + 1)) / (frequency + BM25_K1 * length_norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        ranked = sorted(scores.items(), key=lambda item: (round(item[1], 9), item[0]), reverse=True)
+        return [(doc_id, score) for doc_id, score in ranked[:limit]]
+
+
+class Fts5TextIndex:
+    """SQLite FTS5 index on a private in-memory connection.
+
+    The owning store remains the source of truth and re-adds its documents on
+    startup, so the index never needs its own migrations or recovery.
+    """
+
+    backend = "fts5"
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE text_index USING fts5(body, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM text_index").fetchone()[0])
+
+    def add(self, doc_id: int, text: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM text_index WHERE rowid = ?", (int(doc_id),))
+            self._conn.execute("INSERT INTO text_index (rowid, body) VALUES (?, ?)", (int(doc_id), str(text or "")))
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM text_index WHERE rowid = ?", (int(doc_id),))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM text_index")
+
+    def search(self, query: str, limit: int) -> list[tuple[int, float]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+        match = " OR ".join(f'"{term}"*' for term in terms)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid, bm25(text_index) AS score FROM text_index WHERE text_index MATCH ? "
+                "ORDER BY round(score, 9), rowid DESC LIMIT ?",
+                (match, int(limit)),
+            ).fetchall()
+        return [(int(rowid), -float(score)) for rowid, score in rows]
+
+
+def create_text_index() -> Fts5TextIndex | InvertedTextIndex:
+    """FTS5 when the SQLite build has it, otherwise the pure-Python index."""
+    try:
+        return Fts5TextIndex()
+    except sqlite3.Error as exc:
+        logger.info("SQLite FTS5 unavailable; using in-process inverted index", extra={"error": str(exc)})
+        return InvertedTextIndex()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+import math
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+# Latency percentiles are computed over the most recent writes per store.
+LATENCY_WINDOW = 1024
+
+_lock = threading.Lock()
+_stats: dict[str, "_StoreWriteStats"] = {}
+
+
+class _StoreWriteStats:
+    __slots__ = ("writes", "bytes", "fsyncs", "rows", "latencies_ms")
+
+    def __init__(self) -> None:
+        self.writes = 0
+        self.bytes = 0
+        self.fsyncs = 0
+        self.rows = 0
+        # Preallocated ring so steady-state writes allocate nothing.
+        self.latencies_ms = array("d", bytes(8 * LATENCY_WINDOW))
+
+    def add_latency(self, value_ms: float) -> None:
+        self.latencies_ms[self.writes % LATENCY_WINDOW] = value_ms
+
+    def recent_latencies(self) -> list[float]:
+        return sorted(self.latencies_ms[: min(self.writes, LATENCY_WINDOW)])
+
+
+def store_key(path: Path) -> str:
+    """Metrics key for a store file: its name up to the first dot (``revenue_attribution``)."""
+    return Path(path).name.split(".", 1)[0]
+
+
+def _stats_for(store: str) -> _StoreWriteStats:
+    stats = _stats.get(store)
+    if stats is None:
+        stats = _StoreWriteStats()
+        _stats[store] = stats
+    return stats
+
+
+def record_write(store: str, *, seconds: float, bytes_written: int = 0, fsyncs: int = 0, rows: int = 0) -> None:
+    with _lock:
+        stats = _stats_for(store)
+        stats.add_latency(seconds * 1000.0)
+        stats.writes += 1
+        stats.bytes += max(0, int(bytes_written))
+        stats.fsyncs += max(0, int(fsyncs))
+        stats.rows += max(0, int(rows))
+
+
+def record_fsyncs(store: str, count: int) -> None:
+    """Count fsyncs that happen outside a write (deferred group fsyncs)."""
+    if count <= 0:
+        return
+    with _lock:
+        _stats_for(store).fsyncs += count
+
+
+@contextmanager
+def timed_write(store: str) -> Iterator[dict[str, int]]:
+    """Time the enclosed write and record it on success.
+
+    The caller fills ``bytes``/``fsyncs``/``rows`` on the yielded dict as it
+    learns them. Failed writes are not recorded.
+    """
+    counters = {"bytes": 0, "fsyncs": 0, "rows": 0}
+    started = time.perf_counter()
+    yield counters
+    record_write(
+        store,
+        seconds=time.perf_counter() - started,
+        bytes_written=counters["bytes"],
+        fsyncs=counters["fsyncs"],
+        rows=counters["rows"],
+    )
+
+
+def sqlite_commit_fsyncs(conn: sqlite3.Connection) -> int:
+    """Estimated fsyncs per commit for the connection's journal mode and ``synchronous`` level.
+
+    SQLite does not report its own fsyncs; in WAL mode ``NORMAL`` only syncs at
+    checkpoints while ``FULL`` syncs the WAL on every commit, and rollback
+    journals sync both the journal and the database file.
+    """
+    synchronous = int(conn.execute("PRAGMA synchronous").fetchone()[0])
+    journal_mode = str(conn.execute("PRAGMA journal_mode").fetchone()[0]).lower()
+    if synchronous == 0 or journal_mode in {"memory", "off"}:
+        return 0
+    if journal_mode == "wal":
+        return 1 if synchronous >= 2 else 0
+    return 3 if synchronous >= 3 else 2
+
+
+def _percentile(ordered: list[float], fraction: float) -> float | None:
+    if not ordered:
+        return None
+    # Nearest-rank percentile.
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return round(ordered[index], 3)
+
+
+def snapshot_write_metrics() -> dict[str, dict[str, float | int | None]]:
+    """Per-store totals since start (or the last reset) plus latency percentiles in ms."""
+    with _lock:
+        copied = {
+            store: (stats.writes, stats.bytes, stats.fsyncs, stats.rows, stats.recent_latencies())
+            for store, stats in _stats.items()
+        }
+    return {
+        store: {
+            "writes": writes,
+            "bytes": size,
+            "fsyncs": fsyncs,
+            "rows": rows,
+            "p50_ms": _percentile(latencies, 0.50),
+            "p95_ms": _percentile(latencies, 0.95),
+            "p99_ms": _percentile(latencies, 0.99),
+        }
+        for store, (writes, size, fsyncs, rows, latencies) in sorted(copied.items())
+    }
+
+
+def reset_write_metrics() -> None:
+    with _lock:
+        _stats.clear()
+
+
+@contextmanager
+def timed_commit(store: str, conn: sqlite3.Connection, fsyncs_per_commit: int) -> Iterator[dict[str, int]]:
+    """``timed_write`` for a SQLite transaction; rows come from ``conn.total_changes``."""
+    changes_before = conn.total_changes
+    with timed_write(store) as counters:
+        yield counters
+        counters["rows"] = conn.total_changes - changes_before
+        counters["fsyncs"] = fsyncs_per_commit
@@ -6,13 +6,19 @@ from datetime import datetime, timezone
 import logging
 import os
 from pathlib import Path
+import sqlite3
+import threading
 from typing import Any, Dict, List
 import uuid
 
-from core.execution_focus_engine import ExecutionFocusEngine
-from core.persistence.json_io import atomic_read_json, atomic_write_json, quarantine_corrupt_file
+from core.execution_focus_engine import ExecutionFocusEngine, ExecutionFocusIndex, launch_focus_tier
+from core.persistence.json_io import SharedJsonFile, atomic_read_json, file_lock, quarantine_corrupt_file
+from core.persistence.launch_history import ensure_launch_history_tables
+from core.persistence.pagination import clamp_limit, decode_cursor, encode_cursor, page_after
 from core.launch_metrics import LaunchMetricsModule
 from core.product_proposal_store import ProductProposalStore
+from core.stores.change_feed import ChangeFeed, ChangeListener
+from core.stores.registry import get_store
 
 
 ProductLaunch = Dict[str, Any]
@@ -21,9 +27,19 @@ logger = logging.getLogger(__name__)
 
 
 class ProductLaunchStore:
-    """Persistent bounded store for product launches."""
+    """Persistent bounded store for product launches.
+
+    Only launch headers (id, status, timestamps, metric totals) are kept in
+    memory and in the JSON file. Per-launch detail that grows with activity,
+    the individual sales and the metric history, lives in SQLite tables and is
+    read on demand through ``list_sales``/``list_metric_history``/``get_detail``.
+    A sale is one INSERT in one transaction. Metric history snapshots cost a
+    second row per write, so they are only kept with ``metric_history=True``
+    or ``TRETA_LAUNCH_METRIC_HISTORY=1``.
+    """
 
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "product_launches.json"
     _ALLOWED_STATUSES = {"draft", "active", "paused", "archived"}
     _TRANSITIONS = {
         "draft": {"active", "archived"},
@@ -37,12 +53,51 @@ class ProductLaunchStore:
         proposal_store: ProductProposalStore | None = None,
         capacity: int = 100,
         path: Path | None = None,
+        metric_history: bool | None = None,
     ):
-        self._proposal_store = proposal_store or ProductProposalStore()
+        self._proposal_store = proposal_store or get_store(ProductProposalStore)
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "product_launches.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._items: deque[ProductLaunch] = deque(self._load_items(), maxlen=capacity)
+        self._metric_history = self.metric_history_enabled() if metric_history is None else bool(metric_history)
+        self._history_lock = threading.Lock()
+        self._history = self._open_history(self._resolve_db_path(data_dir=data_dir, json_path=self._path))
+        self._shared = SharedJsonFile(self._path)
+        with file_lock(self._path):
+            self._items: deque[ProductLaunch] = deque(self._load_items(), maxlen=capacity)
+            self._shared.mark_synced()
+        self._focus = ExecutionFocusIndex(launch_focus_tier)
+        self._focus.rebuild(self._items)
+        self._changes = ChangeFeed("product_launches")
+
+    @property
+    def version(self) -> int:
+        self._shared.refresh(self._reload)
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
+
+    def _resolve_db_path(self, *, data_dir: Path, json_path: Path) -> Path:
+        if json_path.is_absolute():
+            return json_path.parent / "memory" / "treta.sqlite"
+        return data_dir / "memory" / "treta.sqlite"
+
+    def _open_history(self, db_path: Path) -> sqlite3.Connection:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            ensure_launch_history_tables(conn)
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "Launch history SQLite unavailable; keeping detail in memory for this process",
+                extra={"error": str(exc), "db_path": str(db_path)},
+            )
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            ensure_launch_history_tables(conn)
+            return conn
 
     def _load_items(self) -> List[ProductLaunch]:
         if not self._path.exists():
@@ -51,11 +106,118 @@ class ProductLaunchStore:
         if not isinstance(loaded, list):
             quarantine_corrupt_file(self._path, ValueError("expected list"))
             return []
-        return [self._normalize_item(dict(item)) for item in loaded if isinstance(item, dict)]
+        items = []
+        for raw in loaded:
+            if not isinstance(raw, dict):
+                continue
+            item = self._normalize_item(dict(raw))
+            self._import_legacy_detail(item["id"], raw)
+            items.append(item)
+        return items
+
+    def _import_legacy_detail(self, launch_id: str, raw: Dict[str, Any]) -> None:
+        """Move inline ``sales``/``metrics_history`` arrays from older files into SQLite.
+
+        The next save rewrites the JSON with headers only; until then a reload
+        re-imports the same rows, which the per-launch ``seq`` keys ignore.
+        """
+        sales = raw.get("sales") if isinstance(raw.get("sales"), list) else []
+        history = raw.get("metrics_history") if isinstance(raw.get("metrics_history"), list) else []
+        if not sales and not history:
+            return
+        with self._history_lock, self._history:
+            self._history.executemany(
+                "INSERT OR IGNORE INTO launch_sales (launch_id, seq, amount, sold_at) VALUES (?, ?, ?, ?)",
+                [
+                    (launch_id, seq, float(sale.get("amount", 0.0) or 0.0), str(sale.get("sold_at") or sale.get("timestamp") or ""))
+                    for seq, sale in enumerate(sales, start=1)
+                    if isinstance(sale, dict)
+                ],
+            )
+            self._history.executemany(
+                """
+                INSERT OR IGNORE INTO launch_metric_history
+                    (launch_id, seq, recorded_at, event, views, clicks, sales, revenue)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        launch_id,
+                        seq,
+                        str(entry.get("recorded_at") or ""),
+                        str(entry.get("event") or "legacy"),
+                        *self._metric_values(entry),
+                    )
+                    for seq, entry in enumerate(history, start=1)
+                    if isinstance(entry, dict)
+                ],
+            )
+
+    @staticmethod
+    def _metric_values(metrics: Dict[str, Any]) -> tuple[int, int, int, float]:
+        normalized = LaunchMetricsModule.normalize(metrics)
+        return normalized["views"], normalized["clicks"], normalized["sales"], normalized["revenue"]
+
+    @staticmethod
+    def metric_history_enabled() -> bool:
+        return os.getenv("TRETA_LAUNCH_METRIC_HISTORY", "").strip().lower() in {"1", "true", "yes"}
+
+    def _record_history(self, item: ProductLaunch, event: str, *, sale_amount: float | None = None) -> None:
+        if sale_amount is None and not self._metric_history:
+            return
+        recorded_at = self._now()
+        launch_id = item["id"]
+        with self._history_lock, self._history:
+            if sale_amount is not None:
+                self._history.execute(
+                    """
+                    INSERT INTO launch_sales (launch_id, seq, amount, sold_at)
+                    SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ? FROM launch_sales WHERE launch_id = ?
+                    """,
+                    (launch_id, float(sale_amount), recorded_at, launch_id),
+                )
+            if not self._metric_history:
+                return
+            self._history.execute(
+                """
+                INSERT INTO launch_metric_history (launch_id, seq, recorded_at, event, views, clicks, sales, revenue)
+                SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ?, ?, ?, ? FROM launch_metric_history WHERE launch_id = ?
+                """,
+                (launch_id, recorded_at, event, *self._metric_values(item.get("metrics", {})), launch_id),
+            )
+
+    def _page_history(self, table: str, columns: str, launch_id: str, limit: Any, cursor: str | None) -> Dict[str, Any]:
+        safe_limit = clamp_limit(limit)
+        after = decode_cursor(cursor, 1)
+        params: list[Any] = [launch_id]
+        where = "launch_id = ?"
+        if after is not None:
+            try:
+                params.append(int(after[0]))
+            except ValueError:
+                raise ValueError("invalid_cursor") from None
+            where += " AND seq < ?"
+        with self._history_lock:
+            cursor_rows = self._history.execute(
+                f"SELECT seq, {columns} FROM {table} WHERE {where} ORDER BY seq DESC LIMIT ?",
+                (*params, safe_limit + 1),
+            )
+            names = [column[0] for column in cursor_rows.description]
+            rows = [dict(zip(names, row)) for row in cursor_rows.fetchall()]
+        next_cursor = None
+        if len(rows) > safe_limit:
+            rows = rows[:safe_limit]
+            next_cursor = encode_cursor(rows[-1]["seq"])
+        return {"items": rows, "next_cursor": next_cursor}
+
+    def _reload(self) -> None:
+        self._items = deque(self._load_items(), maxlen=self._items.maxlen)
+        self._focus.rebuild(self._items)
+        self._changes.publish("reload")
 
     def _save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(self._path, list(self._items))
+        self._shared.write(list(self._items))
 
     def _now(self) -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -102,12 +264,21 @@ class ProductLaunchStore:
         return normalized
 
 
-    def _refresh_execution_focus(self) -> None:
-        target_id = ExecutionFocusEngine.select_active(self._proposal_store._items, self._items)
-        ExecutionFocusEngine.enforce_single_active(
-            target_id,
-            {"proposals": self._proposal_store._items, "launches": self._items},
-        )
+    def _refresh_execution_focus(self) -> bool:
+        # Called under this store's file lock; the proposal store takes its own
+        # lock inside, keeping the launches -> proposals order.
+        target_id = self._proposal_store.refresh_execution_focus(self._focus)
+        changed = self._focus.set_active(target_id)
+        if ExecutionFocusEngine.consistency_check_enabled():
+            ExecutionFocusEngine.verify(target_id, reversed(self._proposal_store.list()), self._items)
+        return changed
+
+    def refresh_execution_focus(self) -> None:
+        """Recompute the single execution target across proposals and launches, saving whichever side moved."""
+        with self._shared.mutation(self._reload):
+            if self._refresh_execution_focus():
+                self._save()
+                self._changes.publish("execution_focus")
 
     def _find(self, launch_id: str) -> ProductLaunch | None:
         for item in self._items:
@@ -120,68 +291,84 @@ class ProductLaunchStore:
         if proposal is None:
             raise ValueError(f"proposal not found: {proposal_id}")
 
-        existing = self.get_by_proposal_id(proposal_id)
-        if existing is not None:
-            return existing
-
-        item = self._normalize_item(
-            {
-                "id": f"launch-{uuid.uuid4().hex[:12]}",
-                "proposal_id": proposal_id,
-                "created_at": self._now(),
-                "launched_at": None,
-                "status": "draft",
-                "metrics": LaunchMetricsModule.default(),
-                "product_name": proposal.get("product_name"),
-            }
-        )
-        self._items.append(item)
-        self._refresh_execution_focus()
-        self._save()
-        return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            existing = self.get_by_proposal_id(proposal_id)
+            if existing is not None:
+                return existing
+
+            item = self._normalize_item(
+                {
+                    "id": f"launch-{uuid.uuid4().hex[:12]}",
+                    "proposal_id": proposal_id,
+                    "created_at": self._now(),
+                    "launched_at": None,
+                    "status": "draft",
+                    "metrics": LaunchMetricsModule.default(),
+                    "product_name": proposal.get("product_name"),
+                }
+            )
+            if self._items.maxlen is not None and len(self._items) == self._items.maxlen:
+                self._focus.forget(self._items[0])
+            self._items.append(item)
+            self._focus.track(item)
+            self._refresh_execution_focus()
+            self._save()
+            self._changes.publish("add_from_proposal", item["id"])
+            return deepcopy(item)
 
     def mark_launched(self, launch_id: str) -> ProductLaunch:
-        item = self._find(launch_id)
-        if item is None:
-            raise ValueError(f"launch not found: {launch_id}")
-        item["launched_at"] = self._now()
-        item["status"] = "active"
-        self._refresh_execution_focus()
-        self._save()
-        return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            item = self._find(launch_id)
+            if item is None:
+                raise ValueError(f"launch not found: {launch_id}")
+            item["launched_at"] = self._now()
+            item["status"] = "active"
+            self._focus.track(item)
+            self._refresh_execution_focus()
+            self._save()
+            self._changes.publish("mark_launched", launch_id)
+            return deepcopy(item)
 
     def add_sale(self, launch_id: str, amount: float) -> ProductLaunch:
-        item = self._find(launch_id)
-        if item is None:
-            raise ValueError(f"launch not found: {launch_id}")
-        item["metrics"] = LaunchMetricsModule.add_sale(item.get("metrics", {}), amount)
-        self._save()
-        return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            item = self._find(launch_id)
+            if item is None:
+                raise ValueError(f"launch not found: {launch_id}")
+            item["metrics"] = LaunchMetricsModule.add_sale(item.get("metrics", {}), amount)
+            self._record_history(item, "sale", sale_amount=amount)
+            self._save()
+            self._changes.publish("add_sale", launch_id)
+            return deepcopy(item)
 
     def add_sales_batch(self, launch_id: str, sales_count: int, revenue_delta: float) -> ProductLaunch:
-        item = self._find(launch_id)
-        if item is None:
-            raise ValueError(f"launch not found: {launch_id}")
-
-        metrics = LaunchMetricsModule.normalize(item.get("metrics", {}))
-        metrics["sales"] += max(0, int(sales_count))
-        metrics["revenue"] = round(metrics["revenue"] + float(revenue_delta), 2)
-        item["metrics"] = metrics
-        self._save()
-        return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            item = self._find(launch_id)
+            if item is None:
+                raise ValueError(f"launch not found: {launch_id}")
+
+            metrics = LaunchMetricsModule.normalize(item.get("metrics", {}))
+            metrics["sales"] += max(0, int(sales_count))
+            metrics["revenue"] = round(metrics["revenue"] + float(revenue_delta), 2)
+            item["metrics"] = metrics
+            self._record_history(item, "sales_batch")
+            self._save()
+            self._changes.publish("add_sales_batch", launch_id)
+            return deepcopy(item)
 
     def link_gumroad_product(self, launch_id: str, gumroad_product_id: str) -> ProductLaunch:
-        item = self._find(launch_id)
-        if item is None:
-            raise ValueError(f"launch not found: {launch_id}")
+        with self._shared.mutation(self._reload):
+            item = self._find(launch_id)
+            if item is None:
+                raise ValueError(f"launch not found: {launch_id}")
 
-        product_id = str(gumroad_product_id).strip()
-        if not product_id:
-            raise ValueError("missing_gumroad_product_id")
+            product_id = str(gumroad_product_id).strip()
+            if not product_id:
+                raise ValueError("missing_gumroad_product_id")
 
-        item["gumroad_product_id"] = product_id
-        self._save()
-        return deepcopy(item)
+            item["gumroad_product_id"] = product_id
+            self._save()
+            self._changes.publish("link_gumroad_product", launch_id)
+            return deepcopy(item)
 
     def update_gumroad_sync_state(
         self,
@@ -190,25 +377,59 @@ class ProductLaunchStore:
         last_sync_at: str,
         last_sale_id: str | None,
     ) -> ProductLaunch:
-        item = self._find(launch_id)
-        if item is None:
-            raise ValueError(f"launch not found: {launch_id}")
+        with self._shared.mutation(self._reload):
+            item = self._find(launch_id)
+            if item is None:
+                raise ValueError(f"launch not found: {launch_id}")
 
-        item["last_gumroad_sync_at"] = str(last_sync_at)
-        item["last_gumroad_sale_id"] = str(last_sale_id) if last_sale_id else None
-        self._save()
-        return deepcopy(item)
+            item["last_gumroad_sync_at"] = str(last_sync_at)
+            item["last_gumroad_sale_id"] = str(last_sale_id) if last_sale_id else None
+            self._save()
+            self._changes.publish("update_gumroad_sync_state", launch_id)
+            return deepcopy(item)
 
     def list(self) -> List[ProductLaunch]:
+        self._shared.refresh(self._reload)
         return deepcopy(list(reversed(self._items)))
 
+    def list_page(self, *, limit: int = 50, cursor: str | None = None) -> Dict[str, Any]:
+        """Newest-first launches after ``cursor`` plus the cursor for the next page."""
+        self._shared.refresh(self._reload)
+        page = page_after(reversed(self._items), limit=clamp_limit(limit), cursor=cursor)
+        return {"items": deepcopy(page["items"]), "next_cursor": page["next_cursor"]}
+
     def get(self, launch_id: str) -> ProductLaunch | None:
+        self._shared.refresh(self._reload)
         item = self._find(launch_id)
         if item is None:
             return None
         return deepcopy(item)
 
+    def list_sales(self, launch_id: str, *, limit: Any = None, cursor: str | None = None) -> Dict[str, Any]:
+        """Newest-first individual sales recorded for ``launch_id``."""
+        return self._page_history("launch_sales", "amount, sold_at", launch_id, limit, cursor)
+
+    def list_metric_history(self, launch_id: str, *, limit: Any = None, cursor: str | None = None) -> Dict[str, Any]:
+        """Newest-first metric snapshots, one per metrics change of ``launch_id``."""
+        return self._page_history(
+            "launch_metric_history",
+            "recorded_at, event, views, clicks, sales, revenue",
+            launch_id,
+            limit,
+            cursor,
+        )
+
+    def get_detail(self, launch_id: str, *, limit: Any = None) -> ProductLaunch | None:
+        """The launch header plus the most recent page of its sales and metric history."""
+        item = self.get(launch_id)
+        if item is None:
+            return None
+        item["sales_history"] = self.list_sales(launch_id, limit=limit)
+        item["metrics_history"] = self.list_metric_history(launch_id, limit=limit)
+        return item
+
     def get_by_proposal_id(self, proposal_id: str) -> ProductLaunch | None:
+        self._shared.refresh(self._reload)
         for item in reversed(self._items):
             if item.get("proposal_id") == proposal_id:
                 return deepcopy(item)
@@ -219,16 +440,19 @@ class ProductLaunchStore:
         if target_status not in self._ALLOWED_STATUSES:
             raise ValueError(f"invalid status: {new_status}")
 
-        item = self._find(launch_id)
-        if item is None:
-            raise ValueError(f"launch not found: {launch_id}")
-
-        current_status = str(item.get("status", "draft"))
-        allowed = self._TRANSITIONS.get(current_status, set())
-        if target_status not in allowed:
-            raise ValueError(f"invalid transition: {current_status} -> {target_status}")
-
-        item["status"] = target_status
-        self._refresh_execution_focus()
-        self._save()
-        return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            item = self._find(launch_id)
+            if item is None:
+                raise ValueError(f"launch not found: {launch_id}")
+
+            current_status = str(item.get("status", "draft"))
+            allowed = self._TRANSITIONS.get(current_status, set())
+            if target_status not in allowed:
+                raise ValueError(f"invalid transition: {current_status} -> {target_status}")
+
+            item["status"] = target_status
+            self._focus.track(item)
+            self._refresh_execution_focus()
+            self._save()
+            self._changes.publish("transition_status", launch_id)
+            return deepcopy(item)
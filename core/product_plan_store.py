@@ -7,7 +7,9 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List
 
-from core.persistence.json_io import atomic_read_json, atomic_write_json
+from core.persistence.json_io import SharedJsonFile, atomic_read_json, file_lock
+from core.persistence.pagination import clamp_limit, page_after
+from core.stores.change_feed import ChangeFeed, ChangeListener
 
 
 ProductPlan = Dict[str, Any]
@@ -15,15 +17,31 @@ logger = logging.getLogger(__name__)
 
 
 class ProductPlanStore:
-    """In-memory bounded store for product plans."""
+    """In-memory bounded store for product plans.
+
+    Shares its file with other processes the same way ``OpportunityStore`` does.
+    """
 
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "product_plans.json"
 
     def __init__(self, capacity: int = 50, path: Path | None = None):
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "product_plans.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._items: deque[ProductPlan] = deque(self._load_from_disk(), maxlen=capacity)
+        self._shared = SharedJsonFile(self._path)
+        with file_lock(self._path):
+            self._items: deque[ProductPlan] = deque(self._load_from_disk(), maxlen=capacity)
+            self._shared.mark_synced()
+        self._changes = ChangeFeed("product_plans")
+
+    @property
+    def version(self) -> int:
+        self._shared.refresh(self._reload)
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
 
     def _load_from_disk(self) -> List[ProductPlan]:
         self._path.parent.mkdir(parents=True, exist_ok=True)
@@ -38,7 +56,7 @@ class ProductPlanStore:
         loaded = atomic_read_json(self._path, [])
 
         if loaded == [] and self._path.exists():
-            content = self._path.read_text(encoding="utf-8").strip()
+            content = self._path.read_bytes().strip()
             if not content:
                 logger.warning("Product plan store file is empty at %s; using empty store", self._path)
                 return []
@@ -48,34 +66,49 @@ class ProductPlanStore:
             return []
         return [dict(item) for item in loaded if isinstance(item, dict)]
 
+    def _reload(self) -> None:
+        self._items = deque(self._load_from_disk(), maxlen=self._items.maxlen)
+        self._changes.publish("reload")
+
     def _persist(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         payload = list(self._items)
 
         try:
-            atomic_write_json(self._path, payload)
+            self._shared.write(payload)
         except OSError as exc:
             logger.error("Failed to persist product plans to %s: %s", self._path, exc)
 
     def add(self, plan: Dict[str, Any]) -> ProductPlan:
         item = dict(plan)
-        self._items.append(item)
-        self._persist()
+        with self._shared.mutation(self._reload):
+            self._items.append(item)
+            self._persist()
+            self._changes.publish("add", item.get("plan_id") or item.get("id"))
         return deepcopy(item)
 
     def list(self, limit: int = 10) -> List[ProductPlan]:
         if limit <= 0:
             return []
+        self._shared.refresh(self._reload)
         items = list(reversed(self._items))[:limit]
         return deepcopy(items)
 
+    def list_page(self, *, limit: int = 50, cursor: str | None = None) -> Dict[str, Any]:
+        """Newest-first plans after ``cursor`` plus the cursor for the next page."""
+        self._shared.refresh(self._reload)
+        page = page_after(reversed(self._items), limit=clamp_limit(limit), cursor=cursor, key="plan_id")
+        return {"items": deepcopy(page["items"]), "next_cursor": page["next_cursor"]}
+
     def get(self, plan_id: str) -> ProductPlan | None:
+        self._shared.refresh(self._reload)
         for item in self._items:
             if item.get("plan_id") == plan_id:
                 return deepcopy(item)
         return None
 
     def get_by_proposal_id(self, proposal_id: str) -> ProductPlan | None:
+        self._shared.refresh(self._reload)
         for item in reversed(self._items):
             if item.get("proposal_id") == proposal_id:
                 return deepcopy(item)
@@ -8,9 +8,11 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List
 
-from core.execution_focus_engine import ExecutionFocusEngine
-from core.persistence.json_io import atomic_read_json, atomic_write_json, quarantine_corrupt_file
+from core.execution_focus_engine import ExecutionFocusEngine, ExecutionFocusIndex, proposal_focus_tier
+from core.persistence.json_io import SharedJsonFile, atomic_read_json, file_lock, quarantine_corrupt_file
+from core.persistence.pagination import clamp_limit, page_after
 from core.domain.lifecycle import ALL_PROPOSAL_STATUSES, PROPOSAL_TRANSITIONS
+from core.stores.change_feed import ChangeFeed, ChangeListener
 
 
 ProductProposal = Dict[str, Any]
@@ -19,17 +21,35 @@ logger = logging.getLogger(__name__)
 
 
 class ProductProposalStore:
-    """In-memory bounded store for product proposals."""
+    """In-memory bounded store for product proposals.
+
+    Shares its file with other processes the same way ``OpportunityStore`` does.
+    """
 
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "product_proposals.json"
     _ALLOWED_STATUSES = ALL_PROPOSAL_STATUSES
     _TRANSITIONS = PROPOSAL_TRANSITIONS
 
     def __init__(self, capacity: int = 50, path: Path | None = None):
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "product_proposals.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._items: deque[ProductProposal] = deque(self._load_items(), maxlen=capacity)
+        self._shared = SharedJsonFile(self._path)
+        with file_lock(self._path):
+            self._items: deque[ProductProposal] = deque(self._load_items(), maxlen=capacity)
+            self._shared.mark_synced()
+        self._focus = ExecutionFocusIndex(proposal_focus_tier)
+        self._focus.rebuild(self._items)
+        self._changes = ChangeFeed("product_proposals")
+
+    @property
+    def version(self) -> int:
+        self._shared.refresh(self._reload)
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
 
     def _load_items(self) -> List[ProductProposal]:
         if not self._path.exists():
@@ -54,24 +74,58 @@ class ProductProposalStore:
 
 
     def _refresh_execution_focus(self) -> None:
-        target_id = ExecutionFocusEngine.select_active(self._items, [])
-        ExecutionFocusEngine.enforce_single_active(target_id, {"proposals": self._items, "launches": []})
+        target_id = ExecutionFocusEngine.select_from_indexes(self._focus)
+        self._focus.set_active(target_id)
+        if ExecutionFocusEngine.consistency_check_enabled():
+            ExecutionFocusEngine.verify(target_id, self._items, [])
+
+    def refresh_execution_focus(self, *others: ExecutionFocusIndex) -> str | None:
+        """Move ``active_execution`` to the focus target across this store and ``others``.
+
+        Runs under this store's file lock and saves only when a flag moved.
+        Callers holding another store's lock must follow the documented order
+        (launches -> proposals). Returns the target id.
+        """
+        with self._shared.mutation(self._reload):
+            target_id = ExecutionFocusEngine.select_from_indexes(self._focus, *others)
+            if self._focus.set_active(target_id):
+                self._save()
+                self._changes.publish("execution_focus", target_id)
+            return target_id
+
+    def _reload(self) -> None:
+        self._items = deque(self._load_items(), maxlen=self._items.maxlen)
+        self._focus.rebuild(self._items)
+        self._changes.publish("reload")
 
     def _save(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(self._path, list(self._items))
+        self._shared.write(list(self._items))
 
     def add(self, proposal: Dict[str, Any]) -> ProductProposal:
         item = self._normalize_item(dict(proposal))
-        self._items.append(item)
-        self._refresh_execution_focus()
-        self._save()
+        with self._shared.mutation(self._reload):
+            if self._items.maxlen is not None and len(self._items) == self._items.maxlen:
+                self._focus.forget(self._items[0])
+            self._items.append(item)
+            self._focus.track(item)
+            self._refresh_execution_focus()
+            self._save()
+            self._changes.publish("add", item.get("id"))
         return deepcopy(item)
 
     def list(self) -> List[ProductProposal]:
+        self._shared.refresh(self._reload)
         return deepcopy(list(reversed(self._items)))
 
+    def list_page(self, *, limit: int = 50, cursor: str | None = None) -> Dict[str, Any]:
+        """Newest-first proposals after ``cursor`` plus the cursor for the next page."""
+        self._shared.refresh(self._reload)
+        page = page_after(reversed(self._items), limit=clamp_limit(limit), cursor=cursor)
+        return {"items": deepcopy(page["items"]), "next_cursor": page["next_cursor"]}
+
     def get(self, proposal_id: str) -> ProductProposal | None:
+        self._shared.refresh(self._reload)
         for item in self._items:
             if item.get("id") == proposal_id:
                 return deepcopy(item)
@@ -82,19 +136,22 @@ class ProductProposalStore:
         if target_status not in self._ALLOWED_STATUSES:
             raise ValueError(f"invalid status: {new_status}")
 
-        for item in self._items:
-            if item.get("id") != proposal_id:
-                continue
-
-            current_status = str(item.get("status", "draft"))
-            allowed_targets = self._TRANSITIONS.get(current_status, set())
-            if target_status not in allowed_targets:
-                raise ValueError(f"invalid transition: {current_status} -> {target_status}")
-
-            item["status"] = target_status
-            item["updated_at"] = self._now()
-            self._refresh_execution_focus()
-            self._save()
-            return deepcopy(item)
+        with self._shared.mutation(self._reload):
+            for item in self._items:
+                if item.get("id") != proposal_id:
+                    continue
+
+                current_status = str(item.get("status", "draft"))
+                allowed_targets = self._TRANSITIONS.get(current_status, set())
+                if target_status not in allowed_targets:
+                    raise ValueError(f"invalid transition: {current_status} -> {target_status}")
+
+                item["status"] = target_status
+                item["updated_at"] = self._now()
+                self._focus.track(item)
+                self._refresh_execution_focus()
+                self._save()
+                self._changes.publish("transition_status", proposal_id)
+                return deepcopy(item)
 
         raise ValueError(f"proposal not found: {proposal_id}")
@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 
 from core.reddit_intelligence.models import ensure_reddit_signals_schema
 from core.storage import Storage
+from core.stores.registry import get_store
 
 
 Signal = Dict[str, Any]
@@ -12,7 +13,7 @@ Signal = Dict[str, Any]
 
 class RedditSignalRepository:
     def __init__(self, storage: Storage | None = None):
-        self.storage = storage or Storage()
+        self.storage = storage or get_store(Storage)
 
     def ensure_initialized(self) -> None:
         ensure_reddit_signals_schema(self.storage.conn)
@@ -9,12 +9,13 @@ class SalesInsightService:
         try:
             from core.product_launch_store import ProductLaunchStore
             from core.product_proposal_store import ProductProposalStore
+            from core.stores.registry import get_store
         except Exception:
             return []
 
         try:
-            proposal_store = ProductProposalStore()
-            launch_store = ProductLaunchStore(proposal_store=proposal_store)
+            proposal_store = get_store(ProductProposalStore)
+            launch_store = get_store(ProductLaunchStore, proposal_store=proposal_store)
             launches = launch_store.list()
             proposals = proposal_store.list()
         except Exception:
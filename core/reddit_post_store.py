@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List
+
+from core.persistence.json_io import atomic_read_json
+from core.persistence.pagination import clamp_limit, decode_cursor, encode_cursor
+from core.persistence.reddit_posts import ensure_reddit_posts_table
+from core.stores.change_feed import ChangeFeed, ChangeListener
+
+
+RedditPost = Dict[str, Any]
+
+logger = logging.getLogger(__name__)
+
+
+class RedditPostStore:
+    """Reddit posts we published or already scanned, deduplicated on ``post_id``.
+
+    Rows live in the ``reddit_posts`` SQLite table and are mirrored in memory
+    in insertion order, so listing and the dedupe check never touch disk and an
+    append is one INSERT. Rows committed by another connection are picked up
+    through ``PRAGMA data_version``. A ``reddit_posts.json`` left by older
+    versions is imported once and renamed to ``reddit_posts.json.migrated``.
+    """
+
+    _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "reddit_posts.json"
+
+    def __init__(self, path: Path | None = None):
+        data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
+        self._path = path or data_dir / self._DEFAULT_FILENAME
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._items: List[RedditPost] = []
+        self._seqs: List[int] = []
+        self._by_post_id: Dict[str, RedditPost] = {}
+        self._changes = ChangeFeed("reddit_posts")
+        self._persistent = True
+        self._conn = self._open(self._resolve_db_path(data_dir=data_dir, json_path=self._path))
+        with self._lock:
+            self._load_after(0)
+            self._import_legacy_file()
+            self._data_version = self._current_data_version()
+
+    @property
+    def version(self) -> int:
+        self._refresh()
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
+
+    def _resolve_db_path(self, *, data_dir: Path, json_path: Path) -> Path:
+        if json_path.is_absolute():
+            return json_path.parent / "memory" / "treta.sqlite"
+        return data_dir / "memory" / "treta.sqlite"
+
+    def _open(self, db_path: Path) -> sqlite3.Connection:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            ensure_reddit_posts_table(conn)
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "Reddit posts SQLite unavailable; keeping posts in memory for this process",
+                extra={"error": str(exc), "db_path": str(db_path)},
+            )
+            self._persistent = False
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            ensure_reddit_posts_table(conn)
+            return conn
+
+    def _import_legacy_file(self) -> None:
+        if not self._path.exists():
+            return
+        loaded = atomic_read_json(self._path, [])
+        items = [item for item in loaded if isinstance(item, dict)] if isinstance(loaded, list) else []
+        self._insert(items)
+        if not self._persistent:
+            return
+        try:
+            self._path.replace(self._path.with_name(self._path.name + ".migrated"))
+        except OSError as exc:
+            logger.warning("Could not rename imported reddit posts file", extra={"error": str(exc), "path": str(self._path)})
+
+    def _current_data_version(self) -> int:
+        return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def _load_after(self, seq: int) -> None:
+        rows = self._conn.execute("SELECT seq, payload_json FROM reddit_posts WHERE seq > ? ORDER BY seq", (seq,)).fetchall()
+        for row_seq, payload_json in rows:
+            self._remember(int(row_seq), json.loads(payload_json))
+
+    def _remember(self, seq: int, item: RedditPost) -> None:
+        self._seqs.append(seq)
+        self._items.append(item)
+        post_id = self._post_id(item)
+        if post_id:
+            self._by_post_id[post_id] = item
+
+    def _refresh(self) -> None:
+        """Pull in rows another connection appended since the last look."""
+        with self._lock:
+            data_version = self._current_data_version()
+            if data_version == self._data_version:
+                return
+            self._data_version = data_version
+            self._load_after(self._seqs[-1] if self._seqs else 0)
+            self._changes.publish("reload")
+
+    def _post_id(self, item: RedditPost) -> str:
+        return str(item.get("post_id") or "").strip()
+
+    def _insert(self, entries: Iterable[RedditPost]) -> List[RedditPost]:
+        inserted: List[tuple[int, RedditPost]] = []
+        with self._conn:
+            for entry in entries:
+                item = dict(entry)
+                post_id = self._post_id(item)
+                if post_id and post_id in self._by_post_id:
+                    continue
+                cursor = self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO reddit_posts (id, post_id, proposal_id, subreddit, created_at, payload_json)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        str(item.get("id") or ""),
+                        post_id or None,
+                        str(item.get("proposal_id") or ""),
+                        str(item.get("subreddit") or ""),
+                        str(item.get("created_at") or ""),
+                        json.dumps(item, separators=(",", ":")),
+                    ),
+                )
+                if cursor.rowcount:
+                    inserted.append((int(cursor.lastrowid), item))
+        # Only mirror rows once the transaction has committed.
+        for seq, item in inserted:
+            self._remember(seq, item)
+        return [item for _, item in inserted]
+
+    def add(self, entry: RedditPost) -> RedditPost:
+        """Append ``entry``; if its ``post_id`` is already stored, return that post instead."""
+        self._refresh()
+        with self._lock:
+            inserted = self._insert([entry])
+            if inserted:
+                self._changes.publish("add", inserted[0].get("id"))
+                return dict(inserted[0])
+            # Duplicate, possibly written by another connection a moment ago.
+            self._refresh()
+            return dict(self._by_post_id[self._post_id(entry)])
+
+    def add_many(self, entries: Iterable[RedditPost]) -> List[RedditPost]:
+        """Append ``entries`` in one transaction, skipping known ``post_id`` values; returns the new posts."""
+        self._refresh()
+        with self._lock:
+            inserted = self._insert(entries)
+            for item in inserted:
+                self._changes.publish("add", item.get("id"))
+        return [dict(item) for item in inserted]
+
+    def has_post(self, post_id: str) -> bool:
+        self._refresh()
+        with self._lock:
+            return str(post_id or "").strip() in self._by_post_id
+
+    def __len__(self) -> int:
+        self._refresh()
+        with self._lock:
+            return len(self._items)
+
+    def list(self, *, proposal_id: str | None = None, subreddit: str | None = None) -> List[RedditPost]:
+        """Every post, newest first, optionally filtered by ``proposal_id``/``subreddit``."""
+        self._refresh()
+        with self._lock:
+            items = self._items[::-1]
+        if proposal_id is not None:
+            items = [item for item in items if str(item.get("proposal_id") or "") == str(proposal_id)]
+        if subreddit is not None:
+            items = [item for item in items if str(item.get("subreddit") or "") == str(subreddit)]
+        return [dict(item) for item in items]
+
+    def list_page(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        proposal_id: str | None = None,
+        subreddit: str | None = None,
+    ) -> Dict[str, Any]:
+        """Newest-first posts after ``cursor`` plus the cursor for the next page.
+
+        Unfiltered pages are sliced from memory; ``proposal_id``/``subreddit``
+        filters run against their SQLite indexes.
+        """
+        safe_limit = clamp_limit(limit)
+        after = decode_cursor(cursor, 1)
+        try:
+            before_seq = int(after[0]) if after is not None else None
+        except ValueError:
+            raise ValueError("invalid_cursor") from None
+        self._refresh()
+
+        if proposal_id is None and subreddit is None:
+            with self._lock:
+                end = len(self._seqs) if before_seq is None else bisect_left(self._seqs, before_seq)
+                start = max(0, end - safe_limit - 1)
+                seqs = self._seqs[start:end][::-1]
+                page = [dict(item) for item in self._items[start:end][::-1]]
+        else:
+            clauses: list[str] = []
+            params: list[Any] = []
+            if proposal_id is not None:
+                clauses.append("proposal_id = ?")
+                params.append(str(proposal_id))
+            if subreddit is not None:
+                clauses.append("subreddit = ?")
+                params.append(str(subreddit))
+            if before_seq is not None:
+                clauses.append("seq < ?")
+                params.append(before_seq)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT seq, payload_json FROM reddit_posts WHERE {' AND '.join(clauses)} ORDER BY seq DESC LIMIT ?",
+                    (*params, safe_limit + 1),
+                ).fetchall()
+            seqs = [int(row[0]) for row in rows]
+            page = [json.loads(row[1]) for row in rows]
+
+        next_cursor = None
+        if len(page) > safe_limit:
+            page = page[:safe_limit]
+            next_cursor = encode_cursor(seqs[safe_limit - 1])
+        return {"items": page, "next_cursor": next_cursor}
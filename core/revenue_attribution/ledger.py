@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+def ensure_revenue_ledger_tables(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS revenue_trackings (
+            tracking_id TEXT PRIMARY KEY,
+            proposal_id TEXT NOT NULL,
+            product_id TEXT NOT NULL,
+            subreddit TEXT,
+            created_at TEXT NOT NULL,
+            payload_json TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS revenue_sales (
+            tracking_id TEXT NOT NULL,
+            sale_id TEXT NOT NULL,
+            product_id TEXT NOT NULL,
+            revenue REAL NOT NULL DEFAULT 0,
+            timestamp TEXT NOT NULL,
+            channel TEXT NOT NULL DEFAULT 'unknown',
+            subreddit TEXT,
+            post_id TEXT,
+            sold_epoch INTEGER,
+            PRIMARY KEY (tracking_id, sale_id)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_revenue_trackings_subreddit ON revenue_trackings(subreddit)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_revenue_sales_subreddit ON revenue_sales(subreddit)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_revenue_sales_timestamp ON revenue_sales(timestamp)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_revenue_sales_product_id ON revenue_sales(product_id)")
+    ensure_revenue_rollup_tables(conn)
+
+
+def ensure_revenue_rollup_tables(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(revenue_sales)")}
+    if "sold_epoch" not in columns:
+        conn.execute("ALTER TABLE revenue_sales ADD COLUMN sold_epoch INTEGER")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_revenue_sales_sold_epoch ON revenue_sales(sold_epoch)")
+    # One row per (granularity, dimension, bucket, key); dimension is one of
+    # total/product/channel/subreddit/tracking and bucket_epoch is the UTC
+    # hour or day start in seconds.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS revenue_rollups (
+            granularity TEXT NOT NULL,
+            bucket_epoch INTEGER NOT NULL,
+            dimension TEXT NOT NULL,
+            key TEXT NOT NULL,
+            sales INTEGER NOT NULL DEFAULT 0,
+            revenue REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (granularity, dimension, bucket_epoch, key)
+        )
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_revenue_rollups_key ON revenue_rollups(granularity, dimension, key, bucket_epoch)"
+    )
@@ -1,27 +1,92 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
+import json
+import logging
 import os
 from pathlib import Path
-from typing import Any
+import sqlite3
+import threading
+from typing import Any, Iterable
 
 from core.persistence.json_io import atomic_read_json, atomic_write_json, quarantine_corrupt_file
+from core.persistence.pagination import clamp_limit, decode_cursor, encode_cursor
+from core.revenue_attribution.ledger import ensure_revenue_ledger_tables
+from core.stores.change_feed import ChangeFeed, ChangeListener
+
+
+logger = logging.getLogger(__name__)
 
 
 class RevenueAttributionStore:
+    """Tracking links and the attributed sales ledger, backed by indexed SQLite tables.
+
+    Sales are keyed by ``(tracking_id, sale_id)`` so replaying the same sale is
+    a no-op. Running totals (overall, per product, channel, subreddit and
+    tracking) are loaded with aggregate queries at startup and then kept up to
+    date by ``upsert_tracking``/``record_sale``; every change bumps
+    ``version``, and ``summary()`` and each ``window_summary`` are rebuilt at
+    most once per version. The legacy JSON file is imported once when the
+    tables are empty; if SQLite cannot be opened the store runs on an
+    in-memory database and keeps the JSON file as its persistence.
+    """
+
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "revenue_attribution.json"
     _DEFAULT_REDDIT_WINDOW_HOURS = 24
+    _SUMMARY_RECENT_SALES = 100
+    _WINDOW_CACHE_SIZE = 64
+    _HOUR_SECONDS = 3600
+    _DAY_SECONDS = 86400
+    # Day-aligned (year 10000), used as the open upper bound of a window.
+    _FAR_FUTURE_EPOCH = 253402300800
 
     def __init__(self, path: Path | None = None, reddit_attribution_window_hours: int | None = None) -> None:
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "revenue_attribution.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
         configured_window = reddit_attribution_window_hours
         if configured_window is None:
             configured_window = int(os.getenv("TRETA_REDDIT_ATTRIBUTION_WINDOW_HOURS", self._DEFAULT_REDDIT_WINDOW_HOURS))
         self._reddit_attribution_window = max(1, int(configured_window))
-        self._items, self._sales = self._load_state()
+        self._lock = threading.RLock()
+
+        db_path = self._resolve_db_path(data_dir=data_dir, json_path=self._path)
+        self._sqlite_persistent = True
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA busy_timeout = 5000;")
+            ensure_revenue_ledger_tables(self._conn)
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "Revenue ledger SQLite unavailable; using in-memory ledger with JSON persistence",
+                extra={"error": str(exc), "db_path": str(db_path)},
+            )
+            self._sqlite_persistent = False
+            self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            ensure_revenue_ledger_tables(self._conn)
+            self._conn.commit()
+
+        if self._is_empty():
+            trackings, sales = self._load_state()
+            if trackings or sales:
+                self._import_rows(trackings, sales)
+
+        self._backfill_rollups()
+        self._changes = ChangeFeed("revenue_attribution")
+        self._cached_summary: dict[str, Any] | None = None
+        self._cached_summary_version = -1
+        self._window_cache: OrderedDict[tuple[int, int, bool], tuple[int, dict[str, Any]]] = OrderedDict()
+        self._load_running_totals()
+
+    def _resolve_db_path(self, *, data_dir: Path, json_path: Path) -> Path:
+        if json_path.is_absolute():
+            return json_path.parent / "memory" / "treta.sqlite"
+        return data_dir / "memory" / "treta.sqlite"
 
     def _now(self) -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -36,9 +101,9 @@ class RevenueAttributionStore:
         except ValueError:
             return None
 
-    def _load_state(self) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+    def _load_state(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
         if not self._path.exists():
-            return {}, []
+            return [], []
 
         loaded = atomic_read_json(self._path, {"trackings": [], "sales": []})
 
@@ -50,57 +115,217 @@ class RevenueAttributionStore:
             sales_rows = loaded.get("sales", [])
         else:
             quarantine_corrupt_file(self._path, ValueError("expected list or dict"))
-            return {}, []
-
-        items: dict[str, dict[str, Any]] = {}
-        if isinstance(tracking_rows, list):
-            for row in tracking_rows:
-                if not isinstance(row, dict):
-                    continue
-                tracking_id = str(row.get("tracking_id") or "").strip()
-                proposal_id = str(row.get("proposal_id") or "").strip()
-                if not tracking_id or not proposal_id:
-                    continue
-                normalized = {
-                    "tracking_id": tracking_id,
-                    "proposal_id": proposal_id,
-                    "product_id": str(row.get("product_id") or proposal_id).strip() or proposal_id,
-                    "subreddit": row.get("subreddit"),
-                    "post_id": row.get("post_id"),
-                    "price": row.get("price"),
-                    "created_at": str(row.get("created_at") or self._now()),
-                }
-                items[tracking_id] = normalized
-
-        sales: list[dict[str, Any]] = []
-        if isinstance(sales_rows, list):
-            for row in sales_rows:
-                if not isinstance(row, dict):
-                    continue
-                sale_id = str(row.get("sale_id") or "").strip()
-                product_id = str(row.get("product_id") or "").strip()
-                if not sale_id or not product_id:
-                    continue
-                attribution = row.get("attribution", {}) if isinstance(row.get("attribution"), dict) else {}
-                sales.append(
-                    {
-                        "sale_id": sale_id,
-                        "product_id": product_id,
-                        "revenue": round(float(row.get("revenue", 0.0) or 0.0), 2),
-                        "timestamp": str(row.get("timestamp") or self._now()),
-                        "attribution": {
-                            "channel": str(attribution.get("channel") or "unknown"),
-                            "subreddit": attribution.get("subreddit"),
-                            "post_id": attribution.get("post_id"),
-                        },
-                    }
-                )
-
+            return [], []
+
+        items = [
+            item
+            for item in (self._normalize_tracking_row(row) for row in (tracking_rows if isinstance(tracking_rows, list) else []))
+            if item is not None
+        ]
+        sales = [
+            sale
+            for sale in (self._normalize_sale_row(row) for row in (sales_rows if isinstance(sales_rows, list) else []))
+            if sale is not None
+        ]
         return items, sales
 
+    def _normalize_tracking_row(self, row: Any) -> dict[str, Any] | None:
+        if not isinstance(row, dict):
+            return None
+        tracking_id = str(row.get("tracking_id") or "").strip()
+        proposal_id = str(row.get("proposal_id") or "").strip()
+        if not tracking_id or not proposal_id:
+            return None
+        return {
+            **row,
+            "tracking_id": tracking_id,
+            "proposal_id": proposal_id,
+            "product_id": str(row.get("product_id") or proposal_id).strip() or proposal_id,
+            "subreddit": row.get("subreddit"),
+            "post_id": row.get("post_id"),
+            "price": row.get("price"),
+            "created_at": str(row.get("created_at") or self._now()),
+        }
+
+    def _normalize_sale_row(self, row: Any) -> dict[str, Any] | None:
+        if not isinstance(row, dict):
+            return None
+        sale_id = str(row.get("sale_id") or "").strip()
+        product_id = str(row.get("product_id") or "").strip()
+        if not sale_id or not product_id:
+            return None
+        attribution = row.get("attribution") if isinstance(row.get("attribution"), dict) else {}
+        return {
+            "tracking_id": str(row.get("tracking_id") or "").strip(),
+            "sale_id": sale_id,
+            "product_id": product_id,
+            "revenue": round(float(row.get("revenue", 0.0) or 0.0), 2),
+            "timestamp": str(row.get("timestamp") or self._now()),
+            "attribution": {
+                "channel": str(attribution.get("channel") or "unknown"),
+                "subreddit": attribution.get("subreddit"),
+                "post_id": attribution.get("post_id"),
+            },
+        }
+
+    def _is_empty(self) -> bool:
+        with self._lock:
+            trackings = self._conn.execute("SELECT 1 FROM revenue_trackings LIMIT 1").fetchone()
+            sales = self._conn.execute("SELECT 1 FROM revenue_sales LIMIT 1").fetchone()
+        return trackings is None and sales is None
+
+    def _import_rows(self, trackings: list[dict[str, Any]], sales: list[dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            for record in trackings:
+                self._write_tracking(record)
+            for sale in sales:
+                self._insert_sale(sale)
+        logger.info(
+            "Imported legacy revenue attribution JSON into SQLite",
+            extra={"trackings": len(trackings), "sales": len(sales), "path": str(self._path)},
+        )
+
+    def _write_tracking(self, record: dict[str, Any]) -> None:
+        subreddit = str(record.get("subreddit") or "").strip() or None
+        self._conn.execute(
+            """
+            INSERT INTO revenue_trackings (tracking_id, proposal_id, product_id, subreddit, created_at, payload_json)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(tracking_id) DO UPDATE SET
+                proposal_id = excluded.proposal_id,
+                product_id = excluded.product_id,
+                subreddit = excluded.subreddit,
+                created_at = excluded.created_at,
+                payload_json = excluded.payload_json
+            """,
+            (
+                record["tracking_id"],
+                record["proposal_id"],
+                record["product_id"],
+                subreddit,
+                record["created_at"],
+                json.dumps(record, ensure_ascii=False, default=str),
+            ),
+        )
+
+    def _insert_sale(self, sale: dict[str, Any]) -> bool:
+        attribution = sale.get("attribution", {}) if isinstance(sale.get("attribution"), dict) else {}
+        tracking_id = str(sale.get("tracking_id") or "")
+        product_id = sale["product_id"]
+        revenue = float(sale.get("revenue", 0.0) or 0.0)
+        channel = str(attribution.get("channel") or "unknown")
+        subreddit = str(attribution.get("subreddit") or "").strip() or None
+        sold_epoch = self._to_epoch(sale["timestamp"])
+        cursor = self._conn.execute(
+            """
+            INSERT OR IGNORE INTO revenue_sales
+                (tracking_id, sale_id, product_id, revenue, timestamp, channel, subreddit, post_id, sold_epoch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                tracking_id,
+                sale["sale_id"],
+                product_id,
+                revenue,
+                sale["timestamp"],
+                channel,
+                subreddit,
+                str(attribution.get("post_id") or "").strip() or None,
+                sold_epoch,
+            ),
+        )
+        if cursor.rowcount <= 0:
+            return False
+        self._add_to_rollups(sold_epoch, tracking_id, product_id, channel, subreddit, revenue)
+        return True
+
+    def _to_epoch(self, value: Any) -> int | None:
+        parsed = self._parse_timestamp(value)
+        if parsed is None:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+    def _add_to_rollups(
+        self,
+        sold_epoch: int | None,
+        tracking_id: str,
+        product_id: str,
+        channel: str,
+        subreddit: str | None,
+        revenue: float,
+    ) -> None:
+        if sold_epoch is None:
+            # Unparseable timestamps stay in the all-time totals only.
+            return
+        keys = [("total", ""), ("product", product_id), ("channel", channel), ("subreddit", subreddit), ("tracking", tracking_id)]
+        rows = [
+            (granularity, sold_epoch - sold_epoch % size, dimension, key, revenue)
+            for granularity, size in (("hour", self._HOUR_SECONDS), ("day", self._DAY_SECONDS))
+            for dimension, key in keys
+            if dimension == "total" or key
+        ]
+        self._conn.executemany(
+            """
+            INSERT INTO revenue_rollups (granularity, bucket_epoch, dimension, key, sales, revenue)
+            VALUES (?, ?, ?, ?, 1, ?)
+            ON CONFLICT(granularity, bucket_epoch, dimension, key) DO UPDATE SET
+                sales = sales + 1,
+                revenue = revenue + excluded.revenue
+            """,
+            rows,
+        )
+
+    def _backfill_rollups(self) -> None:
+        """Roll up ledger rows written before rollups existed (``sold_epoch`` is NULL)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT rowid, tracking_id, product_id, revenue, timestamp, channel, subreddit "
+                "FROM revenue_sales WHERE sold_epoch IS NULL"
+            ).fetchall()
+            if not rows:
+                return
+            with self._conn:
+                for rowid, tracking_id, product_id, revenue, timestamp, channel, subreddit in rows:
+                    sold_epoch = self._to_epoch(timestamp)
+                    if sold_epoch is None:
+                        continue
+                    self._conn.execute("UPDATE revenue_sales SET sold_epoch = ? WHERE rowid = ?", (sold_epoch, rowid))
+                    self._add_to_rollups(sold_epoch, tracking_id, product_id, channel, subreddit, float(revenue or 0.0))
+
+    def _sale_from_row(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        tracking_id, sale_id, product_id, revenue, timestamp, channel, subreddit, post_id = row
+        return {
+            "sale_id": sale_id,
+            "tracking_id": tracking_id or None,
+            "product_id": product_id,
+            "revenue": round(float(revenue or 0.0), 2),
+            "timestamp": timestamp,
+            "attribution": {"channel": channel, "subreddit": subreddit, "post_id": post_id},
+        }
+
+    def _tracking_from_payload(self, payload_json: str | None) -> dict[str, Any] | None:
+        try:
+            payload = json.loads(payload_json or "")
+        except json.JSONDecodeError:
+            return None
+        return payload if isinstance(payload, dict) else None
+
     def _save(self) -> None:
+        """Mirror the ledger to JSON; only used when running without on-disk SQLite."""
+        if self._sqlite_persistent:
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(self._path, {"trackings": list(self._items.values()), "sales": self._sales})
+        with self._lock:
+            sales = [
+                self._sale_from_row(row)
+                for row in self._conn.execute(
+                    "SELECT tracking_id, sale_id, product_id, revenue, timestamp, channel, subreddit, post_id "
+                    "FROM revenue_sales ORDER BY rowid"
+                )
+            ]
+        atomic_write_json(self._path, {"trackings": self.list_all(), "sales": sales})
 
     def upsert_tracking(
         self,
@@ -120,21 +345,32 @@ class RevenueAttributionStore:
         if not normalized_proposal:
             raise ValueError("proposal_id is required")
 
-        existing = self._items.get(normalized_tracking, {})
-        record = {
-            "tracking_id": normalized_tracking,
-            "proposal_id": normalized_proposal,
-            "product_id": str(product_id or existing.get("product_id") or normalized_proposal).strip() or normalized_proposal,
-            "subreddit": subreddit if subreddit is not None else existing.get("subreddit"),
-            "post_id": post_id if post_id is not None else existing.get("post_id"),
-            "price": price if price is not None else existing.get("price"),
-            "created_at": str(created_at or existing.get("created_at") or self._now()),
-        }
-        if extra:
-            record.update(extra)
-
-        self._items[normalized_tracking] = record
-        self._save()
+        with self._lock:
+            existing = self.get_by_tracking(normalized_tracking) or {}
+            record = {
+                **existing,
+                "tracking_id": normalized_tracking,
+                "proposal_id": normalized_proposal,
+                "product_id": str(product_id or existing.get("product_id") or normalized_proposal).strip() or normalized_proposal,
+                "subreddit": subreddit if subreddit is not None else existing.get("subreddit"),
+                "post_id": post_id if post_id is not None else existing.get("post_id"),
+                "price": price if price is not None else existing.get("price"),
+                "created_at": str(created_at or existing.get("created_at") or self._now()),
+            }
+            if extra:
+                record.update(extra)
+
+            previous_subreddit = str(existing.get("subreddit") or "").strip()
+            with self._conn:
+                self._write_tracking(record)
+            current_subreddit = str(record.get("subreddit") or "").strip()
+            if not existing or previous_subreddit != current_subreddit:
+                if existing and previous_subreddit:
+                    self._views[previous_subreddit] = self._views.get(previous_subreddit, 1) - 1
+                if current_subreddit:
+                    self._views[current_subreddit] = self._views.get(current_subreddit, 0) + 1
+            self._save()
+            self._changes.publish("upsert_tracking", normalized_tracking)
         return deepcopy(record)
 
     def _infer_channel(self, sold_at: str, tracking: dict[str, Any] | None) -> str:
@@ -158,8 +394,13 @@ class RevenueAttributionStore:
         sale_id: str | None = None,
         sold_at: str | None = None,
     ) -> dict[str, Any] | None:
+        """Append ``sale_count`` sales for ``tracking_id``.
+
+        Returns the tracking record, or ``None`` when the tracking is unknown or
+        every sale was already recorded under the same ``(tracking_id, sale_id)``.
+        """
         normalized_tracking = str(tracking_id).strip()
-        current = self._items.get(normalized_tracking) if normalized_tracking else None
+        current = self.get_by_tracking(normalized_tracking) if normalized_tracking else None
         if current is None:
             return None
 
@@ -168,80 +409,363 @@ class RevenueAttributionStore:
         timestamp = str(sold_at or self._now())
         product_id = str(current.get("product_id") or current.get("proposal_id") or "").strip()
         channel = self._infer_channel(timestamp, current)
+        attribution = {
+            "channel": channel,
+            "subreddit": current.get("subreddit") if channel == "reddit" else None,
+            "post_id": current.get("post_id") if channel == "reddit" else None,
+        }
 
-        for index in range(count):
-            resolved_sale_id = str(sale_id or f"{normalized_tracking}-sale-{len(self._sales) + 1 + index}")
-            self._sales.append(
-                {
-                    "sale_id": resolved_sale_id,
-                    "product_id": product_id,
-                    "revenue": round(per_sale_revenue, 2),
-                    "timestamp": timestamp,
-                    "attribution": {
-                        "channel": channel,
-                        "subreddit": current.get("subreddit") if channel == "reddit" else None,
-                        "post_id": current.get("post_id") if channel == "reddit" else None,
-                    },
-                }
-            )
-
-        self._save()
-        return deepcopy(current)
+        inserted: list[dict[str, Any]] = []
+        with self._lock:
+            with self._conn:
+                if sale_id:
+                    sale_ids = [str(sale_id) if index == 0 else f"{sale_id}-{index + 1}" for index in range(count)]
+                else:
+                    existing_count = int(self._totals["sales"])
+                    sale_ids = [f"{normalized_tracking}-sale-{existing_count + 1 + index}" for index in range(count)]
+                for resolved_sale_id in sale_ids:
+                    sale = {
+                        "tracking_id": normalized_tracking,
+                        "sale_id": resolved_sale_id,
+                        "product_id": product_id,
+                        "revenue": round(per_sale_revenue, 2),
+                        "timestamp": timestamp,
+                        "attribution": attribution,
+                    }
+                    if self._insert_sale(sale):
+                        inserted.append(sale)
+            if not inserted:
+                return None
+            for sale in inserted:
+                self._apply_sale(sale)
+            self._save()
+            self._changes.publish("record_sale", normalized_tracking)
+        return current
+
+    def import_sales(self, sales: Iterable[dict[str, Any]]) -> int:
+        """Insert ledger rows (``list_sales`` item shape plus ``tracking_id``) in one transaction.
+
+        Rows already present under the same ``(tracking_id, sale_id)`` are
+        skipped; returns the number of rows inserted.
+        """
+        inserted: list[dict[str, Any]] = []
+        with self._lock:
+            with self._conn:
+                for row in sales:
+                    sale = self._normalize_sale_row(row)
+                    if sale is not None and self._insert_sale(sale):
+                        inserted.append(sale)
+            if inserted:
+                for sale in inserted:
+                    self._apply_sale(sale)
+                self._save()
+                self._changes.publish("import_sales")
+        return len(inserted)
+
+    def import_trackings(self, trackings: Iterable[dict[str, Any]]) -> int:
+        """Upsert tracking records (``list_all`` item shape) in one transaction.
+
+        Running totals are reloaded once afterwards instead of per record;
+        returns the number of records written.
+        """
+        written = 0
+        with self._lock:
+            with self._conn:
+                for row in trackings:
+                    record = self._normalize_tracking_row(row)
+                    if record is None:
+                        continue
+                    self._write_tracking(record)
+                    written += 1
+            if written:
+                self._save()
+                self._load_running_totals()
+        return written
 
     def list_all(self) -> list[dict[str, Any]]:
-        return [deepcopy(item) for item in self._items.values()]
+        with self._lock:
+            rows = self._conn.execute("SELECT payload_json FROM revenue_trackings ORDER BY rowid").fetchall()
+        return [item for item in (self._tracking_from_payload(row[0]) for row in rows) if item is not None]
 
     def get_by_tracking(self, tracking_id: str) -> dict[str, Any] | None:
-        item = self._items.get(str(tracking_id).strip())
-        if item is None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload_json FROM revenue_trackings WHERE tracking_id = ?",
+                (str(tracking_id).strip(),),
+            ).fetchone()
+        if row is None:
             return None
-        return deepcopy(item)
+        return self._tracking_from_payload(row[0])
 
-    def summary(self) -> dict[str, Any]:
-        totals = {"sales": 0, "revenue": 0.0}
-        by_product: dict[str, dict[str, float | int]] = {}
-        by_channel: dict[str, dict[str, float | int]] = {}
-        by_subreddit: dict[str, dict[str, float | int]] = {}
-
-        for sale in self._sales:
-            product_id = str(sale.get("product_id") or "").strip()
-            revenue = float(sale.get("revenue", 0.0) or 0.0)
-            attribution = sale.get("attribution", {}) if isinstance(sale.get("attribution"), dict) else {}
-            channel = str(attribution.get("channel") or "unknown")
-            subreddit = str(attribution.get("subreddit") or "").strip()
-
-            totals["sales"] += 1
-            totals["revenue"] = round(float(totals["revenue"]) + revenue, 2)
-
-            if product_id:
-                bucket = by_product.setdefault(product_id, {"sales": 0, "revenue": 0.0})
-                bucket["sales"] = int(bucket["sales"]) + 1
-                bucket["revenue"] = round(float(bucket["revenue"]) + revenue, 2)
-
-            channel_bucket = by_channel.setdefault(channel, {"sales": 0, "revenue": 0.0})
-            channel_bucket["sales"] = int(channel_bucket["sales"]) + 1
-            channel_bucket["revenue"] = round(float(channel_bucket["revenue"]) + revenue, 2)
-
-            if subreddit:
-                sub_bucket = by_subreddit.setdefault(subreddit, {"sales": 0, "revenue": 0.0, "views": 0, "conversion_rate": 0.0})
-                sub_bucket["sales"] = int(sub_bucket["sales"]) + 1
-                sub_bucket["revenue"] = round(float(sub_bucket["revenue"]) + revenue, 2)
-
-        for subreddit, bucket in by_subreddit.items():
-            tracking_views = sum(
-                1
-                for row in self._items.values()
-                if str(row.get("subreddit") or "").strip() == subreddit
+    def list_sales(
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        tracking_id: str | None = None,
+        subreddit: str | None = None,
+    ) -> dict[str, Any]:
+        """Newest-first page of the sales ledger, keyed on ``(timestamp, rowid)``."""
+        page_limit = clamp_limit(limit)
+        clauses: list[str] = []
+        params: list[Any] = []
+        if tracking_id:
+            clauses.append("tracking_id = ?")
+            params.append(str(tracking_id).strip())
+        if subreddit:
+            clauses.append("subreddit = ?")
+            params.append(str(subreddit).strip())
+        if cursor:
+            cursor_timestamp, cursor_rowid = decode_cursor(cursor, 2)
+            clauses.append("(timestamp < ? OR (timestamp = ? AND rowid < ?))")
+            params.extend([cursor_timestamp, cursor_timestamp, int(cursor_rowid)])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT tracking_id, sale_id, product_id, revenue, timestamp, channel, subreddit, post_id, rowid "
+                f"FROM revenue_sales {where} ORDER BY timestamp DESC, rowid DESC LIMIT ?",
+                (*params, page_limit + 1),
+            ).fetchall()
+        next_cursor = None
+        if len(rows) > page_limit:
+            rows = rows[:page_limit]
+            next_cursor = encode_cursor(rows[-1][4], rows[-1][8])
+        return {"items": [self._sale_from_row(row[:8]) for row in rows], "next_cursor": next_cursor}
+
+    def _load_running_totals(self) -> None:
+        def buckets(sql: str) -> dict[str, dict[str, float | int]]:
+            return {
+                str(key): {"sales": int(sales or 0), "revenue": round(float(revenue or 0.0), 2)}
+                for key, sales, revenue in self._conn.execute(sql)
+            }
+
+        with self._lock:
+            total_sales, total_revenue = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(revenue), 0) FROM revenue_sales"
+            ).fetchone()
+            self._totals: dict[str, float | int] = {
+                "sales": int(total_sales or 0),
+                "revenue": round(float(total_revenue or 0.0), 2),
+            }
+            self._by_product = buckets(
+                "SELECT product_id, COUNT(*), SUM(revenue) FROM revenue_sales "
+                "WHERE product_id != '' GROUP BY product_id"
             )
-            bucket["views"] = tracking_views
-            bucket["conversion_rate"] = round(int(bucket["sales"]) / tracking_views, 4) if tracking_views > 0 else 0.0
-
+            self._by_channel = buckets("SELECT channel, COUNT(*), SUM(revenue) FROM revenue_sales GROUP BY channel")
+            self._by_subreddit = buckets(
+                "SELECT subreddit, COUNT(*), SUM(revenue) FROM revenue_sales "
+                "WHERE subreddit IS NOT NULL GROUP BY subreddit"
+            )
+            self._by_tracking = buckets(
+                "SELECT tracking_id, COUNT(*), SUM(revenue) FROM revenue_sales "
+                "WHERE tracking_id != '' GROUP BY tracking_id"
+            )
+            self._views: dict[str, int] = {
+                str(subreddit): int(count)
+                for subreddit, count in self._conn.execute(
+                    "SELECT subreddit, COUNT(*) FROM revenue_trackings WHERE subreddit IS NOT NULL GROUP BY subreddit"
+                )
+            }
+            self._changes.publish("reload")
+
+    def _apply_sale(self, sale: dict[str, Any]) -> None:
+        revenue = float(sale.get("revenue", 0.0) or 0.0)
+        attribution = sale["attribution"]
+        keyed_buckets = [
+            (self._by_product, str(sale.get("product_id") or "").strip()),
+            (self._by_channel, str(attribution.get("channel") or "unknown")),
+            (self._by_subreddit, str(attribution.get("subreddit") or "").strip()),
+            (self._by_tracking, str(sale.get("tracking_id") or "").strip()),
+        ]
+        for target in [self._totals] + [
+            buckets.setdefault(key, {"sales": 0, "revenue": 0.0}) for buckets, key in keyed_buckets if key
+        ]:
+            target["sales"] = int(target["sales"]) + 1
+            target["revenue"] = round(float(target["revenue"]) + revenue, 2)
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every tracking or sale change."""
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
+
+    def get_tracking_totals(self, tracking_id: str) -> dict[str, float | int]:
+        with self._lock:
+            bucket = self._by_tracking.get(str(tracking_id).strip())
+            return dict(bucket) if bucket else {"sales": 0, "revenue": 0.0}
+
+    def _window_segments(self, since: int, until: int) -> list[tuple[str, int, int]]:
+        """Split ``[since, until)`` into raw edges, hourly runs and whole days."""
+        hour, day = self._HOUR_SECONDS, self._DAY_SECONDS
+        first_hour = -(-since // hour) * hour
+        last_hour = until // hour * hour
+        if first_hour >= last_hour:
+            return [("raw", since, until)]
+        first_day = -(-first_hour // day) * day
+        last_day = last_hour // day * day
+        if first_day < last_day:
+            middle = [("hour", first_hour, first_day), ("day", first_day, last_day), ("hour", last_day, last_hour)]
+        else:
+            middle = [("hour", first_hour, last_hour)]
+        segments = [("raw", since, first_hour), *middle, ("raw", last_hour, until)]
+        return [segment for segment in segments if segment[1] < segment[2]]
+
+    def _window_bound(self, value: Any, default: int) -> int:
+        if value is None or value == "":
+            return default
+        if isinstance(value, (int, float)):
+            return int(value)
+        epoch = self._to_epoch(value.isoformat() if isinstance(value, datetime) else value)
+        if epoch is None:
+            raise ValueError("invalid_timestamp")
+        return epoch
+
+    def window_summary(self, since: Any = None, until: Any = None, *, include_trackings: bool = False) -> dict[str, Any]:
+        """Sales and revenue for ``[since, until)`` from hourly/daily rollups.
+
+        Only the partial hours at either edge of the window are read from the
+        raw ledger, in one grouped scan; everything else comes from
+        pre-aggregated buckets. Results are cached per window until the next
+        change. Bounds accept ISO strings, datetimes or epoch seconds. The
+        per-tracking breakdown is opt-in because it is the widest dimension.
+        Sales with unparseable timestamps only count toward the all-time
+        ``summary()``.
+        """
+        start = self._window_bound(since, 0)
+        end = self._window_bound(until, self._FAR_FUTURE_EPOCH)
+        cache_key = (start, end, include_trackings)
+        with self._lock:
+            current_version = self._changes.version
+            cached = self._window_cache.get(cache_key)
+            if cached is not None and cached[0] == current_version:
+                self._window_cache.move_to_end(cache_key)
+                results = cached[1]
+            else:
+                results = self._window_totals(start, end, include_trackings)
+                self._window_cache[cache_key] = (current_version, results)
+                self._window_cache.move_to_end(cache_key)
+                while len(self._window_cache) > self._WINDOW_CACHE_SIZE:
+                    self._window_cache.popitem(last=False)
+            results = deepcopy(results)
+
+        by_product = results["product"]
+        window = {
+            "since": datetime.fromtimestamp(start, tz=timezone.utc).isoformat() if since is not None else None,
+            "until": datetime.fromtimestamp(end, tz=timezone.utc).isoformat() if until is not None else None,
+            "totals": results["total"].get("", {"sales": 0, "revenue": 0.0}),
+            "by_product": by_product,
+            "by_channel": results["channel"],
+            "by_subreddit": results["subreddit"],
+            "by_proposal": by_product,
+        }
+        if include_trackings:
+            window["by_tracking"] = results["tracking"]
+        return window
+
+    def _window_totals(self, start: int, end: int, include_trackings: bool) -> dict[str, dict[str, dict[str, float | int]]]:
+        dimensions = ["total", "product", "channel", "subreddit"] + (["tracking"] if include_trackings else [])
+        raw: list[tuple[int, int]] = []
+        parts: list[str] = []
+        params: list[Any] = []
+        for kind, segment_start, segment_end in self._window_segments(start, end) if start < end else []:
+            if kind == "raw":
+                raw.append((segment_start, segment_end))
+                continue
+            # One equality per dimension keeps the bucket range on the primary
+            # key; with ``dimension IN (...)`` SQLite walks every bucket of the
+            # key index instead.
+            for dimension in dimensions:
+                parts.append(
+                    "SELECT dimension, key, sales, revenue FROM revenue_rollups "
+                    "WHERE granularity = ? AND dimension = ? AND bucket_epoch >= ? AND bucket_epoch < ?"
+                )
+                params.extend([kind, dimension, segment_start, segment_end])
+
+        sums: dict[tuple[str, str], list[float]] = {}
+
+        def add(dimension: str, key: Any, sales: Any, revenue: Any) -> None:
+            if dimension != "total" and not key:
+                return
+            bucket = sums.setdefault((dimension, str(key or "")), [0, 0.0])
+            bucket[0] += int(sales or 0)
+            bucket[1] += float(revenue or 0.0)
+
+        if parts:
+            for row in self._conn.execute(
+                "SELECT dimension, key, SUM(sales), SUM(revenue) FROM (" + " UNION ALL ".join(parts) + ") GROUP BY dimension, key",
+                params,
+            ):
+                add(*row)
+        if raw:
+            # Both edges in one scan, grouped on every dimension at once.
+            group_columns = "product_id, channel, subreddit" + (", tracking_id" if include_trackings else "")
+            edges = " UNION ALL ".join(
+                f"SELECT {group_columns}, revenue FROM revenue_sales WHERE sold_epoch >= ? AND sold_epoch < ?" for _ in raw
+            )
+            for row in self._conn.execute(
+                f"SELECT {group_columns}, COUNT(*), SUM(revenue) FROM ({edges}) GROUP BY {group_columns}",
+                [bound for segment in raw for bound in segment],
+            ):
+                product_id, channel, subreddit = row[:3]
+                sales, revenue = row[-2:]
+                add("total", "", sales, revenue)
+                add("product", product_id, sales, revenue)
+                add("channel", channel, sales, revenue)
+                add("subreddit", subreddit, sales, revenue)
+                if include_trackings:
+                    add("tracking", row[3], sales, revenue)
+
+        results: dict[str, dict[str, dict[str, float | int]]] = {dimension: {} for dimension in dimensions}
+        for (dimension, key), (sales, revenue) in sums.items():
+            results[dimension][key] = {"sales": int(sales), "revenue": round(revenue, 2)}
+        return results
+
+    def summary(self, *, since: Any = None, until: Any = None, include_trackings: bool = False) -> dict[str, Any]:
+        """Revenue summary for the current ``version``.
+
+        The all-time summary is rebuilt at most once per version and callers
+        get their own copy. ``since``/``until`` switch to the time-windowed
+        rollup query (see ``window_summary``).
+        """
+        with self._lock:
+            current_version = self._changes.version
+            if since is not None or until is not None:
+                return {
+                    "version": current_version,
+                    **self.window_summary(since, until, include_trackings=include_trackings),
+                }
+            if self._cached_summary is None or self._cached_summary_version != current_version:
+                self._cached_summary = self._build_summary(current_version)
+                self._cached_summary_version = current_version
+            return deepcopy(self._cached_summary)
+
+    def summary_if_changed(self, version: int) -> dict[str, Any] | None:
+        """``summary()`` unless ``version`` is still current, in which case ``None``."""
+        with self._lock:
+            if int(version) == self._changes.version:
+                return None
+            return self.summary()
+
+    def _build_summary(self, current_version: int) -> dict[str, Any]:
+        by_product = {key: dict(bucket) for key, bucket in self._by_product.items()}
+        by_subreddit: dict[str, dict[str, float | int]] = {}
+        for subreddit, bucket in self._by_subreddit.items():
+            tracking_views = int(self._views.get(subreddit, 0) or 0)
+            by_subreddit[subreddit] = {
+                **bucket,
+                "views": tracking_views,
+                "conversion_rate": round(int(bucket["sales"]) / tracking_views, 4) if tracking_views > 0 else 0.0,
+            }
         return {
-            "totals": totals,
+            "version": current_version,
+            "totals": dict(self._totals),
             "by_product": by_product,
-            "by_channel": by_channel,
+            "by_channel": {key: dict(bucket) for key, bucket in self._by_channel.items()},
             "by_subreddit": by_subreddit,
-            "sales": deepcopy(self._sales),
+            # Most recent sales only; page the full ledger with ``list_sales``.
+            "sales": self.list_sales(limit=self._SUMMARY_RECENT_SALES)["items"],
             # Backward-compatible alias.
             "by_proposal": by_product,
         }
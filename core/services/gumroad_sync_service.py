@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 import logging
 
 from datetime import datetime, timezone
@@ -7,6 +8,7 @@ import re
 from typing import Any
 
 from core.integrations.gumroad_client import GumroadClient
+from core.persistence.json_io import durability_batch
 from core.product_launch_store import ProductLaunchStore
 from core.revenue_attribution.store import RevenueAttributionStore
 from core.subreddit_performance_store import SubredditPerformanceStore
@@ -54,6 +56,13 @@ class GumroadSyncService:
         self._subreddit_performance_store = subreddit_performance_store
 
     def sync_sales(self) -> dict[str, float | int]:
+        # Subreddit counters are journaled per sale inside the batch, so a
+        # launch that fails mid-sync keeps the increments for launches before it.
+        subreddit_batch = self._subreddit_performance_store.batch() if self._subreddit_performance_store is not None else nullcontext()
+        with durability_batch(), subreddit_batch:
+            return self._sync_sales()
+
+    def _sync_sales(self) -> dict[str, float | int]:
         synced_launches = 0
         total_new_sales = 0
         total_revenue_added = 0.0
@@ -95,14 +104,9 @@ class GumroadSyncService:
                             sale_id=str(sale.get("sale_id") or "").strip() or None,
                             sold_at=str(sale.get("created_at") or "").strip() or None,
                         )
-                        if (
-                            attributed is not None
-                            and self._subreddit_performance_store is not None
-                            and str(attributed.get("subreddit") or "").strip()
-                        ):
-                            self._subreddit_performance_store.record_sale(
-                                str(attributed.get("subreddit") or "").strip(),
-                            )
+                        subreddit = str((attributed or {}).get("subreddit") or "").strip()
+                        if subreddit and self._subreddit_performance_store is not None:
+                            self._subreddit_performance_store.record_sale(subreddit)
             else:
                 revenue_added = 0.0
                 newest_sale_id = last_sale_id
@@ -15,6 +15,7 @@ from core.persistence.decision_logs import (
     list_recent_decision_logs,
     update_decision_log_status,
 )
+from core.persistence.write_metrics import sqlite_commit_fsyncs, timed_commit
 
 
 def get_db_path() -> Path:
@@ -23,12 +24,15 @@ def get_db_path() -> Path:
 
 
 class Storage:
+    _DEFAULT_FILENAME = "memory/treta.sqlite"
+
     def __init__(self):
         self.db_path = get_db_path()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self._logger = logging.getLogger("treta.storage")
         self._configure_connection()
+        self._commit_fsyncs = sqlite_commit_fsyncs(self.conn)
         ensure_decision_logs_table(self.conn)
         self._ensure_runtime_overrides_table()
         self._ensure_processed_events_table()
@@ -120,9 +124,17 @@ class Storage:
         wal_mode = str(self.conn.execute("PRAGMA journal_mode;").fetchone()[0]).lower()
         self._logger.info("SQLite configured", extra={"journal_mode": wal_mode, "foreign_keys": 1})
 
+    @property
+    def version(self) -> int:
+        """Moves on every write: rows changed through this connection plus
+        SQLite's ``data_version``, which moves when another connection commits."""
+        with self._lock:
+            data_version = int(self.conn.execute("PRAGMA data_version").fetchone()[0])
+            return self.conn.total_changes + data_version
+
     @contextmanager
     def transaction(self):
-        with self._lock:
+        with self._lock, timed_commit("storage", self.conn, self._commit_fsyncs):
             try:
                 self.conn.execute("BEGIN")
                 yield self.conn
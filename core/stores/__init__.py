@@ -1,3 +1,13 @@
 from core.stores.adaptive_policy_store import AdaptivePolicyStore
+from core.stores.change_feed import ChangeFeed, StoreChange, store_version
+from core.stores.registry import StoreRegistry, get_store, get_store_registry
 
-__all__ = ["AdaptivePolicyStore"]
+__all__ = [
+    "AdaptivePolicyStore",
+    "ChangeFeed",
+    "StoreChange",
+    "StoreRegistry",
+    "get_store",
+    "get_store_registry",
+    "store_version",
+]
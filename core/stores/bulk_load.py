@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from core.opportunity_store import OpportunityStore
+from core.persistence.json_io import atomic_read_json, atomic_write_json, durability_batch, file_lock
+from core.product_launch_store import ProductLaunchStore
+from core.product_plan_store import ProductPlanStore
+from core.product_proposal_store import ProductProposalStore
+from core.revenue_attribution.store import RevenueAttributionStore
+from core.stores.registry import get_store
+from core.strategy_action_store import StrategyActionStore
+
+
+# Dataset keys backed by a plain JSON list file, mapped to the store owning it.
+_JSON_LIST_STORES: dict[str, type] = {
+    "opportunities": OpportunityStore,
+    "product_proposals": ProductProposalStore,
+    "product_plans": ProductPlanStore,
+    "product_launches": ProductLaunchStore,
+}
+DATASET_KEYS = (*_JSON_LIST_STORES, "strategy_actions", "revenue_trackings", "revenue_sales")
+
+
+def bulk_load(data_dir: Path, dataset: Mapping[str, Iterable[dict[str, Any]]]) -> dict[str, int]:
+    """Append ``dataset`` rows to the stores under ``data_dir`` without going record by record.
+
+    JSON list stores are rewritten once each (existing items first, then the
+    new rows) and SQLite-backed stores take all rows in one transaction,
+    through the registry's live instances so their in-memory state and
+    running totals stay current. Rows use the same shape the stores return
+    from ``list``/``list_all``/``list_sales``. JSON stores keep their usual
+    ``capacity`` bound when they are next loaded. Returns the number of rows
+    written per key.
+    """
+    unknown = sorted(set(dataset) - set(DATASET_KEYS))
+    if unknown:
+        raise ValueError(f"unknown_dataset_keys: {', '.join(unknown)}")
+
+    data_dir = Path(data_dir).resolve()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    counts: dict[str, int] = {}
+    with durability_batch():
+        for key, store_cls in _JSON_LIST_STORES.items():
+            if key not in dataset:
+                continue
+            rows = [dict(row) for row in dataset[key] if isinstance(row, dict)]
+            path = data_dir / store_cls._DEFAULT_FILENAME
+            with file_lock(path):
+                existing = atomic_read_json(path, []) if path.exists() else []
+                if not isinstance(existing, list):
+                    raise ValueError(f"store_file_not_a_list: {path.name}")
+                atomic_write_json(path, [*existing, *rows])
+            counts[key] = len(rows)
+
+        if "strategy_actions" in dataset:
+            actions = get_store(StrategyActionStore, path=data_dir / StrategyActionStore._DEFAULT_FILENAME)
+            counts["strategy_actions"] = actions.import_actions(list(dataset["strategy_actions"]))
+
+        if "revenue_trackings" in dataset or "revenue_sales" in dataset:
+            revenue = get_store(RevenueAttributionStore, path=data_dir / RevenueAttributionStore._DEFAULT_FILENAME)
+            if "revenue_trackings" in dataset:
+                counts["revenue_trackings"] = revenue.import_trackings(dataset["revenue_trackings"])
+            if "revenue_sales" in dataset:
+                counts["revenue_sales"] = revenue.import_sales(dataset["revenue_sales"])
+    return counts
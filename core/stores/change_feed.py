@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import threading
+from typing import Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StoreChange:
+    store: str
+    version: int
+    op: str
+    item_id: str | None = None
+
+
+ChangeListener = Callable[[StoreChange], None]
+
+
+class ChangeFeed:
+    """Monotonic version counter plus in-process change listeners for one store.
+
+    Stores call ``publish`` after every committed mutation. Derived views keep
+    the ``version`` they were computed at and recompute only when it moved;
+    listeners run synchronously on the mutating thread, so they should only
+    mark state dirty rather than do heavy work.
+    """
+
+    def __init__(self, store: str) -> None:
+        self._store = store
+        self._lock = threading.Lock()
+        self._version = 0
+        self._listeners: list[ChangeListener] = []
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def subscribe(self, listener: ChangeListener) -> Callable[[], None]:
+        """Register ``listener``; the returned callable removes it again."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return unsubscribe
+
+    def publish(self, op: str, item_id: str | None = None) -> StoreChange:
+        with self._lock:
+            self._version += 1
+            change = StoreChange(self._store, self._version, op, None if item_id is None else str(item_id))
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(change)
+            except Exception:
+                logger.exception("Store change listener failed", extra={"store": self._store, "op": op})
+        return change
+
+
+def store_version(store: object) -> int | None:
+    """``store.version`` when the store exposes a change feed, else ``None``."""
+    version = getattr(store, "version", None)
+    return version if isinstance(version, int) else None
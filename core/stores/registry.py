@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import inspect
+import os
+from pathlib import Path
+import threading
+from typing import Any, TypeVar
+import weakref
+
+
+T = TypeVar("T")
+
+_DEFAULT_DATA_DIR = "./.treta_data"
+
+
+class StoreRegistry:
+    """Process-wide map of live store instances keyed by (store class, backing file).
+
+    Values are held weakly: a store lives as long as something (usually
+    ``TretaApp``) references it, and every ``get`` for the same class and path
+    while it is alive returns that same object instead of re-reading disk.
+    An explicitly ``register``-ed store always replaces the registry's entry,
+    and a ``get`` whose constructor kwargs disagree with what the live instance
+    actually holds raises instead of handing back a differently wired store.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._instances: weakref.WeakValueDictionary[tuple[type, str], Any] = weakref.WeakValueDictionary()
+        self._build_kwargs: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+    def _key(self, store_cls: type, path: Path | None) -> tuple[type, str]:
+        if path is None:
+            data_dir = Path(os.getenv("TRETA_DATA_DIR", _DEFAULT_DATA_DIR))
+            path = data_dir / getattr(store_cls, "_DEFAULT_FILENAME", store_cls.__name__)
+        return store_cls, str(Path(path).resolve())
+
+    def get(self, store_cls: type[T], path: Path | None = None, **kwargs: Any) -> T:
+        """Return the live instance for ``store_cls``/``path``, creating it with ``kwargs`` if needed.
+
+        Raises ``ValueError`` if a live instance exists but holds a different
+        dependency than one passed in ``kwargs``.
+        """
+        key = self._key(store_cls, path)
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                instance = store_cls(**kwargs, **({"path": path} if path is not None else {}))
+                self._instances[key] = instance
+                self._build_kwargs[instance] = dict(kwargs)
+                return instance
+            built_with = self._build_kwargs.get(instance, {})
+            conflicts = sorted(
+                name for name, value in kwargs.items() if not _same(_held(instance, name, built_with), value)
+            )
+            if conflicts:
+                raise ValueError(
+                    f"live {store_cls.__name__} for {key[1]} was built with different {', '.join(conflicts)}"
+                )
+            return instance
+
+    def register(self, store: T, path: Path | None = None) -> T:
+        """Adopt an already built store, replacing any live instance for the same key."""
+        resolved_path = path if path is not None else getattr(store, "_path", None)
+        key = self._key(type(store), resolved_path)
+        with self._lock:
+            self._instances[key] = store
+            return store
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+
+_MISSING = object()
+
+
+def _held(instance: Any, name: str, built_with: dict[str, Any]) -> Any:
+    """What ``instance`` actually holds for constructor argument ``name``.
+
+    Stores keep their collaborators as ``_<name>`` attributes; when one is not
+    exposed that way, fall back to the kwargs it was built with and then to the
+    constructor's default.
+    """
+    attribute = getattr(instance, f"_{name}", _MISSING)
+    if attribute is not _MISSING:
+        return attribute
+    if name in built_with:
+        return built_with[name]
+    try:
+        parameter = inspect.signature(type(instance)).parameters.get(name)
+    except (TypeError, ValueError):
+        return _MISSING
+    if parameter is None or parameter.default is inspect.Parameter.empty:
+        return _MISSING
+    return parameter.default
+
+
+def _same(left: Any, right: Any) -> bool:
+    if left is right or left == right:
+        return True
+    # Two stores of one class over the same file are the same dependency: they
+    # share the on-disk state through the store's own file lock and reload.
+    left_path = getattr(left, "_path", None)
+    right_path = getattr(right, "_path", None)
+    return (
+        type(left) is type(right)
+        and left_path is not None
+        and right_path is not None
+        and Path(left_path).resolve() == Path(right_path).resolve()
+    )
+
+
+_default_registry = StoreRegistry()
+
+
+def get_store_registry() -> StoreRegistry:
+    return _default_registry
+
+
+def get_store(store_cls: type[T], path: Path | None = None, **kwargs: Any) -> T:
+    return _default_registry.get(store_cls, path, **kwargs)
@@ -68,6 +68,9 @@ class StrategyActionExecutionLayer:
     def list_pending_actions(self) -> List[Dict[str, Any]]:
         return self._strategy_action_store.list(status="pending_confirmation")
 
+    def list_actions_page(self, *, status: str | None = None, limit: int = 50, cursor: str | None = None) -> Dict[str, Any]:
+        return self._strategy_action_store.list_page(status=status, limit=limit, cursor=cursor)
+
     def execute_action(self, action_id: str, status: str = "executed", request_id: str | None = None, trace_id: str | None = None) -> Dict[str, Any]:
         action = self._strategy_action_store.get(action_id)
         if action is None:
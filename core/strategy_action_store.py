@@ -8,10 +8,14 @@ import logging
 import os
 from pathlib import Path
 import sqlite3
+import threading
 from typing import Any, Dict, List
 
 from core.persistence.json_io import atomic_read_json, atomic_write_json, quarantine_corrupt_file
+from core.persistence.pagination import clamp_limit, decode_cursor, encode_cursor
+from core.persistence.write_metrics import sqlite_commit_fsyncs, timed_commit
 from core.risk_evaluation_engine import RiskEvaluationEngine
+from core.stores.change_feed import ChangeFeed, ChangeListener
 
 
 StrategyAction = Dict[str, Any]
@@ -20,9 +24,16 @@ logger = logging.getLogger(__name__)
 
 
 class StrategyActionStore:
-    """Persistent bounded store for strategy actions requiring confirmation."""
+    """Persistent bounded store for strategy actions requiring confirmation.
+
+    With SQLite available only the working set (every pending action plus the
+    most recent ``capacity`` rows) is kept in memory; older rows are read on
+    demand through indexed queries and ``list_page``.
+    """
 
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "strategy_actions.json"
+    _METRICS_KEY = "strategy_actions"
     _ALLOWED_TYPES = {
         "scale",
         "review",
@@ -38,11 +49,15 @@ class StrategyActionStore:
 
     def __init__(self, capacity: int = 200, path: Path | None = None):
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "strategy_actions.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._risk_evaluation_engine = RiskEvaluationEngine()
+        self._capacity = max(1, int(capacity))
+        self._max_index = 0
+        self._lock = threading.RLock()
         self._sqlite_enabled = False
         self._conn: sqlite3.Connection | None = None
+        self._commit_fsyncs = 0
 
         db_path = self._resolve_db_path(data_dir=data_dir, json_path=self._path)
         loaded_from_sqlite: list[StrategyAction] = []
@@ -51,7 +66,9 @@ class StrategyActionStore:
             self._conn = sqlite3.connect(db_path, check_same_thread=False)
             self._sqlite_enabled = True
             self._ensure_sqlite_table()
-            loaded_from_sqlite = self._load_items_from_sqlite()
+            self._commit_fsyncs = sqlite_commit_fsyncs(self._conn)
+            self._max_index = self._load_max_index_from_sqlite()
+            loaded_from_sqlite = self._load_working_set_from_sqlite()
             logger.info("StrategyActions now SQLite-only (JSON deprecated)", extra={"db_path": str(db_path)})
         except sqlite3.Error as exc:
             self._sqlite_enabled = False
@@ -64,8 +81,19 @@ class StrategyActionStore:
             initial_items = self._load_items_from_json()
             if self._sqlite_enabled and initial_items:
                 self._migrate_json_to_sqlite(initial_items)
+            initial_items = initial_items[-self._capacity :]
+
+        # Pending actions older than the recent window stay resident, so the
+        # deque may start above ``capacity``; new appends evict the oldest.
+        self._items: deque[StrategyAction] = deque(initial_items, maxlen=max(self._capacity, len(initial_items)))
+        self._changes = ChangeFeed("strategy_actions")
 
-        self._items: deque[StrategyAction] = deque(initial_items, maxlen=capacity)
+    @property
+    def version(self) -> int:
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
 
     def _resolve_db_path(self, *, data_dir: Path, json_path: Path) -> Path:
         if json_path.is_absolute():
@@ -89,6 +117,10 @@ class StrategyActionStore:
         self._conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_actions_status ON strategy_actions(status)")
         self._conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_actions_event_id ON strategy_actions(event_id)")
         self._conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_actions_decision_id ON strategy_actions(decision_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy_actions_created_at ON strategy_actions(created_at, id)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_strategy_actions_status_created_at ON strategy_actions(status, created_at, id)"
+        )
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS decision_outcomes (
@@ -114,39 +146,78 @@ class StrategyActionStore:
             return []
         return [self._normalize_item(dict(item)) for item in loaded if isinstance(item, dict)]
 
-    def _load_items_from_sqlite(self) -> List[StrategyAction]:
+    def _row_to_item(self, payload_json: str | None, decision_id: str | None, event_id: str | None) -> StrategyAction:
+        try:
+            payload = json.loads(payload_json or "{}")
+        except json.JSONDecodeError:
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+        if decision_id and not payload.get("decision_id"):
+            payload["decision_id"] = decision_id
+        if event_id and not payload.get("event_id"):
+            payload["event_id"] = event_id
+        return self._normalize_item(payload)
+
+    def _load_max_index_from_sqlite(self) -> int:
+        assert self._conn is not None
+        # Compare numerically: past action-999999 the ids no longer sort as text.
+        row = self._conn.execute(
+            "SELECT MAX(CAST(substr(id, 8) AS INTEGER)) FROM strategy_actions WHERE id LIKE 'action-%'"
+        ).fetchone()
+        return int(row[0] or 0) if row is not None else 0
+
+    def _load_working_set_from_sqlite(self) -> List[StrategyAction]:
         assert self._conn is not None
-        rows = self._conn.execute(
-            "SELECT payload_json, decision_id, event_id FROM strategy_actions ORDER BY created_at ASC"
+        recent_rows = self._conn.execute(
+            """
+            SELECT id, created_at, payload_json, decision_id, event_id
+            FROM strategy_actions
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+            """,
+            (self._capacity,),
         ).fetchall()
-        items: list[StrategyAction] = []
-        for payload_json, decision_id, event_id in rows:
-            try:
-                payload = json.loads(payload_json or "{}")
-            except json.JSONDecodeError:
-                payload = {}
-            if not isinstance(payload, dict):
-                payload = {}
-            if decision_id and not payload.get("decision_id"):
-                payload["decision_id"] = decision_id
-            if event_id and not payload.get("event_id"):
-                payload["event_id"] = event_id
-            items.append(self._normalize_item(payload))
-        return items
+        pending_rows = self._conn.execute(
+            """
+            SELECT id, created_at, payload_json, decision_id, event_id
+            FROM strategy_actions
+            WHERE status = 'pending_confirmation'
+            """
+        ).fetchall()
+
+        rows_by_id = {str(row[0]): row for row in [*recent_rows, *pending_rows]}
+        ordered = sorted(rows_by_id.values(), key=lambda row: (str(row[1] or ""), str(row[0])))
+        return [self._row_to_item(payload_json, decision_id, event_id) for _, _, payload_json, decision_id, event_id in ordered]
+
+    def _load_item_from_sqlite(self, action_id: str) -> StrategyAction | None:
+        if not self._sqlite_enabled or self._conn is None or not action_id:
+            return None
+        row = self._conn.execute(
+            "SELECT payload_json, decision_id, event_id FROM strategy_actions WHERE id = ?",
+            (action_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_item(*row)
 
     def _migrate_json_to_sqlite(self, items: List[StrategyAction]) -> None:
-        for item in items:
-            self._upsert_sqlite(item)
-        if self._conn is not None:
+        if self._conn is None:
+            return
+        with timed_commit(self._METRICS_KEY, self._conn, self._commit_fsyncs) as counters:
+            for item in items:
+                counters["bytes"] += self._upsert_sqlite(item)
             self._conn.commit()
 
     def _save_json_legacy(self) -> None:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         atomic_write_json(self._path, list(self._items))
 
-    def _upsert_sqlite(self, item: StrategyAction) -> None:
+    def _upsert_sqlite(self, item: StrategyAction) -> int:
+        """Upsert ``item``; returns the payload size in bytes (0 when SQLite is off)."""
         if not self._sqlite_enabled or self._conn is None:
-            return
+            return 0
+        payload_json = json.dumps(item)
         decision_id = str(item.get("decision_id") or "").strip() or None
         event_id = str(item.get("event_id") or "").strip() or None
         self._conn.execute(
@@ -164,11 +235,12 @@ class StrategyActionStore:
                 str(item.get("id") or ""),
                 str(item.get("created_at") or self._now()),
                 str(item.get("status") or "pending_confirmation"),
-                json.dumps(item),
+                payload_json,
                 decision_id,
                 event_id,
             ),
         )
+        return len(payload_json.encode("utf-8"))
 
     def _predict_risk_for_decision(self, decision_id: str) -> float | None:
         if not self._sqlite_enabled or self._conn is None or not decision_id:
@@ -233,26 +305,30 @@ class StrategyActionStore:
 
     def _persist(self, item: StrategyAction) -> None:
         if self._sqlite_enabled and self._conn is not None:
-            self._upsert_sqlite(item)
-            if str(item.get("status") or "").strip().lower() in {"executed", "auto_executed", "completed", "failed"}:
-                self._record_decision_outcome(item)
-            self._conn.commit()
+            with timed_commit(self._METRICS_KEY, self._conn, self._commit_fsyncs) as counters:
+                counters["bytes"] = self._upsert_sqlite(item)
+                if str(item.get("status") or "").strip().lower() in {"executed", "auto_executed", "completed", "failed"}:
+                    self._record_decision_outcome(item)
+                self._conn.commit()
             return
         self._save_json_legacy()
 
     def _now(self) -> str:
         return datetime.now(timezone.utc).isoformat()
 
+    def _index_of(self, item_id: object) -> int:
+        text = str(item_id or "")
+        if not text.startswith("action-"):
+            return 0
+        try:
+            return int(text.replace("action-", ""))
+        except ValueError:
+            return 0
+
     def _next_id(self) -> str:
-        max_index = 0
-        for item in self._items:
-            item_id = str(item.get("id", ""))
-            if item_id.startswith("action-"):
-                try:
-                    max_index = max(max_index, int(item_id.replace("action-", "")))
-                except ValueError:
-                    continue
-        return f"action-{max_index + 1:06d}"
+        with self._lock:
+            self._max_index += 1
+            return f"action-{self._max_index:06d}"
 
     def _normalize_item(self, item: StrategyAction) -> StrategyAction:
         action_type = str(item.get("type") or "review")
@@ -294,13 +370,15 @@ class StrategyActionStore:
             normalized["trace_id"] = trace_id
 
         normalized.update(self._risk_evaluation_engine.evaluate(normalized))
+        with self._lock:
+            self._max_index = max(self._max_index, self._index_of(normalized["id"]))
         return normalized
 
     def _find(self, action_id: str) -> StrategyAction | None:
         for item in self._items:
             if item.get("id") == action_id:
                 return item
-        return None
+        return self._load_item_from_sqlite(action_id)
 
     def add(
         self,
@@ -314,24 +392,50 @@ class StrategyActionStore:
         event_id: str | None = None,
         trace_id: str | None = None,
     ) -> StrategyAction:
-        item = self._normalize_item(
-            {
-                "id": self._next_id(),
-                "type": action_type,
-                "target_id": target_id,
-                "reasoning": reasoning,
-                "status": status,
-                "created_at": self._now(),
-                "sales": sales,
-                "decision_id": decision_id,
-                "event_id": event_id,
-                "trace_id": trace_id,
-            }
-        )
-        self._items.append(item)
-        self._persist(item)
+        with self._lock:
+            item = self._normalize_item(
+                {
+                    "id": self._next_id(),
+                    "type": action_type,
+                    "target_id": target_id,
+                    "reasoning": reasoning,
+                    "status": status,
+                    "created_at": self._now(),
+                    "sales": sales,
+                    "decision_id": decision_id,
+                    "event_id": event_id,
+                    "trace_id": trace_id,
+                }
+            )
+            self._items.append(item)
+            self._persist(item)
+        self._changes.publish("add", item["id"])
         return deepcopy(item)
 
+    def import_actions(self, items: List[StrategyAction]) -> int:
+        """Upsert already-built actions (``list`` item shape) in one transaction.
+
+        The in-memory working set is reloaded once afterwards; returns the
+        number of actions written.
+        """
+        normalized = [self._normalize_item(dict(item)) for item in items if isinstance(item, dict)]
+        if not normalized:
+            return 0
+        with self._lock:
+            if self._sqlite_enabled and self._conn is not None:
+                with timed_commit(self._METRICS_KEY, self._conn, self._commit_fsyncs) as counters, self._conn:
+                    for item in normalized:
+                        counters["bytes"] += self._upsert_sqlite(item)
+                        if str(item.get("status") or "").strip().lower() in {"executed", "auto_executed", "completed", "failed"}:
+                            self._record_decision_outcome(item)
+                working_set = self._load_working_set_from_sqlite()
+                self._items = deque(working_set, maxlen=max(self._capacity, len(working_set)))
+            else:
+                self._items.extend(normalized)
+                self._save_json_legacy()
+        self._changes.publish("import_actions")
+        return len(normalized)
+
     def list(self, status: str | None = None) -> List[StrategyAction]:
         items = list(reversed(self._items))
         if status is not None:
@@ -344,6 +448,56 @@ class StrategyActionStore:
             return None
         return deepcopy(item)
 
+    def list_page(self, *, limit: int = 50, cursor: str | None = None, status: str | None = None) -> Dict[str, Any]:
+        """Return newest-first actions after ``cursor`` plus the cursor for the next page."""
+        safe_limit = clamp_limit(limit)
+        after = decode_cursor(cursor, 2)
+
+        # Writers hold the lock across multi-row transactions on the shared
+        # connection; reading under it keeps their uncommitted rows out of pages.
+        with self._lock:
+            if not self._sqlite_enabled or self._conn is None:
+                items = list(reversed(self._items))
+                if status is not None:
+                    items = [item for item in items if item.get("status") == status]
+                if after is not None:
+                    after_created_at, after_id = after
+                    items = [
+                        item
+                        for item in items
+                        if (str(item.get("created_at") or ""), str(item.get("id") or "")) < (after_created_at, after_id)
+                    ]
+                page = items[: safe_limit + 1]
+            else:
+                clauses: list[str] = []
+                params: list[Any] = []
+                if status is not None:
+                    clauses.append("status = ?")
+                    params.append(status)
+                if after is not None:
+                    clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+                    params.extend([after[0], after[0], after[1]])
+                where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+                rows = self._conn.execute(
+                    f"""
+                    SELECT payload_json, decision_id, event_id
+                    FROM strategy_actions
+                    {where}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT ?
+                    """,
+                    (*params, safe_limit + 1),
+                ).fetchall()
+                page = [self._row_to_item(*row) for row in rows]
+            page = deepcopy(page)
+
+        next_cursor = None
+        if len(page) > safe_limit:
+            page = page[:safe_limit]
+            last = page[-1]
+            next_cursor = encode_cursor(last.get("created_at") or "", last.get("id") or "")
+        return {"items": page, "next_cursor": next_cursor}
+
     def find_pending(self, *, action_type: str, target_id: str, reasoning: str) -> StrategyAction | None:
         for item in reversed(self._items):
             if (
@@ -360,12 +514,14 @@ class StrategyActionStore:
         if target_status not in self._ALLOWED_STATUSES:
             raise ValueError(f"invalid status: {status}")
 
-        item = self._find(action_id)
-        if item is None:
-            raise ValueError(f"strategy action not found: {action_id}")
+        with self._lock:
+            item = self._find(action_id)
+            if item is None:
+                raise ValueError(f"strategy action not found: {action_id}")
 
-        item["status"] = target_status
-        if target_status in {"executed", "auto_executed"}:
-            item["executed_at"] = self._now()
-        self._persist(item)
+            item["status"] = target_status
+            if target_status in {"executed", "auto_executed"}:
+                item["executed_at"] = self._now()
+            self._persist(item)
+        self._changes.publish("set_status", action_id)
         return deepcopy(item)
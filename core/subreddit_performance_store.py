@@ -1,20 +1,62 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+import json
+import logging
 import os
+import threading
 from copy import deepcopy
 from pathlib import Path
 
 from core.persistence.json_io import atomic_read_json, atomic_write_json, quarantine_corrupt_file
+from core.stores.change_feed import ChangeFeed, ChangeListener
+
+
+logger = logging.getLogger(__name__)
 
 
 class SubredditPerformanceStore:
+    """Per-subreddit counters with coalesced snapshot writes.
+
+    Increments are applied in memory and appended to a small line journal next
+    to the snapshot; the full JSON snapshot is rewritten at most once per
+    ``flush_interval_seconds`` (or at the end of a ``batch()``), and the journal
+    is replayed on startup so a crash between flushes loses nothing. The
+    snapshot is ``{"journal_seq": n, "subreddits": {name: stats}}``; the
+    sequence marks which journal entries it already includes.
+    """
+
     _DEFAULT_DATA_DIR = "./.treta_data"
+    _DEFAULT_FILENAME = "subreddit_performance.json"
+    _DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+    _COUNTER_FIELDS = ("posts_attempted", "proposals_generated", "plans_executed", "sales")
 
-    def __init__(self, path: Path | None = None) -> None:
+    def __init__(self, path: Path | None = None, flush_interval_seconds: float | None = None) -> None:
         data_dir = Path(os.getenv("TRETA_DATA_DIR", self._DEFAULT_DATA_DIR))
-        self._path = path or data_dir / "subreddit_performance.json"
+        self._path = path or data_dir / self._DEFAULT_FILENAME
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal_path = self._path.with_suffix(self._path.suffix + ".journal")
+        if flush_interval_seconds is None:
+            flush_interval_seconds = float(
+                os.getenv("TRETA_SUBREDDIT_PERFORMANCE_FLUSH_SECONDS", self._DEFAULT_FLUSH_INTERVAL_SECONDS)
+            )
+        self._flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self._lock = threading.RLock()
+        self._flush_timer: threading.Timer | None = None
+        self._batch_depth = 0
+        self._journal_seq = 0
+        self._changes = ChangeFeed("subreddit_performance")
         self._items: dict[str, dict[str, float | int | str]] = self._load_items()
+        self._dirty = self._replay_journal()
+        self.flush()
+
+    @property
+    def version(self) -> int:
+        return self._changes.version
+
+    def subscribe(self, listener: ChangeListener):
+        return self._changes.subscribe(listener)
 
     def _default_stats(self, subreddit: str) -> dict[str, float | int | str]:
         return {
@@ -34,8 +76,18 @@ class SubredditPerformanceStore:
             quarantine_corrupt_file(self._path, ValueError("expected dict"))
             return {}
 
+        rows = loaded.get("subreddits")
+        if isinstance(rows, dict):
+            try:
+                self._journal_seq = int(loaded.get("journal_seq", 0) or 0)
+            except (TypeError, ValueError):
+                self._journal_seq = 0
+        else:
+            # Older snapshots are a bare ``{name: stats}`` map written without a journal.
+            rows = loaded
+
         items: dict[str, dict[str, float | int | str]] = {}
-        for key, row in loaded.items():
+        for key, row in rows.items():
             if not isinstance(row, dict):
                 continue
             name = str(key).strip() or str(row.get("name") or "").strip()
@@ -50,8 +102,45 @@ class SubredditPerformanceStore:
             }
         return items
 
+    def _replay_journal(self) -> bool:
+        if not self._journal_path.exists():
+            return False
+        try:
+            lines = self._journal_path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            logger.warning("Failed to read subreddit performance journal at %s: %s", self._journal_path, exc)
+            return False
+
+        replayed = False
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                seq = int(entry["seq"])
+                name = str(entry["name"]).strip()
+                field = str(entry["field"])
+                delta = int(entry["delta"])
+            except (ValueError, KeyError, TypeError):
+                # A torn trailing line from a crash mid-append is expected; skip it.
+                continue
+            if seq <= self._journal_seq or not name or field not in self._COUNTER_FIELDS:
+                continue
+            stats = self._ensure(name)
+            stats[field] = int(stats[field]) + delta
+            self._journal_seq = seq
+            replayed = True
+        return replayed
+
+    def _append_journal(self, entries: list[dict[str, object]]) -> None:
+        payload = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        try:
+            with self._journal_path.open("a", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.flush()
+        except OSError as exc:
+            logger.warning("Failed to append subreddit performance journal at %s: %s", self._journal_path, exc)
+
     def _save(self) -> None:
-        atomic_write_json(self._path, self._items)
+        atomic_write_json(self._path, {"journal_seq": self._journal_seq, "subreddits": self._items})
 
     def _ensure(self, subreddit: str) -> dict[str, float | int | str]:
         name = str(subreddit).strip()
@@ -61,33 +150,93 @@ class SubredditPerformanceStore:
             self._items[name] = self._default_stats(name)
         return self._items[name]
 
+    def _increment(self, field: str, counts: dict[str, int]) -> None:
+        with self._lock:
+            entries: list[dict[str, object]] = []
+            for subreddit, delta in counts.items():
+                stats = self._ensure(subreddit)
+                stats[field] = int(stats[field]) + int(delta)
+                self._journal_seq += 1
+                entries.append({"seq": self._journal_seq, "name": stats["name"], "field": field, "delta": int(delta)})
+            if not entries:
+                return
+            self._dirty = True
+            self._changes.publish(field)
+            if self._batch_depth == 0 and self._flush_interval_seconds <= 0:
+                self.flush()
+                return
+            # Journal inside a batch too; the batch only defers the snapshot write.
+            self._append_journal(entries)
+            if self._batch_depth == 0:
+                self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_timer is not None:
+            return
+        timer = threading.Timer(self._flush_interval_seconds, self._flush_from_timer)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _flush_from_timer(self) -> None:
+        if not self._path.parent.exists():
+            # Data dir was removed underneath us (e.g. a temp dir); nothing to persist to.
+            self._flush_timer = None
+            return
+        try:
+            self.flush()
+        except OSError as exc:
+            logger.error("Failed to flush subreddit performance to %s: %s", self._path, exc)
+
+    def flush(self) -> None:
+        """Write the snapshot now and truncate the journal it supersedes."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty and not self._journal_path.exists():
+                return
+            self._save()
+            self._dirty = False
+            try:
+                self._journal_path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.warning("Failed to truncate subreddit performance journal at %s: %s", self._journal_path, exc)
+
+    @contextmanager
+    def batch(self) -> Iterator["SubredditPerformanceStore"]:
+        """Group counter updates so the whole block costs a single snapshot write."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self.flush()
+
     def record_post_attempt(self, subreddit: str) -> None:
-        stats = self._ensure(subreddit)
-        stats["posts_attempted"] = int(stats["posts_attempted"]) + 1
-        self._save()
+        self._increment("posts_attempted", {subreddit: 1})
 
     def record_proposal_generated(self, subreddit: str) -> None:
-        stats = self._ensure(subreddit)
-        stats["proposals_generated"] = int(stats["proposals_generated"]) + 1
-        self._save()
+        self._increment("proposals_generated", {subreddit: 1})
 
     def record_plan_executed(self, subreddit: str) -> None:
-        stats = self._ensure(subreddit)
-        stats["plans_executed"] = int(stats["plans_executed"]) + 1
-        self._save()
+        self._increment("plans_executed", {subreddit: 1})
 
     def record_sale(self, subreddit: str) -> None:
-        stats = self._ensure(subreddit)
-        stats["sales"] = int(stats["sales"]) + 1
-        self._save()
+        self._increment("sales", {subreddit: 1})
 
     def get_subreddit_stats(self, subreddit: str) -> dict[str, float | int | str]:
         name = str(subreddit).strip()
         if not name:
             return self._default_stats("unknown")
-        return deepcopy(self._items.get(name, self._default_stats(name)))
+        with self._lock:
+            return deepcopy(self._items.get(name, self._default_stats(name)))
 
     def get_summary(self) -> dict[str, list[dict[str, float | int | str]]]:
-        items = [deepcopy(item) for item in self._items.values()]
+        with self._lock:
+            items = [deepcopy(item) for item in self._items.values()]
         items.sort(key=lambda row: str(row.get("name") or ""))
         return {"subreddits": items}
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Measure JSON response size and latency: old encoding versus compact + gzip.
+
+For synthetic payloads shaped like ``/revenue/summary``, ``/reddit/posts``,
+``/decision-logs/entity`` and ``/action-executions`` it reports the bytes and
+encode time of the previous ``json.dumps`` default, of compact separators and
+of compact + gzip as ``Handler._send`` now produces. It then seeds a
+RevenueAttributionStore and times ``GET /revenue/summary`` end to end with and
+without ``Accept-Encoding: gzip``.
+
+    python scripts/bench_json_responses.py --rows 5000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.http.compression import compress_response, encode_json  # noqa: E402
+from core.ipc_http import start_http_server  # noqa: E402
+from core.revenue_attribution.store import RevenueAttributionStore  # noqa: E402
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def sales(count: int) -> list[dict]:
+    return [
+        {
+            "tracking_id": f"treta-{index % 500:06x}-1700000000",
+            "sale_id": f"sale-{index}",
+            "product_id": f"proposal-{index % 50}",
+            "revenue": float(5 + index % 55),
+            "timestamp": (START + timedelta(minutes=index * 7)).isoformat(),
+            "attribution": {"channel": "reddit", "subreddit": f"r/sub{index % 40}", "post_id": f"post-{index % 500}"},
+        }
+        for index in range(count)
+    ]
+
+
+def payloads(rows: int) -> dict[str, dict]:
+    return {
+        "/revenue/summary": {"totals": {"sales": rows, "revenue": 1.0 * rows}, "sales": sales(rows)},
+        "/reddit/posts": {
+            "items": [
+                {
+                    "id": f"reddit-post-{index}",
+                    "proposal_id": f"proposal-{index % 50}",
+                    "subreddit": f"r/sub{index % 40}",
+                    "post_url": f"https://www.reddit.com/r/sub{index % 40}/comments/abc{index}/title_{index}/",
+                    "upvotes": index % 300,
+                    "comments": index % 40,
+                    "created_at": (START + timedelta(hours=index)).isoformat(),
+                }
+                for index in range(rows)
+            ]
+        },
+        "/decision-logs/entity": {
+            "items": [
+                {
+                    "id": index,
+                    "decision_type": "strategy_action",
+                    "entity_type": "proposal",
+                    "entity_id": "proposal-7",
+                    "decision": "approve" if index % 3 else "defer",
+                    "inputs": {"score": index % 100, "risk": "low", "signals": ["demand", "margin"]},
+                    "created_at": (START + timedelta(minutes=index)).isoformat(),
+                }
+                for index in range(rows)
+            ]
+        },
+        "/action-executions": {
+            "items": [
+                {
+                    "id": f"exec-{index}",
+                    "action_id": f"action-{index % 200}",
+                    "status": "success",
+                    "result": {"notes": "executed by strategy layer", "attempt": 1 + index % 3},
+                    "created_at": (START + timedelta(minutes=index)).isoformat(),
+                }
+                for index in range(rows)
+            ]
+        },
+    }
+
+
+def median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def fetch(port: int, path: str, accept_encoding: str | None) -> int:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        connection.request("GET", path, headers={"Accept-Encoding": accept_encoding} if accept_encoding else {})
+        return len(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'payload':<24} {'default_B':>11} {'compact_B':>11} {'gzip_B':>9} {'default_ms':>11} {'gzip_ms':>9}")
+    for name, body in payloads(args.rows).items():
+        default = json.dumps(body).encode("utf-8")
+        compact = encode_json(body)
+        gzipped, _ = compress_response(compact, "gzip")
+        default_ms = median_ms(lambda: json.dumps(body).encode("utf-8"), args.repeat)
+        gzip_ms = median_ms(lambda: compress_response(encode_json(body), "gzip"), args.repeat)
+        print(f"{name:<24} {len(default):>11} {len(compact):>11} {len(gzipped):>9} {default_ms:>11.2f} {gzip_ms:>9.2f}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+        store.import_sales(sales(args.rows))
+        server = start_http_server(host="127.0.0.1", port=0, revenue_attribution_store=store)
+        try:
+            print(f"\nGET /revenue/summary over loopback ({args.rows} sales)")
+            print(f"{'accept-encoding':<16} {'wire_B':>10} {'p50_ms':>8}")
+            for accept in (None, "gzip"):
+                size = fetch(server.server_port, "/revenue/summary", accept)
+                latency = median_ms(lambda: fetch(server.server_port, "/revenue/summary", accept), args.repeat)
+                print(f"{accept or 'identity':<16} {size:>10} {latency:>8.2f}")
+        finally:
+            server.shutdown()
+            server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Measure list endpoint payloads and latency: full collections versus cursor pages.
+
+Seeds ``--rows`` items into each list source and, per endpoint, reports the
+bytes and median time of what the handler used to build (the whole collection,
+copied and reversed, or a fixed-size head) against one ``limit`` page from the
+store's ``list_page`` and the same page with a ``fields`` projection. It then
+times the paged endpoints end to end over loopback.
+
+    python scripts/bench_list_pagination.py --rows 10000 --repeat 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.action_execution_store import ActionExecutionStore  # noqa: E402
+from core.creator_intelligence import CreatorPainClassifier  # noqa: E402
+from core.http.compression import encode_json  # noqa: E402
+from core.ipc_http import start_http_server  # noqa: E402
+from core.migrations.runner import run_migrations  # noqa: E402
+from core.opportunity_store import OpportunityStore  # noqa: E402
+from core.persistence.pagination import project_fields  # noqa: E402
+from core.product_proposal_store import ProductProposalStore  # noqa: E402
+from core.reddit_post_store import RedditPostStore  # noqa: E402
+from core.storage import Storage  # noqa: E402
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+PAGE_FIELDS = ("id", "status", "created_at")
+
+
+def median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def fetch(port: int, path: str) -> int:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        connection.request("GET", path)
+        return len(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def seed(root: Path, rows: int) -> dict:
+    # Write the JSON files directly: one add() per row rewrites the whole file.
+    created = [(START + timedelta(minutes=index)).isoformat() for index in range(rows)]
+    (root / "opportunities.json").write_text(json.dumps([
+        {
+            "id": f"opp-{index}",
+            "created_at": created[index],
+            "source": "reddit",
+            "title": f"Opportunity {index}",
+            "summary": "Creators keep asking how to price brand deals and retainers.",
+            "opportunity": {"score": index % 100, "signals": ["pricing", "retainers"]},
+            "decision": None,
+            "status": "new" if index % 4 else "evaluated",
+        }
+        for index in range(rows)
+    ]), encoding="utf-8")
+    (root / "product_proposals.json").write_text(json.dumps([
+        {
+            "id": f"proposal-{index}",
+            "created_at": created[index],
+            "product_name": f"Pricing Toolkit {index}",
+            "target_audience": "freelance creators",
+            "core_problem": "Inconsistent pricing for brand deals",
+            "status": "draft",
+        }
+        for index in range(rows)
+    ]), encoding="utf-8")
+    opportunities = OpportunityStore(capacity=rows, path=root / "opportunities.json")
+    proposals = ProductProposalStore(capacity=rows, path=root / "product_proposals.json")
+    posts = [
+        {
+            "id": f"reddit-post-{index}",
+            "proposal_id": f"proposal-{index % 50}",
+            "subreddit": f"sub{index % 40}",
+            "post_url": f"https://www.reddit.com/r/sub{index % 40}/comments/abc{index}/",
+            "upvotes": index % 300,
+            "comments": index % 40,
+            "status": "open",
+            "created_at": created[index],
+        }
+        for index in range(rows)
+    ]
+    # The file /reddit/posts used to parse per request, next to the store that replaced it.
+    legacy_posts = root / "reddit_posts_legacy.json"
+    legacy_posts.write_text(json.dumps(posts), encoding="utf-8")
+    reddit_posts = RedditPostStore(path=root / "reddit_posts.json")
+    reddit_posts.add_many(posts)
+
+    executions = ActionExecutionStore(sqlite3.connect(":memory:", check_same_thread=False))
+    for index in range(rows):
+        executions.create_queued(action_id=f"action-{index}", action_type="scale", executor="bench", context={"index": index})
+
+    with patch.dict("os.environ", {"TRETA_DATA_DIR": str(root)}, clear=False):
+        storage = Storage()
+    run_migrations(storage.conn)
+    with storage._lock:
+        storage.conn.executemany(
+            "INSERT INTO creator_pain_analysis VALUES (?, ?, 'pricing', 'high', 0.85, ?)",
+            [(f"analysis-{index}", f"signal-{index}", created[index]) for index in range(rows)],
+        )
+        storage.conn.commit()
+    return {
+        "opportunities": opportunities,
+        "proposals": proposals,
+        "legacy_posts": legacy_posts,
+        "reddit_posts": reddit_posts,
+        "executions": executions,
+        "storage": storage,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stores = seed(Path(tmp_dir), args.rows)
+        classifier = CreatorPainClassifier(storage=stores["storage"])
+
+        def load_posts() -> list[dict]:
+            return json.loads(stores["legacy_posts"].read_text(encoding="utf-8"))
+
+        # (name, previous handler body, paged store call)
+        cases = [
+            (
+                "/opportunities",
+                lambda: {"items": stores["opportunities"].list()},
+                lambda: stores["opportunities"].list_page(limit=args.limit),
+            ),
+            (
+                "/product_proposals",
+                lambda: {"items": stores["proposals"].list()[:10]},
+                lambda: stores["proposals"].list_page(limit=10),
+            ),
+            (
+                "/reddit/posts",
+                lambda: {"items": list(reversed(load_posts()))},
+                lambda: stores["reddit_posts"].list_page(limit=args.limit),
+            ),
+            (
+                "/action-executions",
+                lambda: {"items": stores["executions"].list_recent(limit=50)},
+                lambda: stores["executions"].list_page(limit=args.limit),
+            ),
+            (
+                "/creator/pains",
+                lambda: {"data": classifier.list_recent_analysis(limit=50)},
+                lambda: classifier.list_analysis_page(limit=args.limit),
+            ),
+        ]
+
+        print(f"{args.rows} rows, limit={args.limit}, fields={','.join(PAGE_FIELDS)}")
+        print(f"{'endpoint':<20} {'before_B':>10} {'page_B':>8} {'fields_B':>9} {'before_ms':>10} {'page_ms':>8}")
+        for name, before, paged in cases:
+            before_bytes = len(encode_json(before()))
+            page = paged()
+            page_bytes = len(encode_json(page))
+            fields_bytes = len(encode_json({"items": project_fields(page["items"], PAGE_FIELDS), "next_cursor": page["next_cursor"]}))
+            before_ms = median_ms(lambda: encode_json(before()), args.repeat)
+            page_ms = median_ms(lambda: encode_json(paged()), args.repeat)
+            print(f"{name:<20} {before_bytes:>10} {page_bytes:>8} {fields_bytes:>9} {before_ms:>10.2f} {page_ms:>8.2f}")
+
+        server = start_http_server(
+            host="127.0.0.1",
+            port=0,
+            opportunity_store=stores["opportunities"],
+            product_proposal_store=stores["proposals"],
+            strategy_action_execution_layer=SimpleNamespace(_action_execution_store=stores["executions"]),
+            storage=stores["storage"],
+            reddit_post_store=stores["reddit_posts"],
+        )
+        try:
+            print(f"\nGET over loopback, limit={args.limit}")
+            print(f"{'endpoint':<20} {'wire_B':>8} {'p50_ms':>8} {'fields_B':>9} {'fields_ms':>10}")
+            for name, _, _ in cases:
+                path = f"{name}?limit={args.limit}"
+                projected = f"{path}&fields={','.join(PAGE_FIELDS)}"
+                size = fetch(server.server_port, path)
+                latency = median_ms(lambda: fetch(server.server_port, path), args.repeat)
+                projected_size = fetch(server.server_port, projected)
+                projected_latency = median_ms(lambda: fetch(server.server_port, projected), args.repeat)
+                print(f"{name:<20} {size:>8} {latency:>8.2f} {projected_size:>9} {projected_latency:>10.2f}")
+        finally:
+            server.shutdown()
+            server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
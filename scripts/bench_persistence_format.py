@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Compare write latency and file size of the JSON persistence formats.
+
+Builds a synthetic opportunities payload (same shape as OpportunityStore._save)
+and writes it repeatedly with every available format through atomic_write_json.
+
+    python scripts/bench_persistence_format.py --opportunities 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.persistence.json_io import (  # noqa: E402
+    FORMAT_COMPACT,
+    FORMAT_MSGPACK,
+    FORMAT_PRETTY,
+    atomic_read_json,
+    atomic_write_json,
+    msgpack,
+)
+
+
+def build_opportunities_payload(opportunities: int) -> list[dict]:
+    return [
+        {
+            "id": f"{index:08x}",
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "source": "reddit_public",
+            "title": f"Looking for a tool to track client invoices #{index}",
+            "summary": "Freelancer asks for a simple way to track unpaid invoices and follow-ups.",
+            "opportunity": {
+                "subreddit": f"sub{index % 40}",
+                "post_id": f"post-{index}",
+                "pain_score": 60 + index % 40,
+                "intent_type": "tool_request",
+                "urgency_level": "medium",
+            },
+            "decision": None,
+            "status": ("new", "evaluated", "dismissed")[index % 3],
+        }
+        for index in range(opportunities)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--opportunities", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_opportunities_payload(args.opportunities)
+    formats = [FORMAT_PRETTY, FORMAT_COMPACT] + ([FORMAT_MSGPACK] if msgpack is not None else [])
+
+    print(f"opportunities payload: opportunities={args.opportunities} repeat={args.repeat}")
+    print(f"{'format':<10} {'bytes':>12} {'write_p50_ms':>14} {'read_p50_ms':>13}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fmt in formats:
+            path = Path(tmp_dir) / f"opportunities.{fmt}.json"
+            write_ms: list[float] = []
+            read_ms: list[float] = []
+            for _ in range(max(1, args.repeat)):
+                started = time.perf_counter()
+                atomic_write_json(path, payload, fmt=fmt)
+                write_ms.append((time.perf_counter() - started) * 1000)
+                started = time.perf_counter()
+                atomic_read_json(path, None)
+                read_ms.append((time.perf_counter() - started) * 1000)
+            print(
+                f"{fmt:<10} {path.stat().st_size:>12} "
+                f"{statistics.median(write_ms):>14.2f} {statistics.median(read_ms):>13.2f}"
+            )
+    if msgpack is None:
+        print("msgpack not installed; binary format skipped")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare Reddit post persistence: the old ``reddit_posts.json`` file versus ``RedditPostStore``.
+
+With ``--rows`` posts already recorded it times one ``/reddit/mark_posted``
+append (old: parse, append and rewrite the whole file; new: one INSERT), one
+``/reddit/posts`` read (old: parse and reverse the file; new: a page from
+memory) and the per-post dedupe check a scan runs.
+
+    python scripts/bench_reddit_posts.py --rows 10000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.reddit_post_store import RedditPostStore  # noqa: E402
+
+
+def post(index: int) -> dict:
+    return {
+        "id": f"reddit_post_{index}",
+        "post_id": f"abc{index}",
+        "proposal_id": f"proposal_{index % 50}",
+        "product_name": "Pricing Toolkit",
+        "subreddit": f"sub{index % 40}",
+        "post_url": f"https://www.reddit.com/r/sub{index % 40}/comments/abc{index}/",
+        "upvotes": index % 300,
+        "comments": index % 40,
+        "status": "open",
+        "date": "2026-01-01",
+        "created_at": f"2026-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}Z",
+    }
+
+
+def median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        legacy = root / "legacy.json"
+        legacy.write_text(json.dumps([post(index) for index in range(args.rows)], indent=2), encoding="utf-8")
+        store = RedditPostStore(path=root / "reddit_posts.json")
+        store.add_many(post(index) for index in range(args.rows))
+        counter = iter(range(args.rows, args.rows * 10))
+
+        def old_append() -> None:
+            posts = json.loads(legacy.read_text(encoding="utf-8"))
+            posts.append(post(next(counter)))
+            legacy.write_text(json.dumps(posts, indent=2), encoding="utf-8")
+
+        def old_read() -> list:
+            return list(reversed(json.loads(legacy.read_text(encoding="utf-8"))))
+
+        def old_dedupe() -> bool:
+            posts = json.loads(legacy.read_text(encoding="utf-8"))
+            return "abc1" in {str(item.get("post_id", "")).strip() for item in posts}
+
+        rows = [
+            ("append (mark_posted)", old_append, lambda: store.add(post(next(counter)))),
+            ("read (/reddit/posts)", old_read, lambda: store.list_page(limit=50)),
+            ("dedupe check (scan)", old_dedupe, lambda: store.has_post("abc1")),
+        ]
+        print(f"{args.rows} stored posts")
+        print(f"{'operation':<22} {'json_ms':>9} {'store_ms':>9}")
+        for name, old, new in rows:
+            print(f"{name:<22} {median_ms(old, args.repeat):>9.2f} {median_ms(new, args.repeat):>9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
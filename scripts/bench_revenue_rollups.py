@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Time windowed revenue queries answered from hourly/daily rollups.
+
+Seeds a temporary RevenueAttributionStore with synthetic sales spread over
+``--days`` and times ``summary(since=..., until=...)`` for a few typical
+windows, both cold (first query after a change) and cached for the current
+version, against the all-time ``summary()`` and a raw-ledger aggregate.
+
+    python scripts/bench_revenue_rollups.py --sales 100000 --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.revenue_attribution.store import RevenueAttributionStore  # noqa: E402
+
+
+def build_sales(count: int, trackings: int, days: int, start: datetime) -> list[dict]:
+    rng = random.Random(42)
+    span_seconds = days * 86400
+    rows = []
+    for index in range(count):
+        tracking = index % trackings
+        sold_at = start + timedelta(seconds=rng.randrange(span_seconds))
+        rows.append(
+            {
+                "tracking_id": f"treta-{tracking:06x}-1700000000",
+                "sale_id": f"sale-{index}",
+                "product_id": f"proposal-{tracking % 50}",
+                "revenue": float(rng.randrange(5, 60)),
+                "timestamp": sold_at.isoformat(),
+                "attribution": {"channel": "reddit", "subreddit": f"r/sub{tracking % 40}", "post_id": f"post-{tracking}"},
+            }
+        )
+    return rows
+
+
+def time_ms(fn, repeat: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1 if len(samples) > 1 else 0]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sales", type=int, default=100000)
+    parser.add_argument("--trackings", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(days=args.days)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+        started = time.perf_counter()
+        inserted = store.import_sales(build_sales(args.sales, args.trackings, args.days, start))
+        print(f"seeded {inserted} sales over {args.days} days in {time.perf_counter() - started:.1f}s")
+
+        windows = {
+            "last_24h": (end - timedelta(hours=24, minutes=17), end - timedelta(minutes=17)),
+            "last_7d": (end - timedelta(days=7, minutes=17), end - timedelta(minutes=17)),
+            "last_30d": (end - timedelta(days=30, minutes=17), end - timedelta(minutes=17)),
+        }
+        print(f"{'query':<28} {'p50_ms':>10} {'p95_ms':>10}")
+        for name, (since, until) in windows.items():
+            def cold() -> None:
+                # What the first query after a new sale pays.
+                store._window_cache.clear()
+                store.summary(since=since, until=until)
+
+            p50, p95 = time_ms(cold, args.repeat)
+            print(f"{'rollup ' + name + ' cold':<28} {p50:>10.3f} {p95:>10.3f}")
+            p50, p95 = time_ms(lambda: store.summary(since=since, until=until), args.repeat)
+            print(f"{'rollup ' + name + ' cached':<28} {p50:>10.3f} {p95:>10.3f}")
+
+        def raw_window(since: datetime, until: datetime) -> None:
+            store._conn.execute(
+                "SELECT subreddit, COUNT(*), SUM(revenue) FROM revenue_sales "
+                "WHERE sold_epoch >= ? AND sold_epoch < ? GROUP BY subreddit",
+                (int(since.timestamp()), int(until.timestamp())),
+            ).fetchall()
+
+        p50, p95 = time_ms(lambda: raw_window(*windows["last_30d"]), max(1, args.repeat // 10))
+        print(f"{'raw ledger last_30d':<28} {p50:>10.3f} {p95:>10.3f}")
+        p50, p95 = time_ms(store.summary, args.repeat)
+        print(f"{'summary() all-time cached':<28} {p50:>10.3f} {p95:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Time HTTP route resolution for early, late and parameterized paths.
+
+Resolves paths against the server's compiled route table (``_ROUTES`` in
+core.ipc_http) and, for comparison, against a linear scan over the same
+routes, which is what the old if-chain did.
+
+    python scripts/bench_routing.py --repeat 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.ipc_http import _ROUTES  # noqa: E402
+
+CASES = [
+    ("GET", "/state"),
+    ("GET", "/reddit/posts"),
+    ("GET", "/product_launches/launch-000123"),
+    ("POST", "/product_launches/launch-000123/add_sale"),
+    ("POST", "/opportunities/dismiss"),
+    ("GET", "/no/such/route"),
+]
+
+
+def linear_match(routes, method: str, path: str):
+    segments = path.split("/")
+    for route in routes:
+        if route.method != method:
+            continue
+        pattern = route.pattern.split("/")
+        if len(pattern) == len(segments) and all(
+            part.startswith("{") or part == segment for part, segment in zip(pattern, segments)
+        ):
+            return route
+    return None
+
+
+def ns_per_call(fn, repeat: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter_ns() - started) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200000)
+    args = parser.parse_args()
+
+    routes = _ROUTES.routes()
+    print(f"{len(routes)} routes")
+    print(f"{'request':<52} {'table_ns':>10} {'linear_ns':>10}")
+    for method, path in CASES:
+        table = ns_per_call(lambda: _ROUTES.match(method, path), args.repeat)
+        linear = ns_per_call(lambda: linear_match(routes, method, path), max(1, args.repeat // 10))
+        print(f"{method + ' ' + path:<52} {table:>10.0f} {linear:>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
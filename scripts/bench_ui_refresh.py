@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Compare dashboard request rates: interval polling versus ``/stream`` notifications.
+
+Simulates ``--tabs`` open dashboards against a local server for ``--seconds``.
+In polling mode every tab fetches every slice endpoint each ``--refresh-ms``,
+as ``refreshLoop`` did on its timer. In streaming mode every tab holds one
+``/stream`` connection and refetches only the slices a notification names,
+while ``--changes-per-second`` bus events stand in for real activity.
+
+    python scripts/bench_ui_refresh.py --tabs 5 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.bus import EventBus  # noqa: E402
+from core.events import make_event  # noqa: E402
+from core.ipc_http import start_http_server  # noqa: E402
+
+# Mirrors the sliceCalls fan-out in ui/app.js.
+SLICE_ENDPOINTS = {
+    "system": [
+        "/state", "/events", "/memory", "/opportunities", "/product_proposals", "/product_launches",
+        "/product_plans", "/performance/summary", "/daily_loop/status", "/system/integrity",
+    ],
+    "strategy": ["/strategy/recommendations", "/strategy/pending_actions", "/strategy/decide"],
+    "revenue": ["/revenue/summary"],
+    "reddit": [
+        "/reddit/config", "/reddit/last_scan", "/reddit/signals?limit=50", "/reddit/today_plan",
+        "/reddit/daily_actions?limit=5", "/reddit/posts",
+    ],
+}
+
+
+class Counter:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def add(self, amount: int) -> None:
+        with self._lock:
+            self.value += amount
+
+
+def fetch(port: int, paths: list[str], counter: Counter) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        for path in paths:
+            connection.request("GET", path)
+            connection.getresponse().read()
+    finally:
+        connection.close()
+    counter.add(len(paths))
+
+
+def poll_tab(port: int, refresh_s: float, stop: threading.Event, counter: Counter) -> None:
+    every_path = [path for paths in SLICE_ENDPOINTS.values() for path in paths]
+    while not stop.is_set():
+        fetch(port, every_path, counter)
+        stop.wait(refresh_s)
+
+
+def stream_tab(port: int, stop: threading.Event, counter: Counter) -> None:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    connection.request("GET", "/stream")
+    response = connection.getresponse()
+    counter.add(1)
+    event = None
+    while not stop.is_set():
+        line = response.readline().decode("utf-8").rstrip("\n")
+        if not line and event == "change":
+            # Bus events map to the system slice, as slicesForNotification does.
+            fetch(port, SLICE_ENDPOINTS["system"], counter)
+        if not line:
+            event = None
+        elif line.startswith("event: "):
+            event = line[len("event: "):]
+    connection.close()
+
+
+def run(mode: str, args: argparse.Namespace) -> float:
+    bus = EventBus(max_events_per_cycle=10**9)
+    server = start_http_server(host="127.0.0.1", port=0, bus=bus)
+    stop = threading.Event()
+    counter = Counter()
+    if mode == "polling":
+        targets = [(poll_tab, (server.server_port, args.refresh_ms / 1000.0, stop, counter)) for _ in range(args.tabs)]
+    else:
+        targets = [(stream_tab, (server.server_port, stop, counter)) for _ in range(args.tabs)]
+    threads = [threading.Thread(target=target, args=target_args, daemon=True) for target, target_args in targets]
+    for thread in threads:
+        thread.start()
+
+    started = time.perf_counter()
+    interval = 1.0 / args.changes_per_second if args.changes_per_second > 0 else None
+    while time.perf_counter() - started < args.seconds:
+        if interval is None:
+            time.sleep(0.05)
+            continue
+        bus.push(make_event("Heartbeat", {}, source="bench"))
+        time.sleep(interval)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    # Closing the log ends every stream; pollers finish their current tick.
+    server.shutdown()
+    server.server_close()
+    return counter.value / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs", type=int, default=5)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--refresh-ms", type=int, default=3000, help="ui CONFIG.defaultRefreshMs")
+    parser.add_argument("--changes-per-second", type=float, default=0.2)
+    args = parser.parse_args()
+
+    polling = run("polling", args)
+    streaming = run("streaming", args)
+    print(f"{args.tabs} tabs, {args.seconds:.0f}s, {args.changes_per_second} changes/s")
+    print(f"{'mode':<10} {'requests/s':>11}")
+    print(f"{'polling':<10} {polling:>11.2f}")
+    print(f"{'streaming':<10} {streaming:>11.2f}")
+    if streaming:
+        print(f"reduction  {polling / streaming:>10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Generate a synthetic dataset and bulk-load it into a data directory.
+
+Volumes are per store; rows are deterministic for a given ``--seed``. With
+``--bench`` the hot read paths (store loads, daily loop phase, performance
+insights, system integrity, revenue summary) are timed against the result.
+Persistence write metrics for the load are printed either way.
+
+    python scripts/generate_synthetic_data.py --data-dir /tmp/treta-load \\
+        --opportunities 10000 --sales 100000 --bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.daily_loop import DailyLoopEngine  # noqa: E402
+from core.opportunity_store import OpportunityStore  # noqa: E402
+from core.performance_engine import PerformanceEngine  # noqa: E402
+from core.product_launch_store import ProductLaunchStore  # noqa: E402
+from core.product_plan_store import ProductPlanStore  # noqa: E402
+from core.product_proposal_store import ProductProposalStore  # noqa: E402
+from core.revenue_attribution.store import RevenueAttributionStore  # noqa: E402
+from core.strategy_action_store import StrategyActionStore  # noqa: E402
+from core.stores.bulk_load import bulk_load  # noqa: E402
+from core.system_integrity import compute_system_integrity  # noqa: E402
+from core.persistence.write_metrics import snapshot_write_metrics  # noqa: E402
+
+_PRODUCT_KINDS = ["Template", "Checklist", "Toolkit", "Guide", "Kit"]
+_SUBREDDITS = [f"r/sub{index}" for index in range(40)]
+
+
+def build_dataset(
+    *,
+    opportunities: int,
+    proposals: int,
+    launches: int,
+    strategy_actions: int,
+    trackings: int,
+    sales: int,
+    days: int,
+    seed: int,
+    end: datetime,
+) -> dict[str, list[dict]]:
+    rng = random.Random(seed)
+    start = end - timedelta(days=days)
+    span_seconds = max(1, days * 86400)
+
+    def at() -> str:
+        return (start + timedelta(seconds=rng.randrange(span_seconds))).isoformat()
+
+    proposal_rows = []
+    for index in range(proposals):
+        proposal_rows.append(
+            {
+                "id": f"proposal-{index:06d}",
+                "product_name": f"Creator {_PRODUCT_KINDS[index % len(_PRODUCT_KINDS)]} {index}",
+                "status": rng.choice(["draft", "draft", "approved", "rejected", "launched"]),
+                "created_at": at(),
+            }
+        )
+    proposal_ids = [row["id"] for row in proposal_rows] or ["proposal-000000"]
+
+    return {
+        "opportunities": [
+            {
+                "id": f"opp-{index:06d}",
+                "created_at": at(),
+                "source": "synthetic",
+                "title": f"Opportunity {index}",
+                "summary": f"Synthetic demand signal {index}",
+                "opportunity": {"score": round(rng.random(), 3)},
+                "decision": None,
+                "status": rng.choice(["new", "new", "evaluated", "dismissed"]),
+            }
+            for index in range(opportunities)
+        ],
+        "product_proposals": proposal_rows,
+        "product_plans": [
+            {"plan_id": f"plan-{index:06d}", "proposal_id": proposal_ids[index % len(proposal_ids)], "created_at": at()}
+            for index in range(min(proposals, launches or proposals))
+        ],
+        "product_launches": [
+            {
+                "id": f"launch-{index:06d}",
+                "proposal_id": proposal_ids[index % len(proposal_ids)],
+                "product_name": proposal_rows[index % len(proposal_rows)]["product_name"] if proposal_rows else "Kit",
+                "status": rng.choice(["draft", "active", "active", "paused"]),
+                "created_at": at(),
+                "metrics": {"sales": rng.randrange(0, 50), "revenue": float(rng.randrange(0, 2000))},
+            }
+            for index in range(launches)
+        ],
+        "strategy_actions": [
+            {
+                "id": f"action-{index + 1:06d}",
+                "type": rng.choice(["scale", "review", "price_test"]),
+                "target_id": proposal_ids[index % len(proposal_ids)],
+                "reasoning": f"synthetic action {index}",
+                "status": rng.choice(["pending_confirmation", "executed", "rejected"]),
+                "created_at": at(),
+            }
+            for index in range(strategy_actions)
+        ],
+        "revenue_trackings": [
+            {
+                "tracking_id": f"treta-{index:06x}",
+                "proposal_id": proposal_ids[index % len(proposal_ids)],
+                "subreddit": _SUBREDDITS[index % len(_SUBREDDITS)],
+                "created_at": start.isoformat(),
+            }
+            for index in range(trackings)
+        ],
+        "revenue_sales": [
+            {
+                "tracking_id": f"treta-{index % max(1, trackings):06x}",
+                "sale_id": f"sale-{index}",
+                "product_id": proposal_ids[(index % max(1, trackings)) % len(proposal_ids)],
+                "revenue": float(rng.randrange(5, 60)),
+                "timestamp": at(),
+                "attribution": {"channel": "reddit", "subreddit": _SUBREDDITS[index % max(1, trackings) % len(_SUBREDDITS)]},
+            }
+            for index in range(sales)
+        ],
+    }
+
+
+def time_ms(fn, repeat: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[max(0, int(len(samples) * 0.95) - 1)]
+
+
+def bench(data_dir: Path, repeat: int) -> None:
+    def load_stores():
+        proposals = ProductProposalStore(path=data_dir / "product_proposals.json")
+        return {
+            "opportunities": OpportunityStore(path=data_dir / "opportunities.json"),
+            "proposals": proposals,
+            "plans": ProductPlanStore(path=data_dir / "product_plans.json"),
+            "launches": ProductLaunchStore(proposal_store=proposals, path=data_dir / "product_launches.json"),
+            "actions": StrategyActionStore(path=data_dir / "strategy_actions.json"),
+        }
+
+    print(f"{'operation':<32} {'p50_ms':>10} {'p95_ms':>10}")
+    p50, p95 = time_ms(load_stores, max(1, repeat // 10))
+    print(f"{'load json+sqlite stores':<32} {p50:>10.3f} {p95:>10.3f}")
+    p50, p95 = time_ms(lambda: RevenueAttributionStore(path=data_dir / "revenue_attribution.json"), max(1, repeat // 10))
+    print(f"{'load revenue store':<32} {p50:>10.3f} {p95:>10.3f}")
+
+    stores = load_stores()
+    revenue = RevenueAttributionStore(path=data_dir / "revenue_attribution.json")
+    loop = DailyLoopEngine(stores["opportunities"], stores["proposals"], stores["launches"], stores["actions"])
+    performance = PerformanceEngine(product_launch_store=stores["launches"])
+    cases = {
+        "daily loop phase (cached)": loop.compute_phase,
+        "daily loop phase (cold)": lambda: loop._compute_phase(),
+        "performance insights": performance.generate_insights,
+        "system integrity": lambda: compute_system_integrity(
+            proposals=stores["proposals"].list(),
+            plans=stores["plans"].list(limit=100000),
+            launches=stores["launches"].list(),
+        ),
+        "strategy actions page": lambda: stores["actions"].list_page(limit=50),
+        "revenue summary (cached)": revenue.summary,
+        "revenue sales page": lambda: revenue.list_sales(limit=50),
+    }
+    for name, fn in cases.items():
+        p50, p95 = time_ms(fn, repeat)
+        print(f"{name:<32} {p50:>10.3f} {p95:>10.3f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", required=True, type=Path)
+    parser.add_argument("--opportunities", type=int, default=10000)
+    parser.add_argument("--proposals", type=int, default=500)
+    parser.add_argument("--launches", type=int, default=300)
+    parser.add_argument("--strategy-actions", type=int, default=2000)
+    parser.add_argument("--trackings", type=int, default=2000)
+    parser.add_argument("--sales", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=180)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--bench", action="store_true", help="time hot read paths after loading")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    dataset = build_dataset(
+        opportunities=args.opportunities,
+        proposals=args.proposals,
+        launches=args.launches,
+        strategy_actions=args.strategy_actions,
+        trackings=args.trackings,
+        sales=args.sales,
+        days=args.days,
+        seed=args.seed,
+        end=datetime.now(timezone.utc),
+    )
+    built = time.perf_counter()
+    counts = bulk_load(args.data_dir, dataset)
+    loaded = time.perf_counter()
+    print(f"generated in {built - started:.1f}s, loaded in {loaded - built:.1f}s into {args.data_dir}")
+    for key, count in counts.items():
+        print(f"  {key:<20} {count:>8}")
+    print(f"{'store writes':<20} {'writes':>8} {'bytes':>12} {'fsyncs':>8} {'rows':>8} {'p95_ms':>10}")
+    for store, stats in snapshot_write_metrics().items():
+        print(
+            f"  {store:<18} {stats['writes']:>8} {stats['bytes']:>12} {stats['fsyncs']:>8} "
+            f"{stats['rows']:>8} {stats['p95_ms'] or 0:>10.3f}"
+        )
+
+    if args.bench:
+        bench(args.data_dir.resolve(), args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
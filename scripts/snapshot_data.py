@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Export or restore a consistent snapshot of the Treta data directory.
+
+    python scripts/snapshot_data.py export --out /backups/treta-2026-10-19
+    python scripts/snapshot_data.py import --from /backups/treta-2026-10-19
+
+``--data-dir`` defaults to ``$TRETA_DATA_DIR`` (``./.treta_data``). Stop the
+server before importing; exports are safe while it runs (see
+``core.persistence.snapshot.export_snapshot``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.persistence.snapshot import export_snapshot, import_snapshot  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", type=Path, default=Path(os.getenv("TRETA_DATA_DIR", "./.treta_data")))
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="copy the data directory into an empty snapshot directory")
+    export_parser.add_argument("--out", required=True, type=Path)
+    import_parser = commands.add_parser("import", help="restore a snapshot into the data directory")
+    import_parser.add_argument("--from", dest="source", required=True, type=Path)
+    args = parser.parse_args()
+
+    try:
+        if args.command == "export":
+            manifest = export_snapshot(args.data_dir, args.out)
+            target = args.out
+        else:
+            manifest = import_snapshot(args.source, args.data_dir)
+            target = args.data_dir
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    tables = (manifest.get("sqlite") or {}).get("tables", {})
+    print(f"{args.command}: {len(manifest['files'])} files, {len(tables)} sqlite tables -> {target}")
+    for name, count in sorted(tables.items()):
+        print(f"  {name:<32} {count:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
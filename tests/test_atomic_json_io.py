@@ -1,7 +1,9 @@
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from core.persistence import json_io
 from core.persistence.json_io import atomic_read_json, atomic_write_json
 
 
@@ -27,6 +29,91 @@ class AtomicJsonIoTest(unittest.TestCase):
             self.assertFalse(path.exists())
             self.assertEqual(len(list(Path(tmp_dir).glob("broken.json*.corrupt"))), 1)
 
+    def test_compact_format_is_smaller_and_reads_back_like_legacy(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data = {"sales": [{"sale_id": f"s{index}", "revenue": 9.5} for index in range(50)]}
+            pretty_path = Path(tmp_dir) / "pretty.json"
+            compact_path = Path(tmp_dir) / "compact.json"
+
+            atomic_write_json(pretty_path, data)
+            atomic_write_json(compact_path, data, fmt="compact")
+
+            self.assertLess(compact_path.stat().st_size, pretty_path.stat().st_size)
+            self.assertEqual(atomic_read_json(pretty_path, {}), data)
+            self.assertEqual(atomic_read_json(compact_path, {}), data)
+
+    def test_per_store_env_override_selects_format(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "revenue_attribution.json"
+            other = Path(tmp_dir) / "opportunities.json"
+            env = {"TRETA_PERSISTENCE_FORMAT": "pretty", "TRETA_PERSISTENCE_FORMAT_REVENUE_ATTRIBUTION": "compact"}
+            with patch.dict("os.environ", env, clear=False):
+                atomic_write_json(path, [{"a": 1}])
+                atomic_write_json(other, [{"a": 1}])
+
+            self.assertEqual(path.read_text(encoding="utf-8"), '[{"a":1}]\n')
+            self.assertIn("\n  ", other.read_text(encoding="utf-8"))
+
+    @unittest.skipIf(json_io.msgpack is None, "msgpack not installed")
+    def test_msgpack_roundtrip_is_detected_on_read(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "state.json"
+            data = {"trackings": [], "sales": [{"sale_id": "s1", "revenue": 1.5}]}
+
+            atomic_write_json(path, data, fmt="msgpack")
+
+            self.assertEqual(atomic_read_json(path, {}), data)
+
+    def _count_fsyncs(self, env, writes):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "state.json"
+            with patch.dict("os.environ", env, clear=False), patch.object(
+                json_io.os, "fsync", wraps=json_io.os.fsync
+            ) as fsync:
+                writes(path)
+                self.assertEqual(atomic_read_json(path, {}), {"n": 2})
+                return fsync.call_count
+
+    def test_strict_durability_fsyncs_file_and_directory_per_write(self):
+        def writes(path):
+            for n in range(3):
+                atomic_write_json(path, {"n": n})
+
+        self.assertEqual(self._count_fsyncs({"TRETA_PERSISTENCE_DURABILITY": "strict"}, writes), 6)
+
+    def test_relaxed_durability_never_fsyncs(self):
+        def writes(path):
+            for n in range(3):
+                atomic_write_json(path, {"n": n})
+            with json_io.durability_batch():
+                atomic_write_json(path, {"n": 2})
+
+        self.assertEqual(self._count_fsyncs({"TRETA_PERSISTENCE_DURABILITY": "relaxed"}, writes), 0)
+
+    def test_durability_batch_groups_fsyncs_until_exit(self):
+        def writes(path):
+            with json_io.durability_batch():
+                for n in range(3):
+                    atomic_write_json(path, {"n": n})
+                    atomic_write_json(path.with_name("other.json"), {"n": n})
+                self.assertEqual(json_io._pending_paths, {path, path.with_name("other.json")})
+            self.assertEqual(json_io._pending_paths, set())
+
+        # Two files plus their shared directory, once each.
+        self.assertEqual(self._count_fsyncs({"TRETA_PERSISTENCE_DURABILITY": "strict"}, writes), 3)
+
+    def test_batched_durability_flushes_after_window(self):
+        def writes(path):
+            for n in range(3):
+                atomic_write_json(path, {"n": n})
+            timer = json_io._pending_timer
+            self.assertIsNotNone(timer)
+            timer.join(timeout=2)
+            self.assertEqual(json_io._pending_paths, set())
+
+        env = {"TRETA_PERSISTENCE_DURABILITY": "batched", "TRETA_PERSISTENCE_FSYNC_WINDOW_MS": "10"}
+        self.assertEqual(self._count_fsyncs(env, writes), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -124,6 +124,25 @@ class ConversationCoreTest(unittest.TestCase):
                 server.shutdown()
                 server.server_close()
 
+    def test_memory_endpoint_returns_only_recent_chat_history(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            memory_store = MemoryStore(path=Path(tmp_dir) / "memory_store.json")
+            for index in range(30):
+                memory_store.append_message("user", f"message {index}")
+
+            server = start_http_server(host="127.0.0.1", port=0, memory_store=memory_store, bus=self.bus)
+            try:
+                with urlopen(f"http://127.0.0.1:{server.server_port}/memory", timeout=2) as response:
+                    default = json.loads(response.read().decode("utf-8"))["data"]
+                with urlopen(f"http://127.0.0.1:{server.server_port}/memory?limit=5", timeout=2) as response:
+                    limited = json.loads(response.read().decode("utf-8"))["data"]
+                self.assertEqual([item["text"] for item in default["chat_history"]], [f"message {index}" for index in range(10, 30)])
+                self.assertEqual([item["text"] for item in limited["chat_history"]], [f"message {index}" for index in range(25, 30)])
+                self.assertIn("profile", limited)
+            finally:
+                server.shutdown()
+                server.server_close()
+
     def test_reply_builds_context_with_relevant_then_recent_without_duplicates(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             memory_store = MemoryStore(path=Path(tmp_dir) / "memory_store.json")
@@ -154,8 +173,9 @@ class ConversationCoreTest(unittest.TestCase):
             self.assertEqual(
                 context_contents,
                 [
-                    "quiero mejorar pricing",
+                    # BM25 ranks the shorter match first.
                     "prioridad: pricing",
+                    "quiero mejorar pricing",
                     "hola",
                     "testing ideas",
                 ],
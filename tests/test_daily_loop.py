@@ -126,6 +126,10 @@ class DailyLoopEngineTest(unittest.TestCase):
                 self.assertIn("next_action_label", payload)
                 self.assertIn("summary", payload)
                 self.assertIn("timestamp", payload)
+
+                with urlopen(f"http://127.0.0.1:{server.server_port}/daily_loop/status", timeout=2) as response:
+                    second = json.loads(response.read().decode("utf-8"))
+                self.assertGreater(second["timestamp"], payload["timestamp"])
             finally:
                 server.shutdown()
                 server.server_close()
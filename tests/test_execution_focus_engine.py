@@ -1,10 +1,12 @@
+import random
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from core.control import Control
 from core.events import Event
-from core.execution_focus_engine import ExecutionFocusEngine
+from core.execution_focus_engine import ExecutionFocusEngine, ExecutionFocusIndex, proposal_focus_tier
 from core.domain.integrity import DomainIntegrityError
 from core.product_launch_store import ProductLaunchStore
 from core.product_proposal_store import ProductProposalStore
@@ -30,6 +32,28 @@ class ExecutionFocusEngineTest(unittest.TestCase):
         self.assertTrue(proposals[1]["active_execution"])
         self.assertFalse(launches[0]["active_execution"])
 
+    def test_index_tracks_status_changes_and_evictions(self):
+        items = [{"id": f"p{index}", "status": "draft"} for index in range(5)]
+        index = ExecutionFocusIndex(proposal_focus_tier)
+        index.rebuild(items)
+
+        items[1]["status"] = "approved"
+        index.track(items[1])
+        items[3]["status"] = "approved"
+        index.track(items[3])
+        self.assertEqual(ExecutionFocusEngine.select_from_indexes(index), "p3")
+
+        items[0]["status"] = "building"
+        index.track(items[0])
+        self.assertEqual(ExecutionFocusEngine.select_from_indexes(index), "p0")
+        self.assertEqual(index.status_counts(), {"draft": 2, "approved": 2, "building": 1})
+
+        index.forget(items[0])
+        self.assertEqual(ExecutionFocusEngine.select_from_indexes(index), "p3")
+        index.set_active("p3")
+        index.set_active("p1")
+        self.assertEqual([item.get("active_execution") for item in items[1:4]], [True, None, False])
+
 
 class ExecutionFocusStoreIntegrationTest(unittest.TestCase):
     def test_proposal_transition_sets_single_active_execution(self):
@@ -52,6 +76,56 @@ class ExecutionFocusStoreIntegrationTest(unittest.TestCase):
             self.assertTrue(p1["active_execution"])
             self.assertFalse(p2["active_execution"])
 
+    def test_focus_refresh_keeps_proposals_written_by_another_instance(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            control = Control(product_proposal_store=proposals, product_launch_store=launches)
+            proposals.add({"id": "proposal-1", "product_name": "One"})
+            launches.add_from_proposal("proposal-1")
+
+            other = ProductProposalStore(path=root / "product_proposals.json")
+            other.add({"id": "proposal-2", "product_name": "Two", "status": "approved"})
+            control._refresh_execution_focus()
+
+            reread = ProductProposalStore(path=root / "product_proposals.json")
+            self.assertEqual([item["id"] for item in reread.list()], ["proposal-2", "proposal-1"])
+            self.assertTrue(reread.get("proposal-2")["active_execution"])
+            self.assertFalse(launches.list()[0]["active_execution"])
+
+    def test_incremental_focus_matches_full_recompute_under_random_mutations(self):
+        rng = random.Random(11)
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.dict("os.environ", {"TRETA_EXECUTION_FOCUS_CHECK": "1"}):
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(capacity=12, path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, capacity=6, path=root / "product_launches.json")
+            transitions = proposals._TRANSITIONS
+
+            for step in range(300):
+                roll = rng.random()
+                if roll < 0.25 or not proposals._items:
+                    proposals.add({"id": f"proposal-{step}", "product_name": f"P{step}"})
+                elif roll < 0.75:
+                    item = rng.choice(list(proposals._items))
+                    targets = sorted(transitions.get(item["status"], set()))
+                    if targets:
+                        proposals.transition_status(item["id"], rng.choice(targets))
+                elif roll < 0.9:
+                    launches.add_from_proposal(rng.choice(list(proposals._items))["id"])
+                elif launches._items:
+                    launch = rng.choice(list(launches._items))
+                    targets = sorted(launches._TRANSITIONS.get(launch["status"], set()))
+                    if targets:
+                        launches.transition_status(launch["id"], rng.choice(targets))
+
+                # verify() raises on any divergence; also check the combined view explicitly.
+                launches.refresh_execution_focus()
+                self.assertEqual(
+                    ExecutionFocusEngine.select_from_indexes(proposals._focus, launches._focus),
+                    ExecutionFocusEngine.select_active(proposals._items, launches._items),
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
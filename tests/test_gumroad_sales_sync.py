@@ -7,6 +7,7 @@ from core.product_launch_store import ProductLaunchStore
 from core.product_proposal_store import ProductProposalStore
 from core.services.gumroad_sync_service import GumroadSyncService
 from core.revenue_attribution.store import RevenueAttributionStore
+from core.subreddit_performance_store import SubredditPerformanceStore
 
 
 class GumroadSalesSyncServiceTest(unittest.TestCase):
@@ -72,6 +73,34 @@ class GumroadSalesSyncServiceTest(unittest.TestCase):
             self.assertEqual(revenue_summary["totals"]["sales"], 1)
             self.assertEqual(revenue_summary["totals"]["revenue"], 29.0)
 
+    def test_subreddit_sales_survive_a_failure_on_a_later_launch(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals, launches = self._stores(root)
+            for index in (1, 2):
+                proposals.add({"id": f"proposal-{index}", "product_name": f"Kit {index}"})
+                launch = launches.add_from_proposal(f"proposal-{index}")
+                launches.link_gumroad_product(launch["id"], f"gumroad-product-{index}")
+
+            revenue_store = RevenueAttributionStore(path=root / "revenue_attribution.json")
+            revenue_store.upsert_tracking("treta-abc123-1700000000", "proposal-2", subreddit="saas", price=29)
+            subreddits = SubredditPerformanceStore(path=root / "subreddit_performance.json", flush_interval_seconds=0)
+
+            gumroad_client = Mock()
+            gumroad_client.get_sales.side_effect = [
+                [{"sale_id": "sale-1", "amount": 29.0, "description": "Tracking: treta-abc123-1700000000"}],
+                RuntimeError("gumroad unavailable"),
+            ]
+
+            service = GumroadSyncService(launches, gumroad_client, revenue_store, subreddit_performance_store=subreddits)
+            with self.assertRaises(RuntimeError):
+                service.sync_sales()
+
+            self.assertEqual(revenue_store.summary()["totals"]["sales"], 1)
+            self.assertEqual(subreddits.get_subreddit_stats("saas")["sales"], 1)
+            reloaded = SubredditPerformanceStore(path=root / "subreddit_performance.json")
+            self.assertEqual(reloaded.get_subreddit_stats("saas")["sales"], 1)
+
     def test_cursor_prevents_double_counting(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             root = Path(tmp_dir)
@@ -0,0 +1,57 @@
+import gzip
+import json
+import unittest
+from urllib.request import Request, urlopen
+
+from core.http.compression import accepted_encodings, compress_response, encode_json
+from core.ipc_http import start_http_server
+
+
+class CompressionHelpersTest(unittest.TestCase):
+    def test_accept_encoding_respects_q_values(self):
+        self.assertEqual(accepted_encodings("gzip, deflate;q=0.5, br;q=0"), {"gzip", "deflate"})
+        self.assertEqual(accepted_encodings("*"), {"*", "br", "gzip"})
+        self.assertEqual(accepted_encodings(None), set())
+
+    def test_only_large_bodies_are_compressed_for_gzip_clients(self):
+        body = encode_json({"items": [{"id": index, "status": "posted"} for index in range(200)]})
+        self.assertNotIn(b": ", body)
+        compressed, encoding = compress_response(body, "gzip", min_bytes=1024)
+        self.assertEqual(encoding, "gzip")
+        self.assertEqual(gzip.decompress(compressed), body)
+        self.assertEqual(compress_response(body, "identity", min_bytes=1024), (body, None))
+        self.assertEqual(compress_response(b"{}", "gzip", min_bytes=1024), (b"{}", None))
+
+
+class HttpCompressionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = start_http_server(host="127.0.0.1", port=0)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _get(self, path, headers=None):
+        request = Request(f"http://127.0.0.1:{self.server.server_port}{path}", headers=headers or {})
+        with urlopen(request, timeout=2) as response:
+            return response.headers, response.read()
+
+    def test_large_json_is_gzipped_with_content_length(self):
+        self.server.compress_min_bytes = 64
+        headers, body = self._get("/health", {"Accept-Encoding": "gzip"})
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        self.assertTrue(json.loads(gzip.decompress(body))["ok"])
+
+        headers, plain = self._get("/health")
+        self.assertIsNone(headers["Content-Encoding"])
+        self.assertEqual(int(headers["Content-Length"]), len(plain))
+        self.assertEqual(json.loads(plain)["data"]["version"], json.loads(gzip.decompress(body))["data"]["version"])
+
+    def test_small_json_stays_uncompressed(self):
+        headers, body = self._get("/health/live", {"Accept-Encoding": "gzip"})
+        self.assertIsNone(headers["Content-Encoding"])
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+
+
+if __name__ == "__main__":
+    unittest.main()
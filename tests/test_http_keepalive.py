@@ -0,0 +1,70 @@
+import http.client
+import json
+import unittest
+from unittest.mock import patch
+
+from core.ipc_http import Handler, start_http_server
+
+
+class HttpKeepAliveTest(unittest.TestCase):
+    def setUp(self):
+        self.server = start_http_server(host="127.0.0.1", port=0)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+        self.addCleanup(self.connection.close)
+
+    def _request(self, method, path, body=None, headers=None):
+        self.connection.request(method, path, body=body, headers=headers or {})
+        response = self.connection.getresponse()
+        payload = response.read()
+        self.assertEqual(int(response.getheader("Content-Length")), len(payload))
+        return response, payload
+
+    def _socket(self):
+        return self.connection.sock
+
+    def test_many_requests_share_one_connection(self):
+        self._request("GET", "/health/live")
+        sock = self._socket()
+        request_ids = set()
+        for index in range(30):
+            method, path, body = [
+                ("GET", "/health/live", None),
+                ("GET", "/state", None),
+                ("GET", "/app.js", None),
+                ("GET", "/no/such/route", None),
+                ("POST", "/no/such/route", b'{"ignored": true}'),
+                ("POST", "/event", json.dumps({"type": "Heartbeat", "payload": {}}).encode("utf-8")),
+            ][index % 6]
+            response, payload = self._request(method, path, body, {"Content-Type": "application/json"})
+            self.assertFalse(response.will_close)
+            request_ids.add(response.getheader("X-Request-Id"))
+            if path == "/event":
+                self.assertEqual(response.status, 200)
+            if path == "/no/such/route":
+                self.assertEqual(json.loads(payload)["error"]["code"], "not_found")
+        self.assertIs(self._socket(), sock)
+        self.assertEqual(len(request_ids), 30)
+
+    def test_connection_closes_after_the_request_cap(self):
+        with patch.object(Handler, "max_requests_per_connection", 3):
+            responses = [self._request("GET", "/health/live")[0] for _ in range(3)]
+        self.assertEqual([response.will_close for response in responses], [False, False, True])
+        self.assertEqual(responses[-1].getheader("Connection"), "close")
+
+    def test_unauthorized_body_is_discarded_before_the_next_request(self):
+        with patch("core.ipc_http.API_TOKEN", "secret"):
+            response, _ = self._request("POST", "/autonomy/override", b'{"mode": "manual"}')
+            self.assertEqual((response.status, response.will_close), (401, False))
+            response, _ = self._request("GET", "/health/live")
+        self.assertEqual(response.status, 200)
+
+    def test_oversized_body_closes_the_connection(self):
+        response, _ = self._request("POST", "/event", b"{}", {"Content-Length": str(10**9)})
+        self.assertEqual(response.status, 413)
+        self.assertTrue(response.will_close)
+
+
+if __name__ == "__main__":
+    unittest.main()
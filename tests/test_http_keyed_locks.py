@@ -0,0 +1,222 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from core.control import Control
+from core.http.locks import KeyedLocks
+from core.ipc_http import start_http_server
+from core.product_launch_store import ProductLaunchStore
+from core.product_proposal_store import ProductProposalStore
+
+_WRITE_SECONDS = 0.2
+
+
+class _SlowLaunchStore:
+    def __init__(self):
+        self.sales: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add_sale(self, launch_id: str, amount: float):
+        time.sleep(_WRITE_SECONDS)
+        with self._lock:
+            self.sales[launch_id] = self.sales.get(launch_id, 0.0) + amount
+        return {"id": launch_id, "sales": self.sales[launch_id]}
+
+
+class _BlockingControl:
+    def __init__(self):
+        self.scan_started = threading.Event()
+        self.release_scan = threading.Event()
+
+    def run_reddit_scan(self):
+        self.scan_started.set()
+        self.release_scan.wait(timeout=5)
+        return {"status": "ok"}
+
+
+class KeyedLocksTest(unittest.TestCase):
+    def test_keys_are_acquired_in_canonical_order_and_dropped_when_idle(self):
+        locks = KeyedLocks(order=("a", "b"))
+        with locks.hold(("b", "1"), ("a", "2"), ("a", "1")):
+            self.assertEqual(locks.active_keys(), [("a", "1"), ("a", "2"), ("b", "1")])
+        self.assertEqual(locks.active_keys(), [])
+        with self.assertRaises(ValueError):
+            with locks.hold(("c", "1")):
+                pass
+        self.assertEqual(locks.active_keys(), [])
+
+    def test_resource_wide_key_excludes_entity_holders(self):
+        locks = KeyedLocks(order=("a",))
+        events = []
+        entity_in = threading.Event()
+        release_entity = threading.Event()
+
+        def entity(name):
+            with locks.hold(("a", name)):
+                events.append(f"{name}:in")
+                entity_in.set()
+                release_entity.wait(timeout=2)
+            events.append(f"{name}:out")
+
+        def wide():
+            with locks.hold(("a", ""), ("a", "covered")):
+                events.append("wide:in")
+                time.sleep(0.1)
+            events.append("wide:out")
+
+        first = threading.Thread(target=entity, args=("1",))
+        first.start()
+        self.assertTrue(entity_in.wait(timeout=2))
+        blocker = threading.Thread(target=wide)
+        blocker.start()
+        time.sleep(0.05)
+        late = threading.Thread(target=entity, args=("2",))
+        late.start()
+        time.sleep(0.05)
+        self.assertEqual(events, ["1:in"])
+
+        release_entity.set()
+        for thread in (first, blocker, late):
+            thread.join(timeout=5)
+        self.assertEqual(events, ["1:in", "1:out", "wide:in", "wide:out", "2:in", "2:out"])
+        self.assertEqual(locks.active_keys(), [])
+
+
+class HttpProposalLockTest(unittest.TestCase):
+    def test_concurrent_approvals_of_different_proposals_leave_one_active(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            control = Control(product_proposal_store=proposals, product_launch_store=launches)
+            for index in range(2):
+                proposals.add({"id": f"proposal-{index}", "product_name": f"Kit {index}"})
+
+            # Widen the window between the integrity check and the write.
+            check = control.domain_integrity_policy.validate_transition
+
+            def slow_check(*args):
+                check(*args)
+                time.sleep(0.2)
+
+            control.domain_integrity_policy.validate_transition = slow_check
+            server = start_http_server(host="127.0.0.1", port=0, control=control, product_proposal_store=proposals)
+            statuses = []
+            barrier = threading.Barrier(2)
+
+            def approve(proposal_id):
+                request = Request(
+                    f"http://127.0.0.1:{server.server_port}/product_proposals/{proposal_id}/approve",
+                    data=b"{}",
+                    method="POST",
+                    headers={"Content-Type": "application/json"},
+                )
+                barrier.wait(timeout=2)
+                try:
+                    with urlopen(request, timeout=10) as response:
+                        statuses.append(response.status)
+                except HTTPError as exc:
+                    statuses.append(exc.code)
+
+            threads = [threading.Thread(target=approve, args=(f"proposal-{index}",)) for index in range(2)]
+            try:
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join(timeout=10)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+            self.assertEqual(sorted(statuses)[0], 200)
+            self.assertNotEqual(sorted(statuses)[1], 200)
+            self.assertEqual([item["status"] for item in proposals.list()].count("approved"), 1)
+
+
+class HttpKeyedLocksTest(unittest.TestCase):
+    def setUp(self):
+        self.store = _SlowLaunchStore()
+        self.control = _BlockingControl()
+        self.server = start_http_server(host="127.0.0.1", port=0, product_launch_store=self.store, control=self.control)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(self.control.release_scan.set)
+
+    def _post(self, path: str, body: dict):
+        request = Request(
+            f"http://127.0.0.1:{self.server.server_port}{path}",
+            data=json.dumps(body).encode("utf-8"),
+            method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with urlopen(request, timeout=10) as response:
+            return response.status
+
+    def _time_parallel_sales(self, launch_ids):
+        barrier = threading.Barrier(len(launch_ids))
+
+        def post(launch_id):
+            barrier.wait(timeout=2)
+            self._post(f"/product_launches/{launch_id}/add_sale", {"amount": 1})
+
+        threads = [threading.Thread(target=post, args=(launch_id,)) for launch_id in launch_ids]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        return time.perf_counter() - started
+
+    def test_independent_writers_scale_while_same_entity_writers_serialize(self):
+        writers = 4
+        independent = self._time_parallel_sales([f"l{index}" for index in range(writers)])
+        same_entity = self._time_parallel_sales(["shared"] * writers)
+
+        self.assertEqual(self.store.sales["shared"], float(writers))
+        self.assertGreaterEqual(same_entity, writers * _WRITE_SECONDS * 0.9)
+        self.assertLess(independent, same_entity / 2)
+
+    def test_slow_scan_does_not_block_unrelated_mutations(self):
+        scan = threading.Thread(target=self._post, args=("/reddit/run_scan", {}))
+        scan.start()
+        self.assertTrue(self.control.scan_started.wait(timeout=2))
+
+        started = time.perf_counter()
+        self.assertEqual(self._post("/product_launches/l1/add_sale", {"amount": 1}), 200)
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertFalse(self.control.release_scan.is_set())
+
+        self.control.release_scan.set()
+        scan.join(timeout=5)
+
+    def test_mark_posted_proceeds_during_a_scan(self):
+        scan = threading.Thread(target=self._post, args=("/reddit/run_scan", {}))
+        scan.start()
+        self.assertTrue(self.control.scan_started.wait(timeout=2))
+
+        marked = threading.Event()
+
+        def mark_posted():
+            try:
+                self._post("/reddit/mark_posted", {})
+            except HTTPError:
+                pass
+            marked.set()
+
+        writer = threading.Thread(target=mark_posted)
+        writer.start()
+        self.assertTrue(marked.wait(timeout=2))
+        self.assertFalse(self.control.release_scan.is_set())
+
+        self.control.release_scan.set()
+        scan.join(timeout=5)
+        writer.join(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from core.action_execution_store import ActionExecutionStore
+from core.bus import EventBus
+from core.ipc_http import start_http_server
+from core.migrations.runner import run_migrations
+from core.opportunity_store import OpportunityStore
+from core.persistence.pagination import encode_cursor, page_after, parse_fields, project_fields
+from core.product_proposal_store import ProductProposalStore
+from core.reddit_post_store import RedditPostStore
+from core.storage import Storage
+
+
+class PaginationHelpersTest(unittest.TestCase):
+    def test_page_after_walks_pages_in_order(self):
+        items = [{"id": f"item-{index}"} for index in range(5)]
+        first = page_after(items, limit=2, cursor=None)
+        second = page_after(items, limit=2, cursor=first["next_cursor"])
+        last = page_after(items, limit=2, cursor=second["next_cursor"])
+
+        self.assertEqual([item["id"] for item in first["items"]], ["item-0", "item-1"])
+        self.assertEqual([item["id"] for item in second["items"]], ["item-2", "item-3"])
+        self.assertEqual([item["id"] for item in last["items"]], ["item-4"])
+        self.assertIsNone(last["next_cursor"])
+
+    def test_page_after_stops_after_one_extra_item(self):
+        seen = []
+
+        def items():
+            for index in range(1000):
+                seen.append(index)
+                yield {"id": str(index)}
+
+        page = page_after(items(), limit=3, cursor=None)
+
+        self.assertEqual(len(page["items"]), 3)
+        self.assertEqual(len(seen), 4)
+
+    def test_page_after_evicted_anchor_returns_empty_page(self):
+        page = page_after([{"id": "a"}, {"id": "b"}], limit=1, cursor=encode_cursor("gone"))
+        self.assertEqual(page, {"items": [], "next_cursor": None})
+
+    def test_fields_projection(self):
+        self.assertIsNone(parse_fields(""))
+        self.assertEqual(parse_fields("id, status,id,"), ("id", "status"))
+        self.assertEqual(
+            project_fields([{"id": "a", "status": "new", "title": "x"}, {"id": "b"}], ("id", "status")),
+            [{"id": "a", "status": "new"}, {"id": "b"}],
+        )
+
+
+class ListEndpointPaginationTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        self.server = None
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def _start(self, **kwargs):
+        self.server = start_http_server(host="127.0.0.1", port=0, bus=EventBus(), **kwargs)
+
+    def _get(self, path: str) -> dict:
+        with urlopen(f"http://127.0.0.1:{self.server.server_port}{path}", timeout=2) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    @staticmethod
+    def _page(payload: dict) -> tuple[list[dict], str | None]:
+        data = payload.get("data")
+        if isinstance(data, dict):
+            return data["items"], data["next_cursor"]
+        if isinstance(data, list):
+            return data, payload["next_cursor"]
+        return payload["items"], payload["next_cursor"]
+
+    def _collect(self, path: str) -> list[dict]:
+        items, next_cursor = self._page(self._get(path))
+        while next_cursor:
+            page_items, next_cursor = self._page(self._get(f"{path}&cursor={next_cursor}"))
+            items.extend(page_items)
+        return items
+
+    def test_product_proposals_pages_newest_first_with_projection(self):
+        store = ProductProposalStore(path=self.root / "product_proposals.json")
+        for index in range(25):
+            store.add({"id": f"proposal-{index}", "product_name": f"Product {index}", "status": "draft"})
+        self._start(product_proposal_store=store)
+
+        default_page = self._get("/product_proposals")
+        self.assertEqual(len(default_page["items"]), 10)
+        self.assertEqual(default_page["items"][0]["id"], "proposal-24")
+        self.assertIsNotNone(default_page["next_cursor"])
+
+        projected = self._get("/product_proposals?limit=3&fields=id,status")
+        self.assertEqual(projected["items"], [{"id": f"proposal-{index}", "status": "draft"} for index in (24, 23, 22)])
+
+        ids = [item["id"] for item in self._collect("/product_proposals?limit=7&fields=id")]
+        self.assertEqual(ids, [f"proposal-{index}" for index in range(24, -1, -1)])
+
+    def test_opportunities_filter_by_status_across_pages(self):
+        store = OpportunityStore(path=self.root / "opportunities.json")
+        for index in range(12):
+            item = store.add(source="test", title=f"Opp {index}", summary="", opportunity={}, item_id=f"opp-{index}")
+            if index % 3 == 0:
+                store.set_status(item["id"], "evaluated")
+        self._start(opportunity_store=store)
+
+        ids = [item["id"] for item in self._collect("/opportunities?status=new&limit=3")]
+
+        self.assertEqual(ids, [f"opp-{index}" for index in range(11, -1, -1) if index % 3])
+
+    def test_action_executions_page_by_id(self):
+        execution_store = ActionExecutionStore(sqlite3.connect(":memory:", check_same_thread=False))
+        for index in range(9):
+            execution_store.create_queued(action_id=f"action-{index}", action_type="noop", executor="test", context={})
+        self._start(strategy_action_execution_layer=SimpleNamespace(_action_execution_store=execution_store))
+
+        payload = self._get("/action-executions?limit=4&fields=id,action_id")
+        self.assertTrue(payload["ok"])
+        self.assertEqual(payload["data"]["items"][0], {"id": 9, "action_id": "action-8"})
+
+        ids = [item["id"] for item in self._collect("/action-executions?limit=4")]
+        self.assertEqual(ids, list(range(9, 0, -1)))
+
+    def test_creator_pains_page_by_analyzed_at(self):
+        with patch.dict("os.environ", {"TRETA_DATA_DIR": self.temp_dir.name}, clear=False):
+            storage = Storage()
+        run_migrations(storage.conn)
+        with storage._lock:
+            storage.conn.executemany(
+                """
+                INSERT INTO creator_pain_analysis (
+                    id, reddit_signal_id, pain_category, monetization_level, urgency_score, analyzed_at
+                ) VALUES (?, ?, 'pricing', 'high', 0.5, ?)
+                """,
+                [(f"analysis-{index}", f"signal-{index}", f"2026-01-01T00:00:0{index // 2}+00:00") for index in range(7)],
+            )
+            storage.conn.commit()
+        self._start(storage=storage)
+
+        first = self._get("/creator/pains?limit=3")
+        self.assertTrue(first["ok"])
+        self.assertEqual(len(first["data"]), 3)
+
+        ids = [item["id"] for item in self._collect("/creator/pains?limit=3")]
+        self.assertEqual(ids, [f"analysis-{index}" for index in range(6, -1, -1)])
+
+    def test_reddit_posts_page_newest_first(self):
+        store = RedditPostStore(path=self.root / "reddit_posts.json")
+        store.add_many([{"id": f"post-{index}", "subreddit": f"sub{index % 2}"} for index in range(5)])
+        self._start(reddit_post_store=store)
+
+        payload = self._get("/reddit/posts?limit=2&fields=id")
+        ids = [item["id"] for item in self._collect("/reddit/posts?limit=2")]
+        filtered = [item["id"] for item in self._collect("/reddit/posts?limit=2&subreddit=sub0")]
+
+        self.assertEqual(payload["data"]["items"], [{"id": "post-4"}, {"id": "post-3"}])
+        self.assertEqual(ids, [f"post-{index}" for index in range(4, -1, -1)])
+        self.assertEqual(filtered, ["post-4", "post-2", "post-0"])
+
+    def test_opportunities_and_reddit_posts_are_unpaged_without_limit_or_cursor(self):
+        opportunities = OpportunityStore(capacity=100, path=self.root / "opportunities.json")
+        for index in range(60):
+            opportunities.add(source="test", title=f"Opp {index}", summary="", opportunity={}, item_id=f"opp-{index}")
+        posts = RedditPostStore(path=self.root / "reddit_posts.json")
+        posts.add_many([{"id": f"post-{index}", "post_id": f"t3_{index}"} for index in range(60)])
+        self._start(opportunity_store=opportunities, reddit_post_store=posts)
+
+        opportunity_page = self._get("/opportunities?fields=id")
+        post_page = self._get("/reddit/posts")
+
+        self.assertEqual(opportunity_page["items"], [{"id": f"opp-{index}"} for index in range(60)])
+        self.assertNotIn("next_cursor", opportunity_page)
+        self.assertEqual([item["id"] for item in post_page["data"]["items"]], [f"post-{index}" for index in range(59, -1, -1)])
+        self.assertNotIn("next_cursor", post_page["data"])
+
+    def test_bad_limit_and_cursor_are_client_errors(self):
+        store = ProductProposalStore(path=self.root / "product_proposals.json")
+        self._start(product_proposal_store=store)
+
+        for query, code in (("limit=abc", "invalid_limit"), ("cursor=not-a-cursor", "invalid_cursor")):
+            with self.assertRaises(HTTPError) as raised:
+                self._get(f"/product_proposals?{query}")
+            self.assertEqual(raised.exception.code, 400)
+            self.assertEqual(json.loads(raised.exception.read().decode("utf-8"))["error"]["code"], code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from core.http.response_cache import ResponseCache
+from core.ipc_http import start_http_server
+from core.revenue_attribution.store import RevenueAttributionStore
+from core.storage import Storage
+from core.subreddit_performance_store import SubredditPerformanceStore
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_entry_is_replaced_when_versions_move(self):
+        cache = ResponseCache(max_entries=2)
+        key = ("/revenue/summary", "")
+        self.assertIsNone(cache.get(key, (1,)))
+        entry = cache.put(key, (1,), b'{"request_id":"__request_id__"}', "application/json")
+        self.assertIs(cache.get(key, (1,)), entry)
+        self.assertEqual(entry.render('a"b'), b'{"request_id":"a\\"b"}')
+        self.assertTrue(entry.matches(entry.etag))
+        self.assertTrue(entry.matches(entry.etag[2:]))
+        self.assertIsNone(cache.get(key, (2,)))
+
+        cache.put(("/a", ""), (1,), b"{}", "application/json")
+        cache.put(("/b", ""), (1,), b"{}", "application/json")
+        snapshot = cache.snapshot()
+        self.assertEqual((snapshot["hits"], snapshot["misses"], snapshot["entries"]), (1, 2, 2))
+
+
+class InputVersionTest(unittest.TestCase):
+    def test_subreddit_performance_and_storage_expose_versions(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            subreddits = SubredditPerformanceStore(path=Path(tmp_dir) / "subreddit_performance.json", flush_interval_seconds=0)
+            before = subreddits.version
+            subreddits.record_post_attempt("r/test")
+            self.assertEqual(subreddits.version, before + 1)
+
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}):
+                storage = Storage()
+            self.addCleanup(storage.conn.close)
+            version = storage.version
+            self.assertEqual(storage.version, version)
+            storage.set_runtime_override("k", "v")
+            self.assertGreater(storage.version, version)
+
+            # A commit from another connection moves it too.
+            version = storage.version
+            other = sqlite3.connect(storage.db_path)
+            other.execute("UPDATE runtime_overrides SET value = 'w' WHERE key = 'k'")
+            other.commit()
+            other.close()
+            self.assertGreater(storage.version, version)
+
+
+class HttpResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.revenue = RevenueAttributionStore(path=Path(self.tmp_dir.name) / "revenue_attribution.json")
+        self.revenue.upsert_tracking("trk-1", "proposal-1")
+        self.server = start_http_server(host="127.0.0.1", port=0, revenue_attribution_store=self.revenue)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _get(self, path, headers=None):
+        request = Request(f"http://127.0.0.1:{self.server.server_port}{path}", headers=headers or {})
+        try:
+            with urlopen(request, timeout=2) as response:
+                return response.status, response.headers, response.read()
+        except HTTPError as exc:
+            return exc.code, exc.headers, exc.read()
+
+    def test_summary_is_served_from_cache_until_a_sale_lands(self):
+        status, first_headers, first = self._get("/revenue/summary")
+        self.assertEqual(status, 200)
+        status, headers, second = self._get("/revenue/summary")
+        self.assertEqual(headers["ETag"], first_headers["ETag"])
+        self.assertEqual(headers["Cache-Control"], "no-cache")
+        # Cached bytes still carry this request's own id.
+        self.assertEqual(json.loads(second)["request_id"], headers["X-Request-Id"])
+        self.assertNotEqual(json.loads(second)["request_id"], json.loads(first)["request_id"])
+
+        status, _, body = self._get("/revenue/summary", {"If-None-Match": first_headers["ETag"]})
+        self.assertEqual((status, body), (304, b""))
+
+        self.revenue.record_sale("trk-1", sale_id="sale-1", revenue_delta=12)
+        status, headers, third = self._get("/revenue/summary", {"If-None-Match": first_headers["ETag"]})
+        self.assertEqual(status, 200)
+        self.assertNotEqual(headers["ETag"], first_headers["ETag"])
+        self.assertEqual(json.loads(third)["data"]["totals"]["sales"], 1)
+
+        # A different query string is a different entry.
+        self._get("/revenue/summary?trackings=1")
+        cache = self.server.snapshot_metrics()["response_cache"]
+        self.assertEqual((cache["hits"], cache["misses"], cache["not_modified"], cache["entries"]), (2, 3, 1, 2))
+
+    def test_missing_inputs_bypass_the_cache(self):
+        status, headers, _ = self._get("/performance/summary")
+        self.assertEqual(status, 503)
+        self.assertIsNone(headers["ETag"])
+        status, headers, _ = self._get("/revenue/roi")
+        self.assertEqual(status, 200)
+        self.assertIsNone(headers["ETag"])
+        self.assertEqual(self.server.snapshot_metrics()["response_cache"]["bypassed"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import unittest
+from urllib.error import HTTPError
+from unittest.mock import patch
+from urllib.request import Request, urlopen
+
+from core import ipc_http
+from core.http.routes import RouteTable
+from core.ipc_http import Handler, _ROUTES, start_http_server
+
+
+class RouteTableTest(unittest.TestCase):
+    def test_exact_param_and_literal_precedence(self):
+        table = RouteTable()
+        table.add("GET", "/creator/launches", "list_launches")
+        table.add("GET", "/creator/launches/summary", "summary")
+        table.add("GET", "/creator/launches/{launch_id}", "get_launch")
+        table.add("POST", "/creator/launches/{launch_id}/sale", "sale", lock=("creator", None), source="http")
+
+        route, params = table.match("GET", "/creator/launches/summary")
+        self.assertEqual((route.handler, params), ("summary", {}))
+        route, params = table.match("GET", "/creator/launches/abc")
+        self.assertEqual((route.handler, params), ("get_launch", {"launch_id": "abc"}))
+        route, params = table.match("POST", "/creator/launches/abc/sale")
+        self.assertEqual((route.handler, params, route.defaults, route.lock), ("sale", {"launch_id": "abc"}, {"source": "http"}, ("creator", None)))
+
+        self.assertIsNone(table.match("POST", "/creator/launches/abc"))
+        self.assertIsNone(table.match("GET", "/creator/launches/abc/sale/extra"))
+        self.assertEqual(table.match("GET", "/creator/launches/")[1], {"launch_id": ""})
+
+    def test_literal_branch_backtracks_to_param(self):
+        table = RouteTable()
+        table.add("GET", "/a/b/c", "literal")
+        table.add("GET", "/a/{x}/d", "param")
+        route, params = table.match("GET", "/a/b/d")
+        self.assertEqual((route.handler, params), ("param", {"x": "b"}))
+
+    def test_duplicates_and_conflicting_params_are_rejected(self):
+        table = RouteTable()
+        table.add("GET", "/x/{id}", "one")
+        with self.assertRaises(ValueError):
+            table.add("GET", "/x/{id}", "two")
+        with self.assertRaises(ValueError):
+            table.add("GET", "/x/{other}/y", "three")
+
+    def test_every_server_route_names_a_handler_method(self):
+        for route in _ROUTES.routes():
+            self.assertTrue(callable(getattr(Handler, route.handler, None)), route)
+
+
+class _LaunchStore:
+    def add_sale(self, launch_id, amount):
+        return {"id": launch_id, "amount": amount}
+
+
+class HttpRoutingTest(unittest.TestCase):
+    def setUp(self):
+        self.server = start_http_server(host="127.0.0.1", port=0, product_launch_store=_LaunchStore())
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _request(self, method, path, body=None):
+        request = Request(
+            f"http://127.0.0.1:{self.server.server_port}{path}",
+            data=json.dumps(body or {}).encode("utf-8") if method != "GET" else None,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urlopen(request, timeout=2) as response:
+                return response.status, json.loads(response.read().decode("utf-8"))
+        except HTTPError as exc:
+            return exc.code, json.loads(exc.read().decode("utf-8"))
+
+    def test_parameterized_post_dispatches_with_path_params(self):
+        status, body = self._request("POST", "/product_launches/l-7/add_sale?src=ui", {"amount": 3})
+        self.assertEqual(status, 200)
+        self.assertEqual((body["id"], body["amount"]), ("l-7", 3.0))
+
+    def test_query_string_does_not_bypass_auth(self):
+        with patch.object(ipc_http, "API_TOKEN", "secret"), patch.object(ipc_http, "_auth_dev_mode_warned", False):
+            self.assertEqual(self._request("POST", "/opportunities/evaluate?x=1", {"id": "o1"})[0], 401)
+
+    def test_unknown_routes_and_methods_are_404(self):
+        self.assertEqual(self._request("POST", "/product_launches/l-7/unknown")[0], 404)
+        self.assertEqual(self._request("POST", "/state")[0], 404)
+        self.assertEqual(self._request("PATCH", "/reddit/signals/s1")[0], 404)
+        self.assertEqual(self._request("GET", "/no/such/route")[0], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
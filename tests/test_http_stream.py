@@ -0,0 +1,156 @@
+import http.client
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from core.bus import EventBus
+from core.http.notifications import NotificationLog
+from core.ipc_http import start_http_server
+from core.opportunity_store import OpportunityStore
+from core.strategy_action_execution_layer import StrategyActionExecutionLayer
+from core.strategy_action_store import StrategyActionStore
+
+
+class NotificationLogTest(unittest.TestCase):
+    def test_wait_returns_newer_notifications_and_detects_gaps(self):
+        log = NotificationLog(capacity=2)
+        self.assertEqual(log.wait(0, timeout=0.01), ([], True))
+        for topic in ("a", "b", "c"):
+            log.publish(topic, id=topic)
+
+        changes, complete = log.wait(1, timeout=0.01)
+        self.assertTrue(complete)
+        self.assertEqual([(change.seq, change.topic) for change in changes], [(2, "b"), (3, "c")])
+        # Seq 1 fell out of the window, so a client resuming from 0 cannot catch up.
+        self.assertEqual(log.wait(0, timeout=0.01), ([], False))
+
+    def test_resume_point_rejects_ids_from_another_log(self):
+        log = NotificationLog()
+        log.publish("a")
+        self.assertEqual(log.resume_point(log.event_id(1)), 1)
+        self.assertIsNone(log.resume_point(NotificationLog().event_id(1)))
+        self.assertIsNone(log.resume_point(log.event_id(5)))
+        self.assertIsNone(log.resume_point("garbage"))
+        self.assertIsNone(log.resume_point(None))
+
+
+class _StreamClient:
+    def __init__(self, port: int, last_event_id: str | None = None):
+        self.connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        headers = {"Last-Event-ID": last_event_id} if last_event_id else {}
+        self.connection.request("GET", "/stream", headers=headers)
+        self.response = self.connection.getresponse()
+
+    def next_event(self) -> dict:
+        fields = {}
+        while True:
+            line = self.response.readline().decode("utf-8").rstrip("\n")
+            if not line:
+                if "event" in fields:
+                    fields["data"] = json.loads(fields.get("data", "{}"))
+                    return fields
+                fields = {}
+                continue
+            if line.startswith(":"):
+                continue
+            name, _, value = line.partition(": ")
+            fields[name] = value
+
+    def close(self):
+        self.connection.close()
+
+
+class HttpStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.store = OpportunityStore(path=Path(self.tmp_dir.name) / "opportunities.json")
+        self.server = start_http_server(host="127.0.0.1", port=0, bus=EventBus(), opportunity_store=self.store)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _open(self, last_event_id=None) -> _StreamClient:
+        client = _StreamClient(self.server.server_port, last_event_id)
+        self.addCleanup(client.close)
+        return client
+
+    def _post_event(self):
+        request = Request(
+            f"http://127.0.0.1:{self.server.server_port}/event",
+            data=json.dumps({"type": "Heartbeat", "payload": {}}).encode("utf-8"),
+            method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with urlopen(request, timeout=2) as response:
+            self.assertEqual(response.status, 200)
+
+    def test_bus_and_store_changes_are_pushed_to_every_client(self):
+        clients = [self._open() for _ in range(3)]
+        self.assertEqual(clients[0].response.getheader("Content-Type"), "text/event-stream")
+        for client in clients:
+            self.assertEqual(client.next_event()["event"], "ready")
+
+        self._post_event()
+        self.store.add(source="test", title="t", summary="s", opportunity={}, item_id="opp-1")
+
+        for client in clients:
+            first, second = client.next_event(), client.next_event()
+            self.assertEqual(first["data"], {"topic": "events", "type": "Heartbeat"})
+            self.assertEqual(second["data"], {"topic": "opportunities", "op": "add", "id": "opp-1"})
+        self.assertEqual(self.server.snapshot_metrics()["stream"], {"clients": 3, "notifications": 2})
+
+    def test_pending_actions_registered_outside_http_are_pushed(self):
+        action_store = StrategyActionStore(path=Path(self.tmp_dir.name) / "strategy_actions.json")
+        server = start_http_server(
+            host="127.0.0.1",
+            port=0,
+            bus=EventBus(),
+            strategy_action_execution_layer=StrategyActionExecutionLayer(strategy_action_store=action_store, bus=EventBus()),
+        )
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        client = _StreamClient(server.server_port)
+        self.addCleanup(client.close)
+        self.assertEqual(client.next_event()["event"], "ready")
+
+        created = server.strategy_action_execution_layer.register_pending_actions(
+            [{"type": "review", "target_id": "proposal-1", "reasoning": "Validate demand"}]
+        )
+
+        self.assertEqual(
+            client.next_event()["data"],
+            {"topic": "strategy_actions", "op": "add", "id": created[0]["id"]},
+        )
+
+    def test_last_event_id_replays_missed_notifications(self):
+        ready = self._open().next_event()
+        self._post_event()
+        self._post_event()
+
+        resumed = self._open(ready["id"])
+        replayed = [resumed.next_event(), resumed.next_event()]
+        self.assertEqual([event["event"] for event in replayed], ["change", "change"])
+        self.assertEqual(replayed[-1]["id"], self.server.notifications.event_id(2))
+
+        foreign = self._open("0123456789ab-7")
+        self.assertEqual(foreign.next_event()["event"], "resync")
+
+    def test_failed_mutation_publishes_nothing(self):
+        request = Request(
+            f"http://127.0.0.1:{self.server.server_port}/reddit/signals",
+            data=b"{}",
+            method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with self.assertRaises(HTTPError) as raised:
+            urlopen(request, timeout=2)
+        self.assertEqual(raised.exception.code, 400)
+        raised.exception.close()
+        self.assertEqual(self.server.notifications.last_seq, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import json
+import threading
+import time
+import unittest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from core.http.executor import BoundedWorkerPool, WorkerPoolSaturatedError
+from core.ipc_http import start_http_server
+
+
+class BoundedWorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def _blocked(self):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return "done"
+
+    def test_saturated_pool_rejects_instead_of_queueing(self):
+        pool = BoundedWorkerPool(max_workers=1, max_queue=1)
+        self.addCleanup(pool.shutdown)
+        first = pool.submit("a", self._blocked)
+        self.assertTrue(self.started.wait(timeout=2))
+        second = pool.submit("b", self._blocked)
+        with self.assertRaises(WorkerPoolSaturatedError):
+            pool.submit("c", self._blocked)
+
+        snapshot = pool.snapshot()
+        self.assertEqual((snapshot["active_workers"], snapshot["queued"], snapshot["rejected"]), (1, 1, 1))
+        self.release.set()
+        self.assertEqual((first.result(timeout=2), second.result(timeout=2)), ("done", "done"))
+        self.assertEqual(pool.submit("c", lambda: "ok").result(timeout=2), "ok")
+        self.assertIsNotNone(pool.snapshot()["queue_wait_ms"]["p95"])
+
+    def test_joinable_operation_shares_the_in_flight_result(self):
+        pool = BoundedWorkerPool(max_workers=2, max_queue=0, joinable_operations=frozenset({"scan"}))
+        self.addCleanup(pool.shutdown)
+        calls = []
+
+        def scan():
+            calls.append(1)
+            return self._blocked()
+
+        first = pool.submit("scan", scan)
+        joined = pool.submit("scan", scan)
+        self.assertIs(first, joined)
+        self.assertEqual(pool.snapshot()["inflight_operations"], ["scan"])
+        self.release.set()
+        self.assertEqual(joined.result(timeout=2), "done")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(pool.snapshot()["joined"], 1)
+
+    def test_timeout_does_not_grow_the_thread_count(self):
+        pool = BoundedWorkerPool(max_workers=1, max_queue=0)
+        self.addCleanup(pool.shutdown)
+        self.assertEqual(pool.run("slow", self._blocked, timeout=0.05), (False, None))
+        with self.assertRaises(WorkerPoolSaturatedError):
+            pool.run("slow", self._blocked, timeout=0.05)
+
+
+class _BlockingControl:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def run_reddit_scan(self):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return {"scanned": self.calls}
+
+
+class HttpWorkerPoolTest(unittest.TestCase):
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "condition not reached")
+            time.sleep(0.01)
+
+    def test_concurrent_scans_join_and_excess_load_is_shed(self):
+        control = _BlockingControl()
+        server = start_http_server(host="127.0.0.1", port=0, control=control)
+        server.worker_pool.shutdown()
+        server.worker_pool = BoundedWorkerPool(max_workers=1, max_queue=0, joinable_operations=frozenset({"reddit_scan"}))
+        results = []
+
+        def post(path):
+            request = Request(
+                f"http://127.0.0.1:{server.server_port}{path}",
+                data=b"{}",
+                method="POST",
+                headers={"Content-Type": "application/json"},
+            )
+            try:
+                with urlopen(request, timeout=10) as response:
+                    results.append((response.status, json.loads(response.read().decode("utf-8"))))
+            except HTTPError as exc:
+                results.append((exc.code, json.loads(exc.read().decode("utf-8"))))
+
+        try:
+            scans = [threading.Thread(target=post, args=("/reddit/run_scan",)) for _ in range(2)]
+            scans[0].start()
+            self._wait_for(lambda: server.worker_pool.snapshot()["inflight_operations"])
+            scans[1].start()
+            self._wait_for(lambda: server.worker_pool.snapshot()["joined"] >= 1)
+
+            # The only worker is busy with the scan, so an unrelated pooled operation is shed.
+            with self.assertRaises(WorkerPoolSaturatedError):
+                server.worker_pool.submit("integrity_recompute", lambda: None)
+
+            control.release.set()
+            for thread in scans:
+                thread.join(timeout=10)
+        finally:
+            control.release.set()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(control.calls, 1)
+        self.assertEqual([status for status, _ in results], [200, 200])
+        self.assertEqual([body["data"] for _, body in results], [{"scanned": 1}, {"scanned": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
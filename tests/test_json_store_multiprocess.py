@@ -0,0 +1,87 @@
+import multiprocessing
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.opportunity_store import OpportunityStore
+from core.persistence import json_io
+from core.persistence.json_io import SharedJsonFile, atomic_write_json
+from core.product_launch_store import ProductLaunchStore
+from core.product_proposal_store import ProductProposalStore
+
+_WORKERS = 4
+_WRITES_PER_WORKER = 40
+
+
+def _add_opportunities(root: str, worker: int) -> None:
+    store = OpportunityStore(capacity=1000, path=Path(root) / "opportunities.json")
+    for index in range(_WRITES_PER_WORKER):
+        store.add(source="stress", title="t", summary="s", opportunity={}, item_id=f"w{worker}-{index}")
+
+
+def _add_sales(root: str, launch_id: str) -> None:
+    proposals = ProductProposalStore(path=Path(root) / "product_proposals.json")
+    launches = ProductLaunchStore(proposal_store=proposals, path=Path(root) / "product_launches.json")
+    for _ in range(_WRITES_PER_WORKER):
+        launches.add_sale(launch_id, 1)
+
+
+@unittest.skipIf(json_io.fcntl is None, "advisory file locks need fcntl")
+class JsonStoreMultiprocessTest(unittest.TestCase):
+    def _run_workers(self, target, args_for):
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=target, args=args_for(worker)) for worker in range(_WORKERS)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            self.assertEqual(process.exitcode, 0)
+
+    def test_concurrent_appends_from_several_processes_are_all_kept(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # A store opened before the workers run must pick up their writes too.
+            observer = OpportunityStore(capacity=1000, path=Path(tmp_dir) / "opportunities.json")
+            self._run_workers(_add_opportunities, lambda worker: (tmp_dir, worker))
+
+            ids = {item["id"] for item in observer.list()}
+            self.assertEqual(len(ids), _WORKERS * _WRITES_PER_WORKER)
+            self.assertEqual(
+                ids,
+                {f"w{worker}-{index}" for worker in range(_WORKERS) for index in range(_WRITES_PER_WORKER)},
+            )
+
+    def test_concurrent_read_modify_write_counters_lose_no_updates(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            proposals.add({"id": "proposal-1", "product_name": "Stress Kit"})
+            launch_id = launches.add_from_proposal("proposal-1")["id"]
+
+            self._run_workers(_add_sales, lambda worker: (tmp_dir, launch_id))
+
+            expected = _WORKERS * _WRITES_PER_WORKER
+            self.assertEqual(launches.get(launch_id)["metrics"]["sales"], expected)
+            self.assertEqual(len(launches.list_sales(launch_id, limit=500)["items"]), expected)
+
+
+class SharedJsonFileTest(unittest.TestCase):
+    def test_refresh_reloads_only_after_a_foreign_write(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "items.json"
+            atomic_write_json(path, [])
+            shared = SharedJsonFile(path)
+            shared.mark_synced()
+            reloads = []
+
+            self.assertFalse(shared.refresh(lambda: reloads.append(1)))
+            atomic_write_json(path, [{"id": "x"}])
+            self.assertTrue(shared.refresh(lambda: reloads.append(1)))
+            self.assertFalse(shared.refresh(lambda: reloads.append(1)))
+            shared.write([{"id": "y"}])
+            self.assertFalse(shared.is_stale())
+            self.assertEqual(reloads, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,14 +19,7 @@ class OpenClawScanTest(unittest.TestCase):
         self.proposal_store = ProductProposalStore(path=Path(self.temp_dir.name) / "product_proposals.json")
         self.control = Control(product_proposal_store=self.proposal_store, bus=self.bus)
 
-        def _control_temp_reddit_posts_path():
-            return Path(self.temp_dir.name) / "reddit_posts.json"
-
-        self.original_control_reddit_path = self.control._reddit_posts_path
-        self.control._reddit_posts_path = _control_temp_reddit_posts_path
-
     def tearDown(self):
-        self.control._reddit_posts_path = self.original_control_reddit_path
         update_config(DEFAULT_CONFIG.copy())
         self.temp_dir.cleanup()
 
@@ -1,9 +1,15 @@
+import gc
+import json
 import tempfile
+import tracemalloc
 import unittest
+from unittest.mock import patch
 from pathlib import Path
+from urllib.request import urlopen
 
 from core.control import Control
 from core.events import Event
+from core.ipc_http import start_http_server
 from core.product_launch_store import ProductLaunchStore
 from core.product_proposal_store import ProductProposalStore
 
@@ -81,6 +87,167 @@ class ProductLaunchStoreTest(unittest.TestCase):
             with self.assertRaises(ValueError):
                 launches.transition_status(created["id"], "invalid")
 
+    def test_sales_detail_is_stored_outside_the_header_and_paged(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json", metric_history=True)
+            proposals.add({"id": "proposal-5", "product_name": "Detail Kit"})
+            created = launches.add_from_proposal("proposal-5")
+            for amount in (10, 20, 30):
+                launches.add_sale(created["id"], amount)
+            launches.add_sales_batch(created["id"], 2, 15)
+
+            header = json.loads((root / "product_launches.json").read_text(encoding="utf-8"))[0]
+            self.assertNotIn("sales_history", header)
+            self.assertEqual(header["metrics"]["sales"], 5)
+
+            reloaded = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            first = reloaded.list_sales(created["id"], limit=2)
+            self.assertEqual([sale["amount"] for sale in first["items"]], [30.0, 20.0])
+            second = reloaded.list_sales(created["id"], limit=2, cursor=first["next_cursor"])
+            self.assertEqual([sale["amount"] for sale in second["items"]], [10.0])
+            self.assertIsNone(second["next_cursor"])
+
+            history = reloaded.list_metric_history(created["id"])["items"]
+            self.assertEqual([entry["event"] for entry in history], ["sales_batch", "sale", "sale", "sale"])
+            self.assertEqual((history[0]["sales"], history[0]["revenue"]), (5, 75.0))
+
+    def test_legacy_inline_sales_move_to_sqlite_on_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "product_launches.json").write_text(
+                json.dumps(
+                    [
+                        {
+                            "id": "launch-legacy",
+                            "proposal_id": "proposal-legacy",
+                            "status": "active",
+                            "metrics": {"sales": 2, "revenue": 12.0},
+                            "sales": [{"amount": 5, "timestamp": "t1"}, {"amount": 7, "timestamp": "t2"}],
+                        }
+                    ]
+                ),
+                encoding="utf-8",
+            )
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            for _ in range(2):
+                launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+
+            self.assertNotIn("sales", launches.get("launch-legacy"))
+            self.assertEqual(
+                [(sale["amount"], sale["sold_at"]) for sale in launches.list_sales("launch-legacy")["items"]],
+                [(7.0, "t2"), (5.0, "t1")],
+            )
+
+    def test_detail_endpoint_returns_history_on_request(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals, launches = self._stores(root)
+            proposals.add({"id": "proposal-6", "product_name": "Endpoint Kit"})
+            created = launches.add_from_proposal("proposal-6")
+            launches.add_sale(created["id"], 9)
+            server = start_http_server(host="127.0.0.1", port=0, product_launch_store=launches)
+            base = f"http://127.0.0.1:{server.server_port}/product_launches/{created['id']}"
+            try:
+                with urlopen(base, timeout=2) as response:
+                    plain = json.loads(response.read().decode("utf-8"))["data"]
+                with urlopen(base + "?detail=1&limit=5", timeout=2) as response:
+                    detailed = json.loads(response.read().decode("utf-8"))["data"]
+            finally:
+                server.shutdown()
+                server.server_close()
+
+            self.assertNotIn("sales_history", plain)
+            self.assertEqual(detailed["sales_history"]["items"][0]["amount"], 9.0)
+            self.assertEqual(detailed["metrics_history"]["items"], [])
+
+    def test_sale_is_one_insert_and_metric_history_is_opt_in(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals, launches = self._stores(root)
+            proposals.add({"id": "proposal-7", "product_name": "Lean Kit"})
+            created = launches.add_from_proposal("proposal-7")
+            statements = []
+            launches._history.set_trace_callback(statements.append)
+
+            launches.add_sale(created["id"], 4)
+            launches.add_sales_batch(created["id"], 3, 12)
+
+            writes = [sql for sql in statements if sql.lstrip().upper().startswith(("INSERT", "COMMIT"))]
+            self.assertEqual([sql.split()[0].upper() for sql in writes], ["INSERT", "COMMIT"])
+            self.assertEqual(launches.list_metric_history(created["id"])["items"], [])
+            with patch.dict("os.environ", {"TRETA_LAUNCH_METRIC_HISTORY": "1"}):
+                self.assertTrue(ProductLaunchStore.metric_history_enabled())
+
+
+class ProductLaunchStoreMemoryTest(unittest.TestCase):
+    @staticmethod
+    def _traced(build):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            kept = build()
+            gc.collect()
+            return kept, tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+    def test_resident_memory_stays_flat_as_sales_accumulate(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.dict("os.environ", {"TRETA_PERSISTENCE_DURABILITY": "relaxed"}):
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            proposals.add({"id": "proposal-m", "product_name": "Memory Kit"})
+            launch_id = launches.add_from_proposal("proposal-m")["id"]
+
+            def add_sales(count):
+                for _ in range(count):
+                    launches.add_sale(launch_id, 1)
+
+            add_sales(100)
+            _, small = self._traced(lambda: add_sales(100))
+            _, large = self._traced(lambda: add_sales(1000))
+
+            self.assertEqual(launches.get(launch_id)["metrics"]["sales"], 1200)
+            self.assertLess(large, small + 32 * 1024)
+
+    def test_loading_heavy_legacy_history_keeps_only_headers_resident(self):
+        def write_launches(path, sales_per_launch):
+            path.write_text(
+                json.dumps(
+                    [
+                        {
+                            "id": f"launch-{index}",
+                            "proposal_id": f"proposal-{index}",
+                            "status": "active",
+                            "sales": [{"amount": 1, "sold_at": "2026-01-01T00:00:00+00:00"}] * sales_per_launch,
+                        }
+                        for index in range(20)
+                    ]
+                ),
+                encoding="utf-8",
+            )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            (root / "light").mkdir()
+            (root / "heavy").mkdir()
+            write_launches(root / "light" / "product_launches.json", 0)
+            write_launches(root / "heavy" / "product_launches.json", 2000)
+
+            _, light = self._traced(
+                lambda: ProductLaunchStore(proposal_store=proposals, path=root / "light" / "product_launches.json")
+            )
+            heavy_store, heavy = self._traced(
+                lambda: ProductLaunchStore(proposal_store=proposals, path=root / "heavy" / "product_launches.json")
+            )
+
+            self.assertEqual(heavy_store.list_sales("launch-3", limit=1)["next_cursor"] is not None, True)
+            self.assertLess(heavy, light + 64 * 1024)
+
 
 if __name__ == "__main__":
     unittest.main()
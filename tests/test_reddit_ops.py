@@ -9,6 +9,7 @@ from core.bus import EventBus
 from core.control import Control
 from core.ipc_http import start_http_server
 from core.product_proposal_store import ProductProposalStore
+from core.reddit_post_store import RedditPostStore
 
 
 
@@ -21,21 +22,13 @@ class RedditOpsEndpointTest(unittest.TestCase):
     def setUp(self):
         self.bus = EventBus()
         self.temp_dir = tempfile.TemporaryDirectory()
-        self.original_reddit_path = start_http_server.__globals__["Handler"]._reddit_posts_path
-
-        def _temp_reddit_posts_path(handler):
-            return Path(self.temp_dir.name) / "reddit_posts.json"
-
-        start_http_server.__globals__["Handler"]._reddit_posts_path = _temp_reddit_posts_path
-
         self.proposal_store = ProductProposalStore(path=Path(self.temp_dir.name) / "product_proposals.json")
-        self.control = Control(product_proposal_store=self.proposal_store, bus=self.bus)
-        self.original_control_reddit_path = self.control._reddit_posts_path
-
-        def _control_temp_reddit_posts_path():
-            return Path(self.temp_dir.name) / "reddit_posts.json"
-
-        self.control._reddit_posts_path = _control_temp_reddit_posts_path
+        self.reddit_post_store = RedditPostStore(path=Path(self.temp_dir.name) / "reddit_posts.json")
+        self.control = Control(
+            product_proposal_store=self.proposal_store,
+            reddit_post_store=self.reddit_post_store,
+            bus=self.bus,
+        )
         self.proposal_store.add(
             {
                 "id": "proposal_1",
@@ -56,8 +49,6 @@ class RedditOpsEndpointTest(unittest.TestCase):
     def tearDown(self):
         self.server.shutdown()
         self.server.server_close()
-        start_http_server.__globals__["Handler"]._reddit_posts_path = self.original_reddit_path
-        self.control._reddit_posts_path = self.original_control_reddit_path
         self.temp_dir.cleanup()
 
     def test_mark_posted_creates_entry(self):
@@ -82,30 +73,26 @@ class RedditOpsEndpointTest(unittest.TestCase):
         self.assertEqual(payload["data"]["item"]["proposal_id"], "proposal_1")
         self.assertEqual(payload["data"]["item"]["product_name"], "Reddit Micro SaaS")
 
-        stored = json.loads((Path(self.temp_dir.name) / "reddit_posts.json").read_text(encoding="utf-8"))
+        stored = RedditPostStore(path=Path(self.temp_dir.name) / "reddit_posts.json").list_page()["items"]
         self.assertEqual(len(stored), 1)
         self.assertEqual(stored[0]["subreddit"], "indiehackers")
 
     def test_get_posts_returns_list(self):
-        path = Path(self.temp_dir.name) / "reddit_posts.json"
-        path.write_text(
-            json.dumps(
-                [
-                    {
-                        "id": "reddit_post_1",
-                        "proposal_id": "proposal_1",
-                        "product_name": "Reddit Micro SaaS",
-                        "subreddit": "indiehackers",
-                        "post_url": "https://reddit.com/r/indiehackers/post/123",
-                        "upvotes": 3,
-                        "comments": 1,
-                        "status": "open",
-                        "date": "2026-01-01",
-                        "created_at": "2026-01-01T00:00:00Z",
-                    }
-                ]
-            ),
-            encoding="utf-8",
+        self.reddit_post_store.add_many(
+            [
+                {
+                    "id": "reddit_post_1",
+                    "proposal_id": "proposal_1",
+                    "product_name": "Reddit Micro SaaS",
+                    "subreddit": "indiehackers",
+                    "post_url": "https://reddit.com/r/indiehackers/post/123",
+                    "upvotes": 3,
+                    "comments": 1,
+                    "status": "open",
+                    "date": "2026-01-01",
+                    "created_at": "2026-01-01T00:00:00Z",
+                }
+            ]
         )
 
         with urlopen(f"http://127.0.0.1:{self.server.server_port}/reddit/posts", timeout=2) as response:
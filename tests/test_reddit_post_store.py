@@ -0,0 +1,102 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.migrations.runner import run_migrations
+from core.reddit_post_store import RedditPostStore
+
+
+def _post(index: int, **overrides) -> dict:
+    post = {
+        "id": f"reddit_post_{index}",
+        "post_id": f"abc{index}",
+        "proposal_id": f"proposal_{index % 2}",
+        "subreddit": "freelance",
+        "post_url": f"https://reddit.com/r/freelance/comments/abc{index}/",
+        "status": "open",
+        "created_at": f"2026-01-01T00:00:{index:02d}Z",
+    }
+    post.update(overrides)
+    return post
+
+
+class RedditPostStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+        self.path = self.root / "reddit_posts.json"
+
+    def test_add_dedupes_on_post_id(self):
+        store = RedditPostStore(path=self.path)
+
+        first = store.add(_post(1))
+        again = store.add(_post(2, post_id="abc1"))
+        without_id = [store.add(_post(index, post_id="")) for index in (3, 4)]
+
+        self.assertEqual(again, first)
+        self.assertEqual(len(store), 3)
+        self.assertTrue(store.has_post("abc1"))
+        self.assertFalse(store.has_post(""))
+        self.assertEqual([item["id"] for item in without_id], ["reddit_post_3", "reddit_post_4"])
+
+    def test_add_many_skips_known_and_repeated_post_ids(self):
+        store = RedditPostStore(path=self.path)
+        store.add(_post(1))
+
+        inserted = store.add_many([_post(1), _post(2), _post(3, post_id="abc2")])
+
+        self.assertEqual([item["id"] for item in inserted], ["reddit_post_2"])
+        self.assertEqual(len(store), 2)
+
+    def test_posts_survive_reopen_and_share_the_app_database(self):
+        RedditPostStore(path=self.path).add_many([_post(index) for index in range(3)])
+
+        reopened = RedditPostStore(path=self.path)
+
+        self.assertEqual([item["id"] for item in reopened.list_page()["items"]], ["reddit_post_2", "reddit_post_1", "reddit_post_0"])
+        conn = sqlite3.connect(self.root / "memory" / "treta.sqlite")
+        try:
+            run_migrations(conn)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM reddit_posts").fetchone()[0], 3)
+        finally:
+            conn.close()
+
+    def test_legacy_json_is_imported_once(self):
+        self.path.write_text(json.dumps([_post(1), _post(2), _post(3, post_id="abc1")]), encoding="utf-8")
+
+        store = RedditPostStore(path=self.path)
+
+        self.assertEqual([item["id"] for item in store.list_page()["items"]], ["reddit_post_2", "reddit_post_1"])
+        self.assertFalse(self.path.exists())
+        self.assertTrue(self.path.with_name("reddit_posts.json.migrated").exists())
+        self.assertEqual(len(RedditPostStore(path=self.path)), 2)
+
+    def test_rows_from_another_connection_are_picked_up(self):
+        store = RedditPostStore(path=self.path)
+        store.add(_post(1))
+        version = store.version
+
+        RedditPostStore(path=self.path).add(_post(2))
+
+        self.assertTrue(store.has_post("abc2"))
+        self.assertEqual(store.list_page(limit=1)["items"][0]["id"], "reddit_post_2")
+        self.assertGreater(store.version, version)
+
+    def test_filtered_pages_follow_the_cursor(self):
+        store = RedditPostStore(path=self.path)
+        store.add_many([_post(index) for index in range(7)])
+
+        first = store.list_page(limit=2, proposal_id="proposal_0")
+        second = store.list_page(limit=2, proposal_id="proposal_0", cursor=first["next_cursor"])
+
+        self.assertEqual([item["id"] for item in first["items"]], ["reddit_post_6", "reddit_post_4"])
+        self.assertEqual([item["id"] for item in second["items"]], ["reddit_post_2", "reddit_post_0"])
+        self.assertIsNone(second["next_cursor"])
+        self.assertEqual(store.list_page(subreddit="other")["items"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
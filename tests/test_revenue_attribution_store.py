@@ -1,3 +1,4 @@
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -26,6 +27,103 @@ class RevenueAttributionStoreTest(unittest.TestCase):
             self.assertEqual(summary["by_subreddit"]["r/test"]["revenue"], 58.0)
             self.assertEqual(summary["by_channel"]["reddit"]["sales"], 2)
 
+    def test_sales_are_idempotent_and_persist_in_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "revenue_attribution.json"
+            store = RevenueAttributionStore(path=path)
+            store.upsert_tracking("treta-aaa111-1", "proposal-1", subreddit="r/a", created_at="2026-01-01T00:00:00Z")
+            store.upsert_tracking("treta-bbb222-1", "proposal-2", subreddit="r/a", created_at="2026-01-01T00:00:00Z")
+
+            first = store.record_sale("treta-aaa111-1", revenue_delta=10.0, sale_id="g-1", sold_at="2026-01-01T01:00:00Z")
+            replay = store.record_sale("treta-aaa111-1", revenue_delta=10.0, sale_id="g-1", sold_at="2026-01-01T01:00:00Z")
+            store.record_sale("treta-bbb222-1", revenue_delta=5.0, sale_id="g-1", sold_at="2026-01-01T02:00:00Z")
+
+            self.assertIsNotNone(first)
+            self.assertIsNone(replay)
+            self.assertFalse(path.exists())
+            self.assertTrue((Path(tmp_dir) / "memory" / "treta.sqlite").exists())
+
+            summary = RevenueAttributionStore(path=path).summary()
+            self.assertEqual(summary["totals"], {"sales": 2, "revenue": 15.0})
+            self.assertEqual(summary["by_subreddit"]["r/a"]["views"], 2)
+            self.assertEqual(summary["by_subreddit"]["r/a"]["conversion_rate"], 1.0)
+            self.assertEqual([sale["sale_id"] for sale in summary["sales"]], ["g-1", "g-1"])
+
+    def test_legacy_json_is_imported_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "revenue_attribution.json"
+            path.write_text(
+                json.dumps(
+                    {
+                        "trackings": [{"tracking_id": "treta-ccc333-1", "proposal_id": "proposal-3", "subreddit": "r/c"}],
+                        "sales": [
+                            {
+                                "sale_id": "s-1",
+                                "product_id": "proposal-3",
+                                "revenue": 12.5,
+                                "timestamp": "2026-01-01T00:00:00+00:00",
+                                "attribution": {"channel": "reddit", "subreddit": "r/c", "post_id": "p1"},
+                            }
+                        ],
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+            RevenueAttributionStore(path=path)
+            store = RevenueAttributionStore(path=path)
+
+            self.assertEqual(store.get_by_tracking("treta-ccc333-1")["proposal_id"], "proposal-3")
+            self.assertEqual(store.summary()["totals"], {"sales": 1, "revenue": 12.5})
+            self.assertEqual(store.summary()["by_channel"]["reddit"]["sales"], 1)
+
+    def test_list_sales_pages_newest_first(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+            store.upsert_tracking("treta-ddd444-1", "proposal-4", subreddit="r/d", created_at="2026-01-01T00:00:00Z")
+            for hour in range(5):
+                store.record_sale("treta-ddd444-1", revenue_delta=1.0, sale_id=f"s-{hour}", sold_at=f"2026-01-01T0{hour}:30:00Z")
+
+            first = store.list_sales(limit=2)
+            second = store.list_sales(limit=2, cursor=first["next_cursor"])
+            last = store.list_sales(limit=2, cursor=second["next_cursor"])
+
+            self.assertEqual([sale["sale_id"] for sale in first["items"]], ["s-4", "s-3"])
+            self.assertEqual([sale["sale_id"] for sale in second["items"]], ["s-2", "s-1"])
+            self.assertEqual([sale["sale_id"] for sale in last["items"]], ["s-0"])
+            self.assertIsNone(last["next_cursor"])
+
+    def test_summary_is_cached_per_version_and_kept_current(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+            store.upsert_tracking("treta-eee555-1", "proposal-5", subreddit="r/e", created_at="2026-01-01T00:00:00Z")
+            store.record_sale("treta-eee555-1", revenue_delta=4.0, sale_id="s-1", sold_at="2026-01-01T01:00:00Z")
+
+            first = store.summary()
+            first["totals"]["sales"] = 99
+            first["by_subreddit"].clear()
+            self.assertEqual(store.summary()["totals"], {"sales": 1, "revenue": 4.0})
+            self.assertIn("r/e", store.summary()["by_subreddit"])
+            self.assertIsNone(store.summary_if_changed(first["version"]))
+
+            store.upsert_tracking("treta-eee555-2", "proposal-5", subreddit="r/e", created_at="2026-01-01T00:00:00Z")
+            store.record_sale("treta-eee555-2", sale_count=2, revenue_delta=6.0, sale_id="s-2", sold_at="2026-01-01T02:00:00Z")
+            store.upsert_tracking("treta-eee555-2", "proposal-5", subreddit="r/f")
+
+            statements: list[str] = []
+            store._conn.set_trace_callback(statements.append)
+            second = store.summary_if_changed(first["version"])
+            store._conn.set_trace_callback(None)
+            self.assertFalse([sql for sql in statements if "GROUP BY" in sql])
+            self.assertGreater(second["version"], first["version"])
+            self.assertEqual(second["totals"], {"sales": 3, "revenue": 10.0})
+            self.assertEqual(second["by_subreddit"]["r/e"]["views"], 1)
+            self.assertEqual(store.get_tracking_totals("treta-eee555-2"), {"sales": 2, "revenue": 6.0})
+
+            reloaded = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json").summary()
+            for key in ("totals", "by_product", "by_channel", "by_subreddit"):
+                self.assertEqual(reloaded[key], second[key])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -27,7 +27,6 @@ class DominantChannelLockTest(unittest.TestCase):
             subreddit_performance_store=SubredditPerformanceStore(path=root / "subreddit_performance.json"),
             bus=bus,
         )
-        control._reddit_posts_path = lambda: root / "reddit_posts.json"
         return control
 
     def test_top_subreddit_selection(self):
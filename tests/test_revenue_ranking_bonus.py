@@ -53,6 +53,32 @@ class RevenueRankingBonusTest(unittest.TestCase):
             self.assertGreater(high_bonus, low_bonus)
             self.assertEqual(high_bonus, 50.0)
 
+    def test_revenue_summary_is_copied_once_per_store_version(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposal_store = ProductProposalStore(path=root / "product_proposals.json")
+            revenue_store = RevenueAttributionStore(path=root / "revenue_attribution.json")
+            revenue_store.upsert_tracking("treta-a", "proposal-a", subreddit="freelance", created_at="2026-01-01T00:00:00Z")
+            control = Control(
+                opportunity_store=OpportunityStore(path=root / "opportunities.json"),
+                product_proposal_store=proposal_store,
+                product_plan_store=ProductPlanStore(path=root / "product_plans.json"),
+                product_launch_store=ProductLaunchStore(proposal_store=proposal_store, path=root / "product_launches.json"),
+                subreddit_performance_store=SubredditPerformanceStore(path=root / "subreddit_performance.json"),
+                revenue_attribution_store=revenue_store,
+            )
+            revenue_store.record_sale("treta-a", revenue_delta=20.0, sold_at="2026-01-01T01:00:00Z")
+
+            with patch.object(revenue_store, "summary", wraps=revenue_store.summary) as summary:
+                for _ in range(5):
+                    control._compute_ranking_bonuses("freelance")
+                control._get_top_subreddits_by_roi(limit=2)
+                self.assertEqual(summary.call_count, 1)
+
+                revenue_store.record_sale("treta-a", revenue_delta=100.0, sold_at="2026-01-01T02:00:00Z")
+                self.assertEqual(control._compute_ranking_bonuses("freelance")["revenue_bonus"], 50.0)
+                self.assertEqual(summary.call_count, 2)
+
     def test_conversion_bonus_cap(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
             root = Path(tmp_dir)
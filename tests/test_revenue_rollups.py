@@ -0,0 +1,134 @@
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from core.revenue_attribution.store import RevenueAttributionStore
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+class RevenueRollupsTest(unittest.TestCase):
+    def _seed(self, store: RevenueAttributionStore) -> list[dict]:
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        rng = random.Random(7)
+        sales = []
+        for index in range(4):
+            store.upsert_tracking(f"treta-t{index}", f"proposal-{index % 2}", subreddit=f"r/s{index % 3}", created_at=_iso(start))
+        for index in range(300):
+            sold_at = start + timedelta(minutes=rng.randrange(0, 6 * 24 * 60))
+            tracking = f"treta-t{index % 4}"
+            revenue = float(rng.randrange(1, 40))
+            store.record_sale(tracking, revenue_delta=revenue, sale_id=f"s-{index}", sold_at=_iso(sold_at))
+            sales.append({"tracking": tracking, "sold_at": sold_at, "revenue": revenue})
+        return sales
+
+    def test_window_summary_matches_raw_ledger(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json", reddit_attribution_window_hours=1000)
+            sales = self._seed(store)
+            base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+            windows = [
+                (base + timedelta(minutes=17), base + timedelta(minutes=43)),
+                (base + timedelta(hours=5, minutes=10), base + timedelta(hours=9, minutes=5)),
+                (base + timedelta(hours=20, minutes=30), base + timedelta(days=4, hours=3, minutes=1)),
+                (base + timedelta(days=1), base + timedelta(days=3)),
+            ]
+            for since, until in windows:
+                with self.subTest(since=since, until=until):
+                    expected = [sale for sale in sales if since <= sale["sold_at"] < until]
+                    window = store.summary(since=_iso(since), until=_iso(until), include_trackings=True)
+                    self.assertEqual(window["totals"]["sales"], len(expected))
+                    self.assertAlmostEqual(window["totals"]["revenue"], sum(sale["revenue"] for sale in expected), places=2)
+                    tracking_sales = sum(1 for sale in expected if sale["tracking"] == "treta-t1")
+                    self.assertEqual(window["by_tracking"].get("treta-t1", {}).get("sales", 0), tracking_sales)
+
+            unbounded = store.summary(since=None, until=_iso(base + timedelta(days=30)))
+            self.assertEqual(unbounded["totals"], store.summary()["totals"])
+
+    def test_window_results_are_cached_until_the_next_sale(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json", reddit_attribution_window_hours=1000)
+            self._seed(store)
+            since, until = "2026-01-01T05:10:00Z", "2026-01-03T09:05:00Z"
+            first = store.summary(since=since, until=until)
+            first["totals"]["sales"] = -1
+
+            statements: list[str] = []
+            store._conn.set_trace_callback(statements.append)
+            again = store.summary(since=since, until=until)
+            store._conn.set_trace_callback(None)
+            self.assertEqual(statements, [])
+            self.assertGreater(again["totals"]["sales"], 0)
+
+            store.record_sale("treta-t0", revenue_delta=5.0, sale_id="late", sold_at="2026-01-02T00:30:00Z")
+            after = store.summary(since=since, until=until)
+            self.assertEqual(after["totals"]["sales"], again["totals"]["sales"] + 1)
+            self.assertGreater(after["version"], again["version"])
+
+    def test_window_segments_use_rollups_for_whole_hours_and_days(self):
+        store = RevenueAttributionStore.__new__(RevenueAttributionStore)
+        day = RevenueAttributionStore._DAY_SECONDS
+        hour = RevenueAttributionStore._HOUR_SECONDS
+        segments = store._window_segments(day + 90, 4 * day + 2 * hour + 30)
+
+        self.assertEqual(
+            segments,
+            [
+                ("raw", day + 90, day + hour),
+                ("hour", day + hour, 2 * day),
+                ("day", 2 * day, 4 * day),
+                ("hour", 4 * day, 4 * day + 2 * hour),
+                ("raw", 4 * day + 2 * hour, 4 * day + 2 * hour + 30),
+            ],
+        )
+
+    def test_rows_without_epoch_are_backfilled(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "revenue_attribution.json"
+            store = RevenueAttributionStore(path=path)
+            store.upsert_tracking("treta-x", "proposal-x", subreddit="r/x", created_at="2026-01-01T00:00:00Z")
+            store.record_sale("treta-x", revenue_delta=9.0, sale_id="s-1", sold_at="2026-01-01T10:15:00Z")
+            with store._conn:
+                store._conn.execute("UPDATE revenue_sales SET sold_epoch = NULL")
+                store._conn.execute("DELETE FROM revenue_rollups")
+
+            reloaded = RevenueAttributionStore(path=path)
+            window = reloaded.summary(since="2026-01-01T00:00:00Z", until="2026-01-02T00:00:00Z")
+
+            self.assertEqual(window["totals"], {"sales": 1, "revenue": 9.0})
+            self.assertEqual(window["by_subreddit"]["r/x"]["sales"], 1)
+
+    def test_import_sales_is_idempotent_and_rolled_up(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+            rows = [
+                {
+                    "tracking_id": "treta-y",
+                    "sale_id": f"s-{hour}",
+                    "product_id": "proposal-y",
+                    "revenue": 2.5,
+                    "timestamp": f"2026-02-01T{hour:02d}:05:00+00:00",
+                    "attribution": {"channel": "reddit", "subreddit": "r/y"},
+                }
+                for hour in range(24)
+            ]
+
+            self.assertEqual(store.import_sales(rows), 24)
+            self.assertEqual(store.import_sales(rows), 0)
+            self.assertEqual(store.summary()["totals"], {"sales": 24, "revenue": 60.0})
+            window = store.summary(since="2026-02-01T06:00:00Z", until="2026-02-01T12:00:00Z")
+            self.assertEqual(window["by_subreddit"]["r/y"], {"sales": 6, "revenue": 15.0})
+
+    def test_invalid_window_bound_raises(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+            with self.assertRaises(ValueError):
+                store.summary(since="yesterday")
+
+
+if __name__ == "__main__":
+    unittest.main()
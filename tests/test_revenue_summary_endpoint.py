@@ -2,6 +2,7 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from urllib.error import HTTPError
 from urllib.request import urlopen
 
 from core.ipc_http import start_http_server
@@ -30,6 +31,28 @@ class RevenueSummaryEndpointTest(unittest.TestCase):
                 server.shutdown()
                 server.server_close()
 
+    def test_revenue_summary_endpoint_accepts_time_window(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = RevenueAttributionStore(path=Path(tmp_dir) / "revenue_attribution.json")
+            store.upsert_tracking("treta-abc123-1700000000", "proposal-1", subreddit="r/python", created_at="2026-01-01T00:00:00Z")
+            store.record_sale("treta-abc123-1700000000", revenue_delta=19.0, sale_id="s-1", sold_at="2026-01-01T01:00:00Z")
+            store.record_sale("treta-abc123-1700000000", revenue_delta=5.0, sale_id="s-2", sold_at="2026-01-01T05:00:00Z")
+
+            server = start_http_server(host="127.0.0.1", port=0, revenue_attribution_store=store)
+            base = f"http://127.0.0.1:{server.server_port}/revenue/summary"
+            try:
+                with urlopen(f"{base}?since=2026-01-01T04:00:00Z&until=2026-01-01T06:00:00Z&trackings=1", timeout=2) as response:
+                    payload = json.loads(response.read().decode("utf-8"))
+                self.assertEqual(payload["data"]["totals"], {"sales": 1, "revenue": 5.0})
+                self.assertEqual(payload["data"]["by_tracking"]["treta-abc123-1700000000"]["revenue"], 5.0)
+
+                with self.assertRaises(HTTPError) as error:
+                    urlopen(f"{base}?since=yesterday", timeout=2)
+                self.assertEqual(error.exception.code, 400)
+            finally:
+                server.shutdown()
+                server.server_close()
+
 
 if __name__ == "__main__":
     unittest.main()
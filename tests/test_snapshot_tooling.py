@@ -0,0 +1,162 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from core.opportunity_store import OpportunityStore
+from core.persistence.json_io import file_lock
+from core.persistence.snapshot import SNAPSHOT_MANIFEST, export_snapshot, import_snapshot
+from core.revenue_attribution.store import RevenueAttributionStore
+from core.strategy_action_store import StrategyActionStore
+from core.stores.bulk_load import bulk_load
+from core.stores.registry import get_store
+
+
+def _dataset():
+    return {
+        "opportunities": [
+            {"id": f"opp-{index}", "title": f"Opportunity {index}", "status": "new", "opportunity": {}}
+            for index in range(5)
+        ],
+        "strategy_actions": [
+            {"id": f"action-{index + 1:06d}", "type": "review", "target_id": "proposal-1", "reasoning": "r", "status": "executed"}
+            for index in range(3)
+        ],
+        "revenue_trackings": [{"tracking_id": "trk-1", "proposal_id": "proposal-1", "subreddit": "r/a"}],
+        "revenue_sales": [
+            {
+                "tracking_id": "trk-1",
+                "sale_id": f"sale-{index}",
+                "product_id": "proposal-1",
+                "revenue": 10,
+                "timestamp": "2026-01-01T00:00:00+00:00",
+                "attribution": {"channel": "reddit", "subreddit": "r/a"},
+            }
+            for index in range(4)
+        ],
+    }
+
+
+class BulkLoadTest(unittest.TestCase):
+    def test_bulk_load_appends_rows_visible_through_store_apis(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            OpportunityStore(path=root / "opportunities.json").add(
+                source="test", title="Existing", summary="", opportunity={}, item_id="opp-existing"
+            )
+
+            counts = bulk_load(root, _dataset())
+            self.assertEqual(
+                counts,
+                {"opportunities": 5, "strategy_actions": 3, "revenue_trackings": 1, "revenue_sales": 4},
+            )
+            # Replaying the same sales is a no-op for the keyed ledger.
+            self.assertEqual(bulk_load(root, {"revenue_sales": _dataset()["revenue_sales"]}), {"revenue_sales": 0})
+
+            opportunities = OpportunityStore(path=root / "opportunities.json").list()
+            self.assertEqual([item["id"] for item in opportunities][:2], ["opp-existing", "opp-0"])
+            actions = StrategyActionStore(path=root / "strategy_actions.json")
+            self.assertEqual(len(actions.list(status="executed")), 3)
+            self.assertEqual(actions.add(action_type="review", target_id="x", reasoning="y")["id"], "action-000004")
+            summary = RevenueAttributionStore(path=root / "revenue_attribution.json").summary()
+            self.assertEqual(summary["totals"], {"sales": 4, "revenue": 40.0})
+            self.assertEqual(summary["by_subreddit"]["r/a"]["views"], 1)
+
+    def test_bulk_load_updates_live_registry_stores(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir).resolve()
+            revenue = get_store(RevenueAttributionStore, path=root / "revenue_attribution.json")
+            actions = get_store(StrategyActionStore, path=root / "strategy_actions.json")
+            self.assertEqual(revenue.summary()["totals"], {"sales": 0, "revenue": 0.0})
+
+            bulk_load(root, _dataset())
+
+            self.assertEqual(revenue.summary()["totals"], {"sales": 4, "revenue": 40.0})
+            self.assertEqual(len(actions.list(status="executed")), 3)
+
+    def test_bulk_load_rejects_unknown_keys(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                bulk_load(Path(tmp_dir), {"unicorns": []})
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_export_then_import_round_trips_json_and_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            source, snapshot, restored = root / "source", root / "snapshot", root / "restored"
+            bulk_load(source, _dataset())
+
+            manifest = export_snapshot(source, snapshot)
+            self.assertIn("opportunities.json", manifest["files"])
+            self.assertEqual(manifest["sqlite"]["tables"]["revenue_sales"], 4)
+            self.assertTrue((snapshot / SNAPSHOT_MANIFEST).exists())
+            with self.assertRaises(ValueError):
+                export_snapshot(source, snapshot)
+
+            import_snapshot(snapshot, restored)
+            self.assertEqual(
+                (restored / "opportunities.json").read_bytes(),
+                (source / "opportunities.json").read_bytes(),
+            )
+            summary = RevenueAttributionStore(path=restored / "revenue_attribution.json").summary()
+            self.assertEqual(summary["totals"], {"sales": 4, "revenue": 40.0})
+            self.assertEqual(len(StrategyActionStore(path=restored / "strategy_actions.json").list()), 3)
+
+    def test_import_removes_data_files_missing_from_the_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            bulk_load(root / "source", {"opportunities": _dataset()["opportunities"]})
+            manifest = export_snapshot(root / "source", root / "snapshot")
+            self.assertFalse([name for name in manifest["files"] if name.endswith(".lock")])
+
+            restored = root / "restored"
+            (restored / "memory").mkdir(parents=True)
+            (restored / "subreddit_performance.json.journal").write_text('{"seq":1,"name":"a","field":"sales","delta":5}\n', encoding="utf-8")
+            (restored / "memory" / "treta.sqlite").write_bytes(b"stale")
+
+            import_snapshot(root / "snapshot", restored)
+
+            self.assertFalse((restored / "subreddit_performance.json.journal").exists())
+            self.assertFalse((restored / "memory" / "treta.sqlite").exists())
+            self.assertEqual(len(OpportunityStore(path=restored / "opportunities.json").list()), 5)
+
+    def test_export_waits_for_store_file_locks(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            bulk_load(root / "source", {"opportunities": _dataset()["opportunities"]})
+            locked, release = threading.Event(), threading.Event()
+
+            def hold_lock():
+                with file_lock(root / "source" / "opportunities.json"):
+                    locked.set()
+                    release.wait(5)
+
+            holder = threading.Thread(target=hold_lock)
+            holder.start()
+            locked.wait(5)
+            exporter = threading.Thread(target=export_snapshot, args=(root / "source", root / "snapshot"))
+            exporter.start()
+            exporter.join(0.3)
+            self.assertTrue(exporter.is_alive())
+            self.assertFalse((root / "snapshot" / SNAPSHOT_MANIFEST).exists())
+
+            release.set()
+            exporter.join(5)
+            holder.join(5)
+            self.assertTrue((root / "snapshot" / SNAPSHOT_MANIFEST).exists())
+
+    def test_import_refuses_tampered_snapshot_before_writing(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            bulk_load(root / "source", {"opportunities": _dataset()["opportunities"]})
+            export_snapshot(root / "source", root / "snapshot")
+            (root / "snapshot" / "opportunities.json").write_text("[]\n", encoding="utf-8")
+
+            with self.assertRaisesRegex(ValueError, "snapshot_checksum_mismatch"):
+                import_snapshot(root / "snapshot", root / "restored")
+            self.assertFalse((root / "restored" / "opportunities.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import gzip
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from core.http.static_assets import IMMUTABLE_CACHE_CONTROL, StaticAssetCache
+from core.ipc_http import Handler, start_http_server
+
+
+class StaticAssetCacheTest(unittest.TestCase):
+    def test_reloads_only_after_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "app.js"
+            path.write_text("console.log('a');\n" * 100, encoding="utf-8")
+            cache = StaticAssetCache()
+
+            first = cache.get(path)
+            self.assertIs(cache.get(path), first)
+            self.assertIn("gzip", first.variants)
+            self.assertEqual(first.select("br;q=0, gzip;q=0.5")[1], "gzip")
+            self.assertEqual(first.select("gzip;q=0")[1], None)
+
+            path.write_text("console.log('b');\n" * 100, encoding="utf-8")
+            os.utime(path, ns=(first.signature[0] + 10**9, first.signature[0] + 10**9))
+            second = cache.get(path)
+            self.assertIsNot(second, first)
+            self.assertNotEqual(second.etag, first.etag)
+
+            path.unlink()
+            self.assertIsNone(cache.get(path))
+            self.assertEqual(len(cache), 0)
+
+
+class StaticAssetHttpTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.root = Path(self.tmp_dir.name)
+        self.script = ("function render() { return 'treta'; }\n" * 200).encode("utf-8")
+        (self.root / "app.js").write_bytes(self.script)
+        (self.root / "app.0123abcd.js").write_bytes(self.script)
+        (self.root / "index.html").write_text("<html></html>", encoding="utf-8")
+        ui_patch = patch.object(Handler, "ui_dir", self.root)
+        ui_patch.start()
+        self.addCleanup(ui_patch.stop)
+        self.server = start_http_server(host="127.0.0.1", port=0)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def _get(self, path, headers=None):
+        request = Request(f"http://127.0.0.1:{self.server.server_port}{path}", headers=headers or {})
+        try:
+            with urlopen(request, timeout=2) as response:
+                return response.status, response.headers, response.read()
+        except HTTPError as exc:
+            return exc.code, exc.headers, exc.read()
+
+    def test_gzip_variant_with_length_and_validators(self):
+        status, headers, body = self._get("/app.js", {"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        self.assertLess(len(body), len(self.script))
+        self.assertEqual(gzip.decompress(body), self.script)
+        self.assertEqual(headers["Cache-Control"], "no-cache")
+        self.assertEqual(headers["Vary"], "Accept-Encoding")
+        self.assertTrue(headers["Last-Modified"])
+
+        status, headers, body = self._get("/app.js")
+        self.assertEqual((status, headers["Content-Encoding"], body), (200, None, self.script))
+        self.assertTrue(headers["Content-Type"].startswith("application/javascript"))
+
+    def test_if_none_match_returns_304_without_a_body(self):
+        _, headers, _ = self._get("/app.js", {"Accept-Encoding": "gzip"})
+        status, not_modified_headers, body = self._get("/app.js", {"Accept-Encoding": "gzip", "If-None-Match": headers["ETag"]})
+        self.assertEqual((status, body), (304, b""))
+        self.assertEqual(not_modified_headers["ETag"], headers["ETag"])
+
+        status, _, _ = self._get("/app.js", {"If-None-Match": '"stale"'})
+        self.assertEqual(status, 200)
+
+    def test_hashed_assets_are_immutable_and_missing_files_404(self):
+        _, headers, _ = self._get("/app.0123abcd.js")
+        self.assertEqual(headers["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+        status, headers, _ = self._get("/")
+        self.assertEqual((status, headers["Content-Encoding"]), (200, None))
+        self.assertEqual(self._get("/missing.js")[0], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
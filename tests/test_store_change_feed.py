@@ -0,0 +1,145 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.request import urlopen
+
+from core.daily_loop import DailyLoopEngine
+from core.ipc_http import start_http_server
+from core.opportunity_store import OpportunityStore
+from core.performance_engine import PerformanceEngine
+from core.product_launch_store import ProductLaunchStore
+from core.product_plan_store import ProductPlanStore
+from core.product_proposal_store import ProductProposalStore
+from core.revenue_attribution.store import RevenueAttributionStore
+from core.strategy_action_store import StrategyActionStore
+from core.stores import ChangeFeed
+
+
+class ChangeFeedTest(unittest.TestCase):
+    def test_publish_bumps_version_and_notifies_until_unsubscribed(self):
+        feed = ChangeFeed("things")
+        seen = []
+        unsubscribe = feed.subscribe(seen.append)
+        feed.subscribe(lambda change: 1 / 0)
+
+        change = feed.publish("add", "thing-1")
+        unsubscribe()
+        feed.publish("add", "thing-2")
+
+        self.assertEqual(feed.version, 2)
+        self.assertEqual([(item.store, item.version, item.op, item.item_id) for item in seen], [("things", 1, "add", "thing-1")])
+        self.assertEqual(change, seen[0])
+
+
+class StoreVersionTest(unittest.TestCase):
+    def test_every_mutation_bumps_the_owning_store(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            opportunities = OpportunityStore(path=root / "opportunities.json")
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            plans = ProductPlanStore(path=root / "product_plans.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            actions = StrategyActionStore(path=root / "strategy_actions.json")
+            revenue = RevenueAttributionStore(path=root / "revenue_attribution.json")
+
+            changes = []
+            for store in (opportunities, proposals, plans, launches, actions, revenue):
+                store.subscribe(lambda change: changes.append((change.store, change.op)))
+            revenue_start = revenue.version
+
+            opportunities.add(source="test", title="T", summary="S", opportunity={}, item_id="opp-1")
+            opportunities.set_status("opp-1", "archived")
+            proposals.add({"id": "proposal-1", "product_name": "One"})
+            plans.add({"plan_id": "plan-1", "proposal_id": "proposal-1"})
+            launch = launches.add_from_proposal("proposal-1")
+            launches.add_sale(launch["id"], 10)
+            action = actions.add(action_type="review", target_id="proposal-1", reasoning="check")
+            actions.set_status(action["id"], "rejected")
+            revenue.upsert_tracking("trk-1", "proposal-1")
+            revenue.record_sale("trk-1", sale_id="sale-1", revenue_delta=5)
+            revenue.record_sale("trk-1", sale_id="sale-1", revenue_delta=5)
+
+            self.assertEqual(opportunities.version, 2)
+            self.assertEqual(proposals.version, 1)
+            self.assertEqual(plans.version, 1)
+            self.assertEqual(launches.version, 2)
+            self.assertEqual(actions.version, 2)
+            self.assertEqual(revenue.version, revenue_start + 2)
+            self.assertIn(("product_launches", "add_sale"), changes)
+            self.assertNotIn(("product_proposals", "execution_focus"), changes)
+
+
+class VersionedConsumersTest(unittest.TestCase):
+    def test_integrity_report_is_cached_until_an_input_store_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            plans = ProductPlanStore(path=root / "product_plans.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            server = start_http_server(
+                host="127.0.0.1",
+                port=0,
+                product_proposal_store=proposals,
+                product_plan_store=plans,
+                product_launch_store=launches,
+            )
+            url = f"http://127.0.0.1:{server.server_port}/system/integrity"
+            try:
+                # A zero TTL proves hits come from the version key, not the clock.
+                server.integrity_cache_ttl_seconds = 0
+                with patch("core.ipc_http.compute_system_integrity", return_value={"score": 1}) as mocked:
+                    for _ in range(3):
+                        with urlopen(url, timeout=2):
+                            pass
+                    self.assertEqual(mocked.call_count, 1)
+
+                    proposals.add({"id": "proposal-1", "product_name": "One"})
+                    with urlopen(url, timeout=2) as response:
+                        payload = json.loads(response.read().decode("utf-8"))
+
+                self.assertEqual(mocked.call_count, 2)
+                self.assertEqual(payload["data"]["metrics"]["integrity_cache_hit"], 2)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def test_daily_loop_phase_recomputes_only_after_a_change(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            opportunities = OpportunityStore(path=root / "opportunities.json")
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            actions = StrategyActionStore(path=root / "strategy_actions.json")
+            engine = DailyLoopEngine(opportunities, proposals, launches, actions)
+
+            self.assertEqual(engine.compute_phase(), "IDLE")
+            with patch.object(actions, "list", wraps=actions.list) as listed:
+                self.assertEqual(engine.compute_phase(), "IDLE")
+                self.assertEqual(listed.call_count, 0)
+
+            proposals.add({"id": "proposal-1", "product_name": "One"})
+            self.assertEqual(engine.compute_phase(), "DECIDE")
+
+    def test_performance_insights_follow_launch_version(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            proposals = ProductProposalStore(path=root / "product_proposals.json")
+            launches = ProductLaunchStore(proposal_store=proposals, path=root / "product_launches.json")
+            proposals.add({"id": "proposal-1", "product_name": "Pitch Kit"})
+            launch = launches.add_from_proposal("proposal-1")
+            launches.add_sale(launch["id"], 20)
+            engine = PerformanceEngine(product_launch_store=launches)
+
+            self.assertEqual(engine.generate_insights()["total_revenue"], 20.0)
+            with patch.object(launches, "list", wraps=launches.list) as listed:
+                self.assertEqual(engine.generate_insights()["total_revenue"], 20.0)
+                self.assertEqual(listed.call_count, 0)
+
+            launches.add_sale(launch["id"], 5)
+            self.assertEqual(engine.generate_insights()["total_revenue"], 25.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
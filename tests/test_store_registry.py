@@ -0,0 +1,99 @@
+import gc
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.product_launch_store import ProductLaunchStore
+from core.product_proposal_store import ProductProposalStore
+from core.reddit_intelligence.sales_insight import SalesInsightService
+from core.stores.registry import StoreRegistry, get_store
+
+
+class StoreRegistryTest(unittest.TestCase):
+    def test_same_class_and_path_share_one_instance(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry = StoreRegistry()
+            path = Path(tmp_dir) / "product_proposals.json"
+
+            first = registry.get(ProductProposalStore, path=path)
+            second = registry.get(ProductProposalStore, path=Path(tmp_dir) / "." / "product_proposals.json")
+            other = registry.get(ProductProposalStore, path=Path(tmp_dir) / "other.json")
+
+            self.assertIs(first, second)
+            self.assertIsNot(first, other)
+
+    def test_default_path_follows_data_dir_and_releases_unreferenced_stores(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                registry = StoreRegistry()
+                store = registry.get(ProductProposalStore)
+                self.assertEqual(store._path, Path(tmp_dir) / "product_proposals.json")
+                self.assertIs(registry.get(ProductProposalStore, path=Path(tmp_dir) / "product_proposals.json"), store)
+
+                del store
+                gc.collect()
+                self.assertEqual(len(registry._instances), 0)
+
+    def test_registered_store_replaces_live_instance(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry = StoreRegistry()
+            path = Path(tmp_dir) / "product_proposals.json"
+            live = registry.get(ProductProposalStore, path=path)
+
+            injected = ProductProposalStore(path=path)
+
+            self.assertIs(registry.register(injected), injected)
+            self.assertIs(registry.get(ProductProposalStore, path=path), injected)
+            self.assertIsNot(live, injected)
+
+    def test_get_rejects_conflicting_constructor_kwargs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            registry = StoreRegistry()
+            root = Path(tmp_dir)
+            proposals = registry.get(ProductProposalStore, path=root / "product_proposals.json")
+            launches = registry.get(ProductLaunchStore, path=root / "product_launches.json", proposal_store=proposals)
+
+            self.assertIs(
+                registry.get(ProductLaunchStore, path=root / "product_launches.json", proposal_store=proposals),
+                launches,
+            )
+            self.assertIs(registry.get(ProductLaunchStore, path=root / "product_launches.json"), launches)
+            with self.assertRaises(ValueError):
+                registry.get(
+                    ProductLaunchStore,
+                    path=root / "product_launches.json",
+                    proposal_store=ProductProposalStore(path=root / "other_proposals.json"),
+                )
+
+    def test_get_accepts_the_dependency_a_default_built_store_already_holds(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                launches = get_store(ProductLaunchStore)
+                proposals = get_store(ProductProposalStore)
+
+                self.assertIs(launches._proposal_store, proposals)
+                self.assertIs(get_store(ProductLaunchStore, proposal_store=proposals), launches)
+                self.assertIs(get_store(ProductLaunchStore, capacity=100), launches)
+                same_file = ProductProposalStore(path=Path(tmp_dir) / "product_proposals.json")
+                self.assertIs(get_store(ProductLaunchStore, proposal_store=same_file), launches)
+                with self.assertRaises(ValueError):
+                    get_store(ProductLaunchStore, capacity=5)
+
+    def test_sales_insight_reuses_live_stores(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                proposals = get_store(ProductProposalStore)
+                launches = get_store(ProductLaunchStore, proposal_store=proposals)
+                proposals.add({"id": "proposal-1", "product_name": "Notion Budget Planner"})
+                launch = launches.add_from_proposal("proposal-1")
+                launches.add_sales_batch(launch["id"], 3, 30.0)
+
+                with patch.object(ProductProposalStore, "_load_items", side_effect=AssertionError("reloaded")):
+                    keywords = SalesInsightService().get_high_performing_keywords()
+
+                self.assertIn("notion", keywords)
+
+
+if __name__ == "__main__":
+    unittest.main()
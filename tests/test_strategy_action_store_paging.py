@@ -0,0 +1,188 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from core.ipc_http import start_http_server
+from core.strategy_action_execution_layer import StrategyActionExecutionLayer
+from core.strategy_action_store import StrategyActionStore
+
+
+class StrategyActionStorePagingTest(unittest.TestCase):
+    def _seed(self, store: StrategyActionStore, count: int) -> list[dict]:
+        created = []
+        for index in range(count):
+            item = store.add(action_type="review", target_id=f"launch-{index}", reasoning=f"r{index}")
+            if index > 0:
+                item = store.set_status(item["id"], "executed")
+            created.append(item)
+        return created
+
+    def test_startup_loads_only_pending_and_recent_window(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                path = Path(tmp_dir) / "strategy_actions.json"
+                created = self._seed(StrategyActionStore(capacity=50, path=path), 12)
+
+                reloaded = StrategyActionStore(capacity=3, path=path)
+                resident_ids = [item["id"] for item in reloaded._items]
+
+                self.assertEqual(resident_ids, [created[0]["id"], *[item["id"] for item in created[-3:]]])
+                self.assertEqual(reloaded.get(created[4]["id"])["target_id"], "launch-4")
+
+                new_item = reloaded.add(action_type="scale", target_id="launch-x", reasoning="next")
+                self.assertEqual(new_item["id"], "action-000013")
+
+    def test_next_id_follows_numeric_max_past_six_digits(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                path = Path(tmp_dir) / "strategy_actions.json"
+                store = StrategyActionStore(path=path)
+                store.import_actions(
+                    [
+                        {"id": "action-999999", "type": "review", "target_id": "a", "reasoning": "a"},
+                        {"id": "action-1000000", "type": "review", "target_id": "b", "reasoning": "b"},
+                    ]
+                )
+
+                reloaded = StrategyActionStore(path=path)
+
+                self.assertEqual(reloaded.add(action_type="review", target_id="c", reasoning="c")["id"], "action-1000001")
+
+    def test_concurrent_adds_get_distinct_ids(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                store = StrategyActionStore(capacity=500, path=Path(tmp_dir) / "strategy_actions.json")
+                ids: list[str] = []
+
+                def worker(offset: int) -> None:
+                    for index in range(25):
+                        ids.append(store.add(action_type="review", target_id=f"t{offset}-{index}", reasoning="r")["id"])
+
+                threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(len(set(ids)), 200)
+                self.assertEqual(len(store.list_page(limit=500)["items"]), 200)
+
+    def test_list_page_walks_full_history_with_cursor(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                path = Path(tmp_dir) / "strategy_actions.json"
+                created = self._seed(StrategyActionStore(capacity=50, path=path), 7)
+                store = StrategyActionStore(capacity=2, path=path)
+
+                seen: list[str] = []
+                cursor = None
+                while True:
+                    page = store.list_page(limit=3, cursor=cursor)
+                    seen.extend(item["id"] for item in page["items"])
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+
+                self.assertEqual(seen, [item["id"] for item in reversed(created)])
+                executed = store.list_page(limit=50, status="executed")
+                self.assertEqual(len(executed["items"]), 6)
+                self.assertIsNone(executed["next_cursor"])
+                with self.assertRaises(ValueError):
+                    store.list_page(cursor="not-a-cursor")
+
+    def test_list_page_does_not_see_an_open_import_transaction(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                store = StrategyActionStore(path=Path(tmp_dir) / "strategy_actions.json")
+                kept = store.add(action_type="review", target_id="launch-1", reasoning="r")
+                imported = dict(kept, id="action-000900", target_id="launch-900", created_at="2099-01-01T00:00:00+00:00")
+                upserted = threading.Event()
+                release = threading.Event()
+                upsert = store._upsert_sqlite
+
+                def upsert_then_abort(item):
+                    upsert(item)
+                    upserted.set()
+                    release.wait(timeout=5)
+                    raise RuntimeError("import aborted")
+
+                def run_import():
+                    try:
+                        store.import_actions([imported])
+                    except RuntimeError:
+                        pass
+
+                pages: list[dict] = []
+                with patch.object(store, "_upsert_sqlite", side_effect=upsert_then_abort):
+                    importer = threading.Thread(target=run_import)
+                    importer.start()
+                    self.assertTrue(upserted.wait(timeout=2))
+                    reader = threading.Thread(target=lambda: pages.append(store.list_page(limit=10)))
+                    reader.start()
+                    reader.join(timeout=0.2)
+                    self.assertTrue(reader.is_alive())
+                    release.set()
+                    importer.join(timeout=5)
+                    reader.join(timeout=5)
+
+                self.assertEqual([item["id"] for item in pages[0]["items"]], [kept["id"]])
+
+    def test_http_strategy_actions_endpoint_is_paginated(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                store = StrategyActionStore(path=Path(tmp_dir) / "strategy_actions.json")
+                self._seed(store, 5)
+                layer = StrategyActionExecutionLayer(strategy_action_store=store, bus=None)
+                server = start_http_server(host="127.0.0.1", port=0, strategy_action_execution_layer=layer)
+                try:
+                    base = f"http://127.0.0.1:{server.server_port}"
+                    with urlopen(f"{base}/strategy/actions?limit=2", timeout=2) as response:
+                        first = json.loads(response.read().decode("utf-8"))
+                    self.assertEqual(len(first["items"]), 2)
+                    self.assertIsNotNone(first["next_cursor"])
+
+                    with urlopen(f"{base}/strategy/actions?limit=10&cursor={first['next_cursor']}", timeout=2) as response:
+                        second = json.loads(response.read().decode("utf-8"))
+                    self.assertEqual(len(second["items"]), 3)
+                    self.assertIsNone(second["next_cursor"])
+                finally:
+                    server.shutdown()
+                    server.server_close()
+
+    def test_http_strategy_action_lists_reject_bad_cursors_and_project_fields(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict("os.environ", {"TRETA_DATA_DIR": tmp_dir}, clear=False):
+                store = StrategyActionStore(path=Path(tmp_dir) / "strategy_actions.json")
+                self._seed(store, 3)
+                layer = StrategyActionExecutionLayer(strategy_action_store=store, bus=None)
+                server = start_http_server(host="127.0.0.1", port=0, strategy_action_execution_layer=layer)
+                try:
+                    base = f"http://127.0.0.1:{server.server_port}"
+                    for path in ("/strategy/actions", "/strategy/pending_actions"):
+                        with self.subTest(path=path):
+                            with self.assertRaises(HTTPError) as raised:
+                                urlopen(f"{base}{path}?limit=2&cursor=not-a-cursor", timeout=2)
+                            self.assertEqual(raised.exception.code, 400)
+                            body = json.loads(raised.exception.read().decode("utf-8"))
+                            self.assertEqual(body["error"]["code"], "invalid_cursor")
+
+                            with urlopen(f"{base}{path}?limit=5&fields=id,status", timeout=2) as response:
+                                page = json.loads(response.read().decode("utf-8"))
+                            self.assertTrue(page["items"])
+                            self.assertEqual({tuple(sorted(item)) for item in page["items"]}, {("id", "status")})
+
+                    with urlopen(f"{base}/strategy/pending_actions?fields=id", timeout=2) as response:
+                        pending = json.loads(response.read().decode("utf-8"))
+                    self.assertEqual([sorted(item) for item in pending["items"]], [["id"]])
+                finally:
+                    server.shutdown()
+                    server.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from core.subreddit_performance_store import SubredditPerformanceStore
 
@@ -28,6 +30,83 @@ class SubredditPerformanceStoreTest(unittest.TestCase):
             self.assertEqual(len(summary["subreddits"]), 1)
             self.assertEqual(summary["subreddits"][0]["name"], "freelance")
 
+    def test_counter_updates_are_coalesced_into_one_snapshot_write(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "subreddit_performance.json"
+            store = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+
+            with patch("core.subreddit_performance_store.atomic_write_json") as write_mock:
+                for _ in range(5):
+                    store.record_post_attempt("freelance")
+                store.record_sale("saas")
+                self.assertEqual(write_mock.call_count, 0)
+                store.flush()
+                self.assertEqual(write_mock.call_count, 1)
+
+    def test_journal_is_replayed_after_crash_before_flush(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "subreddit_performance.json"
+            store = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+            store.record_post_attempt("freelance")
+            store.flush()
+            store.record_post_attempt("freelance")
+            store.record_sale("freelance")
+            store._flush_timer.cancel()
+
+            with path.with_suffix(".json.journal").open("a", encoding="utf-8") as handle:
+                handle.write('{"seq": 99, "name": "free')
+
+            reloaded = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+            stats = reloaded.get_subreddit_stats("freelance")
+            self.assertEqual(stats["posts_attempted"], 2)
+            self.assertEqual(stats["sales"], 1)
+            self.assertFalse(path.with_suffix(".json.journal").exists())
+
+            again = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+            self.assertEqual(again.get_subreddit_stats("freelance")["posts_attempted"], 2)
+
+    def test_sales_recorded_in_a_batch_write_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "subreddit_performance.json"
+            store = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+
+            with patch("core.subreddit_performance_store.atomic_write_json") as write_mock:
+                with store.batch():
+                    for subreddit in ("saas", "saas", "freelance"):
+                        store.record_sale(subreddit)
+                self.assertEqual(write_mock.call_count, 1)
+
+            self.assertEqual(store.get_subreddit_stats("saas")["sales"], 2)
+            self.assertEqual(store.get_subreddit_stats("freelance")["sales"], 1)
+            self.assertFalse(path.with_suffix(".json.journal").exists())
+
+    def test_increments_inside_a_batch_are_journaled(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "subreddit_performance.json"
+            store = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+
+            with store.batch():
+                store.record_sale("saas")
+                store.record_sale("saas")
+                # Simulate a crash before the batch ends and flushes.
+                reloaded = SubredditPerformanceStore(path=path, flush_interval_seconds=60)
+
+            self.assertEqual(reloaded.get_subreddit_stats("saas")["sales"], 2)
+
+    def test_journal_sequence_is_kept_apart_from_subreddit_rows(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "subreddit_performance.json"
+            path.write_text(json.dumps({"saas": {"name": "saas", "sales": 3}}), encoding="utf-8")
+
+            store = SubredditPerformanceStore(path=path, flush_interval_seconds=0)
+            store.record_sale("saas")
+
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual(set(snapshot), {"journal_seq", "subreddits"})
+            self.assertEqual(set(snapshot["subreddits"]), {"saas"})
+            self.assertEqual(snapshot["subreddits"]["saas"]["sales"], 4)
+            self.assertEqual([row["name"] for row in store.get_summary()["subreddits"]], ["saas"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,118 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.memory_store import MemoryStore
+from core.persistence import text_index
+from core.persistence.text_index import Fts5TextIndex, InvertedTextIndex, create_text_index, tokenize
+
+
+CORPUS = {
+    1: "Necesito mejorar el pricing para Gumroad",
+    2: "Vale, revisemos pricing por segmento y precio",
+    3: "Quiero ideas de contenido para Reddit",
+    4: "Pricing pricing: validar la oferta",
+    5: "Publicación en r/freelance con buen engagement",
+}
+
+
+class TextIndexTest(unittest.TestCase):
+    def _backends(self):
+        return [InvertedTextIndex(), Fts5TextIndex()]
+
+    def test_tokenize_folds_case_and_accents(self):
+        self.assertEqual(tokenize("Publicación en r/Freelance"), ["publicacion", "en", "r", "freelance"])
+
+    def test_backends_rank_identically_with_bm25(self):
+        queries = ["pricing", "pric", "pricing gumroad", "publicacion", "reddit ideas", "nada"]
+        results = {}
+        for index in self._backends():
+            for doc_id, text in CORPUS.items():
+                index.add(doc_id, text)
+            results[index.backend] = {query: [doc_id for doc_id, _ in index.search(query, 10)] for query in queries}
+
+        self.assertEqual(results["inverted"], results["fts5"])
+        self.assertEqual(results["inverted"]["pricing"][0], 4)
+        self.assertEqual(results["inverted"]["pric"], results["inverted"]["pricing"])
+        self.assertEqual(results["inverted"]["publicacion"], [5])
+        self.assertEqual(results["inverted"]["nada"], [])
+
+    def test_remove_and_limit(self):
+        for index in self._backends():
+            with self.subTest(backend=index.backend):
+                for doc_id, text in CORPUS.items():
+                    index.add(doc_id, text)
+                index.remove(4)
+
+                self.assertNotIn(4, [doc_id for doc_id, _ in index.search("pricing", 10)])
+                self.assertEqual(len(index.search("pricing", 1)), 1)
+                self.assertEqual(len(index), 4)
+
+    def test_falls_back_to_inverted_index_without_fts5(self):
+        with patch.object(text_index, "Fts5TextIndex", side_effect=sqlite3.OperationalError("no such module: fts5")):
+            self.assertIsInstance(create_text_index(), InvertedTextIndex)
+
+
+class MemoryStoreSearchTest(unittest.TestCase):
+    def test_long_history_is_indexed_and_evictions_leave_the_index(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "memory_store.json"
+            store = MemoryStore(path=path, history_limit=3000)
+            for turn in range(3200):
+                store._state["chat_history"].append({"role": "user", "text": f"turno {turn} tema-{turn % 50}", "ts": "t"})
+            store.save(store._state)
+            store.append_message("assistant", "resumen de pricing")
+
+            self.assertEqual(len(store.snapshot()["chat_history"]), 3000)
+            self.assertEqual(len(store._index), 3000)
+            self.assertEqual(store.search_chat_history("pricing", limit=3), [{"role": "assistant", "content": "resumen de pricing"}])
+            evicted_prefix = [item["content"] for item in store.search_chat_history("150", limit=50)]
+            self.assertNotIn("turno 150 tema-0", evicted_prefix)
+            self.assertIn("turno 1500 tema-0", evicted_prefix)
+            self.assertEqual(store.search_chat_history("3199", limit=5)[0]["content"], "turno 3199 tema-49")
+
+            reloaded = MemoryStore(path=path, history_limit=3000)
+            self.assertEqual(reloaded.search_chat_history("resumen", limit=1)[0]["content"], "resumen de pricing")
+            self.assertEqual(len(reloaded.recent_messages(5)), 5)
+
+
+    def test_append_is_one_row_and_leaves_the_json_file_alone(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "memory_store.json"
+            store = MemoryStore(path=path, history_limit=3)
+
+            with patch("core.memory_store.atomic_write_json") as write_mock:
+                for turn in range(5):
+                    store.append_message("user", f"mensaje {turn}")
+                self.assertEqual(write_mock.call_count, 0)
+
+            conn = sqlite3.connect(Path(tmp_dir) / "memory" / "treta.sqlite")
+            try:
+                self.assertEqual(conn.execute("SELECT COUNT(*) FROM chat_messages").fetchone()[0], 3)
+            finally:
+                conn.close()
+            self.assertNotIn("chat_history", json.loads(path.read_text(encoding="utf-8")))
+            reloaded = MemoryStore(path=path, history_limit=3)
+            self.assertEqual([item["text"] for item in reloaded.recent_messages(5)], ["mensaje 2", "mensaje 3", "mensaje 4"])
+
+    def test_history_in_legacy_json_is_imported_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "memory_store.json"
+            history = [{"role": "user", "text": f"viejo {turn}", "ts": "t"} for turn in range(3)]
+            path.write_text(json.dumps({"profile": {"name": "Ana"}, "chat_history": history}), encoding="utf-8")
+
+            store = MemoryStore(path=path)
+            again = MemoryStore(path=path)
+
+            self.assertEqual(store.snapshot()["chat_history"], history)
+            self.assertEqual(again.snapshot()["chat_history"], history)
+            self.assertEqual(again.snapshot()["profile"]["name"], "Ana")
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8"))["profile"]["name"], "Ana")
+            self.assertNotIn("chat_history", json.loads(path.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    unittest.main()
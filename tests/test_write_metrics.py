@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.request import urlopen
+
+from core.ipc_http import start_http_server
+from core.opportunity_store import OpportunityStore
+from core.persistence.json_io import atomic_write_json, durability_batch
+from core.persistence.write_metrics import reset_write_metrics, snapshot_write_metrics
+from core.storage import Storage
+from core.strategy_action_store import StrategyActionStore
+
+
+class _Store:
+    def list(self, *args, **kwargs):
+        return []
+
+
+class WriteMetricsTest(unittest.TestCase):
+    def setUp(self):
+        reset_write_metrics()
+        self.addCleanup(reset_write_metrics)
+
+    def test_json_writes_count_bytes_fsyncs_and_latency_per_store(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "opportunities.json"
+            with patch.dict(os.environ, {"TRETA_PERSISTENCE_DURABILITY": "strict"}):
+                store = OpportunityStore(path=path)
+                store.add(source="test", title="a", summary="", opportunity={})
+                first_size = path.stat().st_size
+                store.add(source="test", title="b", summary="", opportunity={})
+
+            stats = snapshot_write_metrics()["opportunities"]
+            self.assertEqual(stats["writes"], 2)
+            self.assertEqual(stats["bytes"], first_size + path.stat().st_size)
+            self.assertGreaterEqual(stats["fsyncs"], 2)
+            self.assertIsNotNone(stats["p50_ms"])
+            self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+
+    def test_batched_fsyncs_are_counted_when_flushed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with durability_batch():
+                atomic_write_json(Path(tmp_dir) / "a.json", [1])
+                atomic_write_json(Path(tmp_dir) / "a.json", [2])
+                self.assertEqual(snapshot_write_metrics()["a"]["fsyncs"], 0)
+
+            stats = snapshot_write_metrics()["a"]
+            self.assertEqual(stats["writes"], 2)
+            self.assertGreaterEqual(stats["fsyncs"], 1)
+
+    def test_sqlite_commits_record_rows(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {"TRETA_DATA_DIR": tmp_dir}):
+                storage = Storage()
+                storage.set_runtime_override("mode", "x")
+                storage.conn.close()
+                actions = StrategyActionStore(path=Path(tmp_dir) / "strategy_actions.json")
+                actions.add(action_type="review", target_id="proposal-1", reasoning="r")
+
+            metrics = snapshot_write_metrics()
+            self.assertEqual(metrics["storage"]["writes"], 1)
+            self.assertEqual(metrics["storage"]["rows"], 1)
+            self.assertEqual(metrics["strategy_actions"]["writes"], 1)
+            self.assertGreater(metrics["strategy_actions"]["bytes"], 0)
+
+    def test_http_metrics_include_persistence_stats(self):
+        store = _Store()
+        server = start_http_server(
+            host="127.0.0.1",
+            port=0,
+            product_proposal_store=store,
+            product_plan_store=store,
+            product_launch_store=store,
+        )
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                atomic_write_json(Path(tmp_dir) / "probe.json", {})
+            with urlopen(f"http://127.0.0.1:{server.server_port}/system/integrity", timeout=2) as response:
+                payload = json.loads(response.read().decode("utf-8"))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(payload["data"]["metrics"]["persistence"]["probe"]["writes"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
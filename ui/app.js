@@ -2,6 +2,9 @@ const CONFIG = {
   routes: ["home", "dashboard", "work", "ideas", "profile", "game", "strategy", "reddit-ops", "decision-intelligence", "autonomy-telemetry", "settings"],
   defaultRoute: "home",
   defaultRefreshMs: 3000,
+  // While /stream is connected, polling is only a safety net for missed notifications.
+  streamFallbackRefreshMs: 60000,
+  streamDebounceMs: 250,
   maxEventStream: 20,
 };
 
@@ -3079,7 +3082,7 @@ function renderTelemetry() {
   `;
 }
 
-async function refreshLoop() {
+async function refreshLoop(slices = null) {
   const markSliceSuccess = (slice) => {
     const now = Date.now();
     state.diagnostics.lastRefreshAt[slice] = now;
@@ -3183,6 +3186,7 @@ async function refreshLoop() {
   };
 
   for (const [slice, task] of Object.entries(sliceCalls)) {
+    if (slices && !slices.includes(slice)) continue;
     try {
       await task();
     } catch (error) {
@@ -3296,7 +3300,83 @@ function bindRedditOpsActions() {
 
 function startRefreshLoop() {
   if (state.timerId) window.clearInterval(state.timerId);
-  state.timerId = window.setInterval(refreshLoop, state.refreshMs);
+  const intervalMs = liveUpdates.connected ? Math.max(state.refreshMs, CONFIG.streamFallbackRefreshMs) : state.refreshMs;
+  state.timerId = window.setInterval(() => refreshLoop(), intervalMs);
+}
+
+const REFRESH_SLICES = ["system", "strategy", "revenue", "reddit"];
+
+// Notification topic -> refreshLoop slices that read it.
+const STREAM_TOPIC_SLICES = {
+  opportunities: ["system"],
+  product_proposals: ["system"],
+  product_plans: ["system"],
+  product_launches: ["system", "revenue"],
+  conversation: ["system"],
+  autonomy: ["system"],
+  revenue: ["revenue"],
+  revenue_attribution: ["revenue"],
+  subreddit_performance: ["revenue"],
+  strategy_actions: ["strategy"],
+  reddit_config: ["reddit"],
+  reddit_scan: ["reddit"],
+  reddit_posts: ["reddit"],
+  reddit_signals: ["reddit"],
+};
+
+const liveUpdates = {
+  source: null,
+  connected: false,
+  pendingSlices: new Set(),
+  debounceId: null,
+};
+
+function slicesForNotification(notification) {
+  if (notification?.topic !== "events") return STREAM_TOPIC_SLICES[notification?.topic] || [];
+  const eventType = String(notification.type || "").toLowerCase();
+  const slices = ["system"];
+  if (eventType.includes("reddit")) slices.push("reddit");
+  if (eventType.includes("strateg") || eventType.includes("action")) slices.push("strategy");
+  if (eventType.includes("sale") || eventType.includes("revenue") || eventType.includes("gumroad")) slices.push("revenue");
+  return slices;
+}
+
+function scheduleSliceRefresh(slices) {
+  slices.forEach((slice) => liveUpdates.pendingSlices.add(slice));
+  if (!liveUpdates.pendingSlices.size || liveUpdates.debounceId) return;
+  // Bursts of notifications (a scan, a bulk import) collapse into one refetch per slice.
+  liveUpdates.debounceId = window.setTimeout(() => {
+    const pending = [...liveUpdates.pendingSlices];
+    liveUpdates.pendingSlices.clear();
+    liveUpdates.debounceId = null;
+    refreshLoop(pending);
+  }, CONFIG.streamDebounceMs);
+}
+
+function startLiveUpdates() {
+  if (typeof window.EventSource !== "function") return;
+  const source = new window.EventSource("/stream");
+  liveUpdates.source = source;
+  source.addEventListener("change", (event) => {
+    try {
+      scheduleSliceRefresh(slicesForNotification(JSON.parse(event.data)));
+    } catch (_error) {
+      scheduleSliceRefresh(REFRESH_SLICES);
+    }
+  });
+  // The server could not replay what was missed (restart or too far behind).
+  source.addEventListener("resync", () => scheduleSliceRefresh(REFRESH_SLICES));
+  source.addEventListener("open", () => {
+    if (liveUpdates.connected) return;
+    liveUpdates.connected = true;
+    startRefreshLoop();
+  });
+  // EventSource reconnects by itself (resuming from Last-Event-ID); poll at the normal rate meanwhile.
+  source.addEventListener("error", () => {
+    if (!liveUpdates.connected) return;
+    liveUpdates.connected = false;
+    startRefreshLoop();
+  });
 }
 
 async function executeCommand(rawInput) {
@@ -3923,4 +4003,5 @@ window.addEventListener("hashchange", () => {
 });
 
 startRefreshLoop();
+startLiveUpdates();
 refreshLoop();